@@ -0,0 +1,110 @@
+"""
+Benchmark of the ASYNC_EXECUTOR strategies used to run the sync code of async services.
+
+Each simulated request makes several sync database calls through the DSG bridge, like an
+async service validating, saving and serializing an instance. The throughput of concurrent
+requests is measured for each strategy and each THREAD_POOL size.
+
+Run it with the database settings of the tests:
+
+    DB_HOST=127.0.0.1 python benchmarks/bench_executors.py --pool-sizes 1 2 4 8 16
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_utils"))
+
+from boot_django import boot_django  # noqa: E402
+
+boot_django()
+
+from django.db import connection, connections  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from django_socio_grpc.utils.executors import (  # noqa: E402
+    request_executor_context,
+    set_thread_pool_executor,
+    sync_to_async,
+)
+
+
+def database_call(latency):
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_sleep(%s)", [latency])
+
+
+async def run_requests(requests, concurrency, calls_per_request, latency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with semaphore, request_executor_context():
+            for _ in range(calls_per_request):
+                await sync_to_async(database_call)(latency)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+def bench(strategy, options, pool_size=None):
+    executor = None
+    if pool_size:
+        executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="dsg-bench")
+        set_thread_pool_executor(executor)
+    try:
+        with override_settings(GRPC_FRAMEWORK={"ASYNC_EXECUTOR": strategy}):
+            return asyncio.run(
+                run_requests(
+                    options.requests,
+                    options.concurrency,
+                    options.calls_per_request,
+                    options.latency,
+                )
+            )
+    finally:
+        set_thread_pool_executor(None)
+        if executor is not None:
+            executor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--calls-per-request", type=int, default=3)
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="Seconds spent in each database call"
+    )
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument(
+        "--conn-max-age",
+        type=int,
+        default=0,
+        help="CONN_MAX_AGE of the database. Default is the one of Django: connections are not reused between requests",
+    )
+    options = parser.parse_args()
+    # Set before any connection is opened so the connections of all the threads use it
+    connections.settings["default"]["CONN_MAX_AGE"] = options.conn_max_age
+
+    results = [
+        ("THREAD_SENSITIVE", "-", bench("THREAD_SENSITIVE", options)),
+        ("PER_REQUEST", "-", bench("PER_REQUEST", options)),
+    ]
+    results += [
+        ("THREAD_POOL", str(size), bench("THREAD_POOL", options, pool_size=size))
+        for size in options.pool_sizes
+    ]
+
+    reference = results[0][2]
+    print(f"{'strategy':<18}{'workers':>8}{'requests/s':>14}{'speedup':>10}")
+    for strategy, workers, throughput in results:
+        print(f"{strategy:<18}{workers:>8}{throughput:>14.1f}{throughput / reference:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+Benchmark of the full request pipeline, from the stub of the client to the database and back.
+
+Each case calls an action of the fakeapp UnitTestModel services (Retrieve, List of 10, 100 and
+1000 rows, Stream of 100 000 rows, Create and PartialUpdate) sequentially, in sync and async mode,
+through the FakeGRPC channel of the tests and through a real server listening on the loopback.
+For each case it reports the throughput, the p50 and p99 latencies and the peak memory allocated by
+one call.
+
+Results can be saved as a baseline and later runs compared to it: the script exits with an error
+when the throughput or the p50 latency of a case regress more than --tolerance.
+
+Run it with the database settings of the tests, a test database is created for the run:
+
+    DB_HOST=127.0.0.1 python benchmarks/bench_requests.py --save-baseline baseline.json
+    DB_HOST=127.0.0.1 python benchmarks/bench_requests.py --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_utils"))
+
+from boot_django import boot_django  # noqa: E402
+
+boot_django()
+
+import grpc  # noqa: E402
+from django.conf import settings  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test import override_settings  # noqa: E402
+from fakeapp.grpc import fakeapp_pb2  # noqa: E402
+from fakeapp.grpc.fakeapp_pb2_grpc import (  # noqa: E402
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel  # noqa: E402
+from fakeapp.services.sync_unit_test_model_service import (  # noqa: E402
+    SyncUnitTestModelService,
+)
+from fakeapp.services.unit_test_model_service import UnitTestModelService  # noqa: E402
+
+from django_socio_grpc.tests.grpc_test_utils.fake_grpc import (  # noqa: E402
+    FakeFullAIOGRPC,
+    FakeGRPC,
+)
+from django_socio_grpc.utils.constants import PARTIAL_UPDATE_FIELD_NAME  # noqa: E402
+
+MODES = ["sync", "async"]
+TRANSPORTS = ["fake", "loopback"]
+
+
+@dataclass
+class BenchCase:
+    name: str
+    method: str
+    rows: int
+    make_request: Callable[[], object]
+    stream: bool = False
+
+
+@dataclass
+class BenchResult:
+    iterations: int
+    throughput: float
+    p50: float
+    p99: float
+    peak_memory: int | None
+
+
+def first_id():
+    return UnitTestModel.objects.order_by("id").values_list("id", flat=True).first()
+
+
+def get_cases(options) -> list[BenchCase]:
+    # INFO - Ordered by number of rows so the rows of a case are reused by the next ones
+    return [
+        BenchCase(
+            "Retrieve",
+            "Retrieve",
+            1,
+            lambda: fakeapp_pb2.UnitTestModelRetrieveRequest(id=first_id()),
+        ),
+        BenchCase(
+            "PartialUpdate",
+            "PartialUpdate",
+            1,
+            lambda: fakeapp_pb2.UnitTestModelPartialUpdateRequest(
+                id=first_id(), title="updated", **{PARTIAL_UPDATE_FIELD_NAME: ["title"]}
+            ),
+        ),
+        *(
+            BenchCase(
+                f"List-{rows}", "List", rows, lambda: fakeapp_pb2.UnitTestModelListRequest()
+            )
+            for rows in (10, 100, 1000)
+        ),
+        BenchCase(
+            f"Stream-{options.stream_rows}",
+            "Stream",
+            options.stream_rows,
+            lambda: fakeapp_pb2.UnitTestModelStreamRequest(),
+            stream=True,
+        ),
+        # INFO - Create adds rows so it is the last case
+        BenchCase(
+            "Create",
+            "Create",
+            0,
+            lambda: fakeapp_pb2.UnitTestModelRequest(title="created", text="text"),
+        ),
+    ]
+
+
+def set_row_count(rows: int):
+    ids = list(UnitTestModel.objects.order_by("id").values_list("id", flat=True))
+    if len(ids) > rows:
+        UnitTestModel.objects.filter(id__gt=ids[rows - 1] if rows else 0).delete()
+    missing = rows - len(ids)
+    if missing > 0:
+        UnitTestModel.objects.bulk_create(
+            (UnitTestModel(title=f"title {idx}", text="text") for idx in range(missing)),
+            batch_size=5000,
+        )
+
+
+def close_other_connections():
+    """
+    Close the connections left open by the threads of the servers so the test database can be dropped.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND pid <> pg_backend_pid()"
+        )
+
+
+def summarize(latencies: list[float], total_time: float, peak_memory: int | None):
+    latencies = sorted(latencies)
+    return BenchResult(
+        iterations=len(latencies),
+        throughput=len(latencies) / total_time,
+        p50=statistics.median(latencies),
+        p99=latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        peak_memory=peak_memory,
+    )
+
+
+def measure(call: Callable[[], object], iterations: int, warmup: int, memory: bool):
+    for _ in range(warmup):
+        call()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_start)
+    total_time = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        call()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return summarize(latencies, total_time, peak_memory)
+
+
+async def async_measure(call, iterations: int, warmup: int, memory: bool):
+    for _ in range(warmup):
+        await call()
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - call_start)
+    total_time = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        tracemalloc.start()
+        await call()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return summarize(latencies, total_time, peak_memory)
+
+
+def run_sync_case(transport: str, case: BenchCase, iterations: int, warmup: int, memory: bool):
+    servicer = SyncUnitTestModelService.as_servicer()
+    if transport == "fake":
+        fake_grpc = FakeGRPC(add_UnitTestModelControllerServicer_to_server, servicer)
+        stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        close = fake_grpc.close
+    else:
+        server = grpc.server(ThreadPoolExecutor(max_workers=4))
+        add_UnitTestModelControllerServicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+        stub = UnitTestModelControllerStub(channel)
+
+        def close():
+            channel.close()
+            server.stop(None)
+
+    method = getattr(stub, case.method)
+    request = case.make_request()
+
+    def call():
+        response = method(request=request)
+        if case.stream:
+            for _ in response:
+                pass
+
+    try:
+        return measure(call, iterations, warmup, memory)
+    finally:
+        close()
+
+
+async def run_async_case(
+    transport: str, case: BenchCase, iterations: int, warmup: int, memory: bool
+):
+    servicer = UnitTestModelService.as_servicer()
+    if transport == "fake":
+        fake_grpc = FakeFullAIOGRPC(add_UnitTestModelControllerServicer_to_server, servicer)
+        stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        server = channel = None
+    else:
+        server = grpc.aio.server()
+        add_UnitTestModelControllerServicer_to_server(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+        stub = UnitTestModelControllerStub(channel)
+
+    method = getattr(stub, case.method)
+    # INFO - The requests are built outside of the event loop as they can query the database
+    request = await asyncio.to_thread(case.make_request)
+
+    async def call():
+        response = method(request=request)
+        if case.stream:
+            async for _ in response:
+                pass
+        else:
+            await response
+
+    try:
+        return await async_measure(call, iterations, warmup, memory)
+    finally:
+        if server is None:
+            fake_grpc.close()
+        else:
+            await channel.close()
+            await server.stop(None)
+
+
+def run_case(mode: str, transport: str, case: BenchCase, options) -> BenchResult:
+    set_row_count(case.rows)
+    iterations = options.stream_iterations if case.stream else options.iterations
+    warmup = 0 if case.stream else options.warmup
+    grpc_framework = {**settings.GRPC_FRAMEWORK, "GRPC_ASYNC": mode == "async"}
+    with override_settings(GRPC_FRAMEWORK=grpc_framework):
+        if mode == "sync":
+            return run_sync_case(transport, case, iterations, warmup, options.memory)
+        return asyncio.run(run_async_case(transport, case, iterations, warmup, options.memory))
+
+
+def compare(key: str, result: BenchResult, baseline: dict, tolerance: float) -> str:
+    reference = baseline.get(key)
+    if reference is None:
+        return "new"
+    throughput_ratio = result.throughput / reference["throughput"]
+    p50_ratio = result.p50 / reference["p50"]
+    status = f"{throughput_ratio:.2f}x"
+    if throughput_ratio < 1 - tolerance or p50_ratio > 1 + tolerance:
+        status += " REGRESSION"
+    return status
+
+
+def format_memory(peak_memory: int | None) -> str:
+    return "-" if peak_memory is None else f"{peak_memory / 1024:.0f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES)
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=TRANSPORTS)
+    parser.add_argument(
+        "--cases", nargs="+", default=None, help="Names of the cases to run. Default runs all"
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--stream-rows", type=int, default=100_000)
+    parser.add_argument("--stream-iterations", type=int, default=3)
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="Do not measure the peak memory, tracing the allocations of the large streams is slow",
+    )
+    parser.add_argument("--baseline", help="JSON file of results to compare with")
+    parser.add_argument("--save-baseline", help="JSON file where the results are saved")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Relative loss of throughput or p50 latency reported as a regression",
+    )
+    parser.add_argument("--keepdb", action="store_true", help="Keep the test database")
+    options = parser.parse_args()
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    cases = get_cases(options)
+    if options.cases:
+        cases = [case for case in cases if case.name in options.cases]
+
+    old_database_name = connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, keepdb=options.keepdb
+    )
+    results = {}
+    regression = False
+    try:
+        # INFO - DEBUG keeps every query in memory and logs every response
+        with override_settings(DEBUG=False):
+            print(
+                f"{'case':<34}{'calls':>7}{'calls/s':>11}{'p50 ms':>10}{'p99 ms':>10}"
+                f"{'peak KiB':>10}  baseline"
+            )
+            for mode in options.modes:
+                for transport in options.transports:
+                    set_row_count(0)
+                    for case in cases:
+                        key = f"{mode}/{transport}/{case.name}"
+                        result = run_case(mode, transport, case, options)
+                        results[key] = asdict(result)
+                        status = compare(key, result, baseline, options.tolerance)
+                        regression = regression or status.endswith("REGRESSION")
+                        print(
+                            f"{key:<34}{result.iterations:>7}{result.throughput:>11.1f}"
+                            f"{result.p50 * 1000:>10.2f}{result.p99 * 1000:>10.2f}"
+                            f"{format_memory(result.peak_memory):>10}  {status}"
+                        )
+    finally:
+        close_other_connections()
+        connection.creation.destroy_test_db(
+            old_database_name, verbosity=0, keepdb=options.keepdb
+        )
+
+    if options.save_baseline:
+        with open(options.save_baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    if regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
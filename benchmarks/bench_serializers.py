@@ -0,0 +1,280 @@
+"""
+Benchmark of the conversions done by the proto serializers, phase by phase.
+
+Each shape is serialized with a ProtoSerializer, a ModelProtoSerializer or a ListProtoSerializer of
+the fakeapp and each phase of the round trip between a protobuf message and a model is timed
+separately:
+
+- message_to_data: protobuf message -> dict of python primitive datatypes (``message_to_dict``)
+- is_valid: validation of this dict by a new serializer
+- data: representation of an instance by a new serializer
+- data_to_message: dict of python primitive datatypes -> protobuf message (``parse_dict``)
+
+The shapes are a flat message, a message with enums, a message with nested messages, a message with
+a repeated nested message, a message with optional and nullable fields and a list of messages.
+For each phase it reports the p50 and mean time of one call and its share of the round trip.
+
+Results can be saved as a baseline and later runs compared to it: the script exits with an error
+when the p50 of a phase regresses more than --tolerance. No database is needed:
+
+    python benchmarks/bench_serializers.py --save-baseline baseline.json
+    python benchmarks/bench_serializers.py --baseline baseline.json --shapes nested list
+"""
+
+import argparse
+import copy
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "test_utils"))
+
+from boot_django import boot_django  # noqa: E402
+
+boot_django()
+
+from fakeapp.grpc import fakeapp_pb2  # noqa: E402
+from fakeapp.models import DefaultValueModel, EnumModel, UnitTestModel  # noqa: E402
+from fakeapp.serializers import (  # noqa: E402
+    DefaultValueSerializer,
+    EnumServiceSerializer,
+    UnitTestModelSerializer,
+)
+from rest_framework import serializers  # noqa: E402
+
+from django_socio_grpc import proto_serializers  # noqa: E402
+
+PHASES = ["message_to_data", "is_valid", "data", "data_to_message"]
+
+
+class ForeignSerializer(proto_serializers.ProtoSerializer):
+    uuid = serializers.UUIDField()
+    name = serializers.CharField()
+
+    class Meta:
+        proto_class = fakeapp_pb2.ForeignModelResponse
+
+
+class ManyManySerializer(proto_serializers.ProtoSerializer):
+    uuid = serializers.UUIDField()
+    name = serializers.CharField()
+
+    class Meta:
+        proto_class = fakeapp_pb2.ManyManyModelResponse
+
+
+class NestedSerializer(proto_serializers.ProtoSerializer):
+    uuid = serializers.UUIDField()
+    foreign = ForeignSerializer()
+    many_many = ManyManySerializer(many=True)
+    custom_field_name = serializers.CharField()
+    many_many_foreigns = serializers.ListField(child=serializers.CharField())
+
+    class Meta:
+        proto_class = fakeapp_pb2.RelatedFieldModelResponse
+
+
+class RepeatedSerializer(proto_serializers.ProtoSerializer):
+    count = serializers.IntegerField()
+    query_fetched_datetime = serializers.CharField()
+    results = UnitTestModelSerializer(many=True)
+
+    class Meta:
+        proto_class = fakeapp_pb2.UnitTestModelListExtraArgsResponse
+
+
+@dataclass
+class Shape:
+    name: str
+    make_serializer: Callable[..., proto_serializers.BaseProtoSerializer]
+    instance: object
+
+
+@dataclass
+class PhaseResult:
+    iterations: int
+    p50: float
+    mean: float
+
+
+def make_unit_test_model(idx: int) -> UnitTestModel:
+    return UnitTestModel(id=idx, title=f"Title {idx}", text=f"Some text for the item {idx}")
+
+
+def get_shapes(items: int) -> list[Shape]:
+    foreign_uuid = str(uuid.uuid4())
+    return [
+        Shape("flat", UnitTestModelSerializer, make_unit_test_model(1)),
+        Shape(
+            "enum",
+            EnumServiceSerializer,
+            EnumModel(
+                id=1,
+                char_choices=EnumModel.MyTestStrEnum.VALUE_2,
+                char_choices_nullable=None,
+                char_choices_no_default_no_null=EnumModel.MyTestStrEnum.VALUE_1,
+                int_choices=EnumModel.MyTestIntEnum.TWO,
+                char_choices_not_annotated=EnumModel.MyNotAnnotatedTestStrEnum.VALUE_2,
+            ),
+        ),
+        Shape(
+            "nested",
+            NestedSerializer,
+            {
+                "uuid": uuid.uuid4(),
+                "foreign": {"uuid": foreign_uuid, "name": "foreign"},
+                "many_many": [
+                    {"uuid": uuid.uuid4(), "name": f"many {idx}"} for idx in range(items)
+                ],
+                "custom_field_name": "custom",
+                "many_many_foreigns": [f"foreign {idx}" for idx in range(items)],
+            },
+        ),
+        Shape(
+            "repeated",
+            RepeatedSerializer,
+            {
+                "count": items,
+                "query_fetched_datetime": "2024-01-01T00:00:00Z",
+                "results": [make_unit_test_model(idx) for idx in range(items)],
+            },
+        ),
+        Shape(
+            "nullable",
+            DefaultValueSerializer,
+            DefaultValueModel(
+                id=1,
+                string_required="required",
+                string_nullable=None,
+                string_null_default_and_blank=None,
+                string_required_but_serializer_default="required",
+                int_required=1,
+                int_nullable=None,
+                int_required_but_serializer_default=2,
+                boolean_required=True,
+                boolean_nullable=None,
+                boolean_required_but_serializer_default=False,
+            ),
+        ),
+        Shape(
+            "list",
+            lambda *args, **kwargs: UnitTestModelSerializer(*args, many=True, **kwargs),
+            [make_unit_test_model(idx) for idx in range(items)],
+        ),
+    ]
+
+
+def measure(call: Callable[[], object], iterations: int, warmup: int) -> PhaseResult:
+    for _ in range(warmup):
+        call()
+    latencies = []
+    for _ in range(iterations):
+        call_start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_start)
+    return PhaseResult(
+        iterations=iterations,
+        p50=statistics.median(latencies),
+        mean=statistics.fmean(latencies),
+    )
+
+
+def run_shape(
+    shape: Shape, phases: list[str], iterations: int, warmup: int
+) -> dict[str, PhaseResult]:
+    data = shape.make_serializer(shape.instance).data
+    # INFO - data_to_message converts the enum values of the data in place, each call needs its copy
+    message = shape.make_serializer().data_to_message(copy.copy(data))
+    serializer = shape.make_serializer()
+    internal_data = serializer.message_to_data(message)
+
+    def is_valid():
+        shape.make_serializer(data=internal_data).is_valid(raise_exception=True)
+
+    calls = {
+        "message_to_data": lambda: serializer.message_to_data(message),
+        "is_valid": is_valid,
+        "data": lambda: shape.make_serializer(shape.instance).data,
+        "data_to_message": lambda: serializer.data_to_message(copy.copy(data)),
+    }
+    return {phase: measure(calls[phase], iterations, warmup) for phase in phases}
+
+
+def compare(key: str, result: PhaseResult, baseline: dict, tolerance: float) -> str:
+    reference = baseline.get(key)
+    if reference is None:
+        return "new"
+    ratio = result.p50 / reference["p50"]
+    status = f"{ratio:.2f}x"
+    if ratio > 1 + tolerance:
+        status += " REGRESSION"
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        default=None,
+        help="Names of the shapes to run. Default runs all",
+    )
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=PHASES)
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=100,
+        help="Number of items of the repeated fields and of the list",
+    )
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--baseline", help="JSON file of results to compare with")
+    parser.add_argument("--save-baseline", help="JSON file where the results are saved")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Relative increase of the p50 of a phase reported as a regression",
+    )
+    options = parser.parse_args()
+
+    baseline = {}
+    if options.baseline:
+        with open(options.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    shapes = get_shapes(options.items)
+    if options.shapes:
+        shapes = [shape for shape in shapes if shape.name in options.shapes]
+
+    results = {}
+    regression = False
+    print(f"{'phase':<28}{'p50 us':>10}{'mean us':>10}{'share':>8}  baseline")
+    for shape in shapes:
+        shape_results = run_shape(shape, options.phases, options.iterations, options.warmup)
+        total = sum(shape_results[phase].p50 for phase in options.phases)
+        for phase in options.phases:
+            result = shape_results[phase]
+            key = f"{shape.name}/{phase}"
+            results[key] = asdict(result)
+            status = compare(key, result, baseline, options.tolerance)
+            regression = regression or status.endswith("REGRESSION")
+            print(
+                f"{key:<28}{result.p50 * 1e6:>10.1f}{result.mean * 1e6:>10.1f}"
+                f"{result.p50 / total:>8.0%}  {status}"
+            )
+
+    if options.save_baseline:
+        with open(options.save_baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    if regression:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
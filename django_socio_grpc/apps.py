@@ -10,5 +10,8 @@ class DjangoSocioGrpcConfig(AppConfig):
     verbose_name = "Django Socio gRPC"
 
     def ready(self):
-        # Import signals module to connect the signals
-        pass
+        from django_socio_grpc.authentication_cache import connect_invalidation_signals
+        from django_socio_grpc.settings import grpc_settings
+
+        grpc_settings.validate()
+        connect_invalidation_signals()
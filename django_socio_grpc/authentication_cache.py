@@ -0,0 +1,304 @@
+"""
+Cache of the result of ``Service.resolve_user`` keyed by a hash of the credentials of the request.
+
+It is enabled by setting AUTHENTICATION_CACHE_TIMEOUT. Each process keeps the last
+AUTHENTICATION_CACHE_MAX_SIZE results and, if AUTHENTICATION_CACHE_ALIAS is set, shares them
+with the other processes through the Django cache. The results of a user are invalidated
+when the user or an instance of AUTHENTICATION_CACHE_INVALIDATION_MODELS is saved or deleted,
+and when the groups or permissions of the user or of one of its groups change.
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import partial
+
+from django.apps import apps
+from django.core.cache import caches
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from django_socio_grpc.settings import grpc_settings
+
+logger = logging.getLogger("django_socio_grpc.authentication_cache")
+
+SHARED_CACHE_KEY_PREFIX = "dsg-auth"
+
+
+class AuthenticationCache:
+    def __init__(self):
+        # key -> (expires_at, user_pk, user_auth_tuple), ordered from the least recently used
+        self._entries: OrderedDict[str, tuple[float, object, tuple]] = OrderedDict()
+        # user_pk -> keys of the entries of this user
+        self._user_keys: dict[object, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, service) -> str | None:
+        """
+        Return the hash of the credential headers and authentication classes of the service,
+        None if the request has no credentials.
+        """
+        meta = getattr(service.context, "META", None) or {}
+        credentials = [
+            (header, str(value))
+            for header in grpc_settings.AUTHENTICATION_CACHE_HEADERS
+            if (value := meta.get(header))
+        ]
+        if not credentials:
+            return None
+        authentication_classes = [
+            f"{auth.__module__}.{auth.__qualname__}"
+            for auth in getattr(service, "authentication_classes", [])
+        ]
+        digest = hashlib.sha256(
+            repr((authentication_classes, credentials)).encode()
+        ).hexdigest()
+        return f"{SHARED_CACHE_KEY_PREFIX}:{digest}"
+
+    def resolve_user(self, service):
+        """
+        Return the cached result of ``service.resolve_user()`` or call it and cache the result.
+        """
+        if not grpc_settings.AUTHENTICATION_CACHE_TIMEOUT:
+            return service.resolve_user()
+        key = self.get_key(service)
+        if key is None:
+            return service.resolve_user()
+
+        # Each request gets its own copy of the user so what a request sets on it does not leak in the others
+        user_auth_tuple = self.get(key)
+        if user_auth_tuple is not None:
+            return copy_user_auth_tuple(user_auth_tuple)
+        user_auth_tuple = service.resolve_user()
+        # Unauthenticated requests are not cached so a new user can use the credentials right away
+        if user_auth_tuple:
+            self.set(key, copy_user_auth_tuple(user_auth_tuple))
+        return user_auth_tuple
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return entry[2]
+                self._remove(key)
+
+        shared_cache = self.get_shared_cache()
+        if shared_cache is None:
+            return None
+        shared_entry = shared_cache.get(key)
+        if not isinstance(shared_entry, tuple) or len(shared_entry) != 3:
+            return None
+        user_pk, generation, user_auth_tuple = shared_entry
+        # The entry is outdated if the results of the user have been invalidated since it was set
+        if (
+            user_pk is not None
+            and shared_cache.get(self.get_user_generation_key(user_pk)) != generation
+        ):
+            return None
+        self._set_local(key, user_auth_tuple)
+        return user_auth_tuple
+
+    def set(self, key: str, user_auth_tuple):
+        self._set_local(key, user_auth_tuple)
+        shared_cache = self.get_shared_cache()
+        if shared_cache is None:
+            return
+        timeout = grpc_settings.AUTHENTICATION_CACHE_TIMEOUT
+        user_pk = get_user_pk(user_auth_tuple[0])
+        generation = None
+        if user_pk is not None:
+            # The entries of a user are tagged with its current generation so any process can invalidate
+            # them at once by replacing it. add, set and touch are atomic so concurrent requests never lose an update.
+            generation_key = self.get_user_generation_key(user_pk)
+            generation = uuid.uuid4().hex
+            if not shared_cache.add(generation_key, generation, timeout):
+                generation = shared_cache.get(generation_key)
+                if generation is None:
+                    return
+                # The generation has to live as long as the entries tagged with it
+                shared_cache.touch(generation_key, timeout)
+        shared_cache.set(key, (user_pk, generation, user_auth_tuple), timeout)
+
+    def _set_local(self, key: str, user_auth_tuple):
+        expires_at = time.monotonic() + grpc_settings.AUTHENTICATION_CACHE_TIMEOUT
+        user_pk = get_user_pk(user_auth_tuple[0])
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (expires_at, user_pk, user_auth_tuple)
+            self._user_keys.setdefault(user_pk, set()).add(key)
+            while len(self._entries) > grpc_settings.AUTHENTICATION_CACHE_MAX_SIZE:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_keys = self._user_keys.get(entry[1])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._user_keys[entry[1]]
+
+    def invalidate_user(self, user_pk):
+        with self._lock:
+            for key in list(self._user_keys.get(user_pk, ())):
+                self._remove(key)
+
+        shared_cache = self.get_shared_cache()
+        if shared_cache is None:
+            return
+        shared_cache.set(
+            self.get_user_generation_key(user_pk),
+            uuid.uuid4().hex,
+            grpc_settings.AUTHENTICATION_CACHE_TIMEOUT,
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._user_keys.clear()
+
+    def get_shared_cache(self):
+        if grpc_settings.AUTHENTICATION_CACHE_ALIAS is None:
+            return None
+        return caches[grpc_settings.AUTHENTICATION_CACHE_ALIAS]
+
+    @staticmethod
+    def get_user_generation_key(user_pk) -> str:
+        return f"{SHARED_CACHE_KEY_PREFIX}-user-generation:{user_pk}"
+
+
+authentication_cache = AuthenticationCache()
+
+
+def copy_user_auth_tuple(user_auth_tuple: tuple) -> tuple:
+    user, *auth = user_auth_tuple
+    return (copy.copy(user), *auth)
+
+
+def get_user_pk(user):
+    return getattr(user, "pk", None)
+
+
+def _invalidate_instance_user(sender, instance, **kwargs):
+    user_model = get_user_model_or_none()
+    if user_model is not None and isinstance(instance, user_model):
+        user_pk = instance.pk
+    else:
+        user_pk = getattr(instance, "user_id", None)
+    if user_pk is not None:
+        authentication_cache.invalidate_user(user_pk)
+
+
+def _get_m2m_changed_pks(m2m_field, instance, action: str, reverse: bool, pk_set) -> list:
+    """
+    Return the pks of the instances of the model declaring m2m_field (users or groups)
+    whose m2m_field is changed by an m2m_changed signal.
+    """
+    if action in ("post_add", "post_remove"):
+        return list(pk_set) if reverse else [instance.pk]
+    if action == "post_clear" and not reverse:
+        return [instance.pk]
+    if action == "pre_clear" and reverse:
+        # INFO - The pk_set of a reverse clear is None, so the instances are read before the clear
+        return list(
+            m2m_field.remote_field.through.objects.filter(
+                **{m2m_field.m2m_reverse_field_name(): instance.pk}
+            ).values_list(m2m_field.m2m_field_name(), flat=True)
+        )
+    return []
+
+
+def _invalidate_m2m_users(m2m_field, sender, instance, action, reverse, pk_set, **kwargs):
+    for user_pk in _get_m2m_changed_pks(m2m_field, instance, action, reverse, pk_set):
+        authentication_cache.invalidate_user(user_pk)
+
+
+def _invalidate_group_users(
+    groups_field, m2m_field, sender, instance, action, reverse, pk_set, **kwargs
+):
+    group_pks = _get_m2m_changed_pks(m2m_field, instance, action, reverse, pk_set)
+    if not group_pks:
+        return
+    user_pks = groups_field.remote_field.through.objects.filter(
+        **{f"{groups_field.m2m_reverse_field_name()}__in": group_pks}
+    ).values_list(groups_field.m2m_field_name(), flat=True)
+    for user_pk in set(user_pks):
+        authentication_cache.invalidate_user(user_pk)
+
+
+def get_user_model_or_none():
+    if not apps.is_installed("django.contrib.auth"):
+        return None
+    from django.contrib.auth import get_user_model
+
+    return get_user_model()
+
+
+def connect_invalidation_signals():
+    """
+    Invalidate the cached results of a user when the user or an instance of
+    AUTHENTICATION_CACHE_INVALIDATION_MODELS linked to it with a ``user`` foreign key is saved or deleted,
+    and when the groups or permissions of the user or the permissions of one of its groups change.
+    """
+    user_model = get_user_model_or_none()
+    if user_model is not None:
+        connect_m2m_invalidation_signals(user_model)
+
+    models = [user_model]
+    for model_label in grpc_settings.AUTHENTICATION_CACHE_INVALIDATION_MODELS:
+        try:
+            models.append(apps.get_model(model_label))
+        except LookupError:
+            logger.warning(
+                f"AUTHENTICATION_CACHE_INVALIDATION_MODELS: {model_label} not found"
+            )
+
+    for model in models:
+        if model is None:
+            continue
+        dispatch_uid = f"dsg_authentication_cache_{model._meta.label_lower}"
+        post_save.connect(
+            _invalidate_instance_user,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"{dispatch_uid}_save",
+        )
+        post_delete.connect(
+            _invalidate_instance_user,
+            sender=model,
+            weak=False,
+            dispatch_uid=f"{dispatch_uid}_delete",
+        )
+
+
+def connect_m2m_invalidation_signals(user_model):
+    for field_name in ("groups", "user_permissions"):
+        try:
+            m2m_field = user_model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+        m2m_changed.connect(
+            partial(_invalidate_m2m_users, m2m_field),
+            sender=m2m_field.remote_field.through,
+            weak=False,
+            dispatch_uid=f"dsg_authentication_cache_{user_model._meta.label_lower}_{field_name}",
+        )
+
+    try:
+        groups_field = user_model._meta.get_field("groups")
+        permissions_field = groups_field.related_model._meta.get_field("permissions")
+    except FieldDoesNotExist:
+        return
+    m2m_changed.connect(
+        partial(_invalidate_group_users, groups_field, permissions_field),
+        sender=permissions_field.remote_field.through,
+        weak=False,
+        dispatch_uid="dsg_authentication_cache_group_permissions",
+    )
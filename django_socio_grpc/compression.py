@@ -0,0 +1,147 @@
+"""
+Compression of the responses, used by ``compression_middleware``.
+
+The algorithm of an action is the ``compression`` of its ``grpc_action``, or RESPONSE_COMPRESSION.
+Compressing small messages costs more CPU than it saves bandwidth, so the messages smaller than
+RESPONSE_COMPRESSION_THRESHOLD bytes are sent uncompressed, even if the server compresses by default.
+Measuring the size of a message walks all its fields: it is skipped when the threshold is 0, or when all
+the messages of a stream are compressed, unless the call is sampled.
+
+gRPC compresses the messages in its C core, out of reach of python. To record the compression ratio and
+the CPU time, a RESPONSE_COMPRESSION_METRICS_SAMPLE_RATE fraction of the calls also compress their
+messages with zlib and send them with the ``grpc_response_compression`` signal.
+"""
+
+import random
+import time
+import zlib
+from typing import TYPE_CHECKING
+
+import grpc
+
+from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.signals import grpc_response_compression
+
+if TYPE_CHECKING:
+    from django_socio_grpc.request_transformer import GRPCRequestContainer
+
+GZIP = "gzip"
+DEFLATE = "deflate"
+NO_COMPRESSION = "none"
+
+COMPRESSION_ALGORITHMS = {
+    NO_COMPRESSION: grpc.Compression.NoCompression,
+    GZIP: grpc.Compression.Gzip,
+    DEFLATE: grpc.Compression.Deflate,
+}
+
+# INFO - zlib wbits producing the gzip and the zlib (used by the deflate gRPC encoding) formats
+ZLIB_WBITS = {GZIP: 16 + zlib.MAX_WBITS, DEFLATE: zlib.MAX_WBITS}
+
+
+def get_action_compression(request: "GRPCRequestContainer") -> str | None:
+    grpc_action = getattr(type(request.service), request.action, None)
+    compression = getattr(grpc_action, "compression", None)
+    if compression is None:
+        return grpc_settings.RESPONSE_COMPRESSION
+    return compression
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    compressor = zlib.compressobj(wbits=ZLIB_WBITS[compression])
+    return compressor.compress(data) + compressor.flush()
+
+
+class ResponseCompressor:
+    """
+    Choose the compression of the messages of one call and record its metrics.
+    """
+
+    def __init__(self, request: "GRPCRequestContainer", compression: str):
+        self.request = request
+        self.compression = compression
+        self.sampled = random.random() < grpc_settings.RESPONSE_COMPRESSION_METRICS_SAMPLE_RATE
+        self.message_count = 0
+        self.compressed_count = 0
+        self.size: int | None = 0
+        self.compressed_size = 0
+        self.cpu_time = 0.0
+
+    @classmethod
+    def for_request(cls, request: "GRPCRequestContainer") -> "ResponseCompressor | None":
+        """
+        Return a compressor if the action of the request has a compression algorithm.
+        """
+        compression = get_action_compression(request)
+        if compression is None:
+            return None
+        return cls(request, compression)
+
+    @property
+    def context(self):
+        return self.request.context
+
+    def should_compress(self, message, use_threshold: bool = True) -> bool:
+        self.message_count += 1
+        if self.compression == NO_COMPRESSION or not hasattr(message, "ByteSize"):
+            return False
+        threshold = grpc_settings.RESPONSE_COMPRESSION_THRESHOLD if use_threshold else 0
+        # INFO - ByteSize walks the whole message, so it is skipped when neither the threshold
+        # nor the sampled metrics need the size. The size of the call is then unknown.
+        if threshold <= 0 and not self.sampled:
+            self.compressed_count += 1
+            self.size = None
+            return True
+        size = message.ByteSize()
+        if size < threshold:
+            return False
+        self.compressed_count += 1
+        if self.size is not None:
+            self.size += size
+        if self.sampled:
+            start = time.process_time()
+            self.compressed_size += len(
+                compress(message.SerializeToString(), self.compression)
+            )
+            self.cpu_time += time.process_time() - start
+        return True
+
+    def compress_response(self, message):
+        """
+        Set the compression of a unary response.
+        """
+        if self.should_compress(message):
+            self.context.set_compression(COMPRESSION_ALGORITHMS[self.compression])
+        else:
+            self.context.set_compression(grpc.Compression.NoCompression)
+        self.send_metrics()
+
+    def start_stream(self):
+        self.context.set_compression(COMPRESSION_ALGORITHMS[self.compression])
+
+    def compress_stream_message(self, message):
+        """
+        Disable the compression of the next message of a stream if it is too small.
+        With ASYNC_STREAM_WRITE_WINDOW the messages are written later by another task,
+        so all the messages of the stream are compressed.
+        """
+        use_threshold = not (
+            grpc_settings.GRPC_ASYNC and grpc_settings.ASYNC_STREAM_WRITE_WINDOW
+        )
+        if (
+            not self.should_compress(message, use_threshold)
+            and self.compression != NO_COMPRESSION
+        ):
+            self.context.disable_next_message_compression()
+
+    def send_metrics(self):
+        grpc_response_compression.send(
+            sender=type(self.request.service),
+            action=self.request.action,
+            compression=self.compression,
+            message_count=self.message_count,
+            compressed_count=self.compressed_count,
+            size=self.size,
+            ratio=self.compressed_size / self.size if self.sampled and self.size else None,
+            cpu_time=self.cpu_time if self.sampled else None,
+        )
@@ -0,0 +1,186 @@
+"""
+Database router sending the queries of read only gRPC actions to read replicas.
+
+Add it to your Django settings and list your replicas in ``READ_REPLICA_DATABASES``::
+
+    DATABASE_ROUTERS = ["django_socio_grpc.db_routers.ReadReplicaRouter"]
+
+An action is read only if it is one of ``permissions.SAFE_ACTIONS`` or if it is
+declared with ``@grpc_action(read_only=True)``. All the other queries, and the
+queries made outside of a gRPC action, go to the default database.
+"""
+
+import itertools
+import logging
+import threading
+import time
+
+from django.db import connections
+
+from django_socio_grpc.grpc_actions.actions import GRPCAction
+from django_socio_grpc.permissions import SAFE_ACTIONS
+from django_socio_grpc.services.servicer_proxy import get_servicer_context
+from django_socio_grpc.settings import ReadReplicaSelectionOptions, grpc_settings
+
+logger = logging.getLogger("django_socio_grpc.db_routers")
+
+DATABASE_WRITTEN_ATTRIBUTE = "_database_written"
+READ_REPLICA_ATTRIBUTE = "_read_replica"
+
+
+def get_postgresql_replica_lag(alias: str) -> float | None:
+    """
+    Return the number of seconds since the last transaction replayed by a PostgreSQL replica.
+    A replica that replayed everything it received has no lag.
+    Return None if the database is not a replica.
+    """
+    with connections[alias].cursor() as cursor:
+        cursor.execute(
+            "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+            "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+        )
+        lag = cursor.fetchone()[0]
+    return None if lag is None else float(lag)
+
+
+def get_current_service():
+    return getattr(get_servicer_context(), "service", None)
+
+
+def is_read_only_action(service) -> bool:
+    action = getattr(service, "action", None)
+    if action is None:
+        return False
+    if action in SAFE_ACTIONS:
+        return True
+    grpc_action = getattr(type(service), action, None)
+    return isinstance(grpc_action, GRPCAction) and grpc_action.read_only
+
+
+def has_written_database(service) -> bool:
+    return getattr(service, DATABASE_WRITTEN_ATTRIBUTE, False)
+
+
+class ReplicaLagCache:
+    """
+    Keep the replication lag of each replica for READ_REPLICA_LAG_CACHE_TIMEOUT seconds
+    to not query the replicas before every read.
+    """
+
+    def __init__(self):
+        self._lags: dict[str, tuple[float | None, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, alias: str) -> tuple[float | None, float]:
+        """
+        Return the lag in seconds (None if unknown) and the time it was measured at.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._lags.get(alias)
+        if (
+            cached is not None
+            and now - cached[1] < grpc_settings.READ_REPLICA_LAG_CACHE_TIMEOUT
+        ):
+            return cached
+
+        try:
+            lag = grpc_settings.READ_REPLICA_LAG_FUNCTION(alias)
+        except Exception:
+            logger.exception(f"Unable to get the replication lag of {alias}")
+            lag = None
+        with self._lock:
+            self._lags[alias] = (lag, now)
+        return lag, now
+
+    def clear(self):
+        with self._lock:
+            self._lags.clear()
+
+
+class ReadReplicaRouter:
+    """
+    Route the reads of read only gRPC actions to one of READ_REPLICA_DATABASES.
+
+    The replica is chosen according to READ_REPLICA_SELECTION. Replicas lagging more than
+    READ_REPLICA_MAX_LAG seconds are skipped. If the request has the READ_YOUR_WRITES_METADATA_KEY
+    metadata, only the replicas that replayed the transactions committed before this timestamp are used.
+    When no replica is usable the read goes to the default database.
+
+    The database is chosen at the first read of the request and used by all its reads, so the count
+    and the rows of a paginated list are read from the same replica.
+    """
+
+    lag_cache = ReplicaLagCache()
+
+    def __init__(self):
+        self._round_robin = itertools.count()
+
+    def db_for_read(self, model, **hints):
+        service = get_current_service()
+        if service is None or not grpc_settings.READ_REPLICA_DATABASES:
+            return None
+        if not is_read_only_action(service):
+            return None
+        # INFO - The service is instantiated for each request
+        if hasattr(service, READ_REPLICA_ATTRIBUTE):
+            return getattr(service, READ_REPLICA_ATTRIBUTE)
+        replica = self.select_replica(self.get_last_write_timestamp(service))
+        setattr(service, READ_REPLICA_ATTRIBUTE, replica)
+        return replica
+
+    def db_for_write(self, model, **hints):
+        service = get_current_service()
+        if service is not None:
+            # Used by read_your_writes_middleware to send the time of the write to the client
+            setattr(service, DATABASE_WRITTEN_ATTRIBUTE, True)
+        return None
+
+    def get_last_write_timestamp(self, service) -> float | None:
+        metadata_key = grpc_settings.READ_YOUR_WRITES_METADATA_KEY
+        try:
+            metadata = dict(service.context.invocation_metadata())
+        except AttributeError:
+            return None
+        try:
+            return float(metadata[metadata_key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def is_replica_usable(
+        self, lag: float | None, measured_at: float, last_write_timestamp: float | None
+    ) -> bool:
+        if lag is None:
+            return False
+        if (
+            grpc_settings.READ_REPLICA_MAX_LAG is not None
+            and lag > grpc_settings.READ_REPLICA_MAX_LAG
+        ):
+            return False
+        # The replica has replayed everything committed before measured_at - lag
+        return last_write_timestamp is None or measured_at - lag >= last_write_timestamp
+
+    def select_replica(self, last_write_timestamp: float | None = None) -> str | None:
+        replicas = grpc_settings.READ_REPLICA_DATABASES
+        selection = grpc_settings.READ_REPLICA_SELECTION
+        need_lag = (
+            selection == ReadReplicaSelectionOptions.LEAST_LAG
+            or grpc_settings.READ_REPLICA_MAX_LAG is not None
+            or last_write_timestamp is not None
+        )
+
+        if not need_lag:
+            return replicas[next(self._round_robin) % len(replicas)]
+
+        lags = {alias: self.lag_cache.get(alias) for alias in replicas}
+        usable_replicas = [
+            alias
+            for alias in replicas
+            if self.is_replica_usable(*lags[alias], last_write_timestamp)
+        ]
+        if not usable_replicas:
+            return None
+
+        if selection == ReadReplicaSelectionOptions.LEAST_LAG:
+            return min(usable_replicas, key=lambda alias: lags[alias][0])
+        return usable_replicas[next(self._round_robin) % len(usable_replicas)]
@@ -5,7 +5,7 @@ from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
 import django
-from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.sync import async_to_sync
 from django.core.cache import cache as default_cache
 from django.core.cache import caches
 from django.db.models import Model
@@ -26,6 +26,7 @@ from django_socio_grpc.request_transformer import (
 )
 from django_socio_grpc.settings import grpc_settings
 from django_socio_grpc.signals import grpc_action_register
+from django_socio_grpc.utils.executors import sync_to_async
 from django_socio_grpc.utils.utils import isgeneratorfunction
 
 from .grpc_actions.actions import GRPCAction
@@ -70,6 +71,8 @@ def grpc_action(
     message_name_constructor_class: type[MessageNameConstructor] = None,
     use_generation_plugins: list["BaseGenerationPlugin"] = None,
     override_default_generation_plugins: bool = False,
+    read_only: bool = False,
+    compression: str | None = None,
 ):
     """
     Easily register a grpc action into the registry to generate it into the proto file.
@@ -84,6 +87,8 @@ def grpc_action(
     :param use_response_list: If true the response message is encapsuled in a list message. Default to false
     :param message_name_constructor_class: The class used to generate the name of the model. Inherit from MessageNameConstructor and chnage logic to have highly customizable name generation.
     :param use_generation_plugins: List of generation plugin to use to customize the message.
+    :param read_only: If true the action does not write in the database and can be routed to a read replica by ReadReplicaRouter. Default to false
+    :param compression: Algorithm ("gzip", "deflate" or "none") used by compression_middleware to compress the responses. Default to RESPONSE_COMPRESSION setting
     """
 
     # INFO - AM - 03/12/2024 - transform old arguments to the correct plugins.
@@ -108,6 +113,8 @@ def grpc_action(
             message_name_constructor_class=message_name_constructor_class
             or grpc_settings.DEFAULT_MESSAGE_NAME_CONSTRUCTOR,
             use_generation_plugins=use_generation_plugins,
+            read_only=read_only,
+            compression=compression,
         )
 
     return wrapper
@@ -13,7 +13,8 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from grpc import StatusCode
 from rest_framework import status
-from rest_framework.exceptions import APIException
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.settings import api_settings
 
 
 class ProtobufGenerationException(Exception):
@@ -36,6 +37,26 @@ class ProtobufGenerationException(Exception):
 LOGGING_LEVEL = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
 
+STATUS_DETAILS_METADATA_KEY = "grpc-status-details-bin"
+"""
+Trailing metadata key of the serialized ``google.rpc.Status``, read by the gRPC clients supporting rich error details.
+"""
+
+
+ERROR_INFO_DOMAIN = "django-socio-grpc"
+
+
+# INFO - The reason of a FieldViolation only exists since googleapis-common-protos 1.66
+try:
+    from google.rpc import error_details_pb2
+
+    FIELD_VIOLATION_HAS_REASON = (
+        "reason" in error_details_pb2.BadRequest.FieldViolation.DESCRIPTOR.fields_by_name
+    )
+except ImportError:
+    FIELD_VIOLATION_HAS_REASON = False
+
+
 class GRPCException(APIException):
     """
     Base class for DSG exceptions.
@@ -107,6 +128,16 @@ class Unimplemented(GRPCException):
     default_code = "unimplemented"
 
 
+class ResourceExhausted(GRPCException):
+    """
+    Subclass of GRPCException representing the RESOURCE_EXHAUSTED gRPC status code. It indicates that a resource or a quota has been exhausted.
+    """
+
+    status_code = StatusCode.RESOURCE_EXHAUSTED
+    default_detail = _("Resource exhausted.")
+    default_code = "resource_exhausted"
+
+
 def get_exception_status_code_and_details(exc: Exception) -> tuple[grpc.StatusCode, str]:
     """
     Get the gRPC status code and details from the exception.
@@ -127,6 +158,82 @@ def get_exception_status_code_and_details(exc: Exception) -> tuple[grpc.StatusCo
         return grpc.StatusCode.UNKNOWN, details
 
 
+def get_exception_status(exc: Exception) -> tuple[grpc.StatusCode, str, tuple]:
+    """
+    Get the gRPC status code, details and trailing metadata of the exception according to ERROR_DETAILS_FORMAT.
+    """
+    from django_socio_grpc.settings import ErrorDetailsFormatOptions, grpc_settings
+
+    if grpc_settings.ERROR_DETAILS_FORMAT != ErrorDetailsFormatOptions.STRUCTURED:
+        return *get_exception_status_code_and_details(exc), ()
+
+    status_code, details = get_exception_structured_details(exc)
+    rpc_status = get_exception_rpc_status(exc, status_code, details)
+    return (
+        status_code,
+        details,
+        ((STATUS_DETAILS_METADATA_KEY, rpc_status.SerializeToString()),),
+    )
+
+
+def get_exception_structured_details(exc: Exception) -> tuple[grpc.StatusCode, str]:
+    """
+    Same as `get_exception_status_code_and_details` but the details are a short message instead of the JSON of the full details.
+    """
+    if not isinstance(exc, APIException):
+        return get_exception_status_code_and_details(exc)
+
+    status_code = exc.status_code
+    if not isinstance(status_code, grpc.StatusCode):
+        status_code = HTTP_CODE_TO_GRPC_CODE.get(status_code, grpc.StatusCode.UNKNOWN)
+    if isinstance(exc.detail, str):
+        return status_code, str(exc.detail)
+    return status_code, str(exc.default_detail)
+
+
+def get_exception_rpc_status(exc: Exception, status_code: grpc.StatusCode, details: str):
+    """
+    Build the ``google.rpc.Status`` of the exception.
+    The field errors of a ValidationError are ``google.rpc.BadRequest.FieldViolation``, other APIException have a ``google.rpc.ErrorInfo``.
+    """
+    from google.rpc import error_details_pb2, status_pb2
+
+    rpc_status = status_pb2.Status(code=status_code.value[0], message=details)
+    if isinstance(exc, ValidationError):
+        bad_request = error_details_pb2.BadRequest()
+        add_field_violations(bad_request, exc.detail)
+        rpc_status.details.add().Pack(bad_request)
+    elif isinstance(exc, APIException):
+        code = getattr(exc.detail, "code", None) or exc.default_code
+        rpc_status.details.add().Pack(
+            error_details_pb2.ErrorInfo(reason=str(code), domain=ERROR_INFO_DOMAIN)
+        )
+    return rpc_status
+
+
+def add_field_violations(bad_request, detail, field: str = ""):
+    """
+    Add a FieldViolation to the BadRequest for each error of a ValidationError detail.
+    The field of nested errors is a path like ``items[0].name``. Errors not related to a field have an empty field.
+    """
+    if isinstance(detail, dict):
+        for key, value in detail.items():
+            if key == api_settings.NON_FIELD_ERRORS_KEY:
+                add_field_violations(bad_request, value, field)
+            else:
+                add_field_violations(bad_request, value, f"{field}.{key}" if field else key)
+    elif isinstance(detail, list):
+        for index, value in enumerate(detail):
+            if isinstance(value, dict | list):
+                add_field_violations(bad_request, value, f"{field}[{index}]")
+            else:
+                add_field_violations(bad_request, value, field)
+    else:
+        violation = bad_request.field_violations.add(field=field, description=str(detail))
+        if FIELD_VIOLATION_HAS_REASON:
+            violation.reason = getattr(detail, "code", None) or ""
+
+
 HTTP_CODE_TO_GRPC_CODE = {
     status.HTTP_400_BAD_REQUEST: StatusCode.INVALID_ARGUMENT,
     status.HTTP_401_UNAUTHORIZED: StatusCode.UNAUTHENTICATED,
@@ -1,7 +1,54 @@
+import threading
+from collections import OrderedDict
+
+from rest_framework.filters import BaseFilterBackend
 from rest_framework.filters import OrderingFilter as RestOrderingFilter
 
 
+def get_filter_params(request) -> dict:
+    """
+    Return the filters of the request decoded once from the `filters` metadata and/or the `_filters` request field.
+    Values keep their type (number, bool, list, dict) instead of being strings of a query string.
+    """
+    filter_params = getattr(request, "filter_params", None)
+    if filter_params is None:
+        return request.query_params
+    return filter_params
+
+
+class GRPCFilterBackend(BaseFilterBackend):
+    """
+    Base class of the filter backends working on the typed filters of the gRPC request
+    instead of the query params of an HTTP request.
+
+    Subclasses implement `filter_queryset_from_params`.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        return self.filter_queryset_from_params(
+            get_filter_params(request), request, queryset, view
+        )
+
+    def filter_queryset_from_params(self, filter_params: dict, request, queryset, view):
+        raise NotImplementedError(".filter_queryset_from_params() must be overridden.")
+
+
 class OrderingFilter(RestOrderingFilter):
+    """
+    DRF OrderingFilter accepting arrays of fields and caching the validation of the requested orderings.
+
+    The valid ordering fields are computed once by service class and serializer class (or ordering_fields)
+    and the last `ordering_cache_size` requested orderings of each of them are kept already validated.
+    Set `cache_ordering` to False if the valid fields depend on the request.
+    """
+
+    cache_ordering = True
+    ordering_cache_size = 128
+
+    _valid_fields_cache: dict = {}
+    _ordering_caches: dict = {}
+    _cache_lock = threading.Lock()
+
     def get_ordering(self, request, queryset, view):
         """
         Allow ordering with direct array value as grpc can pass array directly for ordering
@@ -15,12 +62,93 @@ class OrderingFilter(RestOrderingFilter):
         """
         params = request.query_params.get(self.ordering_param)
         if params:
-            if isinstance(params, str):
-                params = params.split(",")
-            fields = [param.strip() for param in params]
-            ordering = self.remove_invalid_fields(queryset, fields, view, request)
+            if self.cache_ordering:
+                ordering = self.get_cached_ordering(params, queryset, view, request)
+            else:
+                ordering = self.remove_invalid_fields(
+                    queryset, self.split_ordering_params(params), view, request
+                )
             if ordering:
-                return ordering
+                return list(ordering)
 
         # No ordering was included, or all the ordering fields were invalid
         return self.get_default_ordering(view)
+
+    def split_ordering_params(self, params: str | list) -> list[str]:
+        # INFO - Arrays sent with gRPC do not need to be split
+        if isinstance(params, str):
+            params = params.split(",")
+        return [param.strip() for param in params]
+
+    def get_cached_ordering(self, params: str | list, queryset, view, request) -> tuple:
+        ordering_cache = self.get_ordering_cache(
+            self.get_valid_fields_cache_key(queryset, view)
+        )
+        params_key = params if isinstance(params, str) else tuple(params)
+        with self._cache_lock:
+            ordering = ordering_cache.get(params_key)
+            if ordering is not None:
+                ordering_cache.move_to_end(params_key)
+                return ordering
+
+        ordering = tuple(
+            self.remove_invalid_fields(
+                queryset, self.split_ordering_params(params), view, request
+            )
+        )
+        with self._cache_lock:
+            ordering_cache[params_key] = ordering
+            while len(ordering_cache) > self.ordering_cache_size:
+                ordering_cache.popitem(last=False)
+        return ordering
+
+    def get_ordering_cache(self, valid_fields_key: tuple) -> OrderedDict:
+        with self._cache_lock:
+            return self._ordering_caches.setdefault(valid_fields_key, OrderedDict())
+
+    def get_valid_fields_cache_key(self, queryset, view) -> tuple:
+        """
+        Key identifying the valid fields returned by `get_valid_fields` without computing them.
+        """
+        valid_fields = getattr(view, "ordering_fields", self.ordering_fields)
+        if valid_fields is None:
+            # INFO - The valid fields are the fields of the serializer
+            try:
+                serializer_class = view.get_serializer_class()
+            except (AttributeError, AssertionError):
+                serializer_class = getattr(view, "serializer_class", None)
+            return (type(self), type(view), serializer_class)
+        if valid_fields == "__all__":
+            return (
+                type(self),
+                type(view),
+                queryset.model,
+                tuple(queryset.query.annotations),
+            )
+        return (type(self), type(view), repr(valid_fields))
+
+    def get_valid_field_names(self, queryset, view, request) -> frozenset[str]:
+        if not self.cache_ordering:
+            return frozenset(
+                item[0] for item in self.get_valid_fields(queryset, view, {"request": request})
+            )
+
+        key = self.get_valid_fields_cache_key(queryset, view)
+        valid_field_names = self._valid_fields_cache.get(key)
+        if valid_field_names is None:
+            valid_field_names = frozenset(
+                item[0] for item in self.get_valid_fields(queryset, view, {"request": request})
+            )
+            with self._cache_lock:
+                self._valid_fields_cache[key] = valid_field_names
+        return valid_field_names
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        valid_field_names = self.get_valid_field_names(queryset, view, request)
+        return [term for term in fields if term.removeprefix("-") in valid_field_names]
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._valid_fields_cache.clear()
+            cls._ordering_caches.clear()
@@ -0,0 +1,233 @@
+"""
+Compile the typed filter message generated by ``FilterSetGenerationPlugin`` into a ``Q`` object.
+
+The lookups and value converters of each filter of a FilterSet are computed once and cached,
+so filtering a request only converts the fields set in the message instead of building
+and validating the django-filter form.
+
+Requires `django-filter <https://django-filter.readthedocs.io>`_.
+"""
+
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from django_filters import filters as django_filters
+from django_filters.rest_framework import DjangoFilterBackend
+from django_filters.utils import get_model_field
+from google.protobuf.message import Message
+from rest_framework.exceptions import ValidationError
+
+from django_socio_grpc.protobuf.typing import FieldCardinality
+
+# Lookups whose value is not of the type of the model field
+INTEGER_TRANSFORM_LOOKUPS = {
+    "year",
+    "iso_year",
+    "month",
+    "day",
+    "week",
+    "week_day",
+    "iso_week_day",
+    "quarter",
+    "hour",
+    "minute",
+    "second",
+}
+LIST_LOOKUPS = {"in", "range"}
+# Filtering methods that only apply the lookup to the value and can be compiled.
+# Filters overriding filter() (ChoiceFilter, RangeFilter, OrderingFilter, ...) need the FilterSet form.
+COMPILABLE_FILTER_METHODS = (
+    django_filters.Filter.filter,
+    django_filters.MultipleChoiceFilter.filter,
+)
+
+
+@dataclass
+class CompiledFilter:
+    """
+    Precomputed lookup and value converter of a filter of a FilterSet.
+    """
+
+    name: str
+    lookup: str
+    proto_type: str
+    cardinality: FieldCardinality
+    convert: Callable[[Any], Any]
+    exclude: bool = False
+    distinct: bool = False
+    multiple: bool = False
+    conjoined: bool = False
+
+    @staticmethod
+    def is_compilable(filter: django_filters.Filter) -> bool:
+        """
+        Return if the filter can be expressed as its lookup on the converted value.
+        """
+        return filter.method is None and type(filter).filter in COMPILABLE_FILTER_METHODS
+
+    @classmethod
+    def from_filter(cls, name: str, filter: django_filters.Filter, model) -> "CompiledFilter":
+        from django_socio_grpc.protobuf.proto_classes import get_proto_type
+
+        lookup_expr = filter.lookup_expr
+        # INFO - "year__gte" is the "gte" lookup on the "year" transform
+        lookup_parts = lookup_expr.split("__")
+        transform, lookup = lookup_parts[0], lookup_parts[-1]
+        model_field = get_model_field(model, filter.field_name) if model else None
+        # INFO - Relations are filtered with the value of the primary key of the related model
+        if model_field is not None and model_field.is_relation:
+            model_field = model_field.target_field
+
+        if lookup == "isnull" or isinstance(filter, django_filters.BooleanFilter):
+            proto_type, convert = "bool", bool
+        elif transform in INTEGER_TRANSFORM_LOOKUPS:
+            proto_type, convert = "int32", int
+        elif model_field is not None:
+            proto_type, convert = get_proto_type(model_field), model_field.to_python
+        elif isinstance(filter, django_filters.NumberFilter):
+            proto_type, convert = "double", filter.field_class().to_python
+        else:
+            proto_type, convert = "string", str
+
+        cardinality = FieldCardinality.OPTIONAL
+        # INFO - Each value of a MultipleChoiceFilter is a lookup, joined with OR (AND if conjoined)
+        multiple = isinstance(filter, django_filters.MultipleChoiceFilter)
+        if (
+            multiple
+            or lookup in LIST_LOOKUPS
+            or isinstance(filter, django_filters.BaseCSVFilter)
+        ):
+            cardinality = FieldCardinality.REPEATED
+            if not multiple:
+                convert = cls.list_converter(convert)
+
+        return cls(
+            name=name,
+            lookup=f"{filter.field_name}__{lookup_expr}",
+            proto_type=proto_type,
+            cardinality=cardinality,
+            convert=convert,
+            exclude=filter.exclude,
+            distinct=filter.distinct,
+            multiple=multiple,
+            conjoined=getattr(filter, "conjoined", False),
+        )
+
+    @staticmethod
+    def list_converter(convert: Callable[[Any], Any]) -> Callable[[Any], list]:
+        def convert_list(values):
+            return [convert(value) for value in values]
+
+        return convert_list
+
+    def to_q(self, value) -> Q:
+        if self.multiple:
+            q = Q()
+            for item in value:
+                item_q = Q(**{self.lookup: self.convert(item)})
+                q = q & item_q if self.conjoined else q | item_q
+        else:
+            q = Q(**{self.lookup: self.convert(value)})
+        return ~q if self.exclude else q
+
+
+class FilterSetCompiler:
+    """
+    Turn a typed filter message into a ``Q`` object for a FilterSet class.
+    Filters declared with a ``method`` or overriding ``filter()`` can not be expressed
+    as a lookup and are not compiled: they are only available through the FilterSet form.
+    """
+
+    def __init__(self, filterset_class):
+        self.filterset_class = filterset_class
+        model = filterset_class._meta.model
+        self.compiled_filters = {
+            name: CompiledFilter.from_filter(name, filter, model)
+            for name, filter in filterset_class.base_filters.items()
+            if CompiledFilter.is_compilable(filter)
+        }
+
+    def compile(self, filterset_message: Message) -> tuple[Q, bool]:
+        """
+        Return the ``Q`` object of the fields set in the message and if the queryset needs to be distinct.
+        Raise a ValidationError if a value can not be converted to its model field type.
+        """
+        q = Q()
+        distinct = False
+        errors = {}
+        # INFO - ListFields only return the fields that are set, so unset filters cost nothing
+        for field_descriptor, value in filterset_message.ListFields():
+            compiled_filter = self.compiled_filters.get(field_descriptor.name)
+            if compiled_filter is None:
+                continue
+            try:
+                q &= compiled_filter.to_q(value)
+            except (DjangoValidationError, TypeError, ValueError) as e:
+                errors[compiled_filter.name] = getattr(e, "messages", [str(e)])
+                continue
+            distinct = distinct or compiled_filter.distinct
+        if errors:
+            raise ValidationError(errors)
+        return q, distinct
+
+    def filter_queryset(self, queryset, filterset_message: Message):
+        q, distinct = self.compile(filterset_message)
+        queryset = queryset.filter(q)
+        return queryset.distinct() if distinct else queryset
+
+
+class FilterSetCompilerCache:
+    """
+    Keep one FilterSetCompiler by service class and model.
+    The compiler is rebuilt if the filterset_class or filterset_fields of the service change.
+    """
+
+    def __init__(self):
+        self._compilers = {}
+        self._lock = threading.Lock()
+
+    def get(self, backend: DjangoFilterBackend, view, queryset) -> FilterSetCompiler | None:
+        model = getattr(queryset, "model", None)
+        key = (type(view), model)
+        declaration = (
+            getattr(view, "filterset_class", None),
+            repr(getattr(view, "filterset_fields", None)),
+        )
+        cached = self._compilers.get(key)
+        if cached is not None and cached[0] == declaration:
+            return cached[1]
+
+        filterset_class = backend.get_filterset_class(view, queryset)
+        compiler = FilterSetCompiler(filterset_class) if filterset_class else None
+        with self._lock:
+            self._compilers[key] = (declaration, compiler)
+        return compiler
+
+    def clear(self):
+        with self._lock:
+            self._compilers.clear()
+
+
+filterset_compiler_cache = FilterSetCompilerCache()
+
+
+class FilterSetCompilerBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend filtering with the typed ``_filterset`` field of the request when it is set.
+    The ``_filters`` struct and the ``filters`` metadata keep being validated by the django-filter form.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_message = getattr(request, "filterset_message", None)
+        if filterset_message is not None:
+            compiler = filterset_compiler_cache.get(self, view, queryset)
+            if compiler is not None:
+                queryset = compiler.filter_queryset(queryset, filterset_message)
+
+        if filterset_message is None or getattr(request, "filter_params", None):
+            queryset = super().filter_queryset(request, queryset, view)
+        return queryset
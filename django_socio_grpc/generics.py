@@ -1,8 +1,10 @@
-import asyncio
 import logging
 
-from asgiref.sync import async_to_sync, sync_to_async
-from django.core.exceptions import ValidationError
+from asgiref.sync import async_to_sync
+from django.core.exceptions import (
+    ObjectDoesNotExist,
+    ValidationError,
+)
 from django.db.models.query import QuerySet
 from django.http import Http404
 from django.shortcuts import get_object_or_404
@@ -14,6 +16,7 @@ from django_socio_grpc.exceptions import NotFound
 from django_socio_grpc.proto_serializers import ProtoSerializer
 from django_socio_grpc.settings import grpc_settings
 from django_socio_grpc.utils import model_meta
+from django_socio_grpc.utils.executors import sync_to_async
 from django_socio_grpc.utils.tools import rreplace
 
 logger = logging.getLogger("django_socio_grpc.services")
@@ -39,6 +42,15 @@ class GenericService(services.Service):
 
     service_name: str | None = None
 
+    # Call ``get_queryset()`` and the serializer initialization directly in the event loop instead of in a thread
+    # in the async mixins. Only set it if they never do any I/O, like database queries
+    call_sync_methods_in_event_loop: bool = False
+
+    _component_attributes = {
+        **services.Service._component_attributes,
+        "filter_backends": ("filter_queryset",),
+    }
+
     @classmethod
     def get_service_name(cls):
         if cls.service_name:
@@ -73,6 +85,16 @@ class GenericService(services.Service):
             queryset = queryset.all()
         return queryset
 
+    async def aget_queryset(self):
+        """
+        Async version of ``get_queryset()``.
+        ``get_queryset()`` can query the database so it is called in a thread,
+        unless ``call_sync_methods_in_event_loop`` is set.
+        """
+        if self.call_sync_methods_in_event_loop:
+            return self.get_queryset()
+        return await sync_to_async(self.get_queryset)()
+
     def get_serializer_class(self):
         """
         Return the class to use for the serializer. Defaults to using
@@ -121,7 +143,7 @@ class GenericService(services.Service):
         Defaults to using the lookup_field parameter to filter the base
         queryset.
         """
-        queryset = await sync_to_async(self.get_queryset)()
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
         lookup_request_field = self.get_lookup_request_field(queryset)
         assert hasattr(self.request, lookup_request_field), (
@@ -132,8 +154,8 @@ class GenericService(services.Service):
         lookup_value = getattr(self.request, lookup_request_field)
         filter_kwargs = {lookup_request_field: lookup_value}
         try:
-            obj = await sync_to_async(get_object_or_404)(queryset, **filter_kwargs)
-        except (TypeError, ValueError, ValidationError, Http404) as e:
+            obj = await queryset.aget(**filter_kwargs)
+        except (TypeError, ValueError, ValidationError, ObjectDoesNotExist) as e:
             raise NotFound(
                 detail=f"{queryset.model.__name__}: {lookup_value} not found!"
             ) from e
@@ -152,6 +174,9 @@ class GenericService(services.Service):
     async def aget_serializer(self, *args, **kwargs):
         serializer_class = self.get_serializer_class()
         kwargs.setdefault("context", self.get_serializer_context())
+        # A customized serializer initialization can query the database
+        if self.call_sync_methods_in_event_loop:
+            return serializer_class(*args, **kwargs)
         return await sync_to_async(serializer_class)(*args, **kwargs)
 
     def get_serializer_context(self):
@@ -174,13 +199,11 @@ class GenericService(services.Service):
                 "You have defined a custom afilter_queryset method but you are using sync mixins. Sync mixin use the method filter_queryset. If you want to keep this filtering logic please rename your method"
             )
 
-        for backend in list(self.filter_backends):
-            if asyncio.iscoroutinefunction(backend().filter_queryset):
-                queryset = async_to_sync(backend().filter_queryset)(
-                    self.context, queryset, self
-                )
+        for backend, is_async in self.get_component_instances("filter_backends"):
+            if is_async:
+                queryset = async_to_sync(backend.filter_queryset)(self.context, queryset, self)
             else:
-                queryset = backend().filter_queryset(self.context, queryset, self)
+                queryset = backend.filter_queryset(self.context, queryset, self)
         return queryset
 
     async def afilter_queryset(self, queryset):
@@ -192,11 +215,11 @@ class GenericService(services.Service):
                 "You have defined a custom filter_queryset method but you are using async mixins. Async mixin use the method afilter_queryset. If you want to keep this filtering logic please rename your method"
             )
 
-        for backend in list(self.filter_backends):
-            if asyncio.iscoroutinefunction(backend().filter_queryset):
-                queryset = await backend().filter_queryset(self.context, queryset, self)
+        for backend, is_async in self.get_component_instances("filter_backends"):
+            if is_async:
+                queryset = await backend.filter_queryset(self.context, queryset, self)
             else:
-                queryset = await sync_to_async(backend().filter_queryset)(
+                queryset = await sync_to_async(backend.filter_queryset)(
                     self.context, queryset, self
                 )
         return queryset
@@ -221,6 +244,14 @@ class GenericService(services.Service):
             return None
         return self.paginator.paginate_queryset(queryset, self.context, view=self)
 
+    async def apaginate_queryset(self, queryset):
+        """
+        Async version of ``paginate_queryset()``. Only the pagination classes are run in a thread.
+        """
+        if self.paginator is None:
+            return None
+        return await sync_to_async(self.paginate_queryset)(queryset)
+
 
 ############################################################
 #   Synchronous Service                                    #
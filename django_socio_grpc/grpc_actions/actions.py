@@ -40,6 +40,7 @@ import abc
 import asyncio
 import functools
 import logging
+import threading
 from asyncio.coroutines import _is_coroutine
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -48,6 +49,7 @@ from typing import TYPE_CHECKING, Any
 from asgiref.sync import SyncToAsync
 from rest_framework.serializers import BaseSerializer
 
+from django_socio_grpc.compression import COMPRESSION_ALGORITHMS
 from django_socio_grpc.protobuf.exceptions import ProtoRegistrationError
 from django_socio_grpc.protobuf.generation_plugin import BaseGenerationPlugin
 from django_socio_grpc.protobuf.message_name_constructor import MessageNameConstructor
@@ -70,6 +72,9 @@ from .placeholders import Placeholder
 
 logger = logging.getLogger("django_scoio_grpc.generation")
 
+# INFO - Lazily registered actions can be built by several requests at the same time
+_lazy_registration_lock = threading.RLock()
+
 if TYPE_CHECKING:
     from django_socio_grpc.services import Service
 
@@ -92,13 +97,23 @@ class GRPCAction:
     use_generation_plugins: list[BaseGenerationPlugin] = field(
         default_factory=grpc_settings.DEFAULT_GENERATION_PLUGINS.copy
     )
+    read_only: bool = False
+    # Algorithm used by compression_middleware for the responses, see COMPRESSION_ALGORITHMS
+    compression: str | None = None
 
     proto_rpc: ProtoRpc | None = field(init=False, default=None)
+    # Service and name of the action if its proto rpc is built on first use
+    lazy_registration: tuple[type["Service"], str] | None = field(
+        init=False, default=None, repr=False
+    )
 
     def __post_init__(self):
         assert issubclass(
             self.message_name_constructor_class, MessageNameConstructor
         ), "message_name_constructor_class need to be a subclass of MessageNameConstructor"
+        assert (
+            self.compression is None or self.compression in COMPRESSION_ALGORITHMS
+        ), f"compression need to be None or one of {', '.join(COMPRESSION_ALGORITHMS)}"
         if isinstance(self.function, SyncToAsync):
             base_function = self.function
 
@@ -144,19 +159,21 @@ class GRPCAction:
             "response_stream": self.response_stream,
             "message_name_constructor_class": self.message_name_constructor_class,
             "use_generation_plugins": self.use_generation_plugins,
+            "read_only": self.read_only,
+            "compression": self.compression,
         }
 
     @property
     def request_message_name(self) -> str | None:
         try:
-            return self.proto_rpc.request_name
+            return self.get_proto_rpc().request_name
         except AttributeError:
             return None
 
     @property
     def response_message_name(self) -> str | None:
         try:
-            return self.proto_rpc.response_name
+            return self.get_proto_rpc().response_name
         except AttributeError:
             return None
 
@@ -222,7 +239,24 @@ class GRPCAction:
             response_stream=self.response_stream,
         )
 
-    def register(self, owner: type["Service"], action_name: str):
+    def register(self, owner: type["Service"], action_name: str, lazy: bool = False):
+        """
+        Set the action on the service. If lazy, resolving the placeholders and building the proto rpc
+        is postponed until the proto rpc is needed, see `get_proto_rpc`.
+        """
+        if lazy:
+            self.lazy_registration = (owner, action_name)
+            self.proto_rpc = None
+        else:
+            self.lazy_registration = None
+            self.register_proto_rpc(owner, action_name)
+
+        setattr(owner, action_name, self)
+
+        # INFO - AM - 22/08/2024 - Send a signal to notify that a grpc action has been created. Used for now in cache deleter
+        grpc_action_register.send(sender=self, owner=owner, name=action_name)
+
+    def register_proto_rpc(self, owner: type["Service"], action_name: str):
         # INFO - AM - 29/12/2023 - (PROTO_DEBUG, step: 10, method: register) allow to print the service and action being registered before displaying the proto
         ProtoGeneratorPrintHelper.reset()
         ProtoGeneratorPrintHelper.set_service_and_action(
@@ -243,10 +277,20 @@ class GRPCAction:
 
         owner.proto_service.add_rpc(self.proto_rpc)
 
-        setattr(owner, action_name, self)
-
-        # INFO - AM - 22/08/2024 - Send a signal to notify that a grpc action has been created. Used for now in cache deleter
-        grpc_action_register.send(sender=self, owner=owner, name=action_name)
+    def get_proto_rpc(self) -> ProtoRpc | None:
+        """
+        Return the proto rpc of the action, building it first if the action was registered lazily.
+        """
+        if self.proto_rpc is None and self.lazy_registration is not None:
+            owner, action_name = self.lazy_registration
+            # INFO - Accessing the action from the service returns a clone, the proto rpc is
+            # built on the registered action to be shared by all its clones
+            registered_action = owner.__dict__.get(action_name, self)
+            with _lazy_registration_lock:
+                if registered_action.proto_rpc is None:
+                    registered_action.register_proto_rpc(owner, action_name)
+            self.proto_rpc = registered_action.proto_rpc
+        return self.proto_rpc
 
     def resolve_placeholders(self, service_class: type["Service"], action: str):
         """
@@ -275,10 +319,13 @@ class GRPCAction:
         fn = kwargs.pop("function", self.function)
         new_cls = self.__class__(fn, **kwargs)
         new_cls.proto_rpc = self.proto_rpc
+        new_cls.lazy_registration = self.lazy_registration
         return new_cls
 
 
-def register_action(cls, action_name: str, name: str | None = None, **kwargs):
+def register_action(
+    cls, action_name: str, name: str | None = None, lazy: bool = False, **kwargs
+):
     """
     Register action function_name of mixin and register them if they are decorated (so already a GRPCAction)
     or transform them into a GRPCAction before registering them
@@ -291,7 +338,7 @@ def register_action(cls, action_name: str, name: str | None = None, **kwargs):
     if not isinstance(action, GRPCAction):
         action = GRPCAction(action, **kwargs)
 
-    action.register(cls, name or getattr(action.function, "__name__", action_name))
+    action.register(cls, name or getattr(action.function, "__name__", action_name), lazy=lazy)
 
 
 class GRPCActionMixin(abc.ABC):
@@ -315,12 +362,16 @@ class GRPCActionMixin(abc.ABC):
                 base._before_registration(service_class or cls)
 
     @classmethod
-    def get_parents_action_registry(cls, service):
+    def get_parents_action_registry(cls, service=None):
         """
         Returns all the grpc action registries (decorated and dynamic) of all the parent mixin
+        If service is None, the service is only instantiated if a parent has a dynamic registry
         """
         registry = {}
 
+        if service is None and cls.has_dynamic_action_registry():
+            service = cls()
+
         for parent in cls.get_action_parents()[::-1]:
             # INFO - AM - 25/05/2022 - if the parent inherit from GRPCActionMixin it
             # will have _dynamic_grpc_action_registry (method) and
@@ -342,6 +393,17 @@ class GRPCActionMixin(abc.ABC):
             registry.update(cls._dynamic_grpc_action_registry(service))
         return registry
 
+    @classmethod
+    def has_dynamic_action_registry(cls) -> bool:
+        """
+        Returns True if a parent overrides `_dynamic_grpc_action_registry`
+        """
+        return any(
+            "_dynamic_grpc_action_registry" in parent.__dict__
+            for parent in cls.get_action_parents()
+            if parent is not GRPCActionMixin
+        )
+
     @classmethod
     def get_action_parents(cls):
         """
@@ -350,14 +412,25 @@ class GRPCActionMixin(abc.ABC):
         return [base for base in cls.mro() if issubclass(base, GRPCActionMixin)]
 
     @classmethod
-    def register_actions(cls):
+    def register_actions(cls, lazy: bool = False):
         """
         Call the `_before_registration` method of all the parents
         Then iterate over the action registry and register the grpc actions
+        If lazy, the proto rpcs of the actions are only built when they are needed
+        and the service is not instantiated unless a parent has a dynamic registry
         """
         cls.before_registration()
-        for action, kwargs in cls.get_parents_action_registry(cls()).items():
-            register_action(cls, action, **kwargs)
+        for action, kwargs in cls.get_parents_action_registry().items():
+            register_action(cls, action, lazy=lazy, **kwargs)
+
+    @classmethod
+    def register_lazy_actions(cls):
+        """
+        Build the proto rpcs of the actions registered lazily that are not built yet
+        """
+        for attribute in list(cls.__dict__.values()):
+            if isinstance(attribute, GRPCAction):
+                attribute.get_proto_rpc()
 
     def _before_registration(service_class):
         """
@@ -2,13 +2,20 @@
 logging utils
 """
 
+import atexit
 import logging
 import logging.config
-from typing import TYPE_CHECKING
+import queue
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from django_socio_grpc.generics import GenericService
 
+logger = logging.getLogger("django_socio_grpc.log")
+
 
 def default_get_log_extra_context(service: "GenericService"):
     """
@@ -45,12 +52,124 @@ def set_log_record_factory():
         record.grpc_action = ""
         record.grpc_user_pk = ""
 
-        if hasattr(servicer_ctx, "service"):
+        # INFO - Set by RequestLogQueue, the service of the request is not kept by the queued events
+        log_extra_context = getattr(servicer_ctx, "log_extra_context", None)
+        if log_extra_context is None and hasattr(servicer_ctx, "service"):
             log_extra_context = default_get_log_extra_context(servicer_ctx.service)
-
-            for key, value in log_extra_context.items():
-                setattr(record, key, value)
+        if log_extra_context is not None:
+            record.__dict__.update(log_extra_context)
 
         return record
 
     logging.setLogRecordFactory(record_factory)
+
+
+class RequestLogEvent(NamedTuple):
+    """
+    What is needed to log the response of a request. The message and extra are only built when it is emitted.
+    The service, the context and the request are not referenced by the event. The exception is kept with
+    its traceback, whose frames can still reference them until the event is emitted.
+    """
+
+    emit: Callable[["RequestLogEvent"], None]
+    service_name: str
+    action: str
+    user_pk: object
+    exception: Exception | None
+    status_code: object
+    duration: float
+    level: int
+
+    def get_log_extra_context(self) -> dict:
+        """
+        Same as default_get_log_extra_context for the service of the request.
+        """
+        extra_context = {"grpc_service_name": self.service_name, "grpc_action": self.action}
+        if self.user_pk is not None:
+            extra_context["grpc_user_pk"] = self.user_pk
+        return extra_context
+
+
+class RequestLogQueue:
+    """
+    Bounded queue of RequestLogEvent emitted by a background thread, by batches of LOG_QUEUE_BATCH_SIZE.
+    Used instead of logging the responses in the request thread when LOG_QUEUE_SIZE is set.
+    Events are dropped when the queue is full.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._dropped_count_lock = threading.Lock()
+        self.dropped_count = 0
+
+    def put(self, event: RequestLogEvent, max_size: int):
+        if self._thread is None:
+            self._start(max_size)
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            # INFO - put is called from the event loop and from the threads of the sync server
+            with self._dropped_count_lock:
+                self.dropped_count += 1
+
+    def _start(self, max_size: int):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._queue = queue.Queue(maxsize=max_size)
+            self._thread = threading.Thread(
+                target=self._run, name="dsg-request-log", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _run(self):
+        from django_socio_grpc.settings import grpc_settings
+
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < grpc_settings.LOG_QUEUE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for event in batch:
+                try:
+                    self.emit(event)
+                except Exception:
+                    logger.exception("Unable to log a request")
+            with self._dropped_count_lock:
+                dropped_count, self.dropped_count = self.dropped_count, 0
+            if dropped_count:
+                logger.warning(
+                    f"{dropped_count} request logs dropped because LOG_QUEUE_SIZE was reached"
+                )
+            # INFO - Done only now so flush also waits for the warning of the dropped logs
+            for _ in batch:
+                self._queue.task_done()
+
+    def emit(self, event: RequestLogEvent):
+        from django_socio_grpc.services.servicer_proxy import get_servicer_context
+
+        # INFO - The servicer context allows the record factory of set_log_record_factory to find the extra context
+        servicer_ctx = get_servicer_context()
+        servicer_ctx.log_extra_context = event.get_log_extra_context()
+        try:
+            event.emit(event)
+        finally:
+            del servicer_ctx.log_extra_context
+
+    def flush(self, timeout: float = 5):
+        """
+        Wait until all the queued events are emitted or timeout seconds.
+        """
+        if self._queue is None:
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+
+request_log_queue = RequestLogQueue()
@@ -1,5 +1,6 @@
 import asyncio
 import os
+from concurrent.futures import ProcessPoolExecutor
 from importlib import resources
 from pathlib import Path
 
@@ -11,6 +12,7 @@ from grpc_tools import protoc
 from django_socio_grpc.exceptions import ProtobufGenerationException
 from django_socio_grpc.protobuf import RegistrySingleton
 from django_socio_grpc.protobuf.generators import RegistryToProtoGenerator
+from django_socio_grpc.protobuf.manifest import DEFAULT_MANIFEST_NAME, ProtoManifest
 from django_socio_grpc.settings import grpc_settings
 
 
@@ -24,6 +26,8 @@ def _get_resource_file_name(package_or_requirement: str, resource_name: str) ->
 class Command(BaseCommand):
     help = "Generates proto."
 
+    protoc_executor_class = ProcessPoolExecutor
+
     def add_arguments(self, parser):
         parser.add_argument(
             "--project",
@@ -67,6 +71,24 @@ class Command(BaseCommand):
             action="store_true",
             help="Do not follow old field number when generating. /!\\ this can lead to API breaking change.",
         )
+        parser.add_argument(
+            "--incremental",
+            "-i",
+            action="store_true",
+            help="Skip the apps whose registry did not change since the last generation recorded in the manifest",
+        )
+        parser.add_argument(
+            "--manifest",
+            default=None,
+            help=f"Manifest file of the incremental generation. Default is {DEFAULT_MANIFEST_NAME} in the BASE_DIR or in the --directory",
+        )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            default=1,
+            help="Number of processes compiling the proto files of the apps in parallel",
+        )
         parser.add_argument(
             "--extra-args",
             "-a",
@@ -107,50 +129,124 @@ class Command(BaseCommand):
             override_fields_number=options["override_fields_number"],
         )
 
+        # ------------------------------------------------------------
+        # ---- Skip the apps generated from the same registry      ---
+        # ------------------------------------------------------------
+        manifest = None
+        model_hashes = {}
+        up_to_date_apps = set()
+        # INFO - Overriding the fields number changes the proto even if the registry did not change
+        if options["incremental"] and not options["override_fields_number"]:
+            manifest = ProtoManifest.load(self.get_manifest_path(options["manifest"]))
+            for app_name, registry in registry_instance.registered_apps.items():
+                model_hashes[app_name] = generator.get_model_hash(registry)
+                file_path = generator.get_proto_path(registry, self.directory)
+                protoc_args = (
+                    self.get_protoc_args(file_path, options["extra_args"])
+                    if self.generate_pb2
+                    else None
+                )
+                if manifest.is_up_to_date(
+                    app_name, model_hashes[app_name], file_path, protoc_args
+                ):
+                    up_to_date_apps.add(app_name)
+
         # ------------------------------------------------------------
         # ---- Produce a proto file on current filesystem and Path ---
         # ------------------------------------------------------------
-        protos_by_app = generator.get_protos_by_app(directory=self.directory)
+        protos_by_app = generator.get_protos_by_app(
+            directory=self.directory, exclude_apps=up_to_date_apps
+        )
 
         if self.dry_run and not self.check:
             self.stdout.write(protos_by_app)
         # if no filepath specified we create it in a grpc directory in the app
         else:
-            if not protos_by_app.keys():
+            if not registry_instance.registered_apps:
                 raise ProtobufGenerationException(
                     detail="No Service registered. You should use "
                     "ROOT_HANDLERS_HOOK settings and register Service using AppHandlerRegistry."
                 )
+            for app_name in sorted(up_to_date_apps):
+                self.stdout.write(f"{app_name} is up to date, skipping it")
+
+            protoc_args_by_app = {}
             for app_name, proto in protos_by_app.items():
                 registry = RegistrySingleton().registered_apps[app_name]
 
-                if self.directory:
-                    file_path = self.directory / f"{app_name}.proto"
-                else:
-                    file_path = registry.get_proto_path()
+                file_path = generator.get_proto_path(registry, self.directory)
+                if not self.directory:
                     file_path.parent.mkdir(parents=True, exist_ok=True)
                 self.check_or_write(file_path, proto, registry.app_name)
 
                 if self.generate_pb2:
                     if not settings.BASE_DIR:
                         raise ProtobufGenerationException(detail="No BASE_DIR in settings")
-                    extra_args = options["extra_args"] if options["extra_args"] else ""
-                    # INFO - AM - 16/04/2024 - subprocess.run is safe because we are not using shell=True. Please do not change this. Unit test check this
-                    proto_include = _get_resource_file_name(
-                        "grpc_tools", "_proto"
-                    )  # See https://github.com/grpc/grpc/blob/master/tools/distrib/python/grpcio_tools/grpc_tools/protoc.py#L209
-                    protoc.main(
-                        [
-                            "",  # First comment is not taken into account as argv first argument is the command itself and its ignored by protoc
-                            f"--proto_path={settings.BASE_DIR}",
-                            "--python_out=./",
-                            "--grpc_python_out=./",
-                            *extra_args,
-                            str(file_path),
-                            f"-I{proto_include}",  # This come from https://github.com/grpc/grpc/blob/master/tools/distrib/python/grpcio_tools/grpc_tools/protoc.py#L210 and help protoc to import know proto as Struct or Empty
-                        ],
+                    protoc_args_by_app[app_name] = self.get_protoc_args(
+                        file_path, options["extra_args"]
                     )
 
+            return_codes = self.run_protoc(protoc_args_by_app, options["jobs"])
+
+            if manifest is not None and not self.check:
+                for app_name, proto in protos_by_app.items():
+                    if return_codes.get(app_name, 0) != 0:
+                        continue
+                    manifest.update(
+                        app_name,
+                        model_hashes[app_name],
+                        proto,
+                        protoc_args_by_app.get(app_name),
+                    )
+                manifest.save()
+
+    def get_manifest_path(self, manifest_path: str | None) -> Path:
+        if manifest_path:
+            return Path(manifest_path)
+        return Path(self.directory or settings.BASE_DIR) / DEFAULT_MANIFEST_NAME
+
+    def get_protoc_args(self, file_path: Path, extra_args: list[str] | None) -> list[str]:
+        # INFO - AM - 16/04/2024 - subprocess.run is safe because we are not using shell=True. Please do not change this. Unit test check this
+        proto_include = _get_resource_file_name(
+            "grpc_tools", "_proto"
+        )  # See https://github.com/grpc/grpc/blob/master/tools/distrib/python/grpcio_tools/grpc_tools/protoc.py#L209
+        return [
+            "",  # First comment is not taken into account as argv first argument is the command itself and its ignored by protoc
+            f"--proto_path={settings.BASE_DIR}",
+            "--python_out=./",
+            "--grpc_python_out=./",
+            *(extra_args or []),
+            str(file_path),
+            f"-I{proto_include}",  # This come from https://github.com/grpc/grpc/blob/master/tools/distrib/python/grpcio_tools/grpc_tools/protoc.py#L210 and help protoc to import know proto as Struct or Empty
+        ]
+
+    def run_protoc(
+        self, protoc_args_by_app: dict[str, list[str]], jobs: int
+    ) -> dict[str, int]:
+        """
+        Compile the proto files, in jobs worker processes if there are more than one,
+        and return the exit code of protoc for each app.
+        """
+        if jobs > 1 and len(protoc_args_by_app) > 1:
+            with self.protoc_executor_class(max_workers=jobs) as executor:
+                futures = {
+                    app_name: executor.submit(protoc.main, protoc_args)
+                    for app_name, protoc_args in protoc_args_by_app.items()
+                }
+                return_codes = {
+                    app_name: future.result() for app_name, future in futures.items()
+                }
+        else:
+            return_codes = {
+                app_name: protoc.main(protoc_args)
+                for app_name, protoc_args in protoc_args_by_app.items()
+            }
+
+        for app_name, return_code in return_codes.items():
+            if return_code != 0:
+                self.stderr.write(f"protoc failed for {app_name} with exit code {return_code}")
+        return return_codes
+
     def check_or_write(self, file: Path, proto, app_name):
         """
         Write the new generated proto to the corresponding file
@@ -0,0 +1,47 @@
+import json
+from concurrent import futures
+from dataclasses import asdict
+
+import grpc
+from django.core.management.base import BaseCommand
+
+from django_socio_grpc.utils.startup_profiler import PHASES, StartupProfiler
+
+
+class Command(BaseCommand):
+    help = "Times the phases of the startup of the gRPC server and prints the slowest ones."
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=20,
+            help="Number of the slowest settings, services, actions, serializers and plugins to print",
+        )
+        parser.add_argument(
+            "--phases",
+            nargs="+",
+            choices=PHASES,
+            help="Only print the slowest calls of these phases. Default prints all but root_handlers_hook",
+        )
+        parser.add_argument(
+            "--json",
+            dest="json_path",
+            help="JSON file where all the timings are saved",
+        )
+
+    def handle(self, *args, **options):
+        # INFO - The server is never started, it is only used to register the services
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+        profiler = StartupProfiler()
+        try:
+            profiler.profile_startup(server)
+        finally:
+            server.stop(None)
+
+        self.stdout.write(profiler.format_report(options["top"], options["phases"]))
+        if options["json_path"]:
+            with open(options["json_path"], "w") as json_file:
+                json.dump([asdict(timing) for timing in profiler.timings], json_file, indent=2)
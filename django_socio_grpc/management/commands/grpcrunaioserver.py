@@ -13,7 +13,8 @@ from django.core.management.base import BaseCommand
 from django.utils import autoreload
 from grpc_health.v1 import health, health_pb2_grpc
 
-from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.settings import AsyncExecutorOptions, grpc_settings
+from django_socio_grpc.utils.executors import set_thread_pool_executor
 from django_socio_grpc.utils.ssl_credentials import get_server_credentials
 
 logger = logging.getLogger("django_socio_grpc.internal")
@@ -78,8 +79,16 @@ class Command(BaseCommand):
                 extra={"emit_to_server": False},
             )
             server_launch_time = perf_counter()
+            executor = futures.ThreadPoolExecutor(max_workers=self.max_workers)
+            if (
+                grpc_settings.ASYNC_EXECUTOR == AsyncExecutorOptions.THREAD_POOL
+                and grpc_settings.ASYNC_EXECUTOR_MAX_WORKERS is None
+            ):
+                # The async server only use its executor for sync handlers so the sync code
+                # of async services can use the --max-workers threads
+                set_thread_pool_executor(executor)
             server = grpc.aio.server(
-                futures.ThreadPoolExecutor(max_workers=self.max_workers),
+                executor,
                 interceptors=grpc_settings.SERVER_INTERCEPTORS,
                 options=grpc_settings.SERVER_OPTIONS,
             )
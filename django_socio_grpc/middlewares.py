@@ -7,10 +7,12 @@ middlewares as sync and async compatible
 """
 
 import asyncio
+import inspect
 import logging
+import time
 from collections.abc import Callable
 
-from asgiref.sync import async_to_sync, sync_to_async
+from asgiref.sync import async_to_sync
 from django import db
 from django.utils import translation
 from django.utils.decorators import sync_and_async_middleware
@@ -18,6 +20,7 @@ from django.utils.translation import get_language_from_request
 
 from django_socio_grpc.services.servicer_proxy import GRPCRequestContainer
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.executors import sync_to_async
 from django_socio_grpc.utils.utils import safe_async_response
 
 logger = logging.getLogger("django_socio_grpc.middlewares")
@@ -146,3 +149,192 @@ def auth_without_session_middleware(get_response: Callable):
             return get_response(request)
 
     return middleware
+
+
+def _set_last_write_metadata(request: GRPCRequestContainer):
+    from django_socio_grpc.db_routers import has_written_database
+
+    if not has_written_database(request.service):
+        return
+    request.context.set_trailing_metadata(
+        tuple(request.context.trailing_metadata() or ())
+        + ((grpc_settings.READ_YOUR_WRITES_METADATA_KEY, f"{time.time():.6f}"),)
+    )
+
+
+@sync_and_async_middleware
+def read_your_writes_middleware(get_response: Callable):
+    """
+    Middleware to use with django_socio_grpc.db_routers.ReadReplicaRouter.
+    When the action wrote in the database, the time of the end of the action is sent in the
+    READ_YOUR_WRITES_METADATA_KEY trailing metadata. If the client sends it back as metadata
+    of its next requests, their reads only use replicas that already replayed this write.
+    Sync and Async supported.
+    """
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request: GRPCRequestContainer):
+            response = await safe_async_response(get_response, request)
+            stream = response.response.grpc_response
+            if inspect.isasyncgen(stream):
+
+                async def wrapped_stream():
+                    async for message in stream:
+                        yield message
+                    _set_last_write_metadata(request)
+
+                response.response.grpc_response = wrapped_stream()
+            else:
+                _set_last_write_metadata(request)
+            return response
+
+    else:
+
+        def middleware(request: GRPCRequestContainer):
+            response = get_response(request)
+            stream = response.response.grpc_response
+            if inspect.isgenerator(stream):
+
+                def wrapped_stream():
+                    yield from stream
+                    _set_last_write_metadata(request)
+
+                response.response.grpc_response = wrapped_stream()
+            else:
+                _set_last_write_metadata(request)
+            return response
+
+    return middleware
+
+
+@sync_and_async_middleware
+def profiling_middleware(get_response: Callable):
+    """
+    Middleware profiling the calls of the actions listed in PROFILING_ACTIONS.
+    Sampled calls are profiled with cProfile, or their stack is sampled in async, and the stack of the calls slower than
+    PROFILING_SLOW_THRESHOLD is sampled. See django_socio_grpc.profiling.
+    Streams are profiled until their last message.
+    Sync and Async supported.
+    """
+    from django_socio_grpc.profiling import RequestProfiler
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request: GRPCRequestContainer):
+            profiler = RequestProfiler.for_request(request)
+            if profiler is None:
+                return await safe_async_response(get_response, request)
+
+            profiler.start()
+            try:
+                response = await safe_async_response(get_response, request)
+            except BaseException:
+                profiler.stop()
+                raise
+            stream = response.response.grpc_response
+            if not inspect.isasyncgen(stream):
+                profiler.stop()
+                return response
+
+            async def wrapped_stream():
+                profiler.set_task(asyncio.current_task())
+                try:
+                    async for message in stream:
+                        yield message
+                finally:
+                    profiler.stop()
+
+            response.response.grpc_response = wrapped_stream()
+            return response
+
+    else:
+
+        def middleware(request: GRPCRequestContainer):
+            profiler = RequestProfiler.for_request(request)
+            if profiler is None:
+                return get_response(request)
+
+            profiler.start()
+            try:
+                response = get_response(request)
+            except BaseException:
+                profiler.stop()
+                raise
+            stream = response.response.grpc_response
+            if not inspect.isgenerator(stream):
+                profiler.stop()
+                return response
+
+            def wrapped_stream():
+                try:
+                    yield from stream
+                finally:
+                    profiler.stop()
+
+            response.response.grpc_response = wrapped_stream()
+            return response
+
+    return middleware
+
+
+@sync_and_async_middleware
+def compression_middleware(get_response: Callable):
+    """
+    Middleware compressing the responses of the actions with the compression of their grpc_action
+    or RESPONSE_COMPRESSION, only when they are at least RESPONSE_COMPRESSION_THRESHOLD bytes.
+    The compression metrics are sent with the grpc_response_compression signal, see django_socio_grpc.compression.
+    Sync and Async supported.
+    """
+    from django_socio_grpc.compression import ResponseCompressor
+
+    if asyncio.iscoroutinefunction(get_response):
+
+        async def middleware(request: GRPCRequestContainer):
+            response = await safe_async_response(get_response, request)
+            compressor = ResponseCompressor.for_request(request)
+            if compressor is None:
+                return response
+
+            stream = response.response.grpc_response
+            if not inspect.isasyncgen(stream):
+                compressor.compress_response(stream)
+                return response
+
+            async def wrapped_stream():
+                compressor.start_stream()
+                try:
+                    async for message in stream:
+                        compressor.compress_stream_message(message)
+                        yield message
+                finally:
+                    compressor.send_metrics()
+
+            response.response.grpc_response = wrapped_stream()
+            return response
+
+    else:
+
+        def middleware(request: GRPCRequestContainer):
+            response = get_response(request)
+            compressor = ResponseCompressor.for_request(request)
+            if compressor is None:
+                return response
+
+            stream = response.response.grpc_response
+            if not inspect.isgenerator(stream):
+                compressor.compress_response(stream)
+                return response
+
+            def wrapped_stream():
+                compressor.start_stream()
+                try:
+                    for message in stream:
+                        compressor.compress_stream_message(message)
+                        yield message
+                finally:
+                    compressor.send_metrics()
+
+            response.response.grpc_response = wrapped_stream()
+            return response
+
+    return middleware
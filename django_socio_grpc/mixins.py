@@ -1,13 +1,21 @@
-from asgiref.sync import sync_to_async
-from google.protobuf import empty_pb2
+import logging
+from itertools import islice
+
+from django.core.exceptions import ValidationError
+from google.protobuf import descriptor_pool, empty_pb2, message_factory
+from google.protobuf.descriptor import FieldDescriptor
 
 from django_socio_grpc.protobuf.generation_plugin import (
     FilterGenerationPlugin,
     PaginationGenerationPlugin,
     ResponseAsListGenerationPlugin,
+    WatchEventGenerationPlugin,
 )
+from django_socio_grpc.utils.executors import sync_to_async
 
+from . import pubsub
 from .decorators import grpc_action
+from .exceptions import InvalidArgument, ResourceExhausted
 from .grpc_actions.actions import GRPCActionMixin
 from .grpc_actions.placeholders import (
     FnPlaceholder,
@@ -22,6 +30,25 @@ from .grpc_actions.utils import (
 from .settings import grpc_settings
 from .utils.constants import DEFAULT_LIST_FIELD_NAME, REQUEST_SUFFIX
 
+logger = logging.getLogger("django_socio_grpc.services")
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+async def _achunked(aiterable, size):
+    chunk = []
+    async for item in aiterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
 
 ############################################################
 #   Synchronous mixins                                     #
@@ -62,6 +89,12 @@ class CreateModelMixin(GRPCActionMixin):
 
 
 class ListModelMixin(GRPCActionMixin):
+    list_size_check_chunk_size = 1000
+    """
+    Number of rows fetched and serialized at once to check the size of the unpaginated List responses
+    against LIST_MAX_MESSAGE_SIZE
+    """
+
     @grpc_action(
         request=[],
         # DEPRECATED - AM - 23/02/2024 - request_name only keept because will generate emptyMessage. Need to be removed in version 1.0.0
@@ -92,9 +125,49 @@ class ListModelMixin(GRPCActionMixin):
                 serializer.message.count = self.paginator.page.paginator.count
             return serializer.message
         else:
+            return self.get_list_message(queryset)
+
+    def get_list_message(self, queryset):
+        """
+        Serialize the whole queryset in a list message. With LIST_MAX_MESSAGE_SIZE the queryset is
+        serialized by chunks and the request fails as soon as the message gets too large.
+        """
+        if grpc_settings.LIST_MAX_MESSAGE_SIZE is None:
             serializer = self.get_serializer(queryset, many=True)
             return serializer.message
 
+        message = None
+        size = 0
+        chunks = _chunked(
+            queryset.iterator(chunk_size=self.list_size_check_chunk_size),
+            self.list_size_check_chunk_size,
+        )
+        for chunk in chunks:
+            chunk_message = self.get_serializer(chunk, many=True).message
+            size = self.check_list_message_size(size, chunk_message)
+            if message is None:
+                message = chunk_message
+            else:
+                message.MergeFrom(chunk_message)
+        if message is None:
+            message = self.get_serializer([], many=True).message
+        return message
+
+    def check_list_message_size(self, size: int, chunk_message) -> int:
+        """
+        Add the size of a chunk to the size of the list message and raise ResourceExhausted
+        if it exceeds LIST_MAX_MESSAGE_SIZE. The repeated fields of the chunks are concatenated
+        when merged so the size of the message is the sum of the sizes of its chunks.
+        """
+        size += chunk_message.ByteSize()
+        if size > grpc_settings.LIST_MAX_MESSAGE_SIZE:
+            raise ResourceExhausted(
+                detail=f"The {self.action} response exceeds the max message size of "
+                f"{grpc_settings.LIST_MAX_MESSAGE_SIZE} bytes. "
+                "Use pagination or a server streaming action to list this queryset."
+            )
+        return size
+
     @staticmethod
     def get_default_method(model_name):
         return {
@@ -124,6 +197,21 @@ class ListModelMixin(GRPCActionMixin):
 
 
 class StreamModelMixin(GRPCActionMixin):
+    resume_field = None
+    """
+    Unique field (``"id"``, ``"-created_at"``, ...) giving the order of the stream and used as resume token.
+    The stream is not resumable if None
+    """
+
+    resume_token_query_param = "resume_token"
+    """Name of the resume token in the filters or pagination parameters and in the trailing metadata"""
+
+    stream_chunk_size = None
+    """
+    Number of rows fetched and serialized at once when the stream is not paginated.
+    If None the whole queryset is fetched before sending the first message
+    """
+
     @grpc_action(
         request=[],
         request_name=StrTemplatePlaceholder(
@@ -144,16 +232,79 @@ class StreamModelMixin(GRPCActionMixin):
         .. note::
 
             This is a server streaming RPC.
+            If ``resume_field`` is set, the stream can be resumed with a resume token.
         """
         queryset = self.filter_queryset(self.get_queryset())
+        queryset = self.filter_resume_queryset(queryset)
 
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True, stream=True)
+            chunks = [page]
+        elif self.stream_chunk_size:
+            chunks = _chunked(
+                queryset.iterator(chunk_size=self.stream_chunk_size), self.stream_chunk_size
+            )
         else:
-            serializer = self.get_serializer(queryset, many=True, stream=True)
-
-        yield from serializer.message
+            chunks = [queryset]
+
+        resume_token = None
+        try:
+            for chunk in chunks:
+                serializer = self.get_serializer(chunk, many=True, stream=True)
+                if self.resume_field is None:
+                    yield from serializer.message
+                    continue
+                for instance, message in zip(
+                    serializer.instance, serializer.message, strict=True
+                ):
+                    yield message
+                    resume_token = self.get_instance_resume_token(instance)
+        finally:
+            if resume_token is not None:
+                self.set_resume_token_metadata(context, resume_token)
+
+    def get_resume_field_name(self) -> str:
+        return self.resume_field.lstrip("-")
+
+    def filter_resume_queryset(self, queryset):
+        """
+        Order the queryset by ``resume_field`` and, if the request has a resume token,
+        skip the rows already sent with a keyset condition instead of an offset.
+        """
+        if self.resume_field is None:
+            return queryset
+
+        queryset = queryset.order_by(self.resume_field)
+        resume_token = self.context.query_params.get(self.resume_token_query_param)
+        # INFO - A resume token sent in a struct can be a number, 0 being a valid one
+        if resume_token is None or resume_token == "":
+            return queryset
+
+        field_name = self.get_resume_field_name()
+        model_field = (
+            queryset.model._meta.pk
+            if field_name == "pk"
+            else queryset.model._meta.get_field(field_name)
+        )
+        try:
+            value = model_field.to_python(resume_token)
+        except ValidationError as e:
+            raise InvalidArgument(detail=f"Invalid resume token: {resume_token}") from e
+
+        lookup = "lt" if self.resume_field.startswith("-") else "gt"
+        return queryset.filter(**{f"{field_name}__{lookup}": value})
+
+    def get_instance_resume_token(self, instance) -> str:
+        return str(getattr(instance, self.get_resume_field_name()))
+
+    def set_resume_token_metadata(self, context, resume_token: str):
+        """
+        Send the resume token of the last message in the trailing metadata.
+        """
+        context.set_trailing_metadata(
+            tuple(context.trailing_metadata() or ())
+            + ((self.resume_token_query_param, resume_token),)
+        )
 
     @staticmethod
     def get_default_method(model_name):
@@ -173,6 +324,168 @@ class StreamModelMixin(GRPCActionMixin):
         }
 
 
+class StreamPagesModelMixin(GRPCActionMixin):
+    """
+    Stream the queryset in pages of ``stream_page_size`` rows. Each page is a list message
+    of ``serializer.Meta.proto_class_list``, like the response of ``List``: the memory of the
+    server is bounded by the page size while sending fewer messages than ``Stream``.
+    """
+
+    stream_page_size = 100
+    """Number of rows fetched from the database and sent in each page"""
+
+    @grpc_action(
+        request=[],
+        request_name=StrTemplatePlaceholder(
+            f"{{}}StreamPages{REQUEST_SUFFIX}", get_serializer_base_name
+        ),
+        response=SelfSerializer,
+        response_stream=True,
+        use_generation_plugins=[
+            ResponseAsListGenerationPlugin(),
+            FilterGenerationPlugin(display_warning_message=False),
+        ],
+    )
+    def StreamPages(self, request, context):
+        """
+        List a queryset.  This sends a sequence of message arrays of
+        ``serializer.Meta.proto_class`` to the client.
+
+        .. note::
+
+            This is a server streaming RPC.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        pages = _chunked(
+            queryset.iterator(chunk_size=self.stream_page_size), self.stream_page_size
+        )
+        for page in pages:
+            yield self.get_serializer(page, many=True).message
+
+    @staticmethod
+    def get_default_method(model_name):
+        return {
+            "StreamPages": {
+                "request": {"is_stream": False, "message": f"{model_name}StreamPagesRequest"},
+                "response": {"is_stream": True, "message": f"{model_name}ListResponse"},
+            },
+        }
+
+    @staticmethod
+    def get_default_message(model_name, fields=None):
+        if fields is None:
+            fields = []
+        return {
+            f"{model_name}StreamPagesRequest": fields,
+        }
+
+
+class WatchModelMixin(GRPCActionMixin):
+    """
+    Stream the changes of the model of the service queryset as they happen.
+
+    ``post_save`` and ``post_delete`` signals of the model publish events on the
+    backend configured by the ``WATCH_BACKEND`` setting. Each ``Watch`` call
+    subscribe to it with a bounded buffer of ``watch_queue_max_size`` events and
+    is closed with ``RESOURCE_EXHAUSTED`` if it does not consume them fast enough.
+    """
+
+    watch_queue_max_size = None
+    """Max number of events waiting to be sent. Default to the ``WATCH_QUEUE_MAX_SIZE`` setting"""
+
+    watch_poll_interval = 1.0
+    """Seconds between two checks that the client is still connected when no event arrive (sync only)"""
+
+    def _before_registration(service_class):
+        queryset = getattr(service_class, "queryset", None)
+        if queryset is None:
+            logger.warning(
+                f"{service_class.__name__} use WatchModelMixin without queryset attribute. Model events will not be published"
+            )
+            return
+        pubsub.connect_model_events(queryset.model)
+
+    @grpc_action(
+        request=[],
+        request_name=StrTemplatePlaceholder(
+            f"{{}}Watch{REQUEST_SUFFIX}", get_serializer_base_name
+        ),
+        response=SelfSerializer,
+        response_stream=True,
+        use_generation_plugins=[
+            WatchEventGenerationPlugin(),
+            FilterGenerationPlugin(display_warning_message=False),
+        ],
+    )
+    def Watch(self, request, context):
+        """
+        Stream a message each time an instance of the queryset is created, updated or deleted.
+        The message contains the event type (``CREATED``, ``UPDATED``, ``DELETED``)
+        and the instance as a proto message of ``serializer.Meta.proto_class``.
+
+        .. note::
+
+            This is a server streaming RPC that never ends by itself.
+            Deleted instances can not be filtered and only have their primary key set:
+            the deletions of the instances outside of the filters of the request are also sent.
+        """
+        with self.subscribe_to_model_events() as subscription:
+            while self.is_watch_active(context):
+                try:
+                    event = subscription.get(timeout=self.watch_poll_interval)
+                except pubsub.SubscriptionEvicted as e:
+                    raise ResourceExhausted(detail=str(e)) from e
+                if event is None:
+                    continue
+                instance = None
+                if event.event_type != pubsub.ModelEventType.DELETED:
+                    instance = self.get_watched_instance(event.pk)
+                    if instance is None:
+                        continue
+                yield self.get_watch_event_message(event, instance)
+
+    def subscribe_to_model_events(self) -> pubsub.Subscription:
+        model = self.get_queryset().model
+        max_size = self.watch_queue_max_size or grpc_settings.WATCH_QUEUE_MAX_SIZE
+        return pubsub.get_pubsub_backend().subscribe(pubsub.get_model_channel(model), max_size)
+
+    def is_watch_active(self, context) -> bool:
+        is_active = getattr(context, "is_active", None)
+        return is_active() if callable(is_active) else True
+
+    def get_watched_instance(self, pk):
+        """
+        Return the instance if it is still part of the filtered queryset, None otherwise.
+        """
+        return self.filter_queryset(self.get_queryset()).filter(pk=pk).first()
+
+    def get_watch_event_proto_class(self):
+        """
+        Return the proto class of the event message generated by ``WatchEventGenerationPlugin``.
+        It is looked up in the proto package of ``serializer.Meta.proto_class``.
+        """
+        proto_class = self.get_serializer_class().Meta.proto_class
+        action = getattr(type(self), self.action)
+        full_name = f"{proto_class.DESCRIPTOR.file.package}.{action.response_message_name}"
+        descriptor = descriptor_pool.Default().FindMessageTypeByName(full_name)
+        return message_factory.GetMessageClass(descriptor)
+
+    def get_watch_event_message(self, event: pubsub.ModelEvent, instance=None):
+        message = self.get_watch_event_proto_class()(event=event.event_type)
+        if instance is not None:
+            message.data.CopyFrom(self.get_serializer(instance).message)
+        else:
+            self.set_watch_event_pk(message.data, event.pk)
+        return message
+
+    def set_watch_event_pk(self, data, pk):
+        pk_name = self.get_queryset().model._meta.pk.name
+        pk_field = data.DESCRIPTOR.fields_by_name.get(pk_name)
+        if pk_field is None:
+            return
+        setattr(data, pk_name, str(pk) if pk_field.type == FieldDescriptor.TYPE_STRING else pk)
+
+
 class RetrieveModelMixin(GRPCActionMixin):
     @grpc_action(
         request=LookupField,
@@ -356,13 +669,14 @@ class AsyncCreateModelMixin(CreateModelMixin):
         ``serializer.Meta.proto_class``.
         """
         serializer = await self.aget_serializer(message=request)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        # Validators are sync and can query the database so they are run in a thread
+        await serializer.ais_valid(raise_exception=True)
         await self.aperform_create(serializer)
         return await serializer.amessage
 
     async def aperform_create(self, serializer):
         """Save a new object instance."""
-        await sync_to_async(serializer.save)()
+        await serializer.asave()
 
 
 class AsyncListModelMixin(ListModelMixin):
@@ -375,9 +689,9 @@ class AsyncListModelMixin(ListModelMixin):
 
             This is a server streaming RPC.
         """
-        queryset = await sync_to_async(self.get_queryset)()
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
-        page = await sync_to_async(self.paginate_queryset)(queryset)
+        page = await self.apaginate_queryset(queryset)
         if page is not None:
             serializer = await self.aget_serializer(page, many=True)
             message = await serializer.amessage
@@ -385,22 +699,51 @@ class AsyncListModelMixin(ListModelMixin):
                 message.count = self.paginator.page.paginator.count
             return message
         else:
+            return await self.aget_list_message(queryset)
+
+    async def aget_list_message(self, queryset):
+        if grpc_settings.LIST_MAX_MESSAGE_SIZE is None:
             serializer = await self.aget_serializer(queryset, many=True)
             return await serializer.amessage
 
+        message = None
+        size = 0
+        chunks = _achunked(
+            queryset.aiterator(chunk_size=self.list_size_check_chunk_size),
+            self.list_size_check_chunk_size,
+        )
+        async for chunk in chunks:
+            serializer = await self.aget_serializer(chunk, many=True)
+            chunk_message = await serializer.amessage
+            size = self.check_list_message_size(size, chunk_message)
+            if message is None:
+                message = chunk_message
+            else:
+                message.MergeFrom(chunk_message)
+        if message is None:
+            serializer = await self.aget_serializer([], many=True)
+            message = await serializer.amessage
+        return message
+
 
 class AsyncStreamModelMixin(StreamModelMixin):
-    async def _get_list_data(self):
-        queryset = await sync_to_async(self.get_queryset)()
+    async def _aiter_stream_chunks(self):
+        queryset = await self.aget_queryset()
         queryset = await self.afilter_queryset(queryset)
+        queryset = self.filter_resume_queryset(queryset)
 
-        page = await sync_to_async(self.paginate_queryset)(queryset)
+        page = await self.apaginate_queryset(queryset)
         if page is not None:
-            serializer = await self.aget_serializer(page, many=True, stream=True)
+            yield page
+        elif self.stream_chunk_size:
+            # The next rows are only fetched when the previous chunk has been sent
+            chunks = _achunked(
+                queryset.aiterator(chunk_size=self.stream_chunk_size), self.stream_chunk_size
+            )
+            async for chunk in chunks:
+                yield chunk
         else:
-            serializer = await self.aget_serializer(queryset, many=True, stream=True)
-
-        return await serializer.amessage
+            yield queryset
 
     async def Stream(self, request, context):
         """
@@ -410,10 +753,82 @@ class AsyncStreamModelMixin(StreamModelMixin):
         .. note::
 
             This is a server streaming RPC.
+            If ``resume_field`` is set, the stream can be resumed with a resume token.
+        """
+        resume_token = None
+        try:
+            async for chunk in self._aiter_stream_chunks():
+                serializer = await self.aget_serializer(chunk, many=True, stream=True)
+                # Evaluating the messages fill the queryset cache so iterating over the instances does not query the database again
+                messages = await serializer.amessage
+                if self.resume_field is None:
+                    for message in messages:
+                        yield message
+                    continue
+                for instance, message in zip(serializer.instance, messages, strict=True):
+                    yield message
+                    resume_token = self.get_instance_resume_token(instance)
+        finally:
+            if resume_token is not None:
+                self.set_resume_token_metadata(context, resume_token)
+
+
+class AsyncStreamPagesModelMixin(StreamPagesModelMixin):
+    async def StreamPages(self, request, context):
+        """
+        List a queryset.  This sends a sequence of message arrays of
+        ``serializer.Meta.proto_class`` to the client.
+
+        .. note::
+
+            This is a server streaming RPC.
+        """
+        queryset = await self.aget_queryset()
+        queryset = await self.afilter_queryset(queryset)
+        # The next page is only fetched when the previous one has been sent
+        pages = _achunked(
+            queryset.aiterator(chunk_size=self.stream_page_size), self.stream_page_size
+        )
+        async for page in pages:
+            serializer = await self.aget_serializer(page, many=True)
+            yield await serializer.amessage
+
+
+class AsyncWatchModelMixin(WatchModelMixin):
+    async def Watch(self, request, context):
+        """
+        Stream a message each time an instance of the queryset is created, updated or deleted.
+        The message contains the event type (``CREATED``, ``UPDATED``, ``DELETED``)
+        and the instance as a proto message of ``serializer.Meta.proto_class``.
+
+        .. note::
+
+            This is a server streaming RPC that never ends by itself.
+            Deleted instances can not be filtered and only have their primary key set:
+            the deletions of the instances outside of the filters of the request are also sent.
+        """
+        subscription = await sync_to_async(self.subscribe_to_model_events)()
+        with subscription:
+            while True:
+                try:
+                    event = await subscription.aget()
+                except pubsub.SubscriptionEvicted as e:
+                    raise ResourceExhausted(detail=str(e)) from e
+                if event is None:
+                    return
+                instance = None
+                if event.event_type != pubsub.ModelEventType.DELETED:
+                    instance = await self.aget_watched_instance(event.pk)
+                    if instance is None:
+                        continue
+                yield await sync_to_async(self.get_watch_event_message)(event, instance)
+
+    async def aget_watched_instance(self, pk):
+        """
+        Return the instance if it is still part of the filtered queryset, None otherwise.
         """
-        messages = await self._get_list_data()
-        for message in messages:
-            yield message
+        queryset = await self.afilter_queryset(await self.aget_queryset())
+        return await queryset.filter(pk=pk).afirst()
 
 
 class AsyncRetrieveModelMixin(RetrieveModelMixin):
@@ -441,7 +856,7 @@ class AsyncUpdateModelMixin(UpdateModelMixin):
         """
         instance = await self.aget_object()
         serializer = await self.aget_serializer(instance, message=request)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await serializer.ais_valid(raise_exception=True)
         await self.aperform_update(serializer)
 
         if getattr(instance, "_prefetched_objects_cache", None):
@@ -453,7 +868,7 @@ class AsyncUpdateModelMixin(UpdateModelMixin):
 
     async def aperform_update(self, serializer):
         """Save an existing object instance."""
-        await sync_to_async(serializer.save)()
+        await serializer.asave()
 
 
 class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
@@ -469,7 +884,7 @@ class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
         # INFO - L.G. - 11/07/2022 - We use the data parameter instead of message
         # because we handle a dict not a grpc message.
         serializer = await self.aget_serializer(instance, message=request, partial=True)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await serializer.ais_valid(raise_exception=True)
         await self.aperform_partial_update(serializer)
 
         if getattr(instance, "_prefetched_objects_cache", None):
@@ -481,7 +896,7 @@ class AsyncPartialUpdateModelMixin(PartialUpdateModelMixin):
 
     async def aperform_partial_update(self, serializer):
         """Save an existing object instance."""
-        await sync_to_async(serializer.save)()
+        await serializer.asave()
 
 
 class AsyncDestroyModelMixin(DestroyModelMixin):
@@ -499,7 +914,7 @@ class AsyncDestroyModelMixin(DestroyModelMixin):
 
     async def aperform_destroy(self, instance):
         """Delete an object instance."""
-        await sync_to_async(instance.delete)()
+        await instance.adelete()
 
 
 ############################################################
@@ -0,0 +1,292 @@
+"""
+Profiling of the calls of the actions listed in PROFILING_ACTIONS, used by ``profiling_middleware``.
+
+A PROFILING_SAMPLE_RATE fraction of the calls are profiled with cProfile and saved as ``.prof`` files
+readable with ``pstats`` or snakeviz.
+The stack of the other calls is sampled every PROFILING_STACK_INTERVAL seconds once they have run for
+PROFILING_SLOW_THRESHOLD seconds, and saved as collapsed stacks (``.stacks`` files) usable by flamegraph tools.
+
+In async services, cProfile would record all the coroutines run by the event loop thread and only one
+call of the thread could be profiled at a time, so the stack of the task of the sampled calls is sampled
+from their start instead and saved as ``.stacks`` files.
+
+Files are named after the service, the action and the request id and written in PROFILING_DIRECTORY,
+keeping only the PROFILING_MAX_FILES most recent ones.
+"""
+
+import asyncio
+import contextlib
+import cProfile
+import logging
+import os
+import random
+import re
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from django_socio_grpc.settings import grpc_settings
+
+if TYPE_CHECKING:
+    from django_socio_grpc.request_transformer import GRPCRequestContainer
+
+logger = logging.getLogger("django_socio_grpc.profiling")
+
+PROFILE_FILE_SUFFIXES = (".prof", ".stacks")
+
+# INFO - Only one cProfile can be enabled at a time in a thread. Only used by sync calls, each run in its own thread
+_profiled_threads: set[int] = set()
+_profiled_threads_lock = threading.Lock()
+
+
+def is_profiled_action(service_name: str, action: str) -> bool:
+    actions = grpc_settings.PROFILING_ACTIONS
+    return "*" in actions or service_name in actions or f"{service_name}.{action}" in actions
+
+
+def get_profiling_directory() -> str:
+    if grpc_settings.PROFILING_DIRECTORY:
+        return grpc_settings.PROFILING_DIRECTORY
+    return os.path.join(tempfile.gettempdir(), "django-socio-grpc-profiles")
+
+
+def get_request_id(request: "GRPCRequestContainer") -> str:
+    try:
+        metadata = dict(request.context.invocation_metadata() or ())
+    except AttributeError:
+        metadata = {}
+    request_id = metadata.get(grpc_settings.PROFILING_REQUEST_ID_METADATA_KEY)
+    return str(request_id) if request_id else uuid.uuid4().hex
+
+
+def format_frame(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({code.co_filename}:{frame.f_lineno})"
+
+
+class StackSampler:
+    """
+    Count the stacks of a thread, or of an asyncio task, sampled every interval seconds after delay seconds.
+    """
+
+    def __init__(self, delay: float, interval: float, thread_id: int, task=None):
+        self.delay = delay
+        self.interval = interval
+        self.thread_id = thread_id
+        self.task = task
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="dsg-stack-sampler", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self):
+        if self._stopped.wait(self.delay):
+            return
+        while not self._stopped.is_set():
+            stack = self.get_stack()
+            if stack:
+                self.samples[stack] += 1
+            self._stopped.wait(self.interval)
+
+    def get_stack(self) -> tuple[str, ...]:
+        """
+        Return the frames of the stack from the outermost to the innermost.
+        """
+        task = self.task
+        if task is not None:
+            # INFO - Follow the awaited coroutines of the task instead of the event loop thread shared with other requests
+            return tuple(format_frame(frame) for frame in self.get_task_frames(task))
+        frame = sys._current_frames().get(self.thread_id)
+        frames = []
+        while frame is not None:
+            frames.append(format_frame(frame))
+            frame = frame.f_back
+        return tuple(reversed(frames))
+
+    def get_task_frames(self, task) -> list:
+        """
+        Return the frames of the coroutines awaited by the task, from the outermost to the innermost.
+        ``Task.get_stack`` only returns the frame of the coroutine of the task.
+        """
+        frames = []
+        awaitable = task.get_coro()
+        while awaitable is not None:
+            frame = getattr(awaitable, "cr_frame", None) or getattr(
+                awaitable, "ag_frame", None
+            )
+            if frame is None:
+                # INFO - The task is done or waits for a future
+                break
+            frames.append(frame)
+            awaitable = getattr(awaitable, "cr_await", None) or getattr(
+                awaitable, "ag_await", None
+            )
+        if not frames:
+            return frames
+        # INFO - The awaited coroutines of a running task are not known: take them from the stack of the event loop thread
+        thread_frame = sys._current_frames().get(self.thread_id)
+        running_frames = []
+        while thread_frame is not None and thread_frame is not frames[-1]:
+            running_frames.append(thread_frame)
+            thread_frame = thread_frame.f_back
+        if thread_frame is not None:
+            frames.extend(reversed(running_frames))
+        return frames
+
+    def to_collapsed(self) -> str:
+        return "".join(f"{';'.join(stack)} {count}\n" for stack, count in self.samples.items())
+
+
+class RequestProfiler:
+    """
+    Profile one call with cProfile if it is sampled, else sample its stack if it lasts more than PROFILING_SLOW_THRESHOLD.
+    """
+
+    def __init__(self, request: "GRPCRequestContainer"):
+        self.service_name = request.service.get_service_name()
+        self.action = request.action
+        self.request_id = get_request_id(request)
+        self.profile: cProfile.Profile | None = None
+        self.sampler: StackSampler | None = None
+        # INFO - Sampled async calls are saved whatever their duration
+        self.sampled = False
+        self.thread_id: int | None = None
+        self.start_time = 0.0
+
+    @classmethod
+    def for_request(cls, request: "GRPCRequestContainer") -> "RequestProfiler | None":
+        """
+        Return a profiler if the action of the request can be profiled.
+        """
+        if not grpc_settings.PROFILING_ACTIONS:
+            return None
+        if not is_profiled_action(request.service.get_service_name(), request.action):
+            return None
+        if (
+            not grpc_settings.PROFILING_SAMPLE_RATE
+            and grpc_settings.PROFILING_SLOW_THRESHOLD is None
+        ):
+            return None
+        return cls(request)
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        task = self._get_current_task()
+        sampled = random.random() < grpc_settings.PROFILING_SAMPLE_RATE
+        if sampled and task is None and self._enable_profile():
+            return
+        if sampled and task is not None:
+            # INFO - cProfile would also profile the other requests run by the event loop thread
+            self.sampled = True
+            delay = grpc_settings.PROFILING_STACK_INTERVAL
+        elif grpc_settings.PROFILING_SLOW_THRESHOLD is not None:
+            delay = grpc_settings.PROFILING_SLOW_THRESHOLD
+        else:
+            return
+        self.sampler = StackSampler(
+            delay, grpc_settings.PROFILING_STACK_INTERVAL, threading.get_ident(), task=task
+        )
+        self.sampler.start()
+
+    def set_task(self, task):
+        """
+        Sample the stack of another task, used when an async stream is consumed outside of the action task.
+        """
+        if self.sampler is not None:
+            self.sampler.task = task
+
+    def stop(self):
+        duration = time.perf_counter() - self.start_time
+        if self.profile is not None:
+            self._disable_profile()
+            self.save(".prof", self.profile.dump_stats, duration)
+        elif self.sampler is not None:
+            self.sampler.stop()
+            slow_threshold = grpc_settings.PROFILING_SLOW_THRESHOLD
+            is_slow = slow_threshold is not None and duration >= slow_threshold
+            if (self.sampled or is_slow) and self.sampler.samples:
+                self.save(".stacks", self._write_stacks, duration)
+
+    def _enable_profile(self) -> bool:
+        thread_id = threading.get_ident()
+        with _profiled_threads_lock:
+            if thread_id in _profiled_threads:
+                return False
+            _profiled_threads.add(thread_id)
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # INFO - Another profiler or debugger is already active in this thread
+            with _profiled_threads_lock:
+                _profiled_threads.discard(thread_id)
+            return False
+        self.profile = profile
+        self.thread_id = thread_id
+        return True
+
+    def _disable_profile(self):
+        self.profile.disable()
+        with _profiled_threads_lock:
+            _profiled_threads.discard(self.thread_id)
+
+    def _write_stacks(self, path: str):
+        with open(path, "w") as stacks_file:
+            stacks_file.write(self.sampler.to_collapsed())
+
+    @staticmethod
+    def _get_current_task():
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
+
+    def get_filename(self, suffix: str) -> str:
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{self.service_name}-{self.action}-{self.request_id}"
+        return re.sub(r"[^\w.-]", "_", name) + suffix
+
+    def save(self, suffix: str, write, duration: float):
+        directory = get_profiling_directory()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, self.get_filename(suffix))
+            write(path)
+            rotate_profiles(directory, grpc_settings.PROFILING_MAX_FILES)
+        except OSError:
+            logger.exception(
+                f"Unable to save the profile of {self.service_name}.{self.action}"
+            )
+            return
+        logger.info(
+            f"Profile of {self.service_name}.{self.action} ({duration:.3f}s) saved in {path}",
+            extra={"request_id": self.request_id, "duration": duration},
+        )
+
+
+def rotate_profiles(directory: str, max_files: int):
+    """
+    Remove the oldest profiles of the directory to only keep max_files.
+    """
+    entries = [
+        entry
+        for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(PROFILE_FILE_SUFFIXES)
+    ]
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime)
+    for entry in entries[: len(entries) - max_files]:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(entry.path)
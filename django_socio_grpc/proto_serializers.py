@@ -1,6 +1,5 @@
 from collections.abc import MutableSequence
 
-from asgiref.sync import sync_to_async
 from django.core.validators import MaxLengthValidator
 from django.db.models.fields import NOT_PROVIDED
 from django.utils.translation import gettext as _
@@ -15,8 +14,10 @@ from rest_framework.serializers import (
     ModelSerializer,
     ReadOnlyField,
     Serializer,
+    raise_errors_on_nested_writes,
 )
 from rest_framework.settings import api_settings
+from rest_framework.utils import model_meta as drf_model_meta
 from rest_framework.utils.formatting import lazy_format
 
 from django_socio_grpc.protobuf.exceptions import (
@@ -38,6 +39,7 @@ from django_socio_grpc.utils.constants import (
     LIST_ATTR_MESSAGE_NAME,
     PARTIAL_UPDATE_FIELD_NAME,
 )
+from django_socio_grpc.utils.executors import sync_to_async
 from django_socio_grpc.utils.model_meta import get_model_pk
 
 LIST_PROTO_SERIALIZER_KWARGS = (*LIST_SERIALIZER_KWARGS, LIST_ATTR_MESSAGE_NAME, "message")
@@ -117,7 +119,34 @@ class BaseProtoSerializer(BaseSerializer):
         return self._message
 
     async def asave(self, **kwargs):
-        return await sync_to_async(self.save)(**kwargs)
+        """
+        Async version of save calling acreate or aupdate.
+        A serializer overriding save is saved in a thread.
+        """
+        if type(self).save is not BaseSerializer.save:
+            return await sync_to_async(self.save)(**kwargs)
+
+        assert hasattr(
+            self, "_errors"
+        ), "You must call `.is_valid()` before calling `.save()`."
+        assert not self.errors, "You cannot call `.save()` on a serializer with invalid data."
+        assert (
+            "commit" not in kwargs
+        ), "'commit' is not a valid keyword argument to the 'save()' method."
+        assert not hasattr(
+            self, "_data"
+        ), "You cannot call `.save()` after accessing `serializer.data`."
+
+        validated_data = {**self.validated_data, **kwargs}
+
+        if self.instance is not None:
+            self.instance = await self.aupdate(self.instance, validated_data)
+            assert self.instance is not None, "`aupdate()` did not return an object instance."
+        else:
+            self.instance = await self.acreate(validated_data)
+            assert self.instance is not None, "`acreate()` did not return an object instance."
+
+        return self.instance
 
     async def ais_valid(self, *, raise_exception=False):
         return await sync_to_async(self.is_valid)(raise_exception=raise_exception)
@@ -418,6 +447,56 @@ class PropertyReadOnlyField(ReadOnlyField, ProtoFieldConvertible):
 
 
 class ModelProtoSerializer(ProtoSerializer, ModelSerializer):
+    async def acreate(self, validated_data):
+        """
+        Create the instance with the async ORM.
+        A serializer overriding create is still using it in a thread.
+        """
+        if type(self).create is not ModelSerializer.create:
+            return await super().acreate(validated_data)
+
+        raise_errors_on_nested_writes("create", self, validated_data)
+        model_class = self.Meta.model
+        info = drf_model_meta.get_field_info(model_class)
+        # Many to many relationships can only be set once the instance is created
+        many_to_many = {
+            field_name: validated_data.pop(field_name)
+            for field_name, relation_info in info.relations.items()
+            if relation_info.to_many and field_name in validated_data
+        }
+
+        instance = await model_class._default_manager.acreate(**validated_data)
+
+        for field_name, value in many_to_many.items():
+            await getattr(instance, field_name).aset(value)
+
+        return instance
+
+    async def aupdate(self, instance, validated_data):
+        """
+        Update the instance with the async ORM.
+        A serializer overriding update is still using it in a thread.
+        """
+        if type(self).update is not ModelSerializer.update:
+            return await super().aupdate(instance, validated_data)
+
+        raise_errors_on_nested_writes("update", self, validated_data)
+        info = drf_model_meta.get_field_info(instance)
+
+        m2m_fields = []
+        for attr, value in validated_data.items():
+            if attr in info.relations and info.relations[attr].to_many:
+                m2m_fields.append((attr, value))
+            else:
+                setattr(instance, attr, value)
+
+        await instance.asave()
+
+        for attr, value in m2m_fields:
+            await getattr(instance, attr).aset(value)
+
+        return instance
+
     def build_property_field(self, field_name, model_class):
         """
         To generate the correct types of a model property field we have
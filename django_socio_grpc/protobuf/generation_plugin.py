@@ -169,6 +169,74 @@ class FilterGenerationPlugin(BaseAddFieldRequestGenerationPlugin):
         return True
 
 
+class FilterSetGenerationPlugin(FilterGenerationPlugin):
+    """
+    Plugin to add the _filterset field in the request ProtoMessage.
+    Its type is a message generated from the FilterSet of the service (filterset_class or filterset_fields)
+    with one typed field by filter, compiled into a Q object by :class:`django_socio_grpc.filterset_compiler.FilterSetCompilerBackend`.
+    See https://django-socio-grpc.readthedocs.io/en/stable/features/filters.html#filtersetgenerationplugin
+    """
+
+    field_name: str = "_filterset"
+
+    def check_condition(
+        self,
+        service: type["Service"],
+        request_message: ProtoMessage | str,
+        response_message: ProtoMessage | str,
+        message_name_constructor: MessageNameConstructor,
+    ) -> bool:
+        if self.get_filterset_class(service) is None:
+            if self.display_warning_message:
+                logger.warning(
+                    "You are using FilterSetGenerationPlugin but no filterset_class or filterset_fields as been found on the service."
+                )
+            return False
+        return super().check_condition(
+            service, request_message, response_message, message_name_constructor
+        )
+
+    def get_filterset_class(self, service: type["Service"]):
+        from django_filters.rest_framework import DjangoFilterBackend
+
+        return DjangoFilterBackend().get_filterset_class(
+            service, getattr(service, "queryset", None)
+        )
+
+    def transform_request_message(
+        self,
+        service: type["Service"],
+        proto_message: ProtoMessage | str,
+        message_name_constructor: MessageNameConstructor,
+    ):
+        from django_socio_grpc.filterset_compiler import FilterSetCompiler
+
+        if isinstance(proto_message, str):
+            logger.warning(
+                f"Plugin {self.__class__.__name__} can't be used with a string message. Please use the plugin directly on the grpc_action that generate the message"
+            )
+        compiler = FilterSetCompiler(self.get_filterset_class(service))
+        filterset_message = ProtoMessage(
+            name=f"{service.get_service_name()}FilterSet",
+            fields=[
+                ProtoField(
+                    name=compiled_filter.name,
+                    field_type=compiled_filter.proto_type,
+                    cardinality=compiled_filter.cardinality,
+                )
+                for compiled_filter in compiler.compiled_filters.values()
+            ],
+        )
+        proto_message.fields.append(
+            ProtoField(
+                name=self.field_name,
+                field_type=filterset_message,
+                cardinality=self.field_cardinality,
+            )
+        )
+        return proto_message
+
+
 class PaginationGenerationPlugin(BaseAddFieldRequestGenerationPlugin):
     """
     Plugin to add the _pagination field in the request ProtoMessage. See https://django-socio-grpc.readthedocs.io/en/stable/features/pagination.html
@@ -339,6 +407,31 @@ class ListGenerationPlugin(RequestAsListGenerationPlugin, ResponseAsListGenerati
         return proto_message
 
 
+@dataclass
+class WatchEventGenerationPlugin(BaseGenerationPlugin):
+    """
+    Encapsulate the response ProtoMessage into an event message also containing the type of change (CREATED, UPDATED or DELETED).
+    Used by the Watch action of WatchModelMixin.
+    """
+
+    event_field_name: str = "event"
+    data_field_name: str = "data"
+
+    def transform_response_message(
+        self,
+        service: type["Service"],
+        proto_message: ProtoMessage | str,
+        message_name_constructor: MessageNameConstructor,
+    ) -> ProtoMessage:
+        return ProtoMessage(
+            name=message_name_constructor.construct_response_name(before_suffix="WatchEvent"),
+            fields=[
+                ProtoField(name=self.event_field_name, field_type="string"),
+                ProtoField(name=self.data_field_name, field_type=proto_message),
+            ],
+        )
+
+
 @dataclass
 class BaseEnumGenerationPlugin(BaseGenerationPlugin):
     non_annotated_generation: bool = False
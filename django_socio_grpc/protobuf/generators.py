@@ -1,3 +1,4 @@
+import hashlib
 import io
 import logging
 import re
@@ -17,7 +18,7 @@ from django_socio_grpc.protobuf.proto_classes import (
 )
 from django_socio_grpc.services.app_handler_registry import AppHandlerRegistry
 
-from .protoparser import protoparser
+from .protoparser import descriptorparser, protoparser
 
 MAX_SORT_NUMBER = 9999
 
@@ -39,12 +40,20 @@ class RegistryToProtoGenerator:
         if verbose_level <= self.verbose:
             logger.log(verbose_level, message)
 
-    def get_protos_by_app(self, directory: Path | None = None):
+    @staticmethod
+    def get_proto_path(registry: AppHandlerRegistry, directory: Path | None = None) -> Path:
+        if directory:
+            return directory / f"{registry.app_name}.proto"
+        return registry.get_proto_path()
+
+    def get_protos_by_app(
+        self, directory: Path | None = None, exclude_apps: set[str] | None = None
+    ):
         proto_by_app = {}
         for app_name, registry in self.registry_instance.registered_apps.items():
-            proto_path = registry.get_proto_path()
-            if directory:
-                proto_path = directory / f"{app_name}.proto"
+            if exclude_apps and app_name in exclude_apps:
+                continue
+            proto_path = self.get_proto_path(registry, directory)
             self.print("\n\n--------------------------------\n\n", 1)
             self.print(f"GENERATE APP {app_name}", 1)
 
@@ -57,6 +66,51 @@ class RegistryToProtoGenerator:
 
         return OrderedDict(sorted(proto_by_app.items()))
 
+    def get_model_hash(self, registry: AppHandlerRegistry) -> str:
+        """
+        Hash everything of the registry of an app written in its proto file except the field numbers,
+        which come from the previous proto file.
+        """
+        digest = hashlib.sha256()
+
+        def update(*values):
+            digest.update(repr(values).encode())
+
+        update(self.project_name, registry.app_name)
+        for service in sorted(registry.proto_services, key=lambda x: x.name):
+            update("service", service.name)
+            for rpc in sorted(service.rpcs, key=lambda x: x.name):
+                update(
+                    rpc.name,
+                    rpc.request_name,
+                    rpc.request_stream,
+                    rpc.response_name,
+                    rpc.response_stream,
+                )
+
+        messages = registry.get_all_messages()
+        for name in sorted(messages):
+            message = messages[name]
+            update("message", name, message.imported_from, list(message.comments or []))
+            for field in message.fields:
+                update(
+                    field.name,
+                    field.field_type_str,
+                    str(field.cardinality),
+                    list(field.comments or []),
+                )
+                if isinstance(field.field_type, ProtoEnum):
+                    enum = field.field_type.enum
+                    update(
+                        field.field_type.location,
+                        enum.__doc__,
+                        [
+                            (member.name, repr(enum.__annotations__.get(member.name)))
+                            for member in enum
+                        ],
+                    )
+        return digest.hexdigest()
+
     def get_proto(
         self,
         registry: AppHandlerRegistry,
@@ -269,6 +323,9 @@ class RegistryToProtoGenerator:
         if not proto_path.exists():
             return None
 
+        # INFO - Reading the field numbers from the compiled pb2 file is much faster than parsing the proto file
+        if proto_data := descriptorparser.parse_from_pb2_file(proto_path):
+            return proto_data
         return protoparser.parse_from_file(proto_path)
 
 
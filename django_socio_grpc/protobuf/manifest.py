@@ -0,0 +1,118 @@
+"""
+Manifest of the last proto generation of each app, used by ``generateproto --incremental``
+to skip writing and compiling the apps whose registry did not change.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from importlib import metadata
+from pathlib import Path
+
+logger = logging.getLogger("django_socio_grpc.generation")
+
+MANIFEST_VERSION = 2
+DEFAULT_MANIFEST_NAME = ".generateproto_manifest.json"
+# Modules that write the proto files: a change in them changes the generated files even when
+# the registry of the apps is the same
+GENERATOR_MODULES = ("generators.py", "proto_classes.py")
+
+
+def hash_text(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def get_protoc_version() -> str:
+    try:
+        return metadata.version("grpcio-tools")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def get_generator_version() -> str:
+    """
+    Return the version of django-socio-grpc followed by a hash of the source of the generator,
+    so that the manifest is also invalidated by an editable install or a patched generator.
+    """
+    try:
+        version = metadata.version("django-socio-grpc")
+    except metadata.PackageNotFoundError:
+        version = ""
+    source = "".join(
+        Path(__file__).with_name(module_name).read_text() for module_name in GENERATOR_MODULES
+    )
+    return f"{version}:{hash_text(source)}"
+
+
+@dataclass
+class ProtoManifest:
+    path: Path
+    apps: dict[str, dict] = dataclass_field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "ProtoManifest":
+        """
+        Load the manifest, or return an empty one if it does not exist or was written by
+        another version of the manifest, of the generator or of grpcio-tools.
+        """
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls(path)
+        except ValueError:
+            logger.warning(f"Invalid proto generation manifest {path}, all apps are generated")
+            return cls(path)
+        if (
+            data.get("version") != MANIFEST_VERSION
+            or data.get("protoc_version") != get_protoc_version()
+            or data.get("generator_version") != get_generator_version()
+        ):
+            return cls(path)
+        return cls(path, data.get("apps", {}))
+
+    def is_up_to_date(
+        self,
+        app_name: str,
+        model_hash: str,
+        proto_path: Path,
+        protoc_args: list[str] | None,
+    ) -> bool:
+        """
+        Return True if the app was generated from the same registry model, its proto file was not
+        modified since and, when protoc_args is set, its pb2 files were compiled with the same arguments.
+        """
+        entry = self.apps.get(app_name)
+        if not entry or entry["model_hash"] != model_hash:
+            return False
+        if not proto_path.exists() or hash_text(proto_path.read_text()) != entry["proto_hash"]:
+            return False
+        if protoc_args is not None:
+            if entry["protoc_args"] != protoc_args:
+                return False
+            pb2_paths = [
+                proto_path.with_name(f"{app_name}_pb2.py"),
+                proto_path.with_name(f"{app_name}_pb2_grpc.py"),
+            ]
+            if not all(pb2_path.exists() for pb2_path in pb2_paths):
+                return False
+        return True
+
+    def update(
+        self, app_name: str, model_hash: str, proto: str, protoc_args: list[str] | None
+    ):
+        self.apps[app_name] = {
+            "model_hash": model_hash,
+            "proto_hash": hash_text(proto),
+            "protoc_args": protoc_args,
+        }
+
+    def save(self):
+        data = {
+            "version": MANIFEST_VERSION,
+            "protoc_version": get_protoc_version(),
+            "generator_version": get_generator_version(),
+            "apps": dict(sorted(self.apps.items())),
+        }
+        self.path.write_text(json.dumps(data, indent=2) + "\n")
@@ -3,7 +3,7 @@ import logging
 import traceback
 from collections import OrderedDict
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from dataclasses import field as dataclass_field
 from decimal import Decimal
 from enum import Enum
@@ -97,6 +97,19 @@ class ProtoField:
             values.insert(0, self.cardinality)
         return " ".join(values)
 
+    def copy(self) -> "ProtoField":
+        """
+        Return a copy of the field and of its message so they can be modified without changing this field
+        """
+        field_type = self.field_type
+        if isinstance(field_type, ProtoMessage):
+            field_type = field_type.copy()
+        return replace(
+            self,
+            field_type=field_type,
+            comments=list(self.comments) if self.comments is not None else None,
+        )
+
     @classmethod
     def _get_cardinality(cls, field: serializers.Field):
         ProtoGeneratorPrintHelper.print("field.default: ", field.default)
@@ -511,14 +524,44 @@ class ProtoMessage:
     serializer: serializers.BaseSerializer | None = None
     imported_from: str | None = None
 
-    def get_all_messages(self) -> dict[str, "ProtoMessage"]:
-        messages = {self.name: self}
+    # INFO - Messages built by from_serializer, by message class, serializer and name
+    _from_serializer_cache: ClassVar[dict[tuple, "ProtoMessage"]] = {}
+
+    def get_all_messages(
+        self, messages: dict[str, "ProtoMessage"] | None = None
+    ) -> dict[str, "ProtoMessage"]:
+        """
+        Return the message and its nested messages by name, adding them to messages if passed
+        """
+        if messages is None:
+            messages = {}
+        # INFO - The nested messages of a message already added are already in messages
+        if messages.get(self.name) is self:
+            return messages
+        messages[self.name] = self
         for field in self.fields:
             # Retrieve all messages from nested messages
             if isinstance(field.field_type, ProtoMessage):
-                messages.update(field.field_type.get_all_messages())
+                field.field_type.get_all_messages(messages)
         return messages
 
+    def copy(self) -> "ProtoMessage":
+        """
+        Return a copy of the message and of its nested messages so they can be modified without changing this message.
+        Messages imported from other proto files are never modified and are not copied.
+        """
+        if self.imported_from:
+            return self
+        return replace(
+            self,
+            fields=[field.copy() for field in self.fields],
+            comments=list(self.comments) if self.comments is not None else None,
+        )
+
+    @classmethod
+    def clear_from_serializer_cache(cls):
+        ProtoMessage._from_serializer_cache.clear()
+
     def set_indices(self, indices: dict[int, str]) -> None:
         """
         Set the field index that is writed in the proto file while trying to keep the same order that the one passed in the incides parameter
@@ -579,6 +622,24 @@ class ProtoMessage:
         cls,
         serializer: type[serializers.BaseSerializer],
         name: str | None = None,
+    ) -> "ProtoMessage":
+        """
+        Return the message of the serializer. Services sharing serializers would build the same messages
+        for each of their actions, so the messages are built once and cached by message class, which
+        depends on the role of the message and on SEPARATE_READ_WRITE_MODEL, serializer and name.
+        A copy is returned as the generation plugins and the proto generation modify the messages.
+        """
+        key = (cls, serializer, name)
+        if (proto_message := ProtoMessage._from_serializer_cache.get(key)) is None:
+            proto_message = cls.build_from_serializer(serializer, name)
+            ProtoMessage._from_serializer_cache[key] = proto_message
+        return proto_message.copy()
+
+    @classmethod
+    def build_from_serializer(
+        cls,
+        serializer: type[serializers.BaseSerializer],
+        name: str | None = None,
     ) -> "ProtoMessage":
         meta = getattr(serializer, "Meta", None)
         pk_name = None
@@ -747,12 +808,15 @@ class ProtoRpc:
     def response_name(self) -> str:
         return self.response.name if isinstance(self.response, ProtoMessage) else self.response
 
-    def get_all_messages(self) -> dict[str, ProtoMessage]:
-        messages = {}
+    def get_all_messages(
+        self, messages: dict[str, ProtoMessage] | None = None
+    ) -> dict[str, ProtoMessage]:
+        if messages is None:
+            messages = {}
         if isinstance(self.request, ProtoMessage):
-            messages.update(self.request.get_all_messages())
+            self.request.get_all_messages(messages)
         if isinstance(self.response, ProtoMessage):
-            messages.update(self.response.get_all_messages())
+            self.response.get_all_messages(messages)
         return messages
 
 
@@ -779,10 +843,13 @@ class ProtoService:
                 )
         self.rpcs.append(rpc)
 
-    def get_all_messages(self) -> dict[str, ProtoMessage]:
-        messages = {}
+    def get_all_messages(
+        self, messages: dict[str, ProtoMessage] | None = None
+    ) -> dict[str, ProtoMessage]:
+        if messages is None:
+            messages = {}
         for rpc in self.rpcs:
-            messages.update(rpc.get_all_messages())
+            rpc.get_all_messages(messages)
         return messages
 
 
@@ -0,0 +1,236 @@
+"""
+Build the same ProtoFile as ``protoparser`` from the serialized descriptor of a compiled ``*_pb2.py``
+file. Reading the descriptor is much faster than parsing the proto file with lark, so it is used when
+the pb2 file is present and up to date with its proto file.
+
+The comments are not kept in the descriptor: all the comments of the returned ProtoFile are empty and
+the types of the nested messages and enums are qualified by their parent message.
+"""
+
+import ast
+import logging
+import re
+from pathlib import Path
+
+from google.protobuf import descriptor_pb2
+from google.protobuf.message import DecodeError
+
+from .protoparser import Comment, Enum, Field, Message, ProtoFile, RpcFunc, Service
+
+logger = logging.getLogger("django_socio_grpc.generation")
+
+# INFO - Recent protoc versions add the descriptor with AddSerializedFile, older ones with serialized_pb
+SERIALIZED_DESCRIPTOR_REGEX = re.compile(
+    r"(?:AddSerializedFile\(|serialized_pb=)(b'(?:[^'\\]|\\.)*')", re.DOTALL
+)
+PROTO_COMMENT_REGEX = re.compile(r"//[^\n]*|/\*.*?\*/", re.DOTALL)
+PROTO_TOP_LEVEL_REGEX = re.compile(r"^(?:message|enum)\s+(\w+)\s*\{", re.MULTILINE)
+# INFO - Matches the fields, map fields and enum values, not the options whose value is not a number
+PROTO_NUMBER_REGEX = re.compile(r"(\w+)\s*=\s*(\d+)\s*[;\[]")
+PROTO_PACKAGE_REGEX = re.compile(r"^package\s+([\w.]+)\s*;", re.MULTILINE)
+
+FieldType = descriptor_pb2.FieldDescriptorProto
+
+
+def get_pb2_path(proto_path: Path) -> Path:
+    return proto_path.with_name(f"{proto_path.stem}_pb2.py")
+
+
+def get_serialized_descriptor(pb2_content: str) -> bytes | None:
+    match = SERIALIZED_DESCRIPTOR_REGEX.search(pb2_content)
+    if not match:
+        return None
+    return ast.literal_eval(match.group(1))
+
+
+def _empty_comment() -> Comment:
+    return Comment("", {})
+
+
+def _get_type_name(field: FieldType, package: str) -> str:
+    if field.type in (FieldType.TYPE_MESSAGE, FieldType.TYPE_ENUM):
+        type_name = field.type_name.lstrip(".")
+        # INFO - Types of the package are written without it in the proto file
+        if package and type_name.startswith(f"{package}."):
+            type_name = type_name[len(package) + 1 :]
+        return type_name
+    return FieldType.Type.Name(field.type).removeprefix("TYPE_").lower()
+
+
+def _parse_enum(enum: descriptor_pb2.EnumDescriptorProto) -> Enum:
+    return Enum(
+        _empty_comment(),
+        enum.name,
+        [
+            Field(_empty_comment(), "enum", "enum", "enum", value.name, value.number)
+            for value in enum.value
+        ],
+    )
+
+
+def _parse_message(message: descriptor_pb2.DescriptorProto, package: str) -> Message:
+    map_entries = {
+        nested.name: nested for nested in message.nested_type if nested.options.map_entry
+    }
+    fields = []
+    for field in message.field:
+        type_name = _get_type_name(field, package)
+        map_entry = map_entries.get(type_name.rsplit(".", 1)[-1])
+        if field.label == FieldType.LABEL_REPEATED and map_entry is not None:
+            key, value = map_entry.field
+            fields.append(
+                Field(
+                    _empty_comment(),
+                    "map",
+                    _get_type_name(key, package),
+                    _get_type_name(value, package),
+                    field.name,
+                    field.number,
+                )
+            )
+            continue
+        if field.label == FieldType.LABEL_REPEATED:
+            field_type = "repeated"
+        elif field.proto3_optional:
+            field_type = "optional"
+        else:
+            field_type = type_name
+        fields.append(
+            Field(_empty_comment(), field_type, type_name, type_name, field.name, field.number)
+        )
+
+    return Message(
+        _empty_comment(),
+        message.name,
+        fields,
+        {
+            nested.name: _parse_message(nested, package)
+            for nested in message.nested_type
+            if nested.name not in map_entries
+        },
+        {enum.name: _parse_enum(enum) for enum in message.enum_type},
+    )
+
+
+def _parse_service(service: descriptor_pb2.ServiceDescriptorProto, package: str) -> Service:
+    functions = []
+    for method in service.method:
+        in_type = method.input_type.lstrip(".").removeprefix(f"{package}.")
+        out_type = method.output_type.lstrip(".").removeprefix(f"{package}.")
+        functions.append(RpcFunc(method.name, in_type, out_type, ""))
+    return Service(service.name, functions)
+
+
+def parse_file_descriptor(file_descriptor: descriptor_pb2.FileDescriptorProto) -> ProtoFile:
+    package = file_descriptor.package
+    return ProtoFile(
+        messages={
+            message.name: _parse_message(message, package)
+            for message in file_descriptor.message_type
+        },
+        enums={enum.name: _parse_enum(enum) for enum in file_descriptor.enum_type},
+        services={
+            service.name: _parse_service(service, package)
+            for service in file_descriptor.service
+        },
+        imports=list(file_descriptor.dependency),
+        options={},
+        package=package,
+    )
+
+
+def _get_block_body(proto_content: str, start: int) -> str:
+    depth = 1
+    for index in range(start, len(proto_content)):
+        if proto_content[index] == "{":
+            depth += 1
+        elif proto_content[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return proto_content[start:index]
+    return proto_content[start:]
+
+
+def get_proto_numbers(proto_content: str) -> dict[str, list[tuple[str, int]]]:
+    """
+    Return the sorted names and numbers of the fields and enum values declared in each top level
+    message and enum of the proto file, including the ones of their nested messages and enums.
+    """
+    proto_content = PROTO_COMMENT_REGEX.sub("", proto_content)
+    return {
+        match.group(1): sorted(
+            (name, int(number))
+            for name, number in PROTO_NUMBER_REGEX.findall(
+                _get_block_body(proto_content, match.end())
+            )
+        )
+        for match in PROTO_TOP_LEVEL_REGEX.finditer(proto_content)
+    }
+
+
+def _get_enum_numbers(enum: descriptor_pb2.EnumDescriptorProto) -> list[tuple[str, int]]:
+    return [(value.name, value.number) for value in enum.value]
+
+
+def _get_message_numbers(message: descriptor_pb2.DescriptorProto) -> list[tuple[str, int]]:
+    numbers = [(field.name, field.number) for field in message.field]
+    for nested in message.nested_type:
+        # INFO - The map entries are generated by protoc, their key and value are not in the proto file
+        if not nested.options.map_entry:
+            numbers.extend(_get_message_numbers(nested))
+    for enum in message.enum_type:
+        numbers.extend(_get_enum_numbers(enum))
+    return numbers
+
+
+def get_descriptor_numbers(
+    file_descriptor: descriptor_pb2.FileDescriptorProto,
+) -> dict[str, list[tuple[str, int]]]:
+    numbers = {
+        message.name: sorted(_get_message_numbers(message))
+        for message in file_descriptor.message_type
+    }
+    numbers.update(
+        {enum.name: sorted(_get_enum_numbers(enum)) for enum in file_descriptor.enum_type}
+    )
+    return numbers
+
+
+def is_descriptor_up_to_date(
+    file_descriptor: descriptor_pb2.FileDescriptorProto, proto_content: str
+) -> bool:
+    """
+    Check that the descriptor declares the same package, messages and enums as the proto file,
+    with the same field and enum value names and numbers, catching the pb2 files left behind by
+    a proto file edited or generated without compiling it.
+    """
+    package_match = PROTO_PACKAGE_REGEX.search(proto_content)
+    if (package_match.group(1) if package_match else "") != file_descriptor.package:
+        return False
+    return get_proto_numbers(proto_content) == get_descriptor_numbers(file_descriptor)
+
+
+def parse_from_pb2_file(proto_path: Path) -> ProtoFile | None:
+    """
+    Return the ProtoFile of the proto file read from the descriptor of its compiled pb2 file,
+    or None if there is no pb2 file next to it or if it is older than the proto file.
+    """
+    pb2_path = get_pb2_path(proto_path)
+    try:
+        if pb2_path.stat().st_mtime < proto_path.stat().st_mtime:
+            logger.debug(f"{pb2_path} is older than {proto_path}, parsing the proto file")
+            return None
+        serialized_descriptor = get_serialized_descriptor(pb2_path.read_text())
+    except (OSError, ValueError, SyntaxError):
+        return None
+    if serialized_descriptor is None:
+        return None
+
+    try:
+        file_descriptor = descriptor_pb2.FileDescriptorProto.FromString(serialized_descriptor)
+    except DecodeError:
+        return None
+    if not is_descriptor_up_to_date(file_descriptor, proto_path.read_text()):
+        logger.debug(f"{pb2_path} does not match {proto_path}, parsing the proto file")
+        return None
+    return parse_file_descriptor(file_descriptor)
@@ -18,6 +18,7 @@
 
 # From https://github.com/khadgarmage/protoparser v1.6.3
 
+import functools
 import json
 import typing
 
@@ -381,9 +382,14 @@ def parse_from_file(file: str):
         return parse(data)
 
 
+@functools.cache
+def get_parser() -> Lark:
+    # INFO - Building the LALR tables of the grammar takes longer than parsing a big proto file, do it once
+    return Lark(BNF, start="proto", parser="lalr", maybe_placeholders=False)
+
+
 def parse(data: str):
-    parser = Lark(BNF, start="proto", parser="lalr", maybe_placeholders=False)
-    tree = parser.parse(data)
+    tree = get_parser().parse(data)
     trans_tree = ProtoTransformer().transform(tree)
     enums = {}
     messages = {}
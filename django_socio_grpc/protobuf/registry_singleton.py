@@ -26,4 +26,8 @@ class RegistrySingleton(metaclass=SingletonMeta):
 
     @classmethod
     def clean_all(cls):
+        # INFO - proto_classes imports this module through utils.debug
+        from .proto_classes import ProtoMessage
+
         cls._instances.clear()
+        ProtoMessage.clear_from_serializer_cache()
@@ -0,0 +1,298 @@
+"""
+In-process publish/subscribe used to fan out model change events to the
+``Watch`` server streams of :class:`django_socio_grpc.mixins.WatchModelMixin`.
+
+Model signals publish a :class:`ModelEvent` on the backend configured by the
+``WATCH_BACKEND`` setting. Every ``Watch`` call owns a :class:`Subscription` with a
+bounded buffer. When a subscriber does not consume its events fast enough its
+buffer fills up and it is evicted instead of letting memory grow without limit.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger("django_socio_grpc.pubsub")
+
+
+class ModelEventType:
+    CREATED = "CREATED"
+    UPDATED = "UPDATED"
+    DELETED = "DELETED"
+
+
+@dataclass
+class ModelEvent:
+    """
+    Event published when an instance of a watched model is saved or deleted.
+    ``channel`` is the lower label of the model (``app_label.model_name``).
+    """
+
+    channel: str
+    event_type: str
+    pk: Any
+
+    def to_json(self) -> bytes:
+        return json.dumps(asdict(self), default=str).encode()
+
+    @classmethod
+    def from_json(cls, payload: bytes) -> "ModelEvent":
+        return cls(**json.loads(payload))
+
+
+class SubscriptionEvicted(Exception):
+    """
+    Raised when reading from a subscription that has been evicted because its consumer was too slow.
+    """
+
+
+class Subscription:
+    """
+    Bounded buffer of events for one subscriber.
+    It can be consumed from a thread (``get``) or from an event loop (``aget``).
+    """
+
+    def __init__(self, backend: "BasePubSubBackend", channel: str, max_size: int):
+        self.backend = backend
+        self.channel = channel
+        self.max_size = max_size
+        self.evicted = False
+        self.closed = False
+        self._events = deque()
+        self._condition = threading.Condition()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._async_event: asyncio.Event | None = None
+
+    def put(self, event: ModelEvent) -> bool:
+        """
+        Add an event to the buffer. Return False if the subscriber has been evicted.
+        """
+        with self._condition:
+            if self.evicted or self.closed:
+                return not self.evicted
+            if len(self._events) >= self.max_size:
+                # Drop the whole buffer: a slow consumer can not catch up anyway and keeping it would make the memory grow
+                self.evicted = True
+                self._events.clear()
+            else:
+                self._events.append(event)
+            self._condition.notify_all()
+        self._wake_up_async_waiter()
+        return not self.evicted
+
+    def _wake_up_async_waiter(self):
+        if self._loop is not None and self._async_event is not None:
+            # RuntimeError is raised if the loop of the subscriber is closed, nothing to wake up then
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(self._async_event.set)
+
+    def _pop(self) -> ModelEvent | None:
+        if self.evicted:
+            raise SubscriptionEvicted(
+                f"Subscription to {self.channel} has been evicted because its consumer is too slow"
+            )
+        if self._events:
+            return self._events.popleft()
+        return None
+
+    def get(self, timeout: float | None = None) -> ModelEvent | None:
+        """
+        Wait for the next event. Return None if no event arrived before the timeout or if the subscription is closed.
+        """
+        with self._condition:
+            if not self._events and not self.evicted and not self.closed:
+                self._condition.wait(timeout)
+            return self._pop()
+
+    async def aget(self) -> ModelEvent | None:
+        """
+        Wait for the next event without blocking the event loop. Return None if the subscription is closed.
+        """
+        if self._async_event is None:
+            self._loop = asyncio.get_running_loop()
+            self._async_event = asyncio.Event()
+        while True:
+            with self._condition:
+                self._async_event.clear()
+                event = self._pop()
+                if event is not None or self.closed:
+                    return event
+            await self._async_event.wait()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+        self._wake_up_async_waiter()
+        self.backend.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class BasePubSubBackend:
+    """
+    Base class of the backends that deliver model events to subscriptions.
+    """
+
+    def subscribe(self, channel: str, max_size: int) -> Subscription:
+        raise NotImplementedError("You need to implement the subscribe method")
+
+    def unsubscribe(self, subscription: Subscription):
+        raise NotImplementedError("You need to implement the unsubscribe method")
+
+    def publish(self, event: ModelEvent):
+        raise NotImplementedError("You need to implement the publish method")
+
+
+class InMemoryPubSubBackend(BasePubSubBackend):
+    """
+    Deliver events only to the subscriptions of the current process.
+    """
+
+    def __init__(self, **kwargs):
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str, max_size: int) -> Subscription:
+        subscription = Subscription(self, channel, max_size)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            self._subscriptions.get(subscription.channel, set()).discard(subscription)
+
+    def publish(self, event: ModelEvent):
+        self.publish_locally(event)
+
+    def publish_locally(self, event: ModelEvent):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(event.channel, ()))
+        for subscription in subscriptions:
+            if not subscription.put(event):
+                logger.warning(
+                    f"Evicting slow subscriber of {event.channel}: more than {subscription.max_size} events waiting"
+                )
+                self.unsubscribe(subscription)
+
+
+class UnixSocketPubSubBackend(InMemoryPubSubBackend):
+    """
+    Deliver events to every process of the host that use the same ``socket_dir``.
+    Each process bind a Unix datagram socket in ``socket_dir`` and publish to all the sockets found there.
+    Use it when running several server processes on the same machine. For multi-host deployment implement a backend on top of your broker.
+    """
+
+    def __init__(self, socket_dir: str | None = None, **kwargs):
+        super().__init__(**kwargs)
+        self.socket_dir = Path(socket_dir or Path(tempfile.gettempdir()) / "dsg-pubsub")
+        self.socket_dir.mkdir(parents=True, exist_ok=True)
+        self.socket_path = self.socket_dir / f"{os.getpid()}-{uuid.uuid4().hex[:8]}.sock"
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(str(self.socket_path))
+        self._listener = threading.Thread(target=self._listen, daemon=True)
+        self._listener.start()
+
+    def _listen(self):
+        while True:
+            try:
+                payload = self._socket.recv(65536)
+            except OSError:
+                # Socket closed
+                return
+            try:
+                self.publish_locally(ModelEvent.from_json(payload))
+            except Exception:
+                logger.exception(
+                    "Unable to deliver model event received from an other process"
+                )
+
+    def publish(self, event: ModelEvent):
+        payload = event.to_json()
+        for peer_path in self.socket_dir.glob("*.sock"):
+            if peer_path == self.socket_path:
+                continue
+            try:
+                self._socket.sendto(payload, str(peer_path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # The process owning this socket is dead, remove it to avoid trying again
+                peer_path.unlink(missing_ok=True)
+            except OSError:
+                logger.exception(f"Unable to publish model event to {peer_path}")
+        self.publish_locally(event)
+
+    def close(self):
+        self._socket.close()
+        self.socket_path.unlink(missing_ok=True)
+
+
+_backend: BasePubSubBackend | None = None
+
+
+def get_pubsub_backend() -> BasePubSubBackend:
+    """
+    Return the process wide backend configured by the ``WATCH_BACKEND`` and ``WATCH_BACKEND_OPTIONS`` settings.
+    """
+    from django_socio_grpc.settings import grpc_settings
+
+    global _backend
+    if _backend is None:
+        _backend = grpc_settings.WATCH_BACKEND(**grpc_settings.WATCH_BACKEND_OPTIONS)
+    return _backend
+
+
+def get_model_channel(model: type[Model]) -> str:
+    return model._meta.label_lower
+
+
+def publish_model_event(model: type[Model], event_type: str, pk: Any):
+    """
+    Publish the event once the current transaction is committed so subscribers can read the new state of the instance.
+    """
+    event = ModelEvent(channel=get_model_channel(model), event_type=event_type, pk=pk)
+    transaction.on_commit(lambda: get_pubsub_backend().publish(event))
+
+
+def _publish_post_save(sender, instance, created, **kwargs):
+    event_type = ModelEventType.CREATED if created else ModelEventType.UPDATED
+    publish_model_event(sender, event_type, instance.pk)
+
+
+def _publish_post_delete(sender, instance, **kwargs):
+    publish_model_event(sender, ModelEventType.DELETED, instance.pk)
+
+
+def connect_model_events(model: type[Model]):
+    """
+    Connect the ``post_save`` and ``post_delete`` signals of a model to the pub/sub backend.
+    Calling it several times for the same model connect the signals only once.
+    """
+    channel = get_model_channel(model)
+    post_save.connect(
+        _publish_post_save, sender=model, weak=False, dispatch_uid=f"dsg_watch_save_{channel}"
+    )
+    post_delete.connect(
+        _publish_post_delete,
+        sender=model,
+        weak=False,
+        dispatch_uid=f"dsg_watch_delete_{channel}",
+    )
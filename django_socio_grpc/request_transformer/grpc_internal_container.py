@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from google.protobuf.message import Message
@@ -23,6 +24,8 @@ class GRPCRequestContainer:
     context: GRPCInternalProxyContext
     action: str
     service: "Service"
+    # Used to log the duration of the request
+    start_time: float = field(default_factory=time.perf_counter)
 
     def __getattr__(self, attr):
         """
@@ -4,12 +4,62 @@ from typing import Optional
 from django.utils.datastructures import (
     CaseInsensitiveMapping,
 )
+from google.protobuf import descriptor_pool, message_factory
 from google.protobuf.message import Message
 from grpc.aio import ServicerContext
 
 from .socio_internal_request import InternalHttpRequest
 from .socio_internal_response import InternalHttpResponse
 
+# INFO - Incremented when the fields of the cached responses state change
+CACHED_RESPONSE_FORMAT_VERSION = 1
+
+
+def dump_cached_response(grpc_response: Message, metadata: dict, status_code: int) -> tuple:
+    """
+    Return the state of a cached response: a small header with the full name of the message type,
+    the trailing metadata (that are also the HTTP headers) and the HTTP status code, followed by the
+    serialized message. Only primitive types are pickled, instead of the protobuf message and the
+    InternalHttpResponse objects, so the cache entries are smaller and faster to dump and load.
+    """
+    return (
+        CACHED_RESPONSE_FORMAT_VERSION,
+        grpc_response.DESCRIPTOR.full_name,
+        metadata,
+        status_code,
+        grpc_response.SerializeToString(),
+    )
+
+
+def load_cached_response(state: tuple) -> tuple[Message, dict, int] | None:
+    """
+    Return the message, the metadata and the HTTP status code of a state returned by dump_cached_response.
+    The message class is found by its full name in the default descriptor pool.
+    Return None if the state was written by another format version or its message type does not exist anymore.
+    """
+    version, message_type, metadata, status_code, serialized_message = state
+    if version != CACHED_RESPONSE_FORMAT_VERSION:
+        return None
+    try:
+        descriptor = descriptor_pool.Default().FindMessageTypeByName(message_type)
+    except KeyError:
+        return None
+    grpc_response = message_factory.GetMessageClass(descriptor).FromString(serialized_message)
+    return grpc_response, metadata, status_code
+
+
+def load_cached_proxy_response(state: tuple) -> Optional["GRPCInternalProxyResponse"]:
+    """
+    Unpickle a GRPCInternalProxyResponse from its cached state.
+    Return None, that the cache middleware handles as a cache miss, if the state can not be loaded.
+    """
+    cached_response = load_cached_response(state)
+    if cached_response is None:
+        return None
+    proxy_response = GRPCInternalProxyResponse.__new__(GRPCInternalProxyResponse)
+    proxy_response.set_cached_response(*cached_response)
+    return proxy_response
+
 
 @dataclass
 class GRPCInternalProxyContext:
@@ -111,13 +161,20 @@ class GRPCInternalProxyResponse:
 
     def __getstate__(self):
         """
-        Allow to serialize the object mainly for cache purpose
+        Allow to serialize the object mainly for cache purpose. See dump_cached_response
+        """
+        return dump_cached_response(
+            self.grpc_response,
+            dict(self.grpc_context.trailing_metadata() or ()),
+            self.http_response.status_code,
+        )
+
+    def __reduce__(self):
+        """
+        Unpickle the object with load_cached_proxy_response, so that the cache entries written by
+        another format version are loaded as None, a cache miss, instead of raising in cache.get
         """
-        return {
-            "grpc_response": self.grpc_response,
-            "http_response": self.http_response,
-            "response_metadata": dict(self.grpc_context.trailing_metadata()),
-        }
+        return (load_cached_proxy_response, (self.__getstate__(),))
 
     def __repr__(self):
         return f"GRPCInternalProxyResponse<{self.grpc_response.__repr__()}, {self.http_response.__repr__()}>"
@@ -127,6 +184,7 @@ class GRPCInternalProxyResponse:
         Allow to deserialize the object mainly for cache purpose.
         When used in cache, the grpc_context is not set. To be correctly use set_current_context method should be called
         """
+        # INFO - Only the responses cached before the compact format are unpickled here, as pickled dicts
         self.grpc_response = state["grpc_response"]
         self.http_response = state["http_response"]
         self.headers = ResponseHeadersProxy(
@@ -134,6 +192,12 @@ class GRPCInternalProxyResponse:
         )
         self.grpc_context = None
 
+    def set_cached_response(self, grpc_response: Message, metadata: dict, status_code: int):
+        self.grpc_response = grpc_response
+        self.http_response = InternalHttpResponse(status=status_code)
+        self.headers = ResponseHeadersProxy(None, self.http_response, metadata=metadata)
+        self.grpc_context = None
+
     def set_current_context(self, grpc_context: ServicerContext):
         """
         This method is used to set the current context to the response object when fetched from cache
@@ -179,7 +243,8 @@ class ResponseHeadersProxy(CaseInsensitiveMapping):
         if self.grpc_context is None and self.metadata is None:
             raise ValueError("grpc_context or metadata must be set for ResponseHeadersProxy")
         if self.grpc_context is not None:
-            metadata_as_dict = dict(self.grpc_context.trailing_metadata())
+            # INFO - The context of the sync grpc server returns None when no metadata was set
+            metadata_as_dict = dict(self.grpc_context.trailing_metadata() or ())
         else:
             metadata_as_dict = self.metadata
         self.http_response.headers = metadata_as_dict
@@ -191,7 +256,7 @@ class ResponseHeadersProxy(CaseInsensitiveMapping):
         This method is used to set it after the object is created and merge their current metadata with the one cached
         """
         self.grpc_context = grpc_context
-        existing_metadata = dict(grpc_context.trailing_metadata())
+        existing_metadata = dict(grpc_context.trailing_metadata() or ())
 
         trailing_metadata_dict = {**existing_metadata, **self.http_response.headers}
         # INFO - AM - 01/08/2024 - We need to convert all the values to string if not bytes as grpc metadata only accept string and bytes
@@ -208,7 +273,7 @@ class ResponseHeadersProxy(CaseInsensitiveMapping):
 
     def __setitem__(self, key, value):
         if self.grpc_context:
-            trailing_metadata = self.grpc_context.trailing_metadata()
+            trailing_metadata = tuple(self.grpc_context.trailing_metadata() or ())
             self.grpc_context.set_trailing_metadata(
                 trailing_metadata + ((key.lower(), str(value)),)
             )
@@ -219,7 +284,7 @@ class ResponseHeadersProxy(CaseInsensitiveMapping):
         if self.grpc_context:
             new_metadata = [
                 (k, v)
-                for k, v in self.grpc_context.trailing_metadata()
+                for k, v in self.grpc_context.trailing_metadata() or ()
                 if k.lower() != header.lower()
             ]
             self.grpc_context.set_trailing_metadata(new_metadata)
@@ -8,9 +8,10 @@ from django.utils.datastructures import (
     CaseInsensitiveMapping,
 )
 from django.utils.functional import cached_property
+from google.protobuf.json_format import MessageToDict
 from google.protobuf.message import Message
 
-from django_socio_grpc.protobuf.json_format import message_to_dict
+from django_socio_grpc.protobuf.json_format import struct_to_dict
 from django_socio_grpc.settings import FilterAndPaginationBehaviorOptions, grpc_settings
 
 if TYPE_CHECKING:
@@ -32,6 +33,7 @@ class InternalHttpRequest(HttpRequest):
     PAGINATION_KEY = "pagination"
     FILTERS_KEY_IN_REQUEST = "_filters"
     PAGINATION_KEY_IN_REQUEST = "_pagination"
+    FILTERSET_KEY_IN_REQUEST = "_filterset"
 
     #  Map http method to use DjangoModelPermission
     METHOD_MAP = {
@@ -76,11 +78,17 @@ class InternalHttpRequest(HttpRequest):
         self.method = self.grpc_action_to_http_method_name(grpc_action)
 
         # Computed params | grpc_request is passed as argument and not class element because we don't want developer to access to the request from the context proxy
-        self.query_params = self.get_query_params(grpc_request)
+        # The filters and pagination are decoded once and keep their types (number, bool, list, ...)
+        self.filter_params = self.get_filter_params(grpc_request)
+        self.pagination_params = self.get_pagination_params(grpc_request)
+        self.query_params = {**self.filter_params, **self.pagination_params}
+        # Typed filter message generated by FilterSetGenerationPlugin
+        self.filterset_message = self.get_filterset_message(grpc_request)
 
         # INFO - AM - 23/07/2024 - Allow to use cache system based on filter and pagination metadata or request fields
         # See https://github.com/django/django/blob/main/django/http/request.py#L175
-        self.META["QUERY_STRING"] = urllib.parse.urlencode(self.query_params, doseq=True)
+        # The query string is only encoded if something (like the cache) reads it
+        self.META["QUERY_STRING"] = LazyMetaValue(self.get_query_string)
 
         # INFO - AM - 25/07/2024 - We need to set the server name to be able to use the cache system.
         # In Django if there is no HTTP_X_FORWARDED_HOST or HTTP_HOST, it will use the SERVER_NAME set by the ASGI handler
@@ -139,7 +147,7 @@ class InternalHttpRequest(HttpRequest):
         if hasattr(grpc_request, struct_field_name) and grpc_request.HasField(
             struct_field_name
         ):
-            return message_to_dict(getattr(grpc_request, struct_field_name))
+            return struct_to_dict(getattr(grpc_request, struct_field_name))
 
         return {}
 
@@ -154,44 +162,81 @@ class InternalHttpRequest(HttpRequest):
         Method that transform specific metadata and/or request fields (depending on FILTER_BEHAVIOR and PAGINATION_BEHAVIOR settings)
         into a dict as if it was some query params passed in simple HTTP/1 calls
         """
-        query_params = {}
-        if grpc_settings.FILTER_BEHAVIOR in [
-            FilterAndPaginationBehaviorOptions.METADATA_AND_REQUEST_STRUCT,
-            FilterAndPaginationBehaviorOptions.METADATA_STRICT,
-        ]:
-            query_params = {
-                **query_params,
-                **self.parse_specific_key_from_metadata(self.FILTERS_KEY),
-            }
+        return {
+            **self.get_filter_params(grpc_request),
+            **self.get_pagination_params(grpc_request),
+        }
 
-        if grpc_settings.FILTER_BEHAVIOR in [
-            FilterAndPaginationBehaviorOptions.METADATA_AND_REQUEST_STRUCT,
-            FilterAndPaginationBehaviorOptions.REQUEST_STRUCT_STRICT,
-        ]:
-            query_params = {
-                **query_params,
-                **self.get_from_request_struct(grpc_request, self.FILTERS_KEY_IN_REQUEST),
+    def get_filter_params(self, grpc_request: Message) -> dict:
+        """
+        Filters of the request from the metadata and/or the `_filters` request field depending on FILTER_BEHAVIOR.
+        The request field values win over the metadata ones.
+        """
+        return self._get_params(
+            grpc_request,
+            grpc_settings.FILTER_BEHAVIOR,
+            self.FILTERS_KEY,
+            self.FILTERS_KEY_IN_REQUEST,
+        )
+
+    def get_pagination_params(self, grpc_request: Message) -> dict:
+        """
+        Pagination of the request from the metadata and/or the `_pagination` request field depending on PAGINATION_BEHAVIOR.
+        The request field values win over the metadata ones.
+        """
+        return self._get_params(
+            grpc_request,
+            grpc_settings.PAGINATION_BEHAVIOR,
+            self.PAGINATION_KEY,
+            self.PAGINATION_KEY_IN_REQUEST,
+        )
+
+    def get_filterset_message(self, grpc_request: Message) -> Message | None:
+        """
+        The `_filterset` request field if set and allowed by FILTER_BEHAVIOR.
+        """
+        if grpc_settings.FILTER_BEHAVIOR == FilterAndPaginationBehaviorOptions.METADATA_STRICT:
+            return None
+        if hasattr(grpc_request, self.FILTERSET_KEY_IN_REQUEST) and grpc_request.HasField(
+            self.FILTERSET_KEY_IN_REQUEST
+        ):
+            return getattr(grpc_request, self.FILTERSET_KEY_IN_REQUEST)
+        return None
+
+    def get_query_string(self) -> str:
+        """
+        Encode the filters, the pagination and the set fields of the `_filterset` message
+        (prefixed by `_filterset.`) as the query string, so they are all part of the cache keys.
+        """
+        params = self.query_params
+        if self.filterset_message is not None:
+            filterset = MessageToDict(self.filterset_message, preserving_proto_field_name=True)
+            params = {
+                **params,
+                **{
+                    f"{self.FILTERSET_KEY_IN_REQUEST}.{name}": value
+                    for name, value in filterset.items()
+                },
             }
+        return urllib.parse.urlencode(params, doseq=True)
 
-        if grpc_settings.PAGINATION_BEHAVIOR in [
+    def _get_params(
+        self, grpc_request: Message, behavior: str, metadata_key: str, struct_field_name: str
+    ) -> dict:
+        params = {}
+        if behavior in [
             FilterAndPaginationBehaviorOptions.METADATA_AND_REQUEST_STRUCT,
             FilterAndPaginationBehaviorOptions.METADATA_STRICT,
         ]:
-            query_params = {
-                **query_params,
-                **self.parse_specific_key_from_metadata(self.PAGINATION_KEY),
-            }
+            params.update(self.parse_specific_key_from_metadata(metadata_key))
 
-        if grpc_settings.PAGINATION_BEHAVIOR in [
+        if behavior in [
             FilterAndPaginationBehaviorOptions.METADATA_AND_REQUEST_STRUCT,
             FilterAndPaginationBehaviorOptions.REQUEST_STRUCT_STRICT,
         ]:
-            query_params = {
-                **query_params,
-                **self.get_from_request_struct(grpc_request, self.PAGINATION_KEY_IN_REQUEST),
-            }
+            params.update(self.get_from_request_struct(grpc_request, struct_field_name))
 
-        return query_params
+        return params
 
     def grpc_action_to_http_method_name(self, grpc_action: str) -> str:
         """
@@ -204,6 +249,17 @@ class InternalHttpRequest(HttpRequest):
         return self.METHOD_MAP.get(grpc_action, "POST")
 
 
+class LazyMetaValue:
+    """
+    Value of RequestMeta only computed when it is read for the first time
+    """
+
+    __slots__ = ("compute",)
+
+    def __init__(self, compute):
+        self.compute = compute
+
+
 class RequestMeta(CaseInsensitiveMapping):
     """
     Class allowing specific automatic transformation/matching behavior between HTTP headers format expected by django and gRPC metadata format
@@ -211,7 +267,7 @@ class RequestMeta(CaseInsensitiveMapping):
 
     HTTP_PREFIX = HttpHeaders.HTTP_PREFIX  # = HTTP_
 
-    def __getitem__(self, key):
+    def get_store_key(self, key):
         """
         As HTTP headers are prefixed by HTTP_ by proxy server or CGI, Django store and retrieve headers with HTTP_ prefix
         As there is no same rule/restriction in gRPC, we need to check if the key is in the dict without HTTP_ prefix if not existing with
@@ -222,7 +278,19 @@ class RequestMeta(CaseInsensitiveMapping):
             # INFO - AM - 27/07/2024 - Then we check if maybe the key exist but with hypen instead of underscore
             if key.lower() not in self._store and key.replace("_", "-").lower() in self._store:
                 key = key.replace("_", "-")
-        return super().__getitem__(key=key)
+        return key
+
+    def __getitem__(self, key):
+        key = self.get_store_key(key)
+        value = super().__getitem__(key=key)
+        if isinstance(value, LazyMetaValue):
+            value = value.compute()
+            self[key] = value
+        return value
+
+    def __contains__(self, key):
+        # INFO - Do not compute the lazy values only to check the key exist
+        return self.get_store_key(key).lower() in self._store
 
     def __setitem__(self, key, value):
         """See: https://github.com/django/django/blob/main/django/utils/datastructures.py#L305"""
@@ -94,7 +94,7 @@ class AppHandlerRegistry:
     def get_all_messages(self) -> dict[str, ProtoMessage]:
         messages = {}
         for proto_service in self.proto_services:
-            messages.update(proto_service.get_all_messages())
+            proto_service.get_all_messages(messages)
 
         return messages
 
@@ -121,7 +121,10 @@ class AppHandlerRegistry:
         # INFO - AM - 01/12/2023 - register action find mixins into parent class and call GRPCAction class with the correct argument to populate the proto_service attribute of the class
         # INFO - AM - 01/12/2023 - custom action using grpc_action decorator are already populated in proto_service attribute as they are call when the code first launch
         # INFO - AM - 01/12/2023 - to populate the service class the class is passed as argument and then proto_service is just updated in that argument
-        service_class.register_actions()
+        # INFO - The proto messages are only needed to generate the protos, when serving they are built on first use if LAZY_ACTION_REGISTRATION is set
+        service_class.register_actions(
+            lazy=self.server is not None and grpc_settings.LAZY_ACTION_REGISTRATION
+        )
 
         # INFO - AM - 01/12/2023 - add the instance of ProtoService correspondig to the current service being registered as GRPCAction class populate it.
         self.proto_services.append(service_class.proto_service)
@@ -129,14 +132,20 @@ class AppHandlerRegistry:
         if self.server is None:
             return
 
+        pb2_grpc = self.import_pb2_grpc_module()
+        self.add_servicer_to_server(service_class, pb2_grpc)
+
+    def import_pb2_grpc_module(self):
+        path = self.get_pb2_grpc_module()
         try:
-            path = self.get_pb2_grpc_module()
-            pb2_grpc = import_module(path)
+            return import_module(path)
         except ModuleNotFoundError:
             logger.error(
                 f"PB2 module {path} not found. Please generate proto before launching server"
             )
+            raise
 
+    def add_servicer_to_server(self, service_class: type["Service"], pb2_grpc):
         controller_name = service_class.get_controller_name()
         add_server = getattr(pb2_grpc, f"add_{controller_name}Servicer_to_server")
         add_server(service_class.as_servicer(), self.server)
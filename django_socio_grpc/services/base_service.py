@@ -1,16 +1,17 @@
 import asyncio
 from typing import TYPE_CHECKING
 
-from asgiref.sync import sync_to_async
 from django.db.models.query import QuerySet
 from google.protobuf.message import Message
 from rest_framework.permissions import BasePermission
 
+from django_socio_grpc.authentication_cache import authentication_cache
 from django_socio_grpc.exceptions import PermissionDenied, Unauthenticated
 from django_socio_grpc.grpc_actions.actions import GRPCActionMixin
 from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
 from django_socio_grpc.services.servicer_proxy import ServicerProxy
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.utils.executors import sync_to_async
 
 if TYPE_CHECKING:
     from django_socio_grpc.services import AppHandlerRegistry
@@ -34,6 +35,16 @@ class Service(GRPCActionMixin):
 
     _is_auth_performed: bool = False
 
+    # Authentication, permission and filter classes are instantiated once per service class and reused.
+    # Set it to False if their instances keep a state specific to a request.
+    cache_component_instances: bool = True
+
+    # Class attributes listing the components to instantiate with the name of their methods that can be async
+    _component_attributes: dict[str, tuple[str, ...]] = {
+        "authentication_classes": (),
+        "permission_classes": ("has_permission", "has_object_permission"),
+    }
+
     def __init__(self, **kwargs):
         """
         Set kwargs as self attributes.
@@ -49,12 +60,70 @@ class Service(GRPCActionMixin):
     def get_controller_name(cls):
         return f"{cls.get_service_name()}Controller"
 
+    @classmethod
+    def _instantiate_components(
+        cls, attribute_name: str, component_classes
+    ) -> tuple[tuple, ...]:
+        async_methods = cls._component_attributes[attribute_name]
+        return tuple(
+            (
+                instance,
+                *(
+                    asyncio.iscoroutinefunction(getattr(instance, method))
+                    for method in async_methods
+                ),
+            )
+            for instance in (component_class() for component_class in component_classes)
+        )
+
+    @classmethod
+    def get_class_component_instances(cls, attribute_name: str) -> tuple[tuple, ...]:
+        """
+        Return a tuple of ``(instance, *is_async)`` for each class listed in the ``attribute_name``
+        class attribute, ``is_async`` telling if each method of ``_component_attributes`` is a coroutine function.
+        The result is computed once per service class unless ``cache_component_instances`` is False.
+        """
+        component_classes = tuple(getattr(cls, attribute_name))
+        if not cls.cache_component_instances:
+            return cls._instantiate_components(attribute_name, component_classes)
+
+        cache = cls.__dict__.get("_component_instances_cache")
+        if cache is None:
+            cache = {}
+            cls._component_instances_cache = cache
+        cached = cache.get(attribute_name)
+        # The classes are compared in case the class attribute has been changed since
+        if cached is None or cached[0] != component_classes:
+            cached = (
+                component_classes,
+                cls._instantiate_components(attribute_name, component_classes),
+            )
+            cache[attribute_name] = cached
+        return cached[1]
+
+    def get_component_instances(self, attribute_name: str) -> tuple[tuple, ...]:
+        """
+        Same as ``get_class_component_instances`` but the components set on the service instance
+        are instantiated for each request.
+        """
+        if attribute_name in self.__dict__:
+            return self._instantiate_components(attribute_name, getattr(self, attribute_name))
+        return self.get_class_component_instances(attribute_name)
+
+    @classmethod
+    def resolve_component_instances(cls):
+        """
+        Instantiate all the components of ``_component_attributes`` before the first request.
+        """
+        for attribute_name in cls._component_attributes:
+            cls.get_class_component_instances(attribute_name)
+
     def perform_authentication(self):
         if self._is_auth_performed:
             return
         user_auth_tuple = None
         try:
-            user_auth_tuple = self.resolve_user()
+            user_auth_tuple = authentication_cache.resolve_user(self)
         except Exception as e:
             raise Unauthenticated(detail=e) from e
 
@@ -67,13 +136,9 @@ class Service(GRPCActionMixin):
         self._is_auth_performed = True
 
     def resolve_user(self):
-        auth_responses = [
-            response
-            for auth in self.authentication_classes
-            if (response := auth().authenticate(self.context))
-        ]
-        if auth_responses:
-            return auth_responses[0]
+        for (authenticator,) in self.get_component_instances("authentication_classes"):
+            if response := authenticator.authenticate(self.context):
+                return response
         return None
 
     def _check_permissions(self):
@@ -81,10 +146,23 @@ class Service(GRPCActionMixin):
             if not permission.has_permission(self.context, self):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
 
+    def _get_permission_components(self):
+        if type(self).get_permissions is Service.get_permissions:
+            return self.get_component_instances("permission_classes")
+        # A custom get_permissions can return different permissions for each request
+        return [
+            (
+                permission,
+                asyncio.iscoroutinefunction(permission.has_permission),
+                asyncio.iscoroutinefunction(permission.has_object_permission),
+            )
+            for permission in self.get_permissions()
+        ]
+
     async def _async_check_permissions(self):
-        for permission in self.get_permissions():
+        for permission, is_async, _ in self._get_permission_components():
             has_permission = permission.has_permission
-            if not asyncio.iscoroutinefunction(permission.has_permission):
+            if not is_async:
                 has_permission = sync_to_async(permission.has_permission)
             if not await has_permission(self.context, self):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
@@ -95,9 +173,9 @@ class Service(GRPCActionMixin):
         return self._check_permissions()
 
     async def acheck_object_permissions(self, obj):
-        for permission in self.get_permissions():
+        for permission, _, is_async in self._get_permission_components():
             has_object_permission = permission.has_object_permission
-            if not asyncio.iscoroutinefunction(permission.has_object_permission):
+            if not is_async:
                 has_object_permission = sync_to_async(permission.has_object_permission)
             if not await has_object_permission(self.context, self, obj):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
@@ -108,7 +186,9 @@ class Service(GRPCActionMixin):
                 raise PermissionDenied(detail=getattr(permission, "message", None))
 
     def get_permissions(self) -> list[BasePermission]:
-        return [permission() for permission in self.permission_classes]
+        return [
+            permission for permission, *_ in self.get_component_instances("permission_classes")
+        ]
 
     def _before_action(self):
         self.perform_authentication()
@@ -171,4 +251,6 @@ class Service(GRPCActionMixin):
 
             cls.queryset._fetch_all = force_evaluation
 
+        cls.resolve_component_instances()
+
         return cls._servicer_proxy(cls)
@@ -1,6 +1,9 @@
 import abc
 import asyncio
+import contextlib
 import logging
+import random
+import time
 from collections.abc import AsyncIterable, Awaitable, Callable
 from typing import TYPE_CHECKING
 
@@ -17,8 +20,9 @@ from rest_framework.exceptions import APIException
 from django_socio_grpc.exceptions import (
     GRPCException,
     Unimplemented,
-    get_exception_status_code_and_details,
+    get_exception_status,
 )
+from django_socio_grpc.log import RequestLogEvent, request_log_queue
 from django_socio_grpc.request_transformer import (
     GRPCInternalProxyResponse,
     GRPCRequestContainer,
@@ -26,6 +30,8 @@ from django_socio_grpc.request_transformer import (
 )
 from django_socio_grpc.request_transformer.grpc_internal_proxy import GRPCInternalProxyContext
 from django_socio_grpc.settings import grpc_settings
+from django_socio_grpc.signals import grpc_stream_flow_control
+from django_socio_grpc.utils.executors import request_executor_context
 from django_socio_grpc.utils.utils import isgeneratorfunction, safe_async_response
 
 if TYPE_CHECKING:
@@ -34,6 +40,9 @@ if TYPE_CHECKING:
 middleware_logger = logging.getLogger("django_socio_grpc.middlewares")
 request_logger = logging.getLogger("django_socio_grpc.request")
 exception_logger = logging.getLogger("django_socio_grpc.exceptions")
+stream_logger = logging.getLogger("django_socio_grpc.stream")
+
+_END_OF_STREAM = object()
 
 
 _ServicerCtx = Local()
@@ -176,49 +185,150 @@ class ServicerProxy(MiddlewareCapable):
 
     def _get_async_stream_handler(self, action: str) -> Awaitable[Callable]:
         async def handler(request: Message, context) -> AsyncIterable[Message]:
-            proxy_context = GRPCInternalProxyContext(
-                context, request, action, self.service_class.__name__
-            )
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
+            async with request_executor_context():
+                proxy_context = GRPCInternalProxyContext(
+                    context, request, action, self.service_class.__name__
+                )
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    async for response in await safe_async_response(
+                        self._middleware_chain, request_container
+                    ):
+                        yield response.grpc_response
+                except Exception as e:
+                    exc = e
+                    await self.async_process_exception(e, context)
+                finally:
+                    self.log_response(exc, request_container)
+
+        return handler
+
+    def _get_async_stream_write_handler(self, action: str) -> Awaitable[Callable]:
+        """
+        Same as `_get_async_stream_handler` but the responses are sent with `context.write`
+        through a window of ASYNC_STREAM_WRITE_WINDOW messages. See `write_stream`.
+        """
+
+        async def handler(request: Message, context) -> None:
+            async with request_executor_context():
+                proxy_context = GRPCInternalProxyContext(
+                    context, request, action, self.service_class.__name__
+                )
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    responses = await safe_async_response(
+                        self._middleware_chain, request_container
+                    )
+                    await self.write_stream(responses, context, action)
+                except Exception as e:
+                    exc = e
+                    await self.async_process_exception(e, context)
+                finally:
+                    self.log_response(exc, request_container)
+
+        return handler
+
+    async def write_stream(self, responses, context, action: str):
+        """
+        Write the responses with `context.write`, which waits for the gRPC flow control.
+        A writer task consume a queue of at most ASYNC_STREAM_WRITE_WINDOW messages.
+        When the queue is full the producer (the action and its database fetch) is paused
+        until the client read enough messages. The time spent paused is sent with the
+        `grpc_stream_flow_control` signal when the stream ends.
+        If the action raises, the messages of the window are written before the error is sent.
+        """
+        window = asyncio.Queue(maxsize=grpc_settings.ASYNC_STREAM_WRITE_WINDOW)
+
+        async def writer():
+            while (message := await window.get()) is not _END_OF_STREAM:
+                await context.write(message)
+
+        writer_task = asyncio.create_task(writer())
+        message_count = stall_count = 0
+        stall_time = 0.0
+
+        async def put(message):
+            nonlocal stall_count, stall_time
+            if not window.full():
+                window.put_nowait(message)
+                return
+            stall_count += 1
+            stall_start = time.perf_counter()
+            put_task = asyncio.create_task(window.put(message))
             try:
-                exc = None
-                async for response in await safe_async_response(
-                    self._middleware_chain, request_container
-                ):
-                    yield response.grpc_response
-            except Exception as e:
-                exc = e
-                await self.async_process_exception(e, context)
+                await asyncio.wait(
+                    {put_task, writer_task}, return_when=asyncio.FIRST_COMPLETED
+                )
             finally:
-                self.log_response(exc, request_container)
+                stall_time += time.perf_counter() - stall_start
+            if not put_task.done():
+                # The writer stopped before consuming the message (client gone, write error)
+                put_task.cancel()
+                writer_task.result()
 
-        return handler
+        try:
+            async for response in responses:
+                await put(response.grpc_response)
+                message_count += 1
+            await put(_END_OF_STREAM)
+            await writer_task
+        except Exception:
+            # INFO - The messages of the window are written before the error is sent: the action
+            # considers them sent, for example the resume token of Stream already covers them
+            with contextlib.suppress(Exception):
+                await put(_END_OF_STREAM)
+                await writer_task
+            raise
+        finally:
+            if not writer_task.done():
+                writer_task.cancel()
+            grpc_stream_flow_control.send(
+                sender=self.service_class,
+                action=action,
+                message_count=message_count,
+                stall_count=stall_count,
+                stall_time=stall_time,
+            )
+            stream_logger.debug(
+                f"{self.service_class.get_service_name()}/{action} sent {message_count} messages, "
+                f"paused {stall_count} times for {stall_time:.3f}s waiting for the client"
+            )
 
     def _get_async_handler(self, action: str) -> Awaitable[Callable]:
         async def handler(request: Message, context) -> Awaitable[Message]:
-            proxy_context = GRPCInternalProxyContext(
-                context, request, action, self.service_class.__name__
-            )
-            service_instance = self.create_service(
-                request=request, context=proxy_context, action=action
-            )
-            request_container = GRPCRequestContainer(
-                request, proxy_context, action, service_instance
-            )
-            try:
-                exc = None
-                response = await safe_async_response(self._middleware_chain, request_container)
-                return response.grpc_response
-            except Exception as e:
-                exc = e
-                await self.async_process_exception(e, context)
-            finally:
-                self.log_response(exc, request_container)
+            async with request_executor_context():
+                proxy_context = GRPCInternalProxyContext(
+                    context, request, action, self.service_class.__name__
+                )
+                service_instance = self.create_service(
+                    request=request, context=proxy_context, action=action
+                )
+                request_container = GRPCRequestContainer(
+                    request, proxy_context, action, service_instance
+                )
+                try:
+                    exc = None
+                    response = await safe_async_response(
+                        self._middleware_chain, request_container
+                    )
+                    return response.grpc_response
+                except Exception as e:
+                    exc = e
+                    await self.async_process_exception(e, context)
+                finally:
+                    self.log_response(exc, request_container)
 
         return handler
 
@@ -273,6 +383,8 @@ class ServicerProxy(MiddlewareCapable):
 
         if grpc_settings.GRPC_ASYNC:
             if isgeneratorfunction(service_action):
+                if grpc_settings.ASYNC_STREAM_WRITE_WINDOW:
+                    return self._get_async_stream_write_handler(action)
                 return self._get_async_stream_handler(action)
             return self._get_async_handler(action)
 
@@ -293,51 +405,114 @@ class ServicerProxy(MiddlewareCapable):
         return self.get_handler(action)
 
     def process_exception(self, exc: Exception, context: grpc.ServicerContext):
-        status_code, details = get_exception_status_code_and_details(exc)
+        status_code, details, trailing_metadata = get_exception_status(exc)
+        if trailing_metadata:
+            context.set_trailing_metadata(
+                tuple(context.trailing_metadata() or ()) + trailing_metadata
+            )
         context.abort(status_code, details)
 
     async def async_process_exception(self, exc: Exception, context: grpc.aio.ServicerContext):
-        status_code, details = get_exception_status_code_and_details(exc)
+        status_code, details, trailing_metadata = get_exception_status(exc)
+        if trailing_metadata:
+            context.set_trailing_metadata(
+                tuple(context.trailing_metadata() or ()) + trailing_metadata
+            )
         await context.abort(status_code, details)
 
-    def log_exception(self, exception: Exception, message: str, extra=None):
+    def get_exception_log_level(self, exception: Exception) -> int:
         """
         Exception logging levels:
         - GRPCException: `exception.logging_level`
         - APIException: WARNING if `status_code` < 500 else ERROR
         - Other: ERROR
         """
-
-        if extra is None:
-            extra = {}
         logging_level = "ERROR"
         if isinstance(exception, GRPCException):
             logging_level = exception.logging_level
         elif isinstance(exception, APIException) and exception.status_code < 500:
             logging_level = "WARNING"
 
-        try:
-            log_level = getattr(request_logger, logging_level.lower())
-        except AttributeError:
+        log_level = logging.getLevelName(logging_level.upper())
+        if not isinstance(log_level, int):
             exception_logger.warning(
                 f"Unsupported logging level {logging_level}. Defaulting to Warning"
             )
-            log_level = request_logger.warning
-        log_level(message, exc_info=exception, extra=extra)
+            log_level = logging.WARNING
+        return log_level
+
+    def log_exception(self, exception: Exception, message: str, extra=None):
+        if extra is None:
+            extra = {}
+        request_logger.log(
+            self.get_exception_log_level(exception), message, exc_info=exception, extra=extra
+        )
+
+    def get_response_log_level(
+        self, exception: Exception | None, action: str, duration: float
+    ) -> int | None:
+        """
+        Level of the log of the response, None if it is not logged.
+        Errors and responses slower than LOG_SLOW_RESPONSE_THRESHOLD are always logged.
+        OK responses are logged if LOG_OK_RESPONSE or DEBUG, sampled with LOG_SAMPLING_RATES.
+        """
+        if exception is not None:
+            return self.get_exception_log_level(exception)
+        slow_threshold = grpc_settings.LOG_SLOW_RESPONSE_THRESHOLD
+        if slow_threshold is not None and duration >= slow_threshold:
+            return logging.WARNING
+        if not (grpc_settings.LOG_OK_RESPONSE or settings.DEBUG):
+            return None
+        sampling_rates = grpc_settings.LOG_SAMPLING_RATES
+        if sampling_rates:
+            service_name = self.service_class.get_service_name()
+            sampling_rate = sampling_rates.get(
+                f"{service_name}.{action}",
+                sampling_rates.get(service_name, sampling_rates.get("*", 1)),
+            )
+            if sampling_rate < 1 and random.random() >= sampling_rate:
+                return None
+        return logging.INFO
 
     def log_response(
         self, exception: Exception | None, request_container: GRPCRequestContainer
     ):
+        duration = time.perf_counter() - request_container.start_time
+        log_level = self.get_response_log_level(exception, request_container.action, duration)
+        if log_level is None or not request_logger.isEnabledFor(log_level):
+            return
+        user = getattr(request_container.context, "user", None)
+        event = RequestLogEvent(
+            emit=self.emit_response_log,
+            service_name=self.service_class.get_service_name(),
+            action=request_container.action,
+            user_pk=getattr(user, "pk", None),
+            exception=exception,
+            status_code=request_container.context.code(),
+            duration=duration,
+            level=log_level,
+        )
+        if grpc_settings.LOG_QUEUE_SIZE:
+            request_log_queue.put(event, grpc_settings.LOG_QUEUE_SIZE)
+        else:
+            self.emit_response_log(event, request_container)
+
+    def emit_response_log(
+        self, event: RequestLogEvent, request_container: GRPCRequestContainer | None = None
+    ):
+        """
+        Log the response. The request container is only given when the log is not queued.
+        """
         extra = {
-            "request": request_container,
-            "status_code": request_container.context.code(),
+            "status_code": event.status_code,
+            "duration": event.duration,
         }
-        path = f"{self.service_class.get_service_name()}/{request_container.action}"
+        if request_container is not None:
+            extra["request"] = request_container
+        path = f"{event.service_name}/{event.action}"
 
-        if not exception:
-            if grpc_settings.LOG_OK_RESPONSE or settings.DEBUG:
-                message = f"OK : {path}"
-                request_logger.info(message, extra=extra)
+        if not event.exception:
+            request_logger.log(event.level, f"OK : {path}", extra=extra)
         else:
-            message = f"{type(exception).__name__} : {path}"
-            self.log_exception(exception, message, extra=extra)
+            message = f"{type(event.exception).__name__} : {path}"
+            self.log_exception(event.exception, message, extra=extra)
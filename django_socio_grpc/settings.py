@@ -14,9 +14,11 @@ gRPC framework settings, checking for user settings first, then falling
 back to the defaults.
 """
 
+import importlib.util
 from enum import Enum
 
 from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.core.signals import setting_changed
 from django.utils.module_loading import import_string
 
@@ -56,6 +58,63 @@ class FilterAndPaginationBehaviorOptions(str, Enum):
     # METADATA_AND_FILTER_MESSAGE = "METADATA_AND_FILTER_MESSAGE"
 
 
+class ReadReplicaSelectionOptions(str, Enum):
+    """
+    ReadReplicaSelectionOptions is an StrEnum that present the configuration possibilities for READ_REPLICA_SELECTION.
+    """
+
+    ROUND_ROBIN = "ROUND_ROBIN"
+    """
+    Use each replica in turn.
+    """
+
+    LEAST_LAG = "LEAST_LAG"
+    """
+    Use the replica with the smallest replication lag as returned by READ_REPLICA_LAG_FUNCTION.
+    """
+
+
+class AsyncExecutorOptions(str, Enum):
+    """
+    AsyncExecutorOptions is an StrEnum that present the configuration possibilities for ASYNC_EXECUTOR.
+    It defines where the sync code called by the async services of DSG (ORM, serializers, permissions...) is run.
+    """
+
+    THREAD_SENSITIVE = "THREAD_SENSITIVE"
+    """
+    Run all the sync code of all the requests one at a time in the same thread. This is the default of asgiref ``sync_to_async``.
+    """
+
+    PER_REQUEST = "PER_REQUEST"
+    """
+    Run the sync code of each request in a thread dedicated to the request. Requests run their sync code concurrently
+    and a request keeps the same database connection, so transactions can span several sync calls.
+    """
+
+    THREAD_POOL = "THREAD_POOL"
+    """
+    Run each sync call in a thread of a pool of ASYNC_EXECUTOR_MAX_WORKERS threads, each with its own database connection.
+    A request can use several threads so transactions can not span several sync calls.
+    """
+
+
+class ErrorDetailsFormatOptions(str, Enum):
+    """
+    ErrorDetailsFormatOptions is an StrEnum that present the configuration possibilities for ERROR_DETAILS_FORMAT.
+    """
+
+    TEXT = "TEXT"
+    """
+    The details of the error are the JSON of the full details of the exception. This is the legacy behavior.
+    """
+
+    STRUCTURED = "STRUCTURED"
+    """
+    The details of the error are a short message and the errors are sent in a ``google.rpc.Status`` in the ``grpc-status-details-bin`` trailing metadata,
+    with a ``google.rpc.BadRequest`` for the validation errors. Requires the ``googleapis-common-protos`` package.
+    """
+
+
 DEFAULTS = {
     # Root grpc handlers hook configuration
     "ROOT_HANDLERS_HOOK": None,
@@ -96,6 +155,28 @@ DEFAULTS = {
     "LOG_OK_RESPONSE": False,
     # List service action that we do not want to be logged (health check for example) to avoid log flooding. ex: ['Service1.Action1', 'Service1.Action1']
     "IGNORE_LOG_FOR_ACTION": [],
+    # Rate (between 0 and 1) of the OK responses logged by action, service or for all ("*"). ex: {"Service1.Action1": 0.01, "*": 0.1}
+    "LOG_SAMPLING_RATES": {},
+    # Duration in seconds from which OK responses are logged as WARNING, even if LOG_OK_RESPONSE is False or the response is not sampled
+    "LOG_SLOW_RESPONSE_THRESHOLD": None,
+    # If set, responses are logged from a background thread through a queue of this size instead of in the request. Logs are dropped when it is full
+    "LOG_QUEUE_SIZE": None,
+    # Maximum number of logs emitted by the background thread between two checks of the dropped logs
+    "LOG_QUEUE_BATCH_SIZE": 100,
+    # Actions profiled by profiling_middleware, as "Service.Action", "Service" or "*". ex: ['Service1.Action1', 'Service2']
+    "PROFILING_ACTIONS": [],
+    # Rate (between 0 and 1) of the calls of PROFILING_ACTIONS profiled with cProfile, or whose stack is sampled in async
+    "PROFILING_SAMPLE_RATE": 0,
+    # Duration in seconds from which the stack of the calls of PROFILING_ACTIONS not profiled with cProfile is sampled
+    "PROFILING_SLOW_THRESHOLD": None,
+    # Interval in seconds between two stack samples of a slow call
+    "PROFILING_STACK_INTERVAL": 0.005,
+    # Directory where the profiles are written. None to use a django-socio-grpc-profiles directory in the temporary directory
+    "PROFILING_DIRECTORY": None,
+    # Number of profiles kept in PROFILING_DIRECTORY, the oldest ones are removed
+    "PROFILING_MAX_FILES": 100,
+    # Metadata used to name the profile files after the id of the request. A random id is used if it is missing
+    "PROFILING_REQUEST_ID_METADATA_KEY": "x-request-id",
     # An iterable containing pairs path for server certificate. See https://grpc.github.io/grpc/python/grpc.html#create-server-credentials and https://github.com/grpc/grpc/tree/master/examples/python/auth.
     # Exemple of usage: PRIVATE_KEY_CERTIFICATE_CHAIN_PAIRS_PATH: [("server-key.pem", "server.pem")]
     "PRIVATE_KEY_CERTIFICATE_CHAIN_PAIRS_PATH": [],
@@ -113,8 +194,55 @@ DEFAULTS = {
     "DEFAULT_MESSAGE_NAME_CONSTRUCTOR": "django_socio_grpc.protobuf.message_name_constructor.DefaultMessageNameConstructor",
     # Variable that indicate the plugins used in proto generation by default
     "DEFAULT_GENERATION_PLUGINS": [GlobalScopeWrappedEnumGenerationPlugin()],
+    # Only register the actions needed to serve at server startup. Their proto messages are built when first needed
+    "LAZY_ACTION_REGISTRATION": False,
     # Enable the healthcheck service
     "ENABLE_HEALTH_CHECK": False,
+    # Max number of messages waiting to be written for async server streams. When set, the messages are sent with context.write
+    # and the action is paused while the window is full instead of letting gRPC buffer all the messages of a slow client
+    "ASYNC_STREAM_WRITE_WINDOW": None,
+    # Algorithm ("gzip" or "deflate") used by compression_middleware for the responses of the actions without compression in their grpc_action. None to not compress them
+    "RESPONSE_COMPRESSION": None,
+    # Size in bytes under which the response messages are sent uncompressed by compression_middleware
+    "RESPONSE_COMPRESSION_THRESHOLD": 1024,
+    # Rate (between 0 and 1) of the compressed calls whose compression ratio and CPU time are sent with the grpc_response_compression signal
+    "RESPONSE_COMPRESSION_METRICS_SAMPLE_RATE": 0,
+    # Max size in bytes of the unpaginated List responses of ListModelMixin. Larger responses fail early with RESOURCE_EXHAUSTED. None to not check it
+    "LIST_MAX_MESSAGE_SIZE": None,
+    # Where the sync code of async services is run. See AsyncExecutorOptions
+    "ASYNC_EXECUTOR": AsyncExecutorOptions.THREAD_SENSITIVE,
+    # Number of threads of the THREAD_POOL executor. None to use the --max-workers of grpcrunaioserver or the ThreadPoolExecutor default
+    "ASYNC_EXECUTOR_MAX_WORKERS": None,
+    # Database aliases used by django_socio_grpc.db_routers.ReadReplicaRouter for read only actions. ex: ["replica1", "replica2"]
+    "READ_REPLICA_DATABASES": [],
+    # How the replica is chosen between READ_REPLICA_DATABASES. See ReadReplicaSelectionOptions
+    "READ_REPLICA_SELECTION": ReadReplicaSelectionOptions.ROUND_ROBIN,
+    # Replicas with a replication lag in seconds greater than this are not used. None to never check the lag
+    "READ_REPLICA_MAX_LAG": None,
+    # Function taking a database alias and returning its replication lag in seconds (or None if unknown)
+    "READ_REPLICA_LAG_FUNCTION": "django_socio_grpc.db_routers.get_postgresql_replica_lag",
+    # Number of seconds the replication lag of a replica is cached
+    "READ_REPLICA_LAG_CACHE_TIMEOUT": 5,
+    # Metadata key of the timestamp of the last write, returned by read_your_writes_middleware and sent back by the client to read its own writes
+    "READ_YOUR_WRITES_METADATA_KEY": "last-write-at",
+    # Seconds the result of the authentication of a credential is cached. None to authenticate every request
+    "AUTHENTICATION_CACHE_TIMEOUT": None,
+    # Max number of authentication results cached by each process
+    "AUTHENTICATION_CACHE_MAX_SIZE": 10000,
+    # Request META keys containing the credentials the authentication results are cached by
+    "AUTHENTICATION_CACHE_HEADERS": ["HTTP_AUTHORIZATION"],
+    # Django cache alias used to share the authentication results between processes. None to only cache them in the process
+    "AUTHENTICATION_CACHE_ALIAS": None,
+    # Labels of the models invalidating the authentication results of their user when saved or deleted, in addition to the user model. ex: ["authtoken.Token"]
+    "AUTHENTICATION_CACHE_INVALIDATION_MODELS": [],
+    # Format of the errors sent to the client. See ErrorDetailsFormatOptions
+    "ERROR_DETAILS_FORMAT": ErrorDetailsFormatOptions.TEXT,
+    # Backend used to deliver model change events to the Watch streams. See django_socio_grpc.pubsub
+    "WATCH_BACKEND": "django_socio_grpc.pubsub.InMemoryPubSubBackend",
+    # Keyword arguments passed to the WATCH_BACKEND class. ex: {"socket_dir": "/run/dsg"} for UnixSocketPubSubBackend
+    "WATCH_BACKEND_OPTIONS": {},
+    # Number of events a Watch stream can have waiting before being evicted as a slow consumer
+    "WATCH_QUEUE_MAX_SIZE": 1000,
 }
 
 
@@ -127,11 +255,38 @@ IMPORT_STRINGS = [
     "DEFAULT_FILTER_BACKENDS",
     "LOG_EXTRA_CONTEXT_FUNCTION",
     "DEFAULT_MESSAGE_NAME_CONSTRUCTOR",
+    "WATCH_BACKEND",
+    "READ_REPLICA_LAG_FUNCTION",
 ]
 
 MERGE_DEFAULTS = ["MAP_METADATA_KEYS"]
 
 
+def validate_error_details_format(val):
+    try:
+        val = ErrorDetailsFormatOptions(val)
+    except ValueError as e:
+        raise ImproperlyConfigured(
+            f"Invalid GRPC setting 'ERROR_DETAILS_FORMAT': {val!r}. "
+            f"Choices are {[option.value for option in ErrorDetailsFormatOptions]}."
+        ) from e
+    if (
+        val == ErrorDetailsFormatOptions.STRUCTURED
+        and importlib.util.find_spec("google.rpc") is None
+    ):
+        raise ImproperlyConfigured(
+            "GRPC setting 'ERROR_DETAILS_FORMAT' STRUCTURED requires the googleapis-common-protos package. "
+            "Install it with django-socio-grpc[structured-errors]."
+        )
+    return val
+
+
+# Settings validated when they are loaded
+VALIDATORS = {
+    "ERROR_DETAILS_FORMAT": validate_error_details_format,
+}
+
+
 def perform_import(val, setting_name):
     """
     If the given setting is a string import notation,
@@ -207,11 +362,21 @@ class GRPCSettings:
         if attr in MERGE_DEFAULTS:
             val = {**self.defaults[attr], **val}
 
+        if attr in VALIDATORS:
+            val = VALIDATORS[attr](val)
+
         # Cache the result
         self._cached_attrs.add(attr)
         setattr(self, attr, val)
         return val
 
+    def validate(self):
+        """
+        Load the settings having a validator so an invalid one raises ImproperlyConfigured at startup.
+        """
+        for attr in VALIDATORS:
+            getattr(self, attr)
+
     def reload(self):
         for attr in self._cached_attrs:
             delattr(self, attr)
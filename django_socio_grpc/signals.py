@@ -2,3 +2,12 @@ from django.dispatch import Signal
 
 # INFO - AM - 22/08/2024 - grpc_action_register is a signal send for each grpc action when the grpc action is registered. Each grpc action need to be registered to generate proto. It allow us to make action as registration or cache deleter signals as this features need the name of the service
 grpc_action_register = Signal()
+
+# grpc_stream_flow_control is sent at the end of each async server stream written with ASYNC_STREAM_WRITE_WINDOW.
+# Receivers get the action name, the number of messages sent and how many times and how long (in seconds) the action was paused waiting for the client
+grpc_stream_flow_control = Signal()
+
+# grpc_response_compression is sent by compression_middleware at the end of each call of an action with a compression algorithm.
+# Receivers get the action name, the algorithm, the number of messages sent and compressed and the size in bytes of the compressed messages.
+# The ratio (compressed size / size) and the CPU time in seconds are None if the call was not sampled with RESPONSE_COMPRESSION_METRICS_SAMPLE_RATE
+grpc_response_compression = Signal()
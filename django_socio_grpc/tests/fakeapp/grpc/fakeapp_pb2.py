@@ -26,7 +26,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2django_socio_grpc/tests/fakeapp/grpc/fakeapp.proto\x12\x11myproject.fakeapp\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"k\n\x1c\x42\x61seProtoExampleListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.BaseProtoExampleResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\x17\x42\x61seProtoExampleRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"Y\n\x18\x42\x61seProtoExampleResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"1\n\x1c\x42\x61sicFetchDataForUserRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"/\n\x1f\x42\x61sicFetchTranslatedKeyResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\"#\n\x14\x42\x61sicListIdsResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"%\n\x15\x42\x61sicListNameResponse\x12\x0c\n\x04name\x18\x01 \x03(\t\"e\n\x19\x42\x61sicMixParamListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.BasicMixParamResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"*\n\x15\x42\x61sicMixParamResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"b\n\'BasicMixParamWithSerializerListResponse\x12(\n\x07results\x18\x01 \x03(\x0b\x32\x17.google.protobuf.Struct\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"y\n#BasicParamWithSerializerListRequest\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.BasicParamWithSerializerRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xbd\x01\n\x1f\x42\x61sicParamWithSerializerRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"o\n\x1e\x42\x61sicProtoListChildListRequest\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.BasicProtoListChildRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"q\n\x1f\x42\x61sicProtoListChildListResponse\x12?\n\x07results\x18\x01 \x03(\x0b\x32..myproject.fakeapp.BasicProtoListChildResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x87\x01\n\x1a\x42\x61sicProtoListChildRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"\x88\x01\n\x1b\x42\x61sicProtoListChildResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"c\n\x18\x42\x61sicServiceListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.BasicServiceResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\x01\n\x13\x42\x61sicServiceRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"\x9b\x01\n\x14\x42\x61sicServiceResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\rbytes_example\x18\x03 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x04 \x03(\x0b\x32\x17.google.protobuf.Struct\"2\n!BasicTestNoMetaSerializerResponse\x12\r\n\x05value\x18\x01 \x01(\t\"k\n\x1c\x43ustomMixParamForListRequest\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.CustomMixParamForRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"-\n\x18\x43ustomMixParamForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\")\n\x14\x43ustomNameForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"*\n\x15\x43ustomNameForResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"\xa2\x01\n0CustomRetrieveResponseSpecialFieldsModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x14\x64\x65\x66\x61ult_method_field\x18\x02 \x01(\x05\x12\x34\n\x13\x63ustom_method_field\x18\x03 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"(\n\x1a\x44\x65\x66\x61ultValueDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\x19\n\x17\x44\x65\x66\x61ultValueListRequest\"c\n\x18\x44\x65\x66\x61ultValueListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.DefaultValueResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\t\n DefaultValuePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x07 \x03(\t\x12\x17\n\x0fstring_required\x18\x08 \x01(\t\x12\x19\n\x0cstring_blank\x18\t \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\n \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\x0b \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0c \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\r \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\x0e \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0f \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x10 \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x11 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x12 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x13 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x14 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\"\x84\t\n\x13\x44\x65\x66\x61ultValueRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x17\n\x0fstring_required\x18\x07 \x01(\t\x12\x19\n\x0cstring_blank\x18\x08 \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\t \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\n \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0b \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\x0c \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\r \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x10 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x11 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x12 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x13 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\"\x85\t\n\x14\x44\x65\x66\x61ultValueResponse\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x17\n\x0fstring_required\x18\x07 \x01(\t\x12\x19\n\x0cstring_blank\x18\x08 \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\t \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\n \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0b \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\x0c \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\r \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x10 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x11 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x12 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x13 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\")\n\x1b\x44\x65\x66\x61ultValueRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\xaf\x01\n\x14\x45numBasicEnumRequest\x12K\n\x04\x65num\x18\x01 \x01(\x0e\x32=.myproject.fakeapp.EnumBasicEnumRequest.MyGRPCActionEnum.Enum\x1aJ\n\x10MyGRPCActionEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"\xbf\x01\n\x1c\x45numBasicEnumRequestResponse\x12S\n\x04\x65num\x18\x01 \x01(\x0e\x32\x45.myproject.fakeapp.EnumBasicEnumRequestResponse.MyGRPCActionEnum.Enum\x1aJ\n\x10MyGRPCActionEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"r\n%EnumServiceAnnotatedSerializerRequest\x12I\n\x1a\x63har_choices_in_serializer\x18\x01 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\"s\n&EnumServiceAnnotatedSerializerResponse\x12I\n\x1a\x63har_choices_in_serializer\x18\x01 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\"\xcd\x03\n\x12\x45numServiceRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12@\n\x0c\x63har_choices\x18\x02 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x01\x88\x01\x01\x12I\n\x15\x63har_choices_nullable\x18\x03 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x02\x88\x01\x01\x12N\n\x1f\x63har_choices_no_default_no_null\x18\x04 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\x12?\n\x0bint_choices\x18\x05 \x01(\x0e\x32%.myproject.fakeapp.MyTestIntEnum.EnumH\x03\x88\x01\x01\x12\'\n\x1a\x63har_choices_not_annotated\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x05\n\x03_idB\x0f\n\r_char_choicesB\x18\n\x16_char_choices_nullableB\x0e\n\x0c_int_choicesB\x1d\n\x1b_char_choices_not_annotated\"\xce\x03\n\x13\x45numServiceResponse\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12@\n\x0c\x63har_choices\x18\x02 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x01\x88\x01\x01\x12I\n\x15\x63har_choices_nullable\x18\x03 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x02\x88\x01\x01\x12N\n\x1f\x63har_choices_no_default_no_null\x18\x04 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\x12?\n\x0bint_choices\x18\x05 \x01(\x0e\x32%.myproject.fakeapp.MyTestIntEnum.EnumH\x03\x88\x01\x01\x12\'\n\x1a\x63har_choices_not_annotated\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x05\n\x03_idB\x0f\n\r_char_choicesB\x18\n\x16_char_choices_nullableB\x0e\n\x0c_int_choicesB\x1d\n\x1b_char_choices_not_annotated\"(\n\x1a\x45numServiceRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"3\n%ExceptionStreamRaiseExceptionResponse\x12\n\n\x02id\x18\x01 \x01(\t\"\x19\n\x17\x46oreignModelListRequest\"c\n\x18\x46oreignModelListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"@\n\x14\x46oreignModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\tB\x07\n\x05_uuid\"B\n\"ForeignModelRetrieveCustomResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ustom\x18\x02 \x01(\t\"9\n)ForeignModelRetrieveCustomRetrieveRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"q\n#ImportStructEvenInArrayModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"r\n$ImportStructEvenInArrayModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"c\n\x14ManyManyModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x19test_write_only_on_nested\x18\x03 \x01(\tB\x07\n\x05_uuid\"A\n\x15ManyManyModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\tB\x07\n\x05_uuid\"!\n\rNoMetaRequest\x12\x10\n\x08my_field\x18\x01 \x01(\t\"0\n RecursiveTestModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dRecursiveTestModelListRequest\"o\n\x1eRecursiveTestModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xf2\x01\n&RecursiveTestModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x41\n\x06parent\x18\x03 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestH\x01\x88\x01\x01\x12>\n\x08\x63hildren\x18\x04 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestB\x07\n\x05_uuidB\t\n\x07_parent\"\xc5\x01\n\x19RecursiveTestModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x41\n\x06parent\x18\x02 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestH\x01\x88\x01\x01\x12>\n\x08\x63hildren\x18\x03 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestB\x07\n\x05_uuidB\t\n\x07_parent\"\xc8\x01\n\x1aRecursiveTestModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x42\n\x06parent\x18\x02 \x01(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponseH\x01\x88\x01\x01\x12?\n\x08\x63hildren\x18\x03 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponseB\x07\n\x05_uuidB\t\n\x07_parent\"1\n!RecursiveTestModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"/\n\x1fRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1e\n\x1cRelatedFieldModelListRequest\"|\n\x1dRelatedFieldModelListResponse\x12L\n\x16list_custom_field_name\x18\x01 \x03(\x0b\x32,.myproject.fakeapp.RelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xd6\x01\n%RelatedFieldModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x05 \x03(\tB\x07\n\x05_uuid\"\xa9\x01\n\x18RelatedFieldModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\x04 \x03(\tB\x07\n\x05_uuid\"\xa5\x03\n\x19RelatedFieldModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12=\n\x07\x66oreign\x18\x02 \x01(\x0b\x32\'.myproject.fakeapp.ForeignModelResponseH\x01\x88\x01\x01\x12;\n\tmany_many\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.ManyManyModelResponse\x12\x1c\n\x0fslug_test_model\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12\x1f\n\x17slug_reverse_test_model\x18\x05 \x03(\x08\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12%\n\x18proto_slug_related_field\x18\x07 \x01(\tH\x03\x88\x01\x01\x12\x19\n\x11\x63ustom_field_name\x18\x08 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\t \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_modelB\x1b\n\x19_proto_slug_related_field\"0\n RelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"5\n%SimpleRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"$\n\"SimpleRelatedFieldModelListRequest\"y\n#SimpleRelatedFieldModelListResponse\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x84\x02\n+SimpleRelatedFieldModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x14\n\x07\x66oreign\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x05 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x07 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"\xd7\x01\n\x1eSimpleRelatedFieldModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66oreign\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x04 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x05 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x06 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"\xd8\x01\n\x1fSimpleRelatedFieldModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66oreign\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x04 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x05 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x06 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"6\n&SimpleRelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"0\n SpecialFieldsModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dSpecialFieldsModelListRequest\"o\n\x1eSpecialFieldsModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.SpecialFieldsModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb9\x01\n&SpecialFieldsModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x30\n\nmeta_datas\x18\x03 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x04 \x03(\x05\x42\x07\n\x05_uuidB\r\n\x0b_meta_datas\"\x8c\x01\n\x19SpecialFieldsModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x30\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x42\x07\n\x05_uuidB\r\n\x0b_meta_datas\"\xad\x01\n\x1aSpecialFieldsModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x30\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x12\x13\n\x06\x62inary\x18\x04 \x01(\x0cH\x02\x88\x01\x01\x42\x07\n\x05_uuidB\r\n\x0b_meta_datasB\t\n\x07_binary\"1\n!SpecialFieldsModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"k\n\x1cStreamInStreamInListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\'\n\x17StreamInStreamInRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\")\n\x18StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\"-\n\x1dStreamInStreamToStreamRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\".\n\x1eStreamInStreamToStreamResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\"=\n)SyncUnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"\xaa\x01\n\x1dUnitTestModelAdminOnlyRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x05 \x03(\tB\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"\xa3\x01\n\x1eUnitTestModelAdminOnlyResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x12\x17\n\nadmin_text\x18\x05 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\")\n\x1bUnitTestModelDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x8e\x01\n\"UnitTestModelListExtraArgsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x1e\n\x16query_fetched_datetime\x18\x02 \x01(\t\x12\x39\n\x07results\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\"\x1a\n\x18UnitTestModelListRequest\"e\n\x19UnitTestModelListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"9\n%UnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"\x86\x01\n!UnitTestModelPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"Y\n\x14UnitTestModelRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"r\n\x15UnitTestModelResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x07\n\x05_text\"*\n\x1cUnitTestModelRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x1c\n\x1aUnitTestModelStreamRequest\"2\n$UnitTestModelWithCacheDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xba\x01\n8UnitTestModelWithCacheInheritListWithStructFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"w\n\"UnitTestModelWithCacheListResponse\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb3\x01\n1UnitTestModelWithCacheListWithStructFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\x8f\x01\n*UnitTestModelWithCachePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"b\n\x1dUnitTestModelWithCacheRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"\x99\x01\n\x1eUnitTestModelWithCacheResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x12\x1c\n\x14verify_custom_header\x18\x05 \x01(\tB\x05\n\x03_idB\x07\n\x05_text\"3\n%UnitTestModelWithCacheRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"%\n#UnitTestModelWithCacheStreamRequest\"9\n+UnitTestModelWithStructFilterDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xb5\x01\n3UnitTestModelWithStructFilterEmptyWithFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\xaa\x01\n(UnitTestModelWithStructFilterListRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\x85\x01\n)UnitTestModelWithStructFilterListResponse\x12I\n\x07results\x18\x01 \x03(\x0b\x32\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x96\x01\n1UnitTestModelWithStructFilterPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"i\n$UnitTestModelWithStructFilterRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"\x82\x01\n%UnitTestModelWithStructFilterResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x07\n\x05_text\":\n,UnitTestModelWithStructFilterRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\",\n*UnitTestModelWithStructFilterStreamRequest\"G\n\rMyTestStrEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"?\n\rMyTestIntEnum\".\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x07\n\x03ONE\x10\x01\x12\x07\n\x03TWO\x10\x02\x32\xbc\n\n\x0f\x42\x61sicController\x12t\n\tBasicList\x12\x31.myproject.fakeapp.BasicProtoListChildListRequest\x1a\x32.myproject.fakeapp.BasicProtoListChildListResponse\"\x00\x12[\n\x06\x43reate\x12&.myproject.fakeapp.BasicServiceRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12n\n\x10\x46\x65tchDataForUser\x12/.myproject.fakeapp.BasicFetchDataForUserRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12\x62\n\x12\x46\x65tchTranslatedKey\x12\x16.google.protobuf.Empty\x1a\x32.myproject.fakeapp.BasicFetchTranslatedKeyResponse\"\x00\x12T\n\x0bGetMultiple\x12\x16.google.protobuf.Empty\x1a+.myproject.fakeapp.BasicServiceListResponse\"\x00\x12L\n\x07ListIds\x12\x16.google.protobuf.Empty\x1a\'.myproject.fakeapp.BasicListIdsResponse\"\x00\x12N\n\x08ListName\x12\x16.google.protobuf.Empty\x1a(.myproject.fakeapp.BasicListNameResponse\"\x00\x12k\n\x08MixParam\x12/.myproject.fakeapp.CustomMixParamForListRequest\x1a,.myproject.fakeapp.BasicMixParamListResponse\"\x00\x12\x8e\x01\n\x16MixParamWithSerializer\x12\x36.myproject.fakeapp.BasicParamWithSerializerListRequest\x1a:.myproject.fakeapp.BasicMixParamWithSerializerListResponse\"\x00\x12_\n\x08MyMethod\x12\'.myproject.fakeapp.CustomNameForRequest\x1a(.myproject.fakeapp.CustomNameForResponse\"\x00\x12x\n\x17TestBaseProtoSerializer\x12*.myproject.fakeapp.BaseProtoExampleRequest\x1a/.myproject.fakeapp.BaseProtoExampleListResponse\"\x00\x12\x43\n\x0fTestEmptyMethod\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12p\n\x14TestNoMetaSerializer\x12 .myproject.fakeapp.NoMetaRequest\x1a\x34.myproject.fakeapp.BasicTestNoMetaSerializerResponse\"\x00\x32\xe1\x04\n\x16\x44\x65\x66\x61ultValueController\x12[\n\x06\x43reate\x12&.myproject.fakeapp.DefaultValueRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.myproject.fakeapp.DefaultValueDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x61\n\x04List\x12*.myproject.fakeapp.DefaultValueListRequest\x1a+.myproject.fakeapp.DefaultValueListResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.myproject.fakeapp.DefaultValuePartialUpdateRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12\x65\n\x08Retrieve\x12..myproject.fakeapp.DefaultValueRetrieveRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12[\n\x06Update\x12&.myproject.fakeapp.DefaultValueRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x32\xda\x04\n\x0e\x45numController\x12n\n\x10\x42\x61sicEnumRequest\x12\'.myproject.fakeapp.EnumBasicEnumRequest\x1a/.myproject.fakeapp.EnumBasicEnumRequestResponse\"\x00\x12u\n\"BasicEnumRequestWithAnnotatedModel\x12%.myproject.fakeapp.EnumServiceRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x12\xa0\x01\n\'BasicEnumRequestWithAnnotatedSerializer\x12\x38.myproject.fakeapp.EnumServiceAnnotatedSerializerRequest\x1a\x39.myproject.fakeapp.EnumServiceAnnotatedSerializerResponse\"\x00\x12Y\n\x06\x43reate\x12%.myproject.fakeapp.EnumServiceRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x12\x63\n\x08Retrieve\x12-.myproject.fakeapp.EnumServiceRetrieveRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x32\xd1\x02\n\x13\x45xceptionController\x12@\n\x0c\x41PIException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\rGRPCException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12l\n\x14StreamRaiseException\x12\x16.google.protobuf.Empty\x1a\x38.myproject.fakeapp.ExceptionStreamRaiseExceptionResponse\"\x00\x30\x01\x12G\n\x13UnaryRaiseException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xff\x01\n\x16\x46oreignModelController\x12\x61\n\x04List\x12*.myproject.fakeapp.ForeignModelListRequest\x1a+.myproject.fakeapp.ForeignModelListResponse\"\x00\x12\x81\x01\n\x08Retrieve\x12<.myproject.fakeapp.ForeignModelRetrieveCustomRetrieveRequest\x1a\x35.myproject.fakeapp.ForeignModelRetrieveCustomResponse\"\x00\x32\xa5\x01\n&ImportStructEvenInArrayModelController\x12{\n\x06\x43reate\x12\x36.myproject.fakeapp.ImportStructEvenInArrayModelRequest\x1a\x37.myproject.fakeapp.ImportStructEvenInArrayModelResponse\"\x00\x32\xa9\x05\n\x1cRecursiveTestModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.RecursiveTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.RecursiveTestModelListRequest\x1a\x31.myproject.fakeapp.RecursiveTestModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.RecursiveTestModelPartialUpdateRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12q\n\x08Retrieve\x12\x34.myproject.fakeapp.RecursiveTestModelRetrieveRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x32\x9d\x05\n\x1bRelatedFieldModelController\x12\x65\n\x06\x43reate\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12W\n\x07\x44\x65stroy\x12\x32.myproject.fakeapp.RelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12k\n\x04List\x12/.myproject.fakeapp.RelatedFieldModelListRequest\x1a\x30.myproject.fakeapp.RelatedFieldModelListResponse\"\x00\x12y\n\rPartialUpdate\x12\x38.myproject.fakeapp.RelatedFieldModelPartialUpdateRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12o\n\x08Retrieve\x12\x33.myproject.fakeapp.RelatedFieldModelRetrieveRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12\x65\n\x06Update\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x32\xe6\x05\n!SimpleRelatedFieldModelController\x12q\n\x06\x43reate\x12\x31.myproject.fakeapp.SimpleRelatedFieldModelRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12]\n\x07\x44\x65stroy\x12\x38.myproject.fakeapp.SimpleRelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12w\n\x04List\x12\x35.myproject.fakeapp.SimpleRelatedFieldModelListRequest\x1a\x36.myproject.fakeapp.SimpleRelatedFieldModelListResponse\"\x00\x12\x85\x01\n\rPartialUpdate\x12>.myproject.fakeapp.SimpleRelatedFieldModelPartialUpdateRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12{\n\x08Retrieve\x12\x39.myproject.fakeapp.SimpleRelatedFieldModelRetrieveRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12q\n\x06Update\x12\x31.myproject.fakeapp.SimpleRelatedFieldModelRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x32\xc0\x05\n\x1cSpecialFieldsModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.SpecialFieldsModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.SpecialFieldsModelListRequest\x1a\x31.myproject.fakeapp.SpecialFieldsModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.SpecialFieldsModelPartialUpdateRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12\x34.myproject.fakeapp.SpecialFieldsModelRetrieveRequest\x1a\x43.myproject.fakeapp.CustomRetrieveResponseSpecialFieldsModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x32\x84\x03\n\x12StreamInController\x12k\n\x08StreamIn\x12*.myproject.fakeapp.StreamInStreamInRequest\x1a/.myproject.fakeapp.StreamInStreamInListResponse\"\x00(\x01\x12{\n\x0eStreamToStream\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x31.myproject.fakeapp.StreamInStreamToStreamResponse\"\x00(\x01\x30\x01\x12\x83\x01\n\x17StreamToStreamReadWrite\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x30.myproject.fakeapp.StreamInStreamToStreamRequest\"\x00(\x01\x30\x01\x32\xe6\x07\n\x1bSyncUnitTestModelController\x12\x7f\n\x16\x41\x64minOnlyPartialUpdate\x12\x30.myproject.fakeapp.UnitTestModelAdminOnlyRequest\x1a\x31.myproject.fakeapp.UnitTestModelAdminOnlyResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x8a\x01\n\x11ListWithExtraArgs\x12<.myproject.fakeapp.SyncUnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\xde\x07\n\x17UnitTestModelController\x12\x7f\n\x16\x41\x64minOnlyPartialUpdate\x12\x30.myproject.fakeapp.UnitTestModelAdminOnlyRequest\x1a\x31.myproject.fakeapp.UnitTestModelAdminOnlyResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x86\x01\n\x11ListWithExtraArgs\x12\x38.myproject.fakeapp.UnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\xb4\n\n UnitTestModelWithCacheController\x12o\n\x06\x43reate\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12\\\n\x07\x44\x65stroy\x12\x37.myproject.fakeapp.UnitTestModelWithCacheDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12x\n%ListWithAutoCacheCleanOnSaveAndDelete\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12}\n*ListWithAutoCacheCleanOnSaveAndDeleteRedis\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12l\n\x19ListWithPossibilityMaxAge\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x95\x01\n\x14ListWithStructFilter\x12\x44.myproject.fakeapp.UnitTestModelWithCacheListWithStructFilterRequest\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x83\x01\n\rPartialUpdate\x12=.myproject.fakeapp.UnitTestModelWithCachePartialUpdateRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12y\n\x08Retrieve\x12\x38.myproject.fakeapp.UnitTestModelWithCacheRetrieveRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12w\n\x06Stream\x12\x36.myproject.fakeapp.UnitTestModelWithCacheStreamRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x30\x01\x12o\n\x06Update\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x32\xc2\n\n\'UnitTestModelWithCacheInheritController\x12o\n\x06\x43reate\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12\\\n\x07\x44\x65stroy\x12\x37.myproject.fakeapp.UnitTestModelWithCacheDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12x\n%ListWithAutoCacheCleanOnSaveAndDelete\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12}\n*ListWithAutoCacheCleanOnSaveAndDeleteRedis\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12l\n\x19ListWithPossibilityMaxAge\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x9c\x01\n\x14ListWithStructFilter\x12K.myproject.fakeapp.UnitTestModelWithCacheInheritListWithStructFilterRequest\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x83\x01\n\rPartialUpdate\x12=.myproject.fakeapp.UnitTestModelWithCachePartialUpdateRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12y\n\x08Retrieve\x12\x38.myproject.fakeapp.UnitTestModelWithCacheRetrieveRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12w\n\x06Stream\x12\x36.myproject.fakeapp.UnitTestModelWithCacheStreamRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x30\x01\x12o\n\x06Update\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x32\xad\x08\n\'UnitTestModelWithStructFilterController\x12}\n\x06\x43reate\x12\x37.myproject.fakeapp.UnitTestModelWithStructFilterRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x63\n\x07\x44\x65stroy\x12>.myproject.fakeapp.UnitTestModelWithStructFilterDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\x0f\x45mptyWithFilter\x12\x46.myproject.fakeapp.UnitTestModelWithStructFilterEmptyWithFilterRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x83\x01\n\x04List\x12;.myproject.fakeapp.UnitTestModelWithStructFilterListRequest\x1a<.myproject.fakeapp.UnitTestModelWithStructFilterListResponse\"\x00\x12\x91\x01\n\rPartialUpdate\x12\x44.myproject.fakeapp.UnitTestModelWithStructFilterPartialUpdateRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12?.myproject.fakeapp.UnitTestModelWithStructFilterRetrieveRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x85\x01\n\x06Stream\x12=.myproject.fakeapp.UnitTestModelWithStructFilterStreamRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x30\x01\x12}\n\x06Update\x12\x37.myproject.fakeapp.UnitTestModelWithStructFilterRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n2django_socio_grpc/tests/fakeapp/grpc/fakeapp.proto\x12\x11myproject.fakeapp\x1a\x1bgoogle/protobuf/empty.proto\x1a\x1cgoogle/protobuf/struct.proto\"k\n\x1c\x42\x61seProtoExampleListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.BaseProtoExampleResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"X\n\x17\x42\x61seProtoExampleRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"Y\n\x18\x42\x61seProtoExampleResponse\x12\x0c\n\x04uuid\x18\x01 \x01(\t\x12\x1a\n\x12number_of_elements\x18\x02 \x01(\x05\x12\x13\n\x0bis_archived\x18\x03 \x01(\x08\"1\n\x1c\x42\x61sicFetchDataForUserRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"/\n\x1f\x42\x61sicFetchTranslatedKeyResponse\x12\x0c\n\x04text\x18\x01 \x01(\t\"#\n\x14\x42\x61sicListIdsResponse\x12\x0b\n\x03ids\x18\x01 \x03(\x05\"%\n\x15\x42\x61sicListNameResponse\x12\x0c\n\x04name\x18\x01 \x03(\t\"e\n\x19\x42\x61sicMixParamListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.BasicMixParamResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"*\n\x15\x42\x61sicMixParamResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"b\n\'BasicMixParamWithSerializerListResponse\x12(\n\x07results\x18\x01 \x03(\x0b\x32\x17.google.protobuf.Struct\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"y\n#BasicParamWithSerializerListRequest\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.BasicParamWithSerializerRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xbd\x01\n\x1f\x42\x61sicParamWithSerializerRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"o\n\x1e\x42\x61sicProtoListChildListRequest\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.BasicProtoListChildRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"q\n\x1f\x42\x61sicProtoListChildListResponse\x12?\n\x07results\x18\x01 \x03(\x0b\x32..myproject.fakeapp.BasicProtoListChildResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x87\x01\n\x1a\x42\x61sicProtoListChildRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"\x88\x01\n\x1b\x42\x61sicProtoListChildResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"c\n\x18\x42\x61sicServiceListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.BasicServiceResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\x01\n\x13\x42\x61sicServiceRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\ruser_password\x18\x03 \x01(\t\x12\x15\n\rbytes_example\x18\x04 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x05 \x03(\x0b\x32\x17.google.protobuf.Struct\"\x9b\x01\n\x14\x42\x61sicServiceResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12*\n\tuser_data\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x15\n\rbytes_example\x18\x03 \x01(\x0c\x12-\n\x0clist_of_dict\x18\x04 \x03(\x0b\x32\x17.google.protobuf.Struct\"2\n!BasicTestNoMetaSerializerResponse\x12\r\n\x05value\x18\x01 \x01(\t\"k\n\x1c\x43ustomMixParamForListRequest\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.CustomMixParamForRequest\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"-\n\x18\x43ustomMixParamForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\")\n\x14\x43ustomNameForRequest\x12\x11\n\tuser_name\x18\x01 \x01(\t\"*\n\x15\x43ustomNameForResponse\x12\x11\n\tuser_name\x18\x01 \x01(\t\"\xa2\x01\n0CustomRetrieveResponseSpecialFieldsModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1c\n\x14\x64\x65\x66\x61ult_method_field\x18\x02 \x01(\x05\x12\x34\n\x13\x63ustom_method_field\x18\x03 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"(\n\x1a\x44\x65\x66\x61ultValueDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\x19\n\x17\x44\x65\x66\x61ultValueListRequest\"c\n\x18\x44\x65\x66\x61ultValueListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.DefaultValueResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb1\t\n DefaultValuePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x07 \x03(\t\x12\x17\n\x0fstring_required\x18\x08 \x01(\t\x12\x19\n\x0cstring_blank\x18\t \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\n \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\x0b \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0c \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\r \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\x0e \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0f \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x10 \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x11 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x12 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x13 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x14 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\"\x84\t\n\x13\x44\x65\x66\x61ultValueRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x17\n\x0fstring_required\x18\x07 \x01(\t\x12\x19\n\x0cstring_blank\x18\x08 \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\t \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\n \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0b \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\x0c \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\r \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x10 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x11 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x12 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x13 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\"\x85\t\n\x14\x44\x65\x66\x61ultValueResponse\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12\x33\n&string_required_but_serializer_default\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x30\n#int_required_but_serializer_default\x18\x03 \x01(\x05H\x02\x88\x01\x01\x12\x34\n\'boolean_required_but_serializer_default\x18\x04 \x01(\x08H\x03\x88\x01\x01\x12\x32\n%string_default_but_serializer_default\x18\x05 \x01(\tH\x04\x88\x01\x01\x12;\n.string_nullable_default_but_serializer_default\x18\x06 \x01(\tH\x05\x88\x01\x01\x12\x17\n\x0fstring_required\x18\x07 \x01(\t\x12\x19\n\x0cstring_blank\x18\x08 \x01(\tH\x06\x88\x01\x01\x12\x1c\n\x0fstring_nullable\x18\t \x01(\tH\x07\x88\x01\x01\x12\x1b\n\x0estring_default\x18\n \x01(\tH\x08\x88\x01\x01\x12%\n\x18string_default_and_blank\x18\x0b \x01(\tH\t\x88\x01\x01\x12*\n\x1dstring_null_default_and_blank\x18\x0c \x01(\tH\n\x88\x01\x01\x12\x14\n\x0cint_required\x18\r \x01(\x05\x12\x19\n\x0cint_nullable\x18\x0e \x01(\x05H\x0b\x88\x01\x01\x12\x18\n\x0bint_default\x18\x0f \x01(\x05H\x0c\x88\x01\x01\x12\x18\n\x10\x62oolean_required\x18\x10 \x01(\x08\x12\x1d\n\x10\x62oolean_nullable\x18\x11 \x01(\x08H\r\x88\x01\x01\x12\"\n\x15\x62oolean_default_false\x18\x12 \x01(\x08H\x0e\x88\x01\x01\x12!\n\x14\x62oolean_default_true\x18\x13 \x01(\x08H\x0f\x88\x01\x01\x42\x05\n\x03_idB)\n\'_string_required_but_serializer_defaultB&\n$_int_required_but_serializer_defaultB*\n(_boolean_required_but_serializer_defaultB(\n&_string_default_but_serializer_defaultB1\n/_string_nullable_default_but_serializer_defaultB\x0f\n\r_string_blankB\x12\n\x10_string_nullableB\x11\n\x0f_string_defaultB\x1b\n\x19_string_default_and_blankB \n\x1e_string_null_default_and_blankB\x0f\n\r_int_nullableB\x0e\n\x0c_int_defaultB\x13\n\x11_boolean_nullableB\x18\n\x16_boolean_default_falseB\x17\n\x15_boolean_default_true\")\n\x1b\x44\x65\x66\x61ultValueRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"\xaf\x01\n\x14\x45numBasicEnumRequest\x12K\n\x04\x65num\x18\x01 \x01(\x0e\x32=.myproject.fakeapp.EnumBasicEnumRequest.MyGRPCActionEnum.Enum\x1aJ\n\x10MyGRPCActionEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"\xbf\x01\n\x1c\x45numBasicEnumRequestResponse\x12S\n\x04\x65num\x18\x01 \x01(\x0e\x32\x45.myproject.fakeapp.EnumBasicEnumRequestResponse.MyGRPCActionEnum.Enum\x1aJ\n\x10MyGRPCActionEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"r\n%EnumServiceAnnotatedSerializerRequest\x12I\n\x1a\x63har_choices_in_serializer\x18\x01 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\"s\n&EnumServiceAnnotatedSerializerResponse\x12I\n\x1a\x63har_choices_in_serializer\x18\x01 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\"\xcd\x03\n\x12\x45numServiceRequest\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12@\n\x0c\x63har_choices\x18\x02 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x01\x88\x01\x01\x12I\n\x15\x63har_choices_nullable\x18\x03 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x02\x88\x01\x01\x12N\n\x1f\x63har_choices_no_default_no_null\x18\x04 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\x12?\n\x0bint_choices\x18\x05 \x01(\x0e\x32%.myproject.fakeapp.MyTestIntEnum.EnumH\x03\x88\x01\x01\x12\'\n\x1a\x63har_choices_not_annotated\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x05\n\x03_idB\x0f\n\r_char_choicesB\x18\n\x16_char_choices_nullableB\x0e\n\x0c_int_choicesB\x1d\n\x1b_char_choices_not_annotated\"\xce\x03\n\x13\x45numServiceResponse\x12\x0f\n\x02id\x18\x01 \x01(\x03H\x00\x88\x01\x01\x12@\n\x0c\x63har_choices\x18\x02 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x01\x88\x01\x01\x12I\n\x15\x63har_choices_nullable\x18\x03 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.EnumH\x02\x88\x01\x01\x12N\n\x1f\x63har_choices_no_default_no_null\x18\x04 \x01(\x0e\x32%.myproject.fakeapp.MyTestStrEnum.Enum\x12?\n\x0bint_choices\x18\x05 \x01(\x0e\x32%.myproject.fakeapp.MyTestIntEnum.EnumH\x03\x88\x01\x01\x12\'\n\x1a\x63har_choices_not_annotated\x18\x06 \x01(\tH\x04\x88\x01\x01\x42\x05\n\x03_idB\x0f\n\r_char_choicesB\x18\n\x16_char_choices_nullableB\x0e\n\x0c_int_choicesB\x1d\n\x1b_char_choices_not_annotated\"(\n\x1a\x45numServiceRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x03\"3\n%ExceptionStreamRaiseExceptionResponse\x12\n\n\x02id\x18\x01 \x01(\t\"\x19\n\x17\x46oreignModelListRequest\"c\n\x18\x46oreignModelListResponse\x12\x38\n\x07results\x18\x01 \x03(\x0b\x32\'.myproject.fakeapp.ForeignModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"@\n\x14\x46oreignModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\tB\x07\n\x05_uuid\"B\n\"ForeignModelRetrieveCustomResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ustom\x18\x02 \x01(\t\"9\n)ForeignModelRetrieveCustomRetrieveRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"q\n#ImportStructEvenInArrayModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"r\n$ImportStructEvenInArrayModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12.\n\rthis_is_crazy\x18\x02 \x03(\x0b\x32\x17.google.protobuf.StructB\x07\n\x05_uuid\"c\n\x14ManyManyModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\t\x12!\n\x19test_write_only_on_nested\x18\x03 \x01(\tB\x07\n\x05_uuid\"A\n\x15ManyManyModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x0c\n\x04name\x18\x02 \x01(\tB\x07\n\x05_uuid\"!\n\rNoMetaRequest\x12\x10\n\x08my_field\x18\x01 \x01(\t\"0\n RecursiveTestModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dRecursiveTestModelListRequest\"o\n\x1eRecursiveTestModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xf2\x01\n&RecursiveTestModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x41\n\x06parent\x18\x03 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestH\x01\x88\x01\x01\x12>\n\x08\x63hildren\x18\x04 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestB\x07\n\x05_uuidB\t\n\x07_parent\"\xc5\x01\n\x19RecursiveTestModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x41\n\x06parent\x18\x02 \x01(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestH\x01\x88\x01\x01\x12>\n\x08\x63hildren\x18\x03 \x03(\x0b\x32,.myproject.fakeapp.RecursiveTestModelRequestB\x07\n\x05_uuidB\t\n\x07_parent\"\xc8\x01\n\x1aRecursiveTestModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x42\n\x06parent\x18\x02 \x01(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponseH\x01\x88\x01\x01\x12?\n\x08\x63hildren\x18\x03 \x03(\x0b\x32-.myproject.fakeapp.RecursiveTestModelResponseB\x07\n\x05_uuidB\t\n\x07_parent\"1\n!RecursiveTestModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"/\n\x1fRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1e\n\x1cRelatedFieldModelListRequest\"|\n\x1dRelatedFieldModelListResponse\x12L\n\x16list_custom_field_name\x18\x01 \x03(\x0b\x32,.myproject.fakeapp.RelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xd6\x01\n%RelatedFieldModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x05 \x03(\tB\x07\n\x05_uuid\"\xa9\x01\n\x18RelatedFieldModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12:\n\tmany_many\x18\x02 \x03(\x0b\x32\'.myproject.fakeapp.ManyManyModelRequest\x12\x19\n\x11\x63ustom_field_name\x18\x03 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\x04 \x03(\tB\x07\n\x05_uuid\"\xa5\x03\n\x19RelatedFieldModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12=\n\x07\x66oreign\x18\x02 \x01(\x0b\x32\'.myproject.fakeapp.ForeignModelResponseH\x01\x88\x01\x01\x12;\n\tmany_many\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.ManyManyModelResponse\x12\x1c\n\x0fslug_test_model\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12\x1f\n\x17slug_reverse_test_model\x18\x05 \x03(\x08\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12%\n\x18proto_slug_related_field\x18\x07 \x01(\tH\x03\x88\x01\x01\x12\x19\n\x11\x63ustom_field_name\x18\x08 \x01(\t\x12\x1a\n\x12many_many_foreigns\x18\t \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_modelB\x1b\n\x19_proto_slug_related_field\"0\n RelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"5\n%SimpleRelatedFieldModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"$\n\"SimpleRelatedFieldModelListRequest\"y\n#SimpleRelatedFieldModelListResponse\x12\x43\n\x07results\x18\x01 \x03(\x0b\x32\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x84\x02\n+SimpleRelatedFieldModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x14\n\x07\x66oreign\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x05 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x06 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x07 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"\xd7\x01\n\x1eSimpleRelatedFieldModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66oreign\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x04 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x05 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x06 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"\xd8\x01\n\x1fSimpleRelatedFieldModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x14\n\x07\x66oreign\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x1c\n\x0fslug_test_model\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x11\n\tmany_many\x18\x04 \x03(\t\x12\x16\n\x0eslug_many_many\x18\x05 \x03(\t\x12\x1a\n\x12many_many_foreigns\x18\x06 \x03(\tB\x07\n\x05_uuidB\n\n\x08_foreignB\x12\n\x10_slug_test_model\"6\n&SimpleRelatedFieldModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"0\n SpecialFieldsModelDestroyRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"\x1f\n\x1dSpecialFieldsModelListRequest\"o\n\x1eSpecialFieldsModelListResponse\x12>\n\x07results\x18\x01 \x03(\x0b\x32-.myproject.fakeapp.SpecialFieldsModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb9\x01\n&SpecialFieldsModelPartialUpdateRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x02 \x03(\t\x12\x30\n\nmeta_datas\x18\x03 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x04 \x03(\x05\x42\x07\n\x05_uuidB\r\n\x0b_meta_datas\"\x8c\x01\n\x19SpecialFieldsModelRequest\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x30\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x42\x07\n\x05_uuidB\r\n\x0b_meta_datas\"\xad\x01\n\x1aSpecialFieldsModelResponse\x12\x11\n\x04uuid\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x30\n\nmeta_datas\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x12\x12\n\nlist_datas\x18\x03 \x03(\x05\x12\x13\n\x06\x62inary\x18\x04 \x01(\x0cH\x02\x88\x01\x01\x42\x07\n\x05_uuidB\r\n\x0b_meta_datasB\t\n\x07_binary\"1\n!SpecialFieldsModelRetrieveRequest\x12\x0c\n\x04uuid\x18\x01 \x01(\t\"k\n\x1cStreamInStreamInListResponse\x12<\n\x07results\x18\x01 \x03(\x0b\x32+.myproject.fakeapp.StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\'\n\x17StreamInStreamInRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\")\n\x18StreamInStreamInResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\"-\n\x1dStreamInStreamToStreamRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\".\n\x1eStreamInStreamToStreamResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\"=\n)SyncUnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"\xaa\x01\n\x1dUnitTestModelAdminOnlyRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nadmin_text\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x05 \x03(\tB\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\"\xa3\x01\n\x1eUnitTestModelAdminOnlyResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x12\x17\n\nadmin_text\x18\x05 \x01(\tH\x02\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_textB\r\n\x0b_admin_text\")\n\x1bUnitTestModelDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\x8e\x01\n\"UnitTestModelListExtraArgsResponse\x12\r\n\x05\x63ount\x18\x01 \x01(\x05\x12\x1e\n\x16query_fetched_datetime\x18\x02 \x01(\t\x12\x39\n\x07results\x18\x03 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\"\x1a\n\x18UnitTestModelListRequest\"e\n\x19UnitTestModelListResponse\x12\x39\n\x07results\x18\x01 \x03(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"9\n%UnitTestModelListWithExtraArgsRequest\x12\x10\n\x08\x61rchived\x18\x01 \x01(\x08\"\x86\x01\n!UnitTestModelPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"Y\n\x14UnitTestModelRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"r\n\x15UnitTestModelResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x07\n\x05_text\"*\n\x1cUnitTestModelRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"!\n\x1fUnitTestModelStreamPagesRequest\"\x1c\n\x1aUnitTestModelStreamRequest\"h\n\x1fUnitTestModelWatchEventResponse\x12\r\n\x05\x65vent\x18\x01 \x01(\t\x12\x36\n\x04\x64\x61ta\x18\x02 \x01(\x0b\x32(.myproject.fakeapp.UnitTestModelResponse\"\x1b\n\x19UnitTestModelWatchRequest\"2\n$UnitTestModelWithCacheDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xba\x01\n8UnitTestModelWithCacheInheritListWithStructFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"w\n\"UnitTestModelWithCacheListResponse\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\xb3\x01\n1UnitTestModelWithCacheListWithStructFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\x8f\x01\n*UnitTestModelWithCachePartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"b\n\x1dUnitTestModelWithCacheRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"\x99\x01\n\x1eUnitTestModelWithCacheResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x12\x1c\n\x14verify_custom_header\x18\x05 \x01(\tB\x05\n\x03_idB\x07\n\x05_text\"3\n%UnitTestModelWithCacheRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"%\n#UnitTestModelWithCacheStreamRequest\"\xc8\x01\n#UnitTestModelWithFilterSetFilterSet\x12\x12\n\x05title\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\ttitle__in\x18\x02 \x03(\t\x12\x1d\n\x10title__icontains\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x11\n\x04text\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x14\n\x07id__gte\x18\x05 \x01(\x05H\x03\x88\x01\x01\x42\x08\n\x06_titleB\x13\n\x11_title__icontainsB\x07\n\x05_textB\n\n\x08_id__gte\"\xc4\x01\n%UnitTestModelWithFilterSetListRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12O\n\n_filterset\x18\x02 \x01(\x0b\x32\x36.myproject.fakeapp.UnitTestModelWithFilterSetFilterSetH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\r\n\x0bX_filterset\"9\n+UnitTestModelWithStructFilterDestroyRequest\x12\n\n\x02id\x18\x01 \x01(\x05\"\xb5\x01\n3UnitTestModelWithStructFilterEmptyWithFilterRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\xaa\x01\n(UnitTestModelWithStructFilterListRequest\x12.\n\x08_filters\x18\x01 \x01(\x0b\x32\x17.google.protobuf.StructH\x00\x88\x01\x01\x12\x31\n\x0b_pagination\x18\x02 \x01(\x0b\x32\x17.google.protobuf.StructH\x01\x88\x01\x01\x42\x0b\n\tX_filtersB\x0e\n\x0cX_pagination\"\x85\x01\n)UnitTestModelWithStructFilterListResponse\x12I\n\x07results\x18\x01 \x03(\x0b\x32\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\x12\r\n\x05\x63ount\x18\x02 \x01(\x05\"\x96\x01\n1UnitTestModelWithStructFilterPartialUpdateRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x1e\n\x16_partial_update_fields\x18\x04 \x03(\tB\x05\n\x03_idB\x07\n\x05_text\"i\n$UnitTestModelWithStructFilterRequest\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x05\n\x03_idB\x07\n\x05_text\"\x82\x01\n%UnitTestModelWithStructFilterResponse\x12\x0f\n\x02id\x18\x01 \x01(\x05H\x00\x88\x01\x01\x12\r\n\x05title\x18\x02 \x01(\t\x12\x11\n\x04text\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\x0emodel_property\x18\x04 \x01(\x05\x42\x05\n\x03_idB\x07\n\x05_text\":\n,UnitTestModelWithStructFilterRetrieveRequest\x12\n\n\x02id\x18\x01 \x01(\x05\",\n*UnitTestModelWithStructFilterStreamRequest\"G\n\rMyTestStrEnum\"6\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x0b\n\x07VALUE_1\x10\x01\x12\x0b\n\x07VALUE_2\x10\x02\"?\n\rMyTestIntEnum\".\n\x04\x45num\x12\x14\n\x10\x45NUM_UNSPECIFIED\x10\x00\x12\x07\n\x03ONE\x10\x01\x12\x07\n\x03TWO\x10\x02\x32\xbc\n\n\x0f\x42\x61sicController\x12t\n\tBasicList\x12\x31.myproject.fakeapp.BasicProtoListChildListRequest\x1a\x32.myproject.fakeapp.BasicProtoListChildListResponse\"\x00\x12[\n\x06\x43reate\x12&.myproject.fakeapp.BasicServiceRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12n\n\x10\x46\x65tchDataForUser\x12/.myproject.fakeapp.BasicFetchDataForUserRequest\x1a\'.myproject.fakeapp.BasicServiceResponse\"\x00\x12\x62\n\x12\x46\x65tchTranslatedKey\x12\x16.google.protobuf.Empty\x1a\x32.myproject.fakeapp.BasicFetchTranslatedKeyResponse\"\x00\x12T\n\x0bGetMultiple\x12\x16.google.protobuf.Empty\x1a+.myproject.fakeapp.BasicServiceListResponse\"\x00\x12L\n\x07ListIds\x12\x16.google.protobuf.Empty\x1a\'.myproject.fakeapp.BasicListIdsResponse\"\x00\x12N\n\x08ListName\x12\x16.google.protobuf.Empty\x1a(.myproject.fakeapp.BasicListNameResponse\"\x00\x12k\n\x08MixParam\x12/.myproject.fakeapp.CustomMixParamForListRequest\x1a,.myproject.fakeapp.BasicMixParamListResponse\"\x00\x12\x8e\x01\n\x16MixParamWithSerializer\x12\x36.myproject.fakeapp.BasicParamWithSerializerListRequest\x1a:.myproject.fakeapp.BasicMixParamWithSerializerListResponse\"\x00\x12_\n\x08MyMethod\x12\'.myproject.fakeapp.CustomNameForRequest\x1a(.myproject.fakeapp.CustomNameForResponse\"\x00\x12x\n\x17TestBaseProtoSerializer\x12*.myproject.fakeapp.BaseProtoExampleRequest\x1a/.myproject.fakeapp.BaseProtoExampleListResponse\"\x00\x12\x43\n\x0fTestEmptyMethod\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12p\n\x14TestNoMetaSerializer\x12 .myproject.fakeapp.NoMetaRequest\x1a\x34.myproject.fakeapp.BasicTestNoMetaSerializerResponse\"\x00\x32\xe1\x04\n\x16\x44\x65\x66\x61ultValueController\x12[\n\x06\x43reate\x12&.myproject.fakeapp.DefaultValueRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12R\n\x07\x44\x65stroy\x12-.myproject.fakeapp.DefaultValueDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x61\n\x04List\x12*.myproject.fakeapp.DefaultValueListRequest\x1a+.myproject.fakeapp.DefaultValueListResponse\"\x00\x12o\n\rPartialUpdate\x12\x33.myproject.fakeapp.DefaultValuePartialUpdateRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12\x65\n\x08Retrieve\x12..myproject.fakeapp.DefaultValueRetrieveRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x12[\n\x06Update\x12&.myproject.fakeapp.DefaultValueRequest\x1a\'.myproject.fakeapp.DefaultValueResponse\"\x00\x32\xda\x04\n\x0e\x45numController\x12n\n\x10\x42\x61sicEnumRequest\x12\'.myproject.fakeapp.EnumBasicEnumRequest\x1a/.myproject.fakeapp.EnumBasicEnumRequestResponse\"\x00\x12u\n\"BasicEnumRequestWithAnnotatedModel\x12%.myproject.fakeapp.EnumServiceRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x12\xa0\x01\n\'BasicEnumRequestWithAnnotatedSerializer\x12\x38.myproject.fakeapp.EnumServiceAnnotatedSerializerRequest\x1a\x39.myproject.fakeapp.EnumServiceAnnotatedSerializerResponse\"\x00\x12Y\n\x06\x43reate\x12%.myproject.fakeapp.EnumServiceRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x12\x63\n\x08Retrieve\x12-.myproject.fakeapp.EnumServiceRetrieveRequest\x1a&.myproject.fakeapp.EnumServiceResponse\"\x00\x32\xd1\x02\n\x13\x45xceptionController\x12@\n\x0c\x41PIException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12\x41\n\rGRPCException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x12l\n\x14StreamRaiseException\x12\x16.google.protobuf.Empty\x1a\x38.myproject.fakeapp.ExceptionStreamRaiseExceptionResponse\"\x00\x30\x01\x12G\n\x13UnaryRaiseException\x12\x16.google.protobuf.Empty\x1a\x16.google.protobuf.Empty\"\x00\x32\xff\x01\n\x16\x46oreignModelController\x12\x61\n\x04List\x12*.myproject.fakeapp.ForeignModelListRequest\x1a+.myproject.fakeapp.ForeignModelListResponse\"\x00\x12\x81\x01\n\x08Retrieve\x12<.myproject.fakeapp.ForeignModelRetrieveCustomRetrieveRequest\x1a\x35.myproject.fakeapp.ForeignModelRetrieveCustomResponse\"\x00\x32\xa5\x01\n&ImportStructEvenInArrayModelController\x12{\n\x06\x43reate\x12\x36.myproject.fakeapp.ImportStructEvenInArrayModelRequest\x1a\x37.myproject.fakeapp.ImportStructEvenInArrayModelResponse\"\x00\x32\xa9\x05\n\x1cRecursiveTestModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.RecursiveTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.RecursiveTestModelListRequest\x1a\x31.myproject.fakeapp.RecursiveTestModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.RecursiveTestModelPartialUpdateRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12q\n\x08Retrieve\x12\x34.myproject.fakeapp.RecursiveTestModelRetrieveRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.RecursiveTestModelRequest\x1a-.myproject.fakeapp.RecursiveTestModelResponse\"\x00\x32\x9d\x05\n\x1bRelatedFieldModelController\x12\x65\n\x06\x43reate\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12W\n\x07\x44\x65stroy\x12\x32.myproject.fakeapp.RelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12k\n\x04List\x12/.myproject.fakeapp.RelatedFieldModelListRequest\x1a\x30.myproject.fakeapp.RelatedFieldModelListResponse\"\x00\x12y\n\rPartialUpdate\x12\x38.myproject.fakeapp.RelatedFieldModelPartialUpdateRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12o\n\x08Retrieve\x12\x33.myproject.fakeapp.RelatedFieldModelRetrieveRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x12\x65\n\x06Update\x12+.myproject.fakeapp.RelatedFieldModelRequest\x1a,.myproject.fakeapp.RelatedFieldModelResponse\"\x00\x32\xe6\x05\n!SimpleRelatedFieldModelController\x12q\n\x06\x43reate\x12\x31.myproject.fakeapp.SimpleRelatedFieldModelRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12]\n\x07\x44\x65stroy\x12\x38.myproject.fakeapp.SimpleRelatedFieldModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12w\n\x04List\x12\x35.myproject.fakeapp.SimpleRelatedFieldModelListRequest\x1a\x36.myproject.fakeapp.SimpleRelatedFieldModelListResponse\"\x00\x12\x85\x01\n\rPartialUpdate\x12>.myproject.fakeapp.SimpleRelatedFieldModelPartialUpdateRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12{\n\x08Retrieve\x12\x39.myproject.fakeapp.SimpleRelatedFieldModelRetrieveRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x12q\n\x06Update\x12\x31.myproject.fakeapp.SimpleRelatedFieldModelRequest\x1a\x32.myproject.fakeapp.SimpleRelatedFieldModelResponse\"\x00\x32\xc0\x05\n\x1cSpecialFieldsModelController\x12g\n\x06\x43reate\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12X\n\x07\x44\x65stroy\x12\x33.myproject.fakeapp.SpecialFieldsModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12m\n\x04List\x12\x30.myproject.fakeapp.SpecialFieldsModelListRequest\x1a\x31.myproject.fakeapp.SpecialFieldsModelListResponse\"\x00\x12{\n\rPartialUpdate\x12\x39.myproject.fakeapp.SpecialFieldsModelPartialUpdateRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12\x34.myproject.fakeapp.SpecialFieldsModelRetrieveRequest\x1a\x43.myproject.fakeapp.CustomRetrieveResponseSpecialFieldsModelResponse\"\x00\x12g\n\x06Update\x12,.myproject.fakeapp.SpecialFieldsModelRequest\x1a-.myproject.fakeapp.SpecialFieldsModelResponse\"\x00\x32\x84\x03\n\x12StreamInController\x12k\n\x08StreamIn\x12*.myproject.fakeapp.StreamInStreamInRequest\x1a/.myproject.fakeapp.StreamInStreamInListResponse\"\x00(\x01\x12{\n\x0eStreamToStream\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x31.myproject.fakeapp.StreamInStreamToStreamResponse\"\x00(\x01\x30\x01\x12\x83\x01\n\x17StreamToStreamReadWrite\x12\x30.myproject.fakeapp.StreamInStreamToStreamRequest\x1a\x30.myproject.fakeapp.StreamInStreamToStreamRequest\"\x00(\x01\x30\x01\x32\xe6\x07\n\x1bSyncUnitTestModelController\x12\x7f\n\x16\x41\x64minOnlyPartialUpdate\x12\x30.myproject.fakeapp.UnitTestModelAdminOnlyRequest\x1a\x31.myproject.fakeapp.UnitTestModelAdminOnlyResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x8a\x01\n\x11ListWithExtraArgs\x12<.myproject.fakeapp.SyncUnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\xde\x07\n\x17UnitTestModelController\x12\x7f\n\x16\x41\x64minOnlyPartialUpdate\x12\x30.myproject.fakeapp.UnitTestModelAdminOnlyRequest\x1a\x31.myproject.fakeapp.UnitTestModelAdminOnlyResponse\"\x00\x12]\n\x06\x43reate\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12S\n\x07\x44\x65stroy\x12..myproject.fakeapp.UnitTestModelDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x63\n\x04List\x12+.myproject.fakeapp.UnitTestModelListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x12\x86\x01\n\x11ListWithExtraArgs\x12\x38.myproject.fakeapp.UnitTestModelListWithExtraArgsRequest\x1a\x35.myproject.fakeapp.UnitTestModelListExtraArgsResponse\"\x00\x12q\n\rPartialUpdate\x12\x34.myproject.fakeapp.UnitTestModelPartialUpdateRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12g\n\x08Retrieve\x12/.myproject.fakeapp.UnitTestModelRetrieveRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x12\x65\n\x06Stream\x12-.myproject.fakeapp.UnitTestModelStreamRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x30\x01\x12]\n\x06Update\x12\'.myproject.fakeapp.UnitTestModelRequest\x1a(.myproject.fakeapp.UnitTestModelResponse\"\x00\x32\xb4\n\n UnitTestModelWithCacheController\x12o\n\x06\x43reate\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12\\\n\x07\x44\x65stroy\x12\x37.myproject.fakeapp.UnitTestModelWithCacheDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12x\n%ListWithAutoCacheCleanOnSaveAndDelete\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12}\n*ListWithAutoCacheCleanOnSaveAndDeleteRedis\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12l\n\x19ListWithPossibilityMaxAge\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x95\x01\n\x14ListWithStructFilter\x12\x44.myproject.fakeapp.UnitTestModelWithCacheListWithStructFilterRequest\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x83\x01\n\rPartialUpdate\x12=.myproject.fakeapp.UnitTestModelWithCachePartialUpdateRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12y\n\x08Retrieve\x12\x38.myproject.fakeapp.UnitTestModelWithCacheRetrieveRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12w\n\x06Stream\x12\x36.myproject.fakeapp.UnitTestModelWithCacheStreamRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x30\x01\x12o\n\x06Update\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x32\xc2\n\n\'UnitTestModelWithCacheInheritController\x12o\n\x06\x43reate\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12\\\n\x07\x44\x65stroy\x12\x37.myproject.fakeapp.UnitTestModelWithCacheDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12x\n%ListWithAutoCacheCleanOnSaveAndDelete\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12}\n*ListWithAutoCacheCleanOnSaveAndDeleteRedis\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12l\n\x19ListWithPossibilityMaxAge\x12\x16.google.protobuf.Empty\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x9c\x01\n\x14ListWithStructFilter\x12K.myproject.fakeapp.UnitTestModelWithCacheInheritListWithStructFilterRequest\x1a\x35.myproject.fakeapp.UnitTestModelWithCacheListResponse\"\x00\x12\x83\x01\n\rPartialUpdate\x12=.myproject.fakeapp.UnitTestModelWithCachePartialUpdateRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12y\n\x08Retrieve\x12\x38.myproject.fakeapp.UnitTestModelWithCacheRetrieveRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x12w\n\x06Stream\x12\x36.myproject.fakeapp.UnitTestModelWithCacheStreamRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x30\x01\x12o\n\x06Update\x12\x30.myproject.fakeapp.UnitTestModelWithCacheRequest\x1a\x31.myproject.fakeapp.UnitTestModelWithCacheResponse\"\x00\x32\x98\x01\n$UnitTestModelWithFilterSetController\x12p\n\x04List\x12\x38.myproject.fakeapp.UnitTestModelWithFilterSetListRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x32\x9d\x01\n&UnitTestModelWithStreamPagesController\x12s\n\x0bStreamPages\x12\x32.myproject.fakeapp.UnitTestModelStreamPagesRequest\x1a,.myproject.fakeapp.UnitTestModelListResponse\"\x00\x30\x01\x32\xad\x08\n\'UnitTestModelWithStructFilterController\x12}\n\x06\x43reate\x12\x37.myproject.fakeapp.UnitTestModelWithStructFilterRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x63\n\x07\x44\x65stroy\x12>.myproject.fakeapp.UnitTestModelWithStructFilterDestroyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12s\n\x0f\x45mptyWithFilter\x12\x46.myproject.fakeapp.UnitTestModelWithStructFilterEmptyWithFilterRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x83\x01\n\x04List\x12;.myproject.fakeapp.UnitTestModelWithStructFilterListRequest\x1a<.myproject.fakeapp.UnitTestModelWithStructFilterListResponse\"\x00\x12\x91\x01\n\rPartialUpdate\x12\x44.myproject.fakeapp.UnitTestModelWithStructFilterPartialUpdateRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x87\x01\n\x08Retrieve\x12?.myproject.fakeapp.UnitTestModelWithStructFilterRetrieveRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x12\x85\x01\n\x06Stream\x12=.myproject.fakeapp.UnitTestModelWithStructFilterStreamRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x30\x01\x12}\n\x06Update\x12\x37.myproject.fakeapp.UnitTestModelWithStructFilterRequest\x1a\x38.myproject.fakeapp.UnitTestModelWithStructFilterResponse\"\x00\x32\x91\x01\n UnitTestModelWithWatchController\x12m\n\x05Watch\x12,.myproject.fakeapp.UnitTestModelWatchRequest\x1a\x32.myproject.fakeapp.UnitTestModelWatchEventResponse\"\x00\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -231,82 +231,98 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UNITTESTMODELRESPONSE']._serialized_end=13785
   _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_start=13787
   _globals['_UNITTESTMODELRETRIEVEREQUEST']._serialized_end=13829
-  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_start=13831
-  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_end=13859
-  _globals['_UNITTESTMODELWITHCACHEDESTROYREQUEST']._serialized_start=13861
-  _globals['_UNITTESTMODELWITHCACHEDESTROYREQUEST']._serialized_end=13911
-  _globals['_UNITTESTMODELWITHCACHEINHERITLISTWITHSTRUCTFILTERREQUEST']._serialized_start=13914
-  _globals['_UNITTESTMODELWITHCACHEINHERITLISTWITHSTRUCTFILTERREQUEST']._serialized_end=14100
-  _globals['_UNITTESTMODELWITHCACHELISTRESPONSE']._serialized_start=14102
-  _globals['_UNITTESTMODELWITHCACHELISTRESPONSE']._serialized_end=14221
-  _globals['_UNITTESTMODELWITHCACHELISTWITHSTRUCTFILTERREQUEST']._serialized_start=14224
-  _globals['_UNITTESTMODELWITHCACHELISTWITHSTRUCTFILTERREQUEST']._serialized_end=14403
-  _globals['_UNITTESTMODELWITHCACHEPARTIALUPDATEREQUEST']._serialized_start=14406
-  _globals['_UNITTESTMODELWITHCACHEPARTIALUPDATEREQUEST']._serialized_end=14549
-  _globals['_UNITTESTMODELWITHCACHEREQUEST']._serialized_start=14551
-  _globals['_UNITTESTMODELWITHCACHEREQUEST']._serialized_end=14649
-  _globals['_UNITTESTMODELWITHCACHERESPONSE']._serialized_start=14652
-  _globals['_UNITTESTMODELWITHCACHERESPONSE']._serialized_end=14805
-  _globals['_UNITTESTMODELWITHCACHERETRIEVEREQUEST']._serialized_start=14807
-  _globals['_UNITTESTMODELWITHCACHERETRIEVEREQUEST']._serialized_end=14858
-  _globals['_UNITTESTMODELWITHCACHESTREAMREQUEST']._serialized_start=14860
-  _globals['_UNITTESTMODELWITHCACHESTREAMREQUEST']._serialized_end=14897
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERDESTROYREQUEST']._serialized_start=14899
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERDESTROYREQUEST']._serialized_end=14956
-  _globals['_UNITTESTMODELWITHSTRUCTFILTEREMPTYWITHFILTERREQUEST']._serialized_start=14959
-  _globals['_UNITTESTMODELWITHSTRUCTFILTEREMPTYWITHFILTERREQUEST']._serialized_end=15140
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTREQUEST']._serialized_start=15143
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTREQUEST']._serialized_end=15313
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTRESPONSE']._serialized_start=15316
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTRESPONSE']._serialized_end=15449
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERPARTIALUPDATEREQUEST']._serialized_start=15452
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERPARTIALUPDATEREQUEST']._serialized_end=15602
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERREQUEST']._serialized_start=15604
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERREQUEST']._serialized_end=15709
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERRESPONSE']._serialized_start=15712
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERRESPONSE']._serialized_end=15842
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERRETRIEVEREQUEST']._serialized_start=15844
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERRETRIEVEREQUEST']._serialized_end=15902
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERSTREAMREQUEST']._serialized_start=15904
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERSTREAMREQUEST']._serialized_end=15948
-  _globals['_MYTESTSTRENUM']._serialized_start=15950
-  _globals['_MYTESTSTRENUM']._serialized_end=16021
+  _globals['_UNITTESTMODELSTREAMPAGESREQUEST']._serialized_start=13831
+  _globals['_UNITTESTMODELSTREAMPAGESREQUEST']._serialized_end=13864
+  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_start=13866
+  _globals['_UNITTESTMODELSTREAMREQUEST']._serialized_end=13894
+  _globals['_UNITTESTMODELWATCHEVENTRESPONSE']._serialized_start=13896
+  _globals['_UNITTESTMODELWATCHEVENTRESPONSE']._serialized_end=14000
+  _globals['_UNITTESTMODELWATCHREQUEST']._serialized_start=14002
+  _globals['_UNITTESTMODELWATCHREQUEST']._serialized_end=14029
+  _globals['_UNITTESTMODELWITHCACHEDESTROYREQUEST']._serialized_start=14031
+  _globals['_UNITTESTMODELWITHCACHEDESTROYREQUEST']._serialized_end=14081
+  _globals['_UNITTESTMODELWITHCACHEINHERITLISTWITHSTRUCTFILTERREQUEST']._serialized_start=14084
+  _globals['_UNITTESTMODELWITHCACHEINHERITLISTWITHSTRUCTFILTERREQUEST']._serialized_end=14270
+  _globals['_UNITTESTMODELWITHCACHELISTRESPONSE']._serialized_start=14272
+  _globals['_UNITTESTMODELWITHCACHELISTRESPONSE']._serialized_end=14391
+  _globals['_UNITTESTMODELWITHCACHELISTWITHSTRUCTFILTERREQUEST']._serialized_start=14394
+  _globals['_UNITTESTMODELWITHCACHELISTWITHSTRUCTFILTERREQUEST']._serialized_end=14573
+  _globals['_UNITTESTMODELWITHCACHEPARTIALUPDATEREQUEST']._serialized_start=14576
+  _globals['_UNITTESTMODELWITHCACHEPARTIALUPDATEREQUEST']._serialized_end=14719
+  _globals['_UNITTESTMODELWITHCACHEREQUEST']._serialized_start=14721
+  _globals['_UNITTESTMODELWITHCACHEREQUEST']._serialized_end=14819
+  _globals['_UNITTESTMODELWITHCACHERESPONSE']._serialized_start=14822
+  _globals['_UNITTESTMODELWITHCACHERESPONSE']._serialized_end=14975
+  _globals['_UNITTESTMODELWITHCACHERETRIEVEREQUEST']._serialized_start=14977
+  _globals['_UNITTESTMODELWITHCACHERETRIEVEREQUEST']._serialized_end=15028
+  _globals['_UNITTESTMODELWITHCACHESTREAMREQUEST']._serialized_start=15030
+  _globals['_UNITTESTMODELWITHCACHESTREAMREQUEST']._serialized_end=15067
+  _globals['_UNITTESTMODELWITHFILTERSETFILTERSET']._serialized_start=15070
+  _globals['_UNITTESTMODELWITHFILTERSETFILTERSET']._serialized_end=15270
+  _globals['_UNITTESTMODELWITHFILTERSETLISTREQUEST']._serialized_start=15273
+  _globals['_UNITTESTMODELWITHFILTERSETLISTREQUEST']._serialized_end=15469
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERDESTROYREQUEST']._serialized_start=15471
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERDESTROYREQUEST']._serialized_end=15528
+  _globals['_UNITTESTMODELWITHSTRUCTFILTEREMPTYWITHFILTERREQUEST']._serialized_start=15531
+  _globals['_UNITTESTMODELWITHSTRUCTFILTEREMPTYWITHFILTERREQUEST']._serialized_end=15712
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTREQUEST']._serialized_start=15715
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTREQUEST']._serialized_end=15885
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTRESPONSE']._serialized_start=15888
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERLISTRESPONSE']._serialized_end=16021
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERPARTIALUPDATEREQUEST']._serialized_start=16024
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERPARTIALUPDATEREQUEST']._serialized_end=16174
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERREQUEST']._serialized_start=16176
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERREQUEST']._serialized_end=16281
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERRESPONSE']._serialized_start=16284
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERRESPONSE']._serialized_end=16414
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERRETRIEVEREQUEST']._serialized_start=16416
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERRETRIEVEREQUEST']._serialized_end=16474
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERSTREAMREQUEST']._serialized_start=16476
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERSTREAMREQUEST']._serialized_end=16520
+  _globals['_MYTESTSTRENUM']._serialized_start=16522
+  _globals['_MYTESTSTRENUM']._serialized_end=16593
   _globals['_MYTESTSTRENUM_ENUM']._serialized_start=6422
   _globals['_MYTESTSTRENUM_ENUM']._serialized_end=6476
-  _globals['_MYTESTINTENUM']._serialized_start=16023
-  _globals['_MYTESTINTENUM']._serialized_end=16086
-  _globals['_MYTESTINTENUM_ENUM']._serialized_start=16040
-  _globals['_MYTESTINTENUM_ENUM']._serialized_end=16086
-  _globals['_BASICCONTROLLER']._serialized_start=16089
-  _globals['_BASICCONTROLLER']._serialized_end=17429
-  _globals['_DEFAULTVALUECONTROLLER']._serialized_start=17432
-  _globals['_DEFAULTVALUECONTROLLER']._serialized_end=18041
-  _globals['_ENUMCONTROLLER']._serialized_start=18044
-  _globals['_ENUMCONTROLLER']._serialized_end=18646
-  _globals['_EXCEPTIONCONTROLLER']._serialized_start=18649
-  _globals['_EXCEPTIONCONTROLLER']._serialized_end=18986
-  _globals['_FOREIGNMODELCONTROLLER']._serialized_start=18989
-  _globals['_FOREIGNMODELCONTROLLER']._serialized_end=19244
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_start=19247
-  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_end=19412
-  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_start=19415
-  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_end=20096
-  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_start=20099
-  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_end=20768
-  _globals['_SIMPLERELATEDFIELDMODELCONTROLLER']._serialized_start=20771
-  _globals['_SIMPLERELATEDFIELDMODELCONTROLLER']._serialized_end=21513
-  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_start=21516
-  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_end=22220
-  _globals['_STREAMINCONTROLLER']._serialized_start=22223
-  _globals['_STREAMINCONTROLLER']._serialized_end=22611
-  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_start=22614
-  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_end=23612
-  _globals['_UNITTESTMODELCONTROLLER']._serialized_start=23615
-  _globals['_UNITTESTMODELCONTROLLER']._serialized_end=24605
-  _globals['_UNITTESTMODELWITHCACHECONTROLLER']._serialized_start=24608
-  _globals['_UNITTESTMODELWITHCACHECONTROLLER']._serialized_end=25940
-  _globals['_UNITTESTMODELWITHCACHEINHERITCONTROLLER']._serialized_start=25943
-  _globals['_UNITTESTMODELWITHCACHEINHERITCONTROLLER']._serialized_end=27289
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERCONTROLLER']._serialized_start=27292
-  _globals['_UNITTESTMODELWITHSTRUCTFILTERCONTROLLER']._serialized_end=28361
+  _globals['_MYTESTINTENUM']._serialized_start=16595
+  _globals['_MYTESTINTENUM']._serialized_end=16658
+  _globals['_MYTESTINTENUM_ENUM']._serialized_start=16612
+  _globals['_MYTESTINTENUM_ENUM']._serialized_end=16658
+  _globals['_BASICCONTROLLER']._serialized_start=16661
+  _globals['_BASICCONTROLLER']._serialized_end=18001
+  _globals['_DEFAULTVALUECONTROLLER']._serialized_start=18004
+  _globals['_DEFAULTVALUECONTROLLER']._serialized_end=18613
+  _globals['_ENUMCONTROLLER']._serialized_start=18616
+  _globals['_ENUMCONTROLLER']._serialized_end=19218
+  _globals['_EXCEPTIONCONTROLLER']._serialized_start=19221
+  _globals['_EXCEPTIONCONTROLLER']._serialized_end=19558
+  _globals['_FOREIGNMODELCONTROLLER']._serialized_start=19561
+  _globals['_FOREIGNMODELCONTROLLER']._serialized_end=19816
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_start=19819
+  _globals['_IMPORTSTRUCTEVENINARRAYMODELCONTROLLER']._serialized_end=19984
+  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_start=19987
+  _globals['_RECURSIVETESTMODELCONTROLLER']._serialized_end=20668
+  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_start=20671
+  _globals['_RELATEDFIELDMODELCONTROLLER']._serialized_end=21340
+  _globals['_SIMPLERELATEDFIELDMODELCONTROLLER']._serialized_start=21343
+  _globals['_SIMPLERELATEDFIELDMODELCONTROLLER']._serialized_end=22085
+  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_start=22088
+  _globals['_SPECIALFIELDSMODELCONTROLLER']._serialized_end=22792
+  _globals['_STREAMINCONTROLLER']._serialized_start=22795
+  _globals['_STREAMINCONTROLLER']._serialized_end=23183
+  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_start=23186
+  _globals['_SYNCUNITTESTMODELCONTROLLER']._serialized_end=24184
+  _globals['_UNITTESTMODELCONTROLLER']._serialized_start=24187
+  _globals['_UNITTESTMODELCONTROLLER']._serialized_end=25177
+  _globals['_UNITTESTMODELWITHCACHECONTROLLER']._serialized_start=25180
+  _globals['_UNITTESTMODELWITHCACHECONTROLLER']._serialized_end=26512
+  _globals['_UNITTESTMODELWITHCACHEINHERITCONTROLLER']._serialized_start=26515
+  _globals['_UNITTESTMODELWITHCACHEINHERITCONTROLLER']._serialized_end=27861
+  _globals['_UNITTESTMODELWITHFILTERSETCONTROLLER']._serialized_start=27864
+  _globals['_UNITTESTMODELWITHFILTERSETCONTROLLER']._serialized_end=28016
+  _globals['_UNITTESTMODELWITHSTREAMPAGESCONTROLLER']._serialized_start=28019
+  _globals['_UNITTESTMODELWITHSTREAMPAGESCONTROLLER']._serialized_end=28176
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERCONTROLLER']._serialized_start=28179
+  _globals['_UNITTESTMODELWITHSTRUCTFILTERCONTROLLER']._serialized_end=29248
+  _globals['_UNITTESTMODELWITHWATCHCONTROLLER']._serialized_start=29251
+  _globals['_UNITTESTMODELWITHWATCHCONTROLLER']._serialized_end=29396
 # @@protoc_insertion_point(module_scope)
@@ -19,6 +19,15 @@ from fakeapp.services.unit_test_model_with_cache_service import (
     UnitTestModelWithCacheInheritService,
     UnitTestModelWithCacheService,
 )
+from fakeapp.services.unit_test_model_with_filterset_service import (
+    UnitTestModelWithFilterSetService,
+)
+from fakeapp.services.unit_test_model_with_stream_pages_service import (
+    UnitTestModelWithStreamPagesService,
+)
+from fakeapp.services.unit_test_model_with_watch_service import (
+    UnitTestModelWithWatchService,
+)
 
 from django_socio_grpc.services.app_handler_registry import AppHandlerRegistry
 from django_socio_grpc.tests.fakeapp.services.unit_test_model_with_struct_filter_service import (
@@ -47,6 +56,9 @@ def grpc_handlers(server):
     app_registry.register(UnitTestModelWithCacheService)
     app_registry.register(UnitTestModelWithCacheInheritService)
     app_registry.register(EnumService)
+    app_registry.register(UnitTestModelWithWatchService)
+    app_registry.register(UnitTestModelWithStreamPagesService)
+    app_registry.register(UnitTestModelWithFilterSetService)
 
 
 services = (
@@ -63,4 +75,7 @@ services = (
     UnitTestModelWithStructFilterService,
     UnitTestModelWithCacheService,
     EnumService,
+    UnitTestModelWithWatchService,
+    UnitTestModelWithStreamPagesService,
+    UnitTestModelWithFilterSetService,
 )
@@ -0,0 +1,55 @@
+from django_filters import FilterSet, RangeFilter
+from fakeapp.models import UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
+
+from django_socio_grpc import generics, mixins
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.filterset_compiler import FilterSetCompilerBackend
+from django_socio_grpc.protobuf.generation_plugin import (
+    FilterGenerationPlugin,
+    FilterSetGenerationPlugin,
+    ListGenerationPlugin,
+)
+
+
+class UnitTestModelFilterSet(FilterSet):
+    # INFO - RangeFilter overrides filter() so it is only available in the _filters struct
+    id__range = RangeFilter(field_name="id")
+
+    class Meta:
+        model = UnitTestModel
+        fields = {
+            "title": ["exact", "in", "icontains"],
+            "text": ["exact"],
+            "id": ["gte"],
+        }
+
+
+# INFO - This is just for testing the FilterSetGenerationPlugin in proto generation. The filters will not work if FILTER_BEHAVIOR settings not correctly set.
+class FilterGenerationPluginForce(FilterGenerationPlugin):
+    def check_condition(self, *args, **kwargs) -> bool:
+        return True
+
+
+class FilterSetGenerationPluginForce(FilterSetGenerationPlugin):
+    def check_condition(self, *args, **kwargs) -> bool:
+        return True
+
+
+class UnitTestModelWithFilterSetService(mixins.AsyncListModelMixin, generics.GenericService):
+    queryset = UnitTestModel.objects.all().order_by("-id")
+    serializer_class = UnitTestModelSerializer
+    filter_backends = [FilterSetCompilerBackend]
+    filterset_class = UnitTestModelFilterSet
+
+    @grpc_action(
+        request=[],
+        response=UnitTestModelSerializer,
+        use_generation_plugins=[
+            ListGenerationPlugin(response=True),
+            FilterGenerationPluginForce(),
+            FilterSetGenerationPluginForce(),
+        ],
+    )
+    async def List(self, request, context):
+        return await super().List(request, context)
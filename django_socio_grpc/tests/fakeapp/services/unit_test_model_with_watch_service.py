@@ -0,0 +1,12 @@
+from django_filters.rest_framework import DjangoFilterBackend
+from fakeapp.models import UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
+
+from django_socio_grpc import generics, mixins
+
+
+class UnitTestModelWithWatchService(mixins.AsyncWatchModelMixin, generics.GenericService):
+    queryset = UnitTestModel.objects.all().order_by("id")
+    serializer_class = UnitTestModelSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["title"]
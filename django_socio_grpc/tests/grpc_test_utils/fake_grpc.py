@@ -70,6 +70,8 @@ class _BaseFakeContext:
         self._trailing_metadata = ()
         self._code = grpc.StatusCode.OK
         self._details = None
+        self._compression = None
+        self._disabled_compression_count = 0
 
     def __iter__(self):
         return self
@@ -114,6 +116,12 @@ class _BaseFakeContext:
     def set_details(self, details):
         self._details = details
 
+    def set_compression(self, compression):
+        self._compression = compression
+
+    def disable_next_message_compression(self):
+        self._disabled_compression_count += 1
+
     def abort(self, code, details):
         self.set_code(code)
         self.set_details(details)
@@ -188,7 +196,8 @@ class FakeAsyncContext(_BaseFakeContext):
                     "closing your stream with `stream_call.done_writing()`"
                 )
             try:
-                await asyncio.sleep(0.1)
+                # INFO - Only wait when the pipe is empty so long streams are not slowed down by the polling
+                await asyncio.sleep(0.1 if count else 0)
                 return pipe.get_nowait()
             except queue.Empty as e:
                 if wait:
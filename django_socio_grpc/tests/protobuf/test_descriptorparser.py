@@ -0,0 +1,112 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from google.protobuf import descriptor_pb2
+
+from django_socio_grpc.protobuf.protoparser import descriptorparser, protoparser
+
+FieldType = descriptor_pb2.FieldDescriptorProto
+FAKEAPP_GRPC_DIR = Path(__file__).parent.parent / "fakeapp" / "grpc"
+
+
+@pytest.fixture
+def proto_path(tmp_path):
+    shutil.copy(FAKEAPP_GRPC_DIR / "fakeapp.proto", tmp_path / "fakeapp.proto")
+    shutil.copy(FAKEAPP_GRPC_DIR / "fakeapp_pb2.py", tmp_path / "fakeapp_pb2.py")
+    proto_mtime = (tmp_path / "fakeapp.proto").stat().st_mtime
+    os.utime(tmp_path / "fakeapp_pb2.py", (proto_mtime + 1, proto_mtime + 1))
+    return tmp_path / "fakeapp.proto"
+
+
+def test_parse_from_pb2_file_same_numbers_as_proto_file(proto_path):
+    proto_data = descriptorparser.parse_from_pb2_file(proto_path)
+    expected_proto_data = protoparser.parse_from_file(proto_path)
+
+    assert proto_data.package == expected_proto_data.package
+    assert proto_data.imports == expected_proto_data.imports
+    assert proto_data.services == expected_proto_data.services
+    assert proto_data.messages.keys() == expected_proto_data.messages.keys()
+    for name, message in proto_data.messages.items():
+        expected_message = expected_proto_data.messages[name]
+        assert [(f.name, f.number) for f in message.fields] == [
+            (f.name, f.number) for f in expected_message.fields
+        ]
+        assert message.enums.keys() == expected_message.enums.keys()
+        for enum_name, enum in message.enums.items():
+            assert [(f.name, f.number) for f in enum.fields] == [
+                (f.name, int(f.number)) for f in expected_message.enums[enum_name].fields
+            ]
+
+
+def test_parse_from_pb2_file_field_types(proto_path):
+    messages = descriptorparser.parse_from_pb2_file(proto_path).messages
+
+    fields = {f.name: f for f in messages["BasicServiceResponse"].fields}
+    assert fields["user_name"].type == "string"
+    assert fields["user_data"].type == "google.protobuf.Struct"
+    assert fields["bytes_example"].type == "bytes"
+    assert fields["list_of_dict"].type == "repeated"
+    assert fields["list_of_dict"].val_type == "google.protobuf.Struct"
+
+    fields = {f.name: f for f in messages["DefaultValueRequest"].fields}
+    assert fields["string_nullable"].type == "optional"
+    assert fields["string_nullable"].val_type == "string"
+
+
+def test_parse_from_pb2_file_pb2_older_than_proto(proto_path):
+    os.utime(proto_path.with_name("fakeapp_pb2.py"), (0, 0))
+
+    assert descriptorparser.parse_from_pb2_file(proto_path) is None
+
+
+def test_parse_from_pb2_file_proto_not_compiled(proto_path):
+    with open(proto_path, "a") as proto_file:
+        proto_file.write("\nmessage NotCompiledMessage {\n    string name = 1;\n}\n")
+    pb2_mtime = proto_path.stat().st_mtime + 1
+    os.utime(proto_path.with_name("fakeapp_pb2.py"), (pb2_mtime, pb2_mtime))
+
+    assert descriptorparser.parse_from_pb2_file(proto_path) is None
+
+
+def test_parse_from_pb2_file_field_renumbered_not_compiled(proto_path):
+    proto_content = proto_path.read_text()
+    proto_path.write_text(
+        proto_content.replace("    bytes bytes_example = 3;", "    bytes bytes_example = 42;")
+    )
+    pb2_mtime = proto_path.stat().st_mtime + 1
+    os.utime(proto_path.with_name("fakeapp_pb2.py"), (pb2_mtime, pb2_mtime))
+
+    assert descriptorparser.parse_from_pb2_file(proto_path) is None
+
+
+def test_parse_from_pb2_file_without_pb2(proto_path):
+    proto_path.with_name("fakeapp_pb2.py").unlink()
+
+    assert descriptorparser.parse_from_pb2_file(proto_path) is None
+
+
+def test_parse_file_descriptor_map_field():
+    file_descriptor = descriptor_pb2.FileDescriptorProto(
+        name="app.proto", package="project.app"
+    )
+    message = file_descriptor.message_type.add(name="MyMessage")
+    entry = message.nested_type.add(name="CountsEntry")
+    entry.options.map_entry = True
+    entry.field.add(name="key", number=1, type=FieldType.TYPE_STRING)
+    entry.field.add(name="value", number=2, type=FieldType.TYPE_INT32)
+    message.field.add(
+        name="counts",
+        number=3,
+        type=FieldType.TYPE_MESSAGE,
+        type_name=".project.app.MyMessage.CountsEntry",
+        label=FieldType.LABEL_REPEATED,
+    )
+
+    message = descriptorparser.parse_file_descriptor(file_descriptor).messages["MyMessage"]
+
+    assert message.messages == {}
+    (field,) = message.fields
+    assert (field.type, field.key_type, field.val_type) == ("map", "string", "int32")
+    assert (field.name, field.number) == ("counts", 3)
@@ -1,7 +1,10 @@
-from django.test import TestCase
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from fakeapp.grpc.fakeapp_pb2 import UnitTestModelListRequest
 from fakeapp.grpc.fakeapp_pb2_grpc import UnitTestModelControllerStub
 from fakeapp.models import UnitTestModel
+from fakeapp.services.unit_test_model_service import UnitTestModelService
 
 from django_socio_grpc.protobuf import RegistrySingleton
 from django_socio_grpc.services.app_handler_registry import (
@@ -84,3 +87,58 @@ class TestAppHandlerRegistry(TestCase):
         # stop fake server
         ###############
         fake_server.stop(grace=None)
+
+    @override_settings(GRPC_FRAMEWORK={"LAZY_ACTION_REGISTRATION": True})
+    def test_AppHandlerRegistry_lazy_registration(self):
+        fake_server = FakeServer()
+        fake_server.add_insecure_port(FakeGRPC.get_grpc_addr())
+        fake_server.start()
+
+        fakeapp_handler_registry = AppHandlerRegistry(app_name="fakeapp", server=fake_server)
+        with mock.patch.object(
+            UnitTestModelService, "__init__", return_value=None
+        ) as mock_init:
+            fakeapp_handler_registry.register(UnitTestModelService)
+        # INFO - The service has no dynamic action registry, it is not instantiated at startup
+        mock_init.assert_not_called()
+
+        # INFO - The actions are set on the service but their proto rpcs are not built yet
+        self.assertEqual(UnitTestModelService.proto_service.rpcs, [])
+        self.assertIsNone(UnitTestModelService.__dict__["List"].proto_rpc)
+
+        grpc_stub = UnitTestModelControllerStub(FakeChannel(fake_server))
+        response = grpc_stub.List(request=UnitTestModelListRequest())
+        self.assertEqual(len(response.results), 10)
+
+        self.assertEqual(
+            UnitTestModelService.List.response_message_name, "UnitTestModelListResponse"
+        )
+        self.assertIsNotNone(UnitTestModelService.__dict__["List"].proto_rpc)
+        self.assertEqual(
+            [rpc.name for rpc in UnitTestModelService.proto_service.rpcs], ["List"]
+        )
+
+        UnitTestModelService.register_lazy_actions()
+        self.assertEqual(
+            len(UnitTestModelService.proto_service.rpcs),
+            len(UnitTestModelService.get_parents_action_registry(UnitTestModelService())),
+        )
+
+        fake_server.stop(grace=None)
+        # INFO - Other tests expect the service to be registered eagerly
+        UnitTestModelService.register_actions()
+
+    def test_dynamic_action_registry_get_a_service_instance(self):
+        services = []
+
+        class DynamicRegistryService(UnitTestModelService):
+            def _dynamic_grpc_action_registry(service):
+                services.append(service)
+                return {}
+
+        self.assertFalse(UnitTestModelService.has_dynamic_action_registry())
+        self.assertTrue(DynamicRegistryService.has_dynamic_action_registry())
+
+        DynamicRegistryService.get_parents_action_registry()
+        self.assertEqual(len(services), 1)
+        self.assertIsInstance(services[0], DynamicRegistryService)
@@ -1,15 +1,26 @@
+import json
 import logging
+from unittest import mock
 
 import grpc
+from django.core.exceptions import ImproperlyConfigured
 from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
 from fakeapp.grpc.fakeapp_pb2_grpc import (
     ExceptionControllerStub,
+    UnitTestModelControllerStub,
     add_ExceptionControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
 )
 from fakeapp.services.exception_service import ExceptionService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
 from google.protobuf import empty_pb2
+from google.rpc import error_details_pb2, status_pb2
+from rest_framework.exceptions import ErrorDetail, ValidationError
 
+from django_socio_grpc.exceptions import NotFound, get_exception_status
 from django_socio_grpc.log import set_log_record_factory
+from django_socio_grpc.settings import grpc_settings
 
 from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
 
@@ -145,3 +156,92 @@ class TestAsyncException(TestCase):
             self.assertEqual(cm.records[1].grpc_service_name, "Exception")
             self.assertEqual(cm.records[1].msg, "NotFound : Exception/GRPCException")
             self.assertIsNotNone(cm.records[1].exc_info)
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True, "ERROR_DETAILS_FORMAT": "STRUCTURED"})
+class TestStructuredErrorDetails(TestCase):
+    def get_bad_request(self, rpc_status):
+        bad_request = error_details_pb2.BadRequest()
+        self.assertTrue(rpc_status.details[0].Unpack(bad_request))
+        return [
+            (violation.field, violation.description, violation.reason)
+            for violation in bad_request.field_violations
+        ]
+
+    def test_validation_error_field_violations(self):
+        exc = ValidationError(
+            {
+                "title": [ErrorDetail("This field is required.", code="required")],
+                "items": [{}, {"name": [ErrorDetail("Too long.", code="max_length")]}],
+                "non_field_errors": [ErrorDetail("Not unique.", code="unique")],
+            }
+        )
+        status_code, details, trailing_metadata = get_exception_status(exc)
+
+        self.assertEqual(status_code, grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(details, "Invalid input.")
+        self.assertEqual(trailing_metadata[0][0], "grpc-status-details-bin")
+        rpc_status = status_pb2.Status.FromString(trailing_metadata[0][1])
+        self.assertEqual(rpc_status.code, grpc.StatusCode.INVALID_ARGUMENT.value[0])
+        self.assertEqual(rpc_status.message, "Invalid input.")
+        self.assertEqual(
+            self.get_bad_request(rpc_status),
+            [
+                ("title", "This field is required.", "required"),
+                ("items[1].name", "Too long.", "max_length"),
+                ("", "Not unique.", "unique"),
+            ],
+        )
+
+    def test_api_exception_error_info(self):
+        status_code, details, trailing_metadata = get_exception_status(NotFound())
+
+        self.assertEqual(status_code, grpc.StatusCode.NOT_FOUND)
+        self.assertEqual(details, "Not found.")
+        rpc_status = status_pb2.Status.FromString(trailing_metadata[0][1])
+        error_info = error_details_pb2.ErrorInfo()
+        rpc_status.details[0].Unpack(error_info)
+        self.assertEqual(error_info.reason, "not_found")
+        self.assertEqual(error_info.domain, "django-socio-grpc")
+
+    @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+    def test_text_format_by_default(self):
+        status_code, details, trailing_metadata = get_exception_status(NotFound())
+
+        self.assertEqual(status_code, grpc.StatusCode.NOT_FOUND)
+        self.assertEqual(json.loads(details), {"message": "Not found.", "code": "not_found"})
+        self.assertEqual(trailing_metadata, ())
+
+    async def test_validation_error_sent_in_trailing_metadata(self):
+        fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.addCleanup(fake_grpc.close)
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        call = grpc_stub.Create(request=fakeapp_pb2.UnitTestModelRequest(title="z" * 30))
+        with self.assertRaises(grpc.RpcError) as error:
+            await call
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+        self.assertEqual(error.exception.details(), "Invalid input.")
+        rpc_status = status_pb2.Status.FromString(
+            dict(call.trailing_metadata())["grpc-status-details-bin"]
+        )
+        self.assertEqual(
+            self.get_bad_request(rpc_status),
+            [("title", "Ensure this field has no more than 20 characters.", "max_length")],
+        )
+
+    def test_structured_requires_googleapis_common_protos(self):
+        grpc_settings.reload()
+        with (
+            mock.patch("importlib.util.find_spec", return_value=None),
+            self.assertRaisesMessage(ImproperlyConfigured, "googleapis-common-protos"),
+        ):
+            grpc_settings.validate()
+
+    @override_settings(GRPC_FRAMEWORK={"ERROR_DETAILS_FORMAT": "JSON"})
+    def test_invalid_error_details_format(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "ERROR_DETAILS_FORMAT"):
+            grpc_settings.validate()
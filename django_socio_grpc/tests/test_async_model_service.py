@@ -1,6 +1,11 @@
+import json
+import threading
 from datetime import datetime, timezone
+from unittest import mock
 
+import grpc
 from asgiref.sync import sync_to_async
+from django.core.exceptions import SynchronousOnlyOperation
 from django.test import TestCase, override_settings
 from fakeapp.grpc import fakeapp_pb2
 from fakeapp.grpc.fakeapp_pb2_grpc import (
@@ -11,7 +16,8 @@ from fakeapp.grpc.fakeapp_pb2_grpc import (
     add_SimpleRelatedFieldModelControllerServicer_to_server,
     add_UnitTestModelControllerServicer_to_server,
 )
-from fakeapp.models import ForeignModel, RelatedFieldModel, UnitTestModel
+from fakeapp.models import ForeignModel, ManyManyModel, RelatedFieldModel, UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
 from fakeapp.services.unit_test_model_service import UnitTestModelService
 from freezegun import freeze_time
 
@@ -59,6 +65,32 @@ class TestAsyncModelService(TestCase):
 
         self.assertEqual(len(response.results), 10)
 
+    @mock.patch.object(UnitTestModelService, "list_size_check_chunk_size", 3)
+    async def test_async_list_max_message_size(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelListRequest()
+        expected_response = await grpc_stub.List(request=request)
+
+        with override_settings(
+            GRPC_FRAMEWORK={
+                "GRPC_ASYNC": True,
+                "LIST_MAX_MESSAGE_SIZE": expected_response.ByteSize(),
+            }
+        ):
+            response = await grpc_stub.List(request=request)
+        self.assertEqual(response, expected_response)
+
+        settings = {
+            "GRPC_ASYNC": True,
+            "LIST_MAX_MESSAGE_SIZE": expected_response.ByteSize() - 1,
+        }
+        with (
+            override_settings(GRPC_FRAMEWORK=settings),
+            self.assertRaises(grpc.RpcError) as error,
+        ):
+            await grpc_stub.List(request=request)
+        self.assertEqual(error.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+
     async def test_async_retrieve(self):
         unit_id = (await sync_to_async(UnitTestModel.objects.first)()).id
         grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
@@ -109,6 +141,50 @@ class TestAsyncModelService(TestCase):
 
         self.assertEqual(len(response_list), 10)
 
+    @mock.patch.object(UnitTestModelService, "resume_field", "id")
+    async def test_async_stream_resume(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+
+        stream_call = grpc_stub.Stream(request=request)
+        response_list = [response async for response in stream_call]
+        ids = [response.id for response in response_list]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(dict(stream_call.trailing_metadata())["resume_token"], str(ids[-1]))
+
+        # Simulate a stream interrupted after the fourth message
+        metadata = (("pagination", json.dumps({"resume_token": str(ids[3])})),)
+        resumed_list = [
+            response async for response in grpc_stub.Stream(request=request, metadata=metadata)
+        ]
+        self.assertEqual([response.id for response in resumed_list], ids[4:])
+
+    @mock.patch.object(UnitTestModelService, "resume_field", "-id")
+    async def test_async_stream_resume_descending_order(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        ids = [response.id async for response in grpc_stub.Stream(request=request)]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+        metadata = (("pagination", json.dumps({"resume_token": str(ids[3])})),)
+        resumed_ids = [
+            response.id
+            async for response in grpc_stub.Stream(request=request, metadata=metadata)
+        ]
+        self.assertEqual(resumed_ids, ids[4:])
+
+    @mock.patch.object(UnitTestModelService, "resume_field", "id")
+    async def test_async_stream_invalid_resume_token(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        metadata = (("pagination", json.dumps({"resume_token": "not-an-id"})),)
+
+        with self.assertRaises(grpc.RpcError) as error:
+            async for _ in grpc_stub.Stream(request=request, metadata=metadata):
+                pass
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.INVALID_ARGUMENT)
+
     async def test_async_list_custom_action(self):
         with freeze_time(datetime(2022, 1, 21, tzinfo=timezone.utc)):
             grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
@@ -249,3 +325,99 @@ class TestSimpleRelatedFieldModelService(TestCase):
         response = await grpc_stub.Create(request=request)
 
         self.assertEqual(response.foreign, str(self.foreign.uuid))
+
+    async def test_async_create_and_update_many_to_many(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(SimpleRelatedFieldModelControllerStub)
+        first = await ManyManyModel.objects.acreate(name="first")
+        second = await ManyManyModel.objects.acreate(name="second")
+
+        request = fakeapp_pb2.SimpleRelatedFieldModelRequest(
+            foreign=str(self.foreign.uuid), many_many=[str(first.uuid), str(second.uuid)]
+        )
+        response = await grpc_stub.Create(request=request)
+
+        self.assertEqual(set(response.many_many), {str(first.uuid), str(second.uuid)})
+        instance = await RelatedFieldModel.objects.aget(uuid=response.uuid)
+        self.assertEqual(
+            {many.name async for many in instance.many_many.all()}, {"first", "second"}
+        )
+
+        request = fakeapp_pb2.SimpleRelatedFieldModelRequest(
+            uuid=response.uuid, many_many=[str(second.uuid)]
+        )
+        response = await grpc_stub.Update(request=request)
+
+        self.assertEqual(list(response.many_many), [str(second.uuid)])
+        self.assertEqual([many.name async for many in instance.many_many.all()], ["second"])
+
+
+class TestAsyncNativeDatabaseAccess(TestCase):
+    async def test_asave_use_overridden_create_in_thread(self):
+        class CustomCreateSerializer(UnitTestModelSerializer):
+            def create(self, validated_data):
+                validated_data["text"] = "from create"
+                return super().create(validated_data)
+
+        serializer = CustomCreateSerializer(data={"title": "title", "text": "text"})
+        await serializer.ais_valid(raise_exception=True)
+        instance = await serializer.asave()
+
+        self.assertEqual(instance.text, "from create")
+        self.assertEqual(
+            (await UnitTestModel.objects.aget(pk=instance.pk)).text, "from create"
+        )
+
+    async def test_asave_update_with_async_orm(self):
+        instance = await UnitTestModel.objects.acreate(title="title", text="text")
+        serializer = UnitTestModelSerializer(instance, data={"title": "new", "text": "text"})
+        await serializer.ais_valid(raise_exception=True)
+        with mock.patch.object(UnitTestModel, "asave", autospec=True) as asave:
+            await serializer.asave(text="kwarg")
+
+        asave.assert_awaited_once_with(instance)
+        self.assertEqual(instance.title, "new")
+        self.assertEqual(instance.text, "kwarg")
+
+    async def test_aget_queryset_run_in_thread_when_querying_database(self):
+        class QueryingService(UnitTestModelService):
+            def get_queryset(self):
+                self.first_title = UnitTestModel.objects.first().title
+                return super().get_queryset()
+
+        await UnitTestModel.objects.acreate(title="title", text="text")
+
+        with self.assertRaises(SynchronousOnlyOperation):
+            QueryingService().get_queryset()
+
+        service = QueryingService()
+        queryset = await service.aget_queryset()
+        self.assertEqual(service.first_title, "title")
+        self.assertEqual(await queryset.acount(), 1)
+
+    async def test_sync_methods_in_event_loop(self):
+        class ThreadSerializer(UnitTestModelSerializer):
+            def __init__(self, *args, **kwargs):
+                self.thread = threading.current_thread()
+                super().__init__(*args, **kwargs)
+
+        class ThreadService(UnitTestModelService):
+            serializer_class = ThreadSerializer
+
+            def get_queryset(self):
+                self.thread = threading.current_thread()
+                return super().get_queryset()
+
+        class InEventLoopService(ThreadService):
+            call_sync_methods_in_event_loop = True
+
+        service = ThreadService()
+        await service.aget_queryset()
+        serializer = await service.aget_serializer()
+        self.assertIsNot(service.thread, threading.current_thread())
+        self.assertIsNot(serializer.thread, threading.current_thread())
+
+        service = InEventLoopService()
+        await service.aget_queryset()
+        serializer = await service.aget_serializer()
+        self.assertIs(service.thread, threading.current_thread())
+        self.assertIs(serializer.thread, threading.current_thread())
@@ -1,9 +1,13 @@
 import json
 from unittest import mock
 
+from django.contrib.auth.models import Group, Permission, User
+from django.core.cache import caches
 from django.test import TestCase, override_settings
 from grpc._cython.cygrpc import _Metadatum
 
+from django_socio_grpc.authentication_cache import authentication_cache
+from django_socio_grpc.exceptions import Unauthenticated
 from django_socio_grpc.services import Service
 from django_socio_grpc.services.servicer_proxy import get_servicer_context
 from django_socio_grpc.settings import grpc_settings
@@ -111,3 +115,143 @@ class TestAuthenticationIntegration(TestCase):
             servicer_context.service.context.user, {"email": "john.doe@johndoe.com"}
         )
         self.assertEqual(servicer_context.service.context.auth, "faketoken")
+
+
+class UserTokenAuthentication:
+    def authenticate(self, context):
+        token = context.META.get("HTTP_AUTHORIZATION")
+        return (User.objects.get(username=token), token)
+
+
+class CachedAuthenticationService(Service):
+    authentication_classes = [UserTokenAuthentication]
+
+
+@override_settings(
+    GRPC_FRAMEWORK={"AUTHENTICATION_CACHE_TIMEOUT": 60, "AUTHENTICATION_CACHE_MAX_SIZE": 2}
+)
+class TestAuthenticationCache(TestCase):
+    def setUp(self):
+        authentication_cache.clear()
+        self.addCleanup(authentication_cache.clear)
+        self.john = User.objects.create(username="john")
+        self.jane = User.objects.create(username="jane")
+
+    def authenticate(self, token=None):
+        service = CachedAuthenticationService()
+        service.context = FakeContext()
+        service.context.META = {"HTTP_AUTHORIZATION": token} if token else {}
+        service.perform_authentication()
+        return service.context.user
+
+    def test_result_cached_by_credential(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(self.authenticate("john"), self.john)
+            self.assertEqual(self.authenticate("john"), self.john)
+            self.assertEqual(self.authenticate("jane"), self.jane)
+            self.assertEqual(self.authenticate("jane"), self.jane)
+
+    def test_each_request_gets_its_own_user(self):
+        first_user = self.authenticate("john")
+        first_user.request_attribute = "first"
+        second_user = self.authenticate("john")
+        third_user = self.authenticate("john")
+
+        self.assertEqual(second_user, self.john)
+        self.assertIsNot(second_user, first_user)
+        self.assertIsNot(third_user, second_user)
+        self.assertFalse(hasattr(second_user, "request_attribute"))
+
+    def test_request_without_credentials_not_cached(self):
+        with mock.patch.object(
+            CachedAuthenticationService, "resolve_user", return_value=None
+        ) as resolve_user:
+            self.assertIsNone(self.authenticate())
+            self.assertIsNone(self.authenticate())
+        self.assertEqual(resolve_user.call_count, 2)
+
+    def test_least_recently_used_evicted(self):
+        User.objects.create(username="jack")
+        self.authenticate("john")
+        self.authenticate("jane")
+        self.authenticate("john")
+        self.authenticate("jack")
+
+        with self.assertNumQueries(0):
+            self.authenticate("john")
+        with self.assertNumQueries(1):
+            self.authenticate("jane")
+
+    def test_user_save_invalidate_its_results(self):
+        self.authenticate("john")
+        self.authenticate("jane")
+
+        self.john.first_name = "John"
+        self.john.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.authenticate("john").first_name, "John")
+        with self.assertNumQueries(0):
+            self.authenticate("jane")
+
+    def test_user_groups_and_permissions_change_invalidate_its_results(self):
+        group = Group.objects.create(name="group")
+        permission = Permission.objects.get(codename="view_user")
+        for change in (
+            lambda: self.john.groups.add(group),
+            lambda: group.permissions.add(permission),
+            lambda: permission.group_set.clear(),
+            lambda: self.john.user_permissions.add(permission),
+            lambda: group.user_set.clear(),
+        ):
+            self.authenticate("john")
+            self.authenticate("jane")
+
+            change()
+
+            with self.assertNumQueries(1):
+                self.authenticate("john")
+            with self.assertNumQueries(0):
+                self.authenticate("jane")
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "AUTHENTICATION_CACHE_TIMEOUT": 60,
+            "AUTHENTICATION_CACHE_ALIAS": "second",
+        }
+    )
+    def test_shared_cache(self):
+        caches["second"].clear()
+        self.addCleanup(caches["second"].clear)
+        self.authenticate("john")
+        # Another process only has the shared cache
+        authentication_cache.clear()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate("john"), self.john)
+
+        self.john.delete()
+        authentication_cache.clear()
+        with self.assertRaises(Unauthenticated):
+            self.authenticate("john")
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "AUTHENTICATION_CACHE_TIMEOUT": 60,
+            "AUTHENTICATION_CACHE_ALIAS": "second",
+        }
+    )
+    def test_shared_cache_invalidate_all_the_results_of_a_user(self):
+        caches["second"].clear()
+        self.addCleanup(caches["second"].clear)
+        # Results of the same user set by several processes
+        authentication_cache.set("first-credential", (self.john, None))
+        authentication_cache.set("second-credential", (self.john, None))
+        authentication_cache.set("jane-credential", (self.jane, None))
+
+        authentication_cache.clear()
+        authentication_cache.invalidate_user(self.john.pk)
+
+        self.assertIsNone(authentication_cache.get("first-credential"))
+        self.assertIsNone(authentication_cache.get("second-credential"))
+        self.assertEqual(authentication_cache.get("jane-credential"), (self.jane, None))
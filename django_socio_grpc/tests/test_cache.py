@@ -1,4 +1,5 @@
 import json
+import pickle
 from datetime import datetime, timezone
 from unittest import mock
 
@@ -11,29 +12,46 @@ from fakeapp.grpc.fakeapp_pb2 import (
     UnitTestModelWithCacheListWithStructFilterRequest,
     UnitTestModelWithCacheResponse,
     UnitTestModelWithCacheRetrieveRequest,
+    UnitTestModelWithFilterSetFilterSet,
+    UnitTestModelWithFilterSetListRequest,
 )
 from fakeapp.grpc.fakeapp_pb2_grpc import (
     UnitTestModelWithCacheControllerStub,
     UnitTestModelWithCacheInheritControllerStub,
+    UnitTestModelWithFilterSetControllerStub,
     add_UnitTestModelWithCacheControllerServicer_to_server,
     add_UnitTestModelWithCacheInheritControllerServicer_to_server,
+    add_UnitTestModelWithFilterSetControllerServicer_to_server,
 )
 from fakeapp.models import UnitTestModel
 from fakeapp.services.unit_test_model_with_cache_service import (
     UnitTestModelWithCacheInheritService,
     UnitTestModelWithCacheService,
 )
+from fakeapp.services.unit_test_model_with_filterset_service import (
+    UnitTestModelWithFilterSetService,
+)
 from freezegun import freeze_time
 from google.protobuf import empty_pb2, struct_pb2
 
+from django_socio_grpc.decorators import cache_endpoint
 from django_socio_grpc.request_transformer import (
     GRPCInternalProxyResponse,
 )
+from django_socio_grpc.request_transformer.socio_internal_response import (
+    InternalHttpResponse,
+)
 from django_socio_grpc.settings import FilterAndPaginationBehaviorOptions
 
 from .grpc_test_utils.fake_grpc import FakeAsyncContext, FakeFullAIOGRPC
 
 
+class UnitTestModelWithCachedFilterSetService(UnitTestModelWithFilterSetService):
+    @cache_endpoint(300)
+    async def List(self, request, context):
+        return await super().List(request, context)
+
+
 @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
 class TestCacheService(TestCase):
     def setUp(self):
@@ -126,6 +144,75 @@ class TestCacheService(TestCase):
         self.assertEqual(response.count, 2)
         self.assertEqual(response.results[0].title, "test_manual_1")
 
+    def test_response_headers_without_trailing_metadata(self):
+        # INFO - The context of the sync grpc server returns None until trailing metadata are set
+        context = FakeAsyncContext()
+        context._trailing_metadata = None
+        fake_socio_response = GRPCInternalProxyResponse(empty_pb2.Empty(), context)
+        self.assertEqual(dict(fake_socio_response.headers), {})
+
+        fake_socio_response.headers["Cache-Control"] = "max-age=10"
+        self.assertEqual(dict(context.trailing_metadata()), {"cache-control": "max-age=10"})
+
+    def test_cached_response_state_does_not_pickle_objects(self):
+        grpc_response = UnitTestModelWithCacheListResponse(
+            results=[UnitTestModelWithCacheResponse(title="title", text="text")], count=1
+        )
+        context = FakeAsyncContext()
+        context.set_trailing_metadata(
+            (("cache-control", "max-age=10"), ("trace-bin", b"\x00"))
+        )
+        fake_socio_response = GRPCInternalProxyResponse(grpc_response, context)
+
+        _, message_type, metadata, status_code, serialized_message = (
+            fake_socio_response.__getstate__()
+        )
+        self.assertEqual(message_type, grpc_response.DESCRIPTOR.full_name)
+        self.assertEqual(metadata, {"cache-control": "max-age=10", "trace-bin": b"\x00"})
+        self.assertEqual(status_code, 200)
+        self.assertEqual(serialized_message, grpc_response.SerializeToString())
+
+        cached_response = pickle.loads(pickle.dumps(fake_socio_response))
+        self.assertEqual(cached_response.grpc_response, grpc_response)
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response["Cache-Control"], "max-age=10")
+
+        new_context = FakeAsyncContext()
+        cached_response.set_current_context(new_context)
+        self.assertEqual(
+            dict(new_context.trailing_metadata()),
+            {"cache-control": "max-age=10", "trace-bin": b"\x00"},
+        )
+
+    def test_unknown_cached_response_version_is_a_cache_miss(self):
+        grpc_response = UnitTestModelWithCacheResponse(title="title", text="text")
+        fake_socio_response = GRPCInternalProxyResponse(grpc_response, FakeAsyncContext())
+        cache = caches[DEFAULT_CACHE_ALIAS]
+
+        with mock.patch(
+            "django_socio_grpc.request_transformer.grpc_internal_proxy.CACHED_RESPONSE_FORMAT_VERSION",
+            2,
+        ):
+            cache.set("test_unknown_version", fake_socio_response)
+        self.assertIsNone(cache.get("test_unknown_version"))
+
+        cache.set("test_known_version", fake_socio_response)
+        self.assertEqual(cache.get("test_known_version").grpc_response, grpc_response)
+
+    def test_legacy_cached_response_state(self):
+        grpc_response = UnitTestModelWithCacheResponse(title="title", text="text")
+        cached_response = GRPCInternalProxyResponse.__new__(GRPCInternalProxyResponse)
+        cached_response.__setstate__(
+            {
+                "grpc_response": grpc_response,
+                "http_response": InternalHttpResponse(),
+                "response_metadata": {"cache-control": "max-age=10"},
+            }
+        )
+
+        self.assertEqual(cached_response.grpc_response, grpc_response)
+        self.assertEqual(cached_response["Cache-Control"], "max-age=10")
+
     @mock.patch("django.middleware.cache.get_cache_key")
     @mock.patch("django.middleware.cache.learn_cache_key")
     async def test_cache_decorators_paremeters_correctly_working(
@@ -233,6 +320,40 @@ class TestCacheService(TestCase):
         self.assertEqual(len(response.results), 1)
         self.assertEqual(response.results[0].title, "zzzzzzz")
 
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "GRPC_ASYNC": True,
+            "FILTER_BEHAVIOR": FilterAndPaginationBehaviorOptions.REQUEST_STRUCT_STRICT,
+        }
+    )
+    async def test_when_filterset_change_cache_not_used(self):
+        fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelWithFilterSetControllerServicer_to_server,
+            UnitTestModelWithCachedFilterSetService.as_servicer(),
+        )
+        self.addCleanup(fake_grpc.close)
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelWithFilterSetControllerStub)
+
+        request = UnitTestModelWithFilterSetListRequest(
+            _filterset=UnitTestModelWithFilterSetFilterSet(title="zz")
+        )
+        response = await grpc_stub.List(request=request)
+        self.assertEqual([result.title for result in response.results], ["zz"])
+
+        request = UnitTestModelWithFilterSetListRequest(
+            _filterset=UnitTestModelWithFilterSetFilterSet(title="zzz")
+        )
+        response = await grpc_stub.List(request=request)
+        self.assertEqual([result.title for result in response.results], ["zzz"])
+
+        # INFO - The same filterset is served from the cache
+        await UnitTestModel.objects.filter(title="zz").aupdate(text="updated")
+        request = UnitTestModelWithFilterSetListRequest(
+            _filterset=UnitTestModelWithFilterSetFilterSet(title="zz")
+        )
+        response = await grpc_stub.List(request=request)
+        self.assertEqual([result.text for result in response.results], ["bcd"])
+
     async def test_when_filter_change_in_metadata_cache_not_used(
         self,
     ):
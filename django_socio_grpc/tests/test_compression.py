@@ -0,0 +1,178 @@
+import inspect
+from types import SimpleNamespace
+from unittest import mock
+
+import grpc
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.sync_unit_test_model_service import SyncUnitTestModelService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.compression import ResponseCompressor, get_action_compression
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.services.servicer_proxy import get_servicer_context
+from django_socio_grpc.signals import grpc_response_compression
+
+from .grpc_test_utils.fake_grpc import FakeGRPC
+
+
+async def collect(stream):
+    return [message async for message in stream]
+
+
+class TestCompressionMiddleware(TestCase):
+    def setUp(self):
+        for idx in range(10):
+            UnitTestModel(title=f"Title {idx}", text="text" * 10).save()
+        self.metrics = []
+        grpc_response_compression.connect(self.receive_metrics)
+
+    def tearDown(self):
+        grpc_response_compression.disconnect(self.receive_metrics)
+        # INFO - The sync calls leave their service in the servicer context of the thread
+        servicer_context = get_servicer_context()
+        if hasattr(servicer_context, "service"):
+            del servicer_context.service
+
+    def receive_metrics(self, sender, **kwargs):
+        self.metrics.append(kwargs)
+
+    def get_settings(self, grpc_async=False, **compression_settings):
+        return {
+            "GRPC_ASYNC": grpc_async,
+            "GRPC_MIDDLEWARE": ["django_socio_grpc.middlewares.compression_middleware"],
+            **compression_settings,
+        }
+
+    def call(self, method, request, **settings):
+        grpc_async = settings.get("grpc_async", False)
+        service = UnitTestModelService if grpc_async else SyncUnitTestModelService
+        with override_settings(GRPC_FRAMEWORK=self.get_settings(**settings)):
+            fake_grpc = FakeGRPC(
+                add_UnitTestModelControllerServicer_to_server, service.as_servicer()
+            )
+            grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+            response = getattr(grpc_stub, method)(request=request)
+            if inspect.isasyncgen(response):
+                response = async_to_sync(collect)(response)
+            elif method == "Stream":
+                response = list(response)
+            fake_grpc.close()
+        return response, fake_grpc.grpc_channel.context
+
+    def test_large_response_compressed(self):
+        response, context = self.call(
+            "List",
+            fakeapp_pb2.UnitTestModelListRequest(),
+            RESPONSE_COMPRESSION="gzip",
+            RESPONSE_COMPRESSION_THRESHOLD=100,
+        )
+
+        self.assertEqual(len(response.results), 10)
+        self.assertEqual(context._compression, grpc.Compression.Gzip)
+        (metrics,) = self.metrics
+        self.assertEqual(metrics["action"], "List")
+        self.assertEqual(metrics["compression"], "gzip")
+        self.assertEqual(metrics["message_count"], 1)
+        self.assertEqual(metrics["compressed_count"], 1)
+        self.assertEqual(metrics["size"], response.ByteSize())
+        self.assertIsNone(metrics["ratio"])
+        self.assertIsNone(metrics["cpu_time"])
+
+    def test_small_response_not_compressed(self):
+        response, context = self.call(
+            "List",
+            fakeapp_pb2.UnitTestModelListRequest(),
+            RESPONSE_COMPRESSION="gzip",
+            RESPONSE_COMPRESSION_THRESHOLD=100000,
+        )
+
+        self.assertEqual(context._compression, grpc.Compression.NoCompression)
+        self.assertEqual(self.metrics[0]["compressed_count"], 0)
+
+    def test_no_threshold_size_not_measured(self):
+        response, context = self.call(
+            "List",
+            fakeapp_pb2.UnitTestModelListRequest(),
+            RESPONSE_COMPRESSION="gzip",
+            RESPONSE_COMPRESSION_THRESHOLD=0,
+        )
+
+        self.assertEqual(context._compression, grpc.Compression.Gzip)
+        (metrics,) = self.metrics
+        self.assertEqual(metrics["compressed_count"], 1)
+        self.assertIsNone(metrics["size"])
+
+        with override_settings(GRPC_FRAMEWORK={"RESPONSE_COMPRESSION_THRESHOLD": 0}):
+            compressor = ResponseCompressor(SimpleNamespace(), "gzip")
+            message = mock.Mock()
+            self.assertTrue(compressor.should_compress(message))
+        message.ByteSize.assert_not_called()
+
+    def test_no_compression(self):
+        _, context = self.call("List", fakeapp_pb2.UnitTestModelListRequest())
+
+        self.assertIsNone(context._compression)
+        self.assertEqual(self.metrics, [])
+
+    def test_sampled_metrics(self):
+        self.call(
+            "List",
+            fakeapp_pb2.UnitTestModelListRequest(),
+            grpc_async=True,
+            RESPONSE_COMPRESSION="deflate",
+            RESPONSE_COMPRESSION_THRESHOLD=100,
+            RESPONSE_COMPRESSION_METRICS_SAMPLE_RATE=1,
+        )
+
+        (metrics,) = self.metrics
+        self.assertEqual(metrics["compression"], "deflate")
+        self.assertLess(metrics["ratio"], 1)
+        self.assertGreaterEqual(metrics["cpu_time"], 0)
+
+    def test_stream_small_messages_not_compressed(self):
+        UnitTestModel.objects.filter(pk=UnitTestModel.objects.order_by("id")[0].pk).update(
+            text=""
+        )
+        for grpc_async in (False, True):
+            self.metrics.clear()
+            response, context = self.call(
+                "Stream",
+                fakeapp_pb2.UnitTestModelStreamRequest(),
+                grpc_async=grpc_async,
+                RESPONSE_COMPRESSION="gzip",
+                RESPONSE_COMPRESSION_THRESHOLD=40,
+            )
+
+            self.assertEqual(len(response), 10)
+            self.assertEqual(context._compression, grpc.Compression.Gzip)
+            # INFO - Only the first message, without text, is smaller than the threshold
+            self.assertEqual(context._disabled_compression_count, 1)
+            (metrics,) = self.metrics
+            self.assertEqual(metrics["message_count"], 10)
+            self.assertEqual(metrics["compressed_count"], 9)
+
+
+class TestActionCompression(TestCase):
+    def test_grpc_action_compression(self):
+        class MyService:
+            @grpc_action(request=[], response=[], compression="deflate")
+            def Compressed(self, request, context): ...
+
+            @grpc_action(request=[], response=[])
+            def Default(self, request, context): ...
+
+        with override_settings(GRPC_FRAMEWORK={"RESPONSE_COMPRESSION": "gzip"}):
+            for action, compression in (("Compressed", "deflate"), ("Default", "gzip")):
+                request = SimpleNamespace(service=MyService(), action=action)
+                self.assertEqual(get_action_compression(request), compression)
+
+    def test_grpc_action_unknown_compression(self):
+        with self.assertRaises(AssertionError):
+            grpc_action(request=[], response=[], compression="brotli")(lambda: None)
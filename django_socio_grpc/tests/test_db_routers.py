@@ -0,0 +1,193 @@
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc import generics
+from django_socio_grpc.db_routers import ReadReplicaRouter, is_read_only_action
+from django_socio_grpc.decorators import grpc_action
+from django_socio_grpc.services.servicer_proxy import get_servicer_context
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+REPLICA_LAGS = {}
+
+
+def fake_replica_lag(alias):
+    return REPLICA_LAGS[alias]
+
+
+class ReadOnlyActionService(generics.GenericService):
+    @grpc_action(request=[], response=[], read_only=True)
+    def Report(self, request, context): ...
+
+    @grpc_action(request=[], response=[])
+    def Compute(self, request, context): ...
+
+
+class FakeContext:
+    def __init__(self, metadata=()):
+        self.metadata = metadata
+
+    def invocation_metadata(self):
+        return self.metadata
+
+
+@override_settings(
+    GRPC_FRAMEWORK={
+        "READ_REPLICA_DATABASES": ["replica1", "replica2"],
+        "READ_REPLICA_LAG_FUNCTION": "django_socio_grpc.tests.test_db_routers.fake_replica_lag",
+        "READ_REPLICA_LAG_CACHE_TIMEOUT": 0,
+    }
+)
+class TestReadReplicaRouter(TestCase):
+    def setUp(self):
+        REPLICA_LAGS.update({"replica1": 3, "replica2": 1})
+        self.router = ReadReplicaRouter()
+
+    def tearDown(self):
+        servicer_context = get_servicer_context()
+        if hasattr(servicer_context, "service"):
+            del servicer_context.service
+
+    def start_action(self, service_class, action, metadata=()):
+        service = service_class(action=action, context=FakeContext(metadata))
+        get_servicer_context().service = service
+        return service
+
+    def test_is_read_only_action(self):
+        self.assertTrue(is_read_only_action(UnitTestModelService(action="List")))
+        self.assertTrue(is_read_only_action(UnitTestModelService(action="Retrieve")))
+        self.assertFalse(is_read_only_action(UnitTestModelService(action="Create")))
+        self.assertTrue(is_read_only_action(ReadOnlyActionService(action="Report")))
+        self.assertFalse(is_read_only_action(ReadOnlyActionService(action="Compute")))
+
+    def read_in_new_action(self, service_class=UnitTestModelService, action="List"):
+        self.start_action(service_class, action)
+        return self.router.db_for_read(UnitTestModel)
+
+    def test_round_robin_for_read_only_actions(self):
+        self.assertEqual(
+            [self.read_in_new_action() for _ in range(3)],
+            ["replica1", "replica2", "replica1"],
+        )
+
+    def test_replica_pinned_for_the_request(self):
+        self.start_action(UnitTestModelService, "List")
+        self.assertEqual(
+            [self.router.db_for_read(UnitTestModel) for _ in range(3)],
+            ["replica1", "replica1", "replica1"],
+        )
+        self.assertEqual(self.read_in_new_action(), "replica2")
+
+    def test_default_database_for_write_actions_and_outside_actions(self):
+        self.assertIsNone(self.router.db_for_read(UnitTestModel))
+
+        service = self.start_action(UnitTestModelService, "Update")
+        self.assertIsNone(self.router.db_for_read(UnitTestModel))
+        self.assertIsNone(self.router.db_for_write(UnitTestModel))
+        self.assertTrue(service._database_written)
+
+    def test_least_lag(self):
+        self.start_action(UnitTestModelService, "Retrieve")
+        with override_settings(
+            GRPC_FRAMEWORK={
+                "READ_REPLICA_DATABASES": ["replica1", "replica2"],
+                "READ_REPLICA_SELECTION": "LEAST_LAG",
+                "READ_REPLICA_LAG_FUNCTION": "django_socio_grpc.tests.test_db_routers.fake_replica_lag",
+                "READ_REPLICA_LAG_CACHE_TIMEOUT": 0,
+            }
+        ):
+            self.assertEqual(self.router.db_for_read(UnitTestModel), "replica2")
+            REPLICA_LAGS["replica1"] = 0
+            self.assertEqual(self.read_in_new_action(action="Retrieve"), "replica1")
+
+    def test_fallback_to_primary_when_lag_too_high(self):
+        self.start_action(UnitTestModelService, "List")
+        with override_settings(
+            GRPC_FRAMEWORK={
+                "READ_REPLICA_DATABASES": ["replica1", "replica2"],
+                "READ_REPLICA_MAX_LAG": 2,
+                "READ_REPLICA_LAG_FUNCTION": "django_socio_grpc.tests.test_db_routers.fake_replica_lag",
+                "READ_REPLICA_LAG_CACHE_TIMEOUT": 0,
+            }
+        ):
+            self.assertEqual(self.router.db_for_read(UnitTestModel), "replica2")
+            self.assertEqual(self.read_in_new_action(), "replica2")
+            REPLICA_LAGS["replica2"] = 5
+            self.assertIsNone(self.read_in_new_action())
+            REPLICA_LAGS["replica2"] = None
+            self.assertIsNone(self.read_in_new_action())
+
+    def test_read_your_writes(self):
+        # replica2 replayed the transactions until 1 second ago, replica1 until 3 seconds ago
+        metadata = (("last-write-at", str(time.time() - 2)),)
+        self.start_action(UnitTestModelService, "List", metadata)
+        self.assertEqual(self.router.db_for_read(UnitTestModel), "replica2")
+
+        metadata = (("last-write-at", str(time.time())),)
+        self.start_action(UnitTestModelService, "List", metadata)
+        self.assertIsNone(self.router.db_for_read(UnitTestModel))
+
+    def test_lag_is_cached(self):
+        self.start_action(UnitTestModelService, "List", (("last-write-at", "0"),))
+        with (
+            override_settings(
+                GRPC_FRAMEWORK={
+                    "READ_REPLICA_DATABASES": ["replica1"],
+                    "READ_REPLICA_LAG_FUNCTION": "django_socio_grpc.tests.test_db_routers.fake_replica_lag",
+                    "READ_REPLICA_LAG_CACHE_TIMEOUT": 60,
+                }
+            ),
+            mock.patch(
+                "django_socio_grpc.tests.test_db_routers.fake_replica_lag", return_value=0
+            ) as lag_function,
+        ):
+            ReadReplicaRouter.lag_cache.clear()
+            self.router.db_for_read(UnitTestModel)
+            self.start_action(UnitTestModelService, "List", (("last-write-at", "0"),))
+            self.router.db_for_read(UnitTestModel)
+            ReadReplicaRouter.lag_cache.clear()
+
+        lag_function.assert_called_once_with("replica1")
+
+
+@override_settings(
+    DATABASE_ROUTERS=["django_socio_grpc.db_routers.ReadReplicaRouter"],
+    GRPC_FRAMEWORK={
+        "GRPC_ASYNC": True,
+        "GRPC_MIDDLEWARE": ["django_socio_grpc.middlewares.read_your_writes_middleware"],
+        "READ_REPLICA_DATABASES": ["default"],
+    },
+)
+class TestReadYourWritesMiddleware(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_last_write_timestamp_sent_only_after_write(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+
+        before_write = time.time()
+        create_call = grpc_stub.Create(
+            request=fakeapp_pb2.UnitTestModelRequest(title="fake", text="text")
+        )
+        await create_call
+        last_write_at = float(dict(create_call.trailing_metadata())["last-write-at"])
+        self.assertGreaterEqual(last_write_at, before_write)
+
+        list_call = grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+        response = await list_call
+        self.assertEqual(len(response.results), 1)
+        self.assertNotIn("last-write-at", dict(list_call.trailing_metadata()))
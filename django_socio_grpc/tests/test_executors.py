@@ -0,0 +1,105 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from django_socio_grpc.utils.executors import (
+    request_executor_context,
+    set_thread_pool_executor,
+    sync_to_async,
+)
+
+
+def wait_for_other_call(barrier):
+    barrier.wait(timeout=5)
+    return threading.get_ident()
+
+
+class TestExecutors(TestCase):
+    async def test_thread_sensitive_run_one_call_at_a_time(self):
+        barrier = threading.Barrier(2)
+
+        with self.assertRaises(threading.BrokenBarrierError):
+            await asyncio.gather(
+                sync_to_async(barrier.wait)(timeout=0.1),
+                sync_to_async(barrier.wait)(timeout=0.1),
+            )
+
+    @override_settings(GRPC_FRAMEWORK={"ASYNC_EXECUTOR": "THREAD_POOL"})
+    async def test_thread_pool_run_calls_concurrently(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        set_thread_pool_executor(executor)
+        self.addCleanup(set_thread_pool_executor, None)
+        self.addCleanup(executor.shutdown)
+        barrier = threading.Barrier(2)
+
+        thread_ids = await asyncio.gather(
+            sync_to_async(wait_for_other_call)(barrier),
+            sync_to_async(wait_for_other_call)(barrier),
+        )
+
+        self.assertNotEqual(thread_ids[0], thread_ids[1])
+
+    @override_settings(GRPC_FRAMEWORK={"ASYNC_EXECUTOR": "THREAD_POOL"})
+    async def test_thread_pool_close_old_connections_once_per_request(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        set_thread_pool_executor(executor)
+        self.addCleanup(set_thread_pool_executor, None)
+        self.addCleanup(executor.shutdown)
+
+        async def request():
+            async with request_executor_context():
+                for _ in range(3):
+                    await sync_to_async(threading.get_ident)()
+
+        with mock.patch(
+            "django_socio_grpc.utils.executors.close_old_connections"
+        ) as close_old_connections:
+            await request()
+            await request()
+
+        self.assertEqual(close_old_connections.call_count, 2)
+
+    @override_settings(GRPC_FRAMEWORK={"ASYNC_EXECUTOR": "THREAD_POOL"})
+    async def test_thread_pool_keep_connections_of_running_requests(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        set_thread_pool_executor(executor)
+        self.addCleanup(set_thread_pool_executor, None)
+        self.addCleanup(executor.shutdown)
+
+        async def request():
+            async with request_executor_context():
+                for _ in range(3):
+                    await sync_to_async(threading.get_ident)()
+                    await asyncio.sleep(0)
+
+        with mock.patch(
+            "django_socio_grpc.utils.executors.close_old_connections"
+        ) as close_old_connections:
+            await asyncio.gather(request(), request())
+
+        self.assertEqual(close_old_connections.call_count, 1)
+
+    @override_settings(GRPC_FRAMEWORK={"ASYNC_EXECUTOR": "PER_REQUEST"})
+    def test_per_request_use_one_thread_per_request(self):
+        barrier = threading.Barrier(2)
+
+        async def request():
+            async with request_executor_context():
+                first_call = await sync_to_async(wait_for_other_call)(barrier)
+                second_call = await sync_to_async(threading.get_ident)()
+            return first_call, second_call
+
+        async def requests():
+            return await asyncio.gather(request(), request())
+
+        # Async tests are run by async_to_sync whose thread would be used instead of the
+        # thread of each request, so the requests are run in a new event loop like in the server
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first_request, second_request = executor.submit(asyncio.run, requests()).result()
+
+        self.assertEqual(first_request[0], first_request[1])
+        self.assertEqual(second_request[0], second_request[1])
+        self.assertNotEqual(first_request[0], second_request[0])
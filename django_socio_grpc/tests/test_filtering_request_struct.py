@@ -1,20 +1,48 @@
 import json
+import urllib.parse
+from types import SimpleNamespace
+from unittest import mock
 
+from django.db.models import Q
 from django.test import TestCase, override_settings
-from fakeapp.grpc.fakeapp_pb2 import UnitTestModelWithStructFilterListRequest
+from django_filters import (
+    ChoiceFilter,
+    FilterSet,
+    MultipleChoiceFilter,
+    RangeFilter,
+)
+from django_filters.rest_framework import DjangoFilterBackend
+from fakeapp.grpc.fakeapp_pb2 import (
+    UnitTestModelWithFilterSetFilterSet,
+    UnitTestModelWithFilterSetListRequest,
+    UnitTestModelWithStructFilterListRequest,
+)
 from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelWithFilterSetControllerStub,
     UnitTestModelWithStructFilterControllerStub,
+    add_UnitTestModelWithFilterSetControllerServicer_to_server,
     add_UnitTestModelWithStructFilterControllerServicer_to_server,
 )
 from fakeapp.models import UnitTestModel
+from fakeapp.services.unit_test_model_with_filterset_service import (
+    UnitTestModelWithFilterSetService,
+)
 from fakeapp.services.unit_test_model_with_struct_filter_service import (
     UnitTestModelWithStructFilterService,
 )
 from google.protobuf import struct_pb2
+from rest_framework.exceptions import ValidationError
 
+from django_socio_grpc.filterset_compiler import (
+    FilterSetCompiler,
+    FilterSetCompilerBackend,
+    filterset_compiler_cache,
+)
+from django_socio_grpc.protobuf.json_format import message_to_dict, struct_to_dict
+from django_socio_grpc.request_transformer.socio_internal_request import InternalHttpRequest
 from django_socio_grpc.settings import FilterAndPaginationBehaviorOptions
 
-from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+from .grpc_test_utils.fake_grpc import FakeContext, FakeFullAIOGRPC
 
 
 @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
@@ -106,3 +134,160 @@ class TestFilteringRequestStruct(TestCase):
         self.assertEqual(len(response.results), 1)
         # responses_as_list[0] is type of django_socio_grpc.tests.grpc_test_utils.unittest_pb2.Test
         self.assertEqual(response.results[0].title, "zzzzzzz")
+
+
+@override_settings(
+    GRPC_FRAMEWORK={
+        "GRPC_ASYNC": True,
+        "FILTER_BEHAVIOR": FilterAndPaginationBehaviorOptions.REQUEST_STRUCT_STRICT,
+    }
+)
+class TestFilterSetRequest(TestCase):
+    def setUp(self):
+        for idx in range(10):
+            UnitTestModel(title="z" * (idx + 1), text=chr(idx + ord("a"))).save()
+
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelWithFilterSetControllerServicer_to_server,
+            UnitTestModelWithFilterSetService.as_servicer(),
+        )
+        filterset_compiler_cache.clear()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def list(self, **kwargs):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithFilterSetControllerStub)
+        request = UnitTestModelWithFilterSetListRequest(**kwargs)
+        response = await grpc_stub.List(request=request)
+        return [result.title for result in response.results]
+
+    async def test_typed_filterset_without_filter_form(self):
+        with mock.patch.object(
+            DjangoFilterBackend, "filter_queryset", side_effect=AssertionError
+        ):
+            titles = await self.list(
+                _filterset=UnitTestModelWithFilterSetFilterSet(
+                    title__in=["zz", "zzzz", "zzzzzzzzz"], id__gte=0
+                )
+            )
+            self.assertEqual(titles, ["zzzzzzzzz", "zzzz", "zz"])
+
+            titles = await self.list(
+                _filterset=UnitTestModelWithFilterSetFilterSet(title="zzz", text="c")
+            )
+            self.assertEqual(titles, ["zzz"])
+
+    async def test_typed_filterset_and_struct_filters(self):
+        filter_as_struct = struct_pb2.Struct()
+        filter_as_struct.update({"text": "b"})
+        titles = await self.list(
+            _filters=filter_as_struct,
+            _filterset=UnitTestModelWithFilterSetFilterSet(title__icontains="zz"),
+        )
+        self.assertEqual(titles, ["zz"])
+
+    def test_compiler_cached_by_service(self):
+        backend = FilterSetCompilerBackend()
+        service = UnitTestModelWithFilterSetService()
+        queryset = UnitTestModel.objects.all()
+        compiler = filterset_compiler_cache.get(backend, service, queryset)
+
+        self.assertIs(filterset_compiler_cache.get(backend, service, queryset), compiler)
+        self.assertEqual(
+            list(compiler.compiled_filters),
+            ["title", "title__in", "title__icontains", "text", "id__gte"],
+        )
+        q, distinct = compiler.compile(
+            UnitTestModelWithFilterSetFilterSet(title__in=["a", "b"], id__gte=3)
+        )
+        self.assertEqual(q, Q(title__in=["a", "b"]) & Q(id__gte=3))
+        self.assertFalse(distinct)
+
+    async def test_filters_overriding_filter_use_the_form(self):
+        filter_as_struct = struct_pb2.Struct()
+        first_id = await UnitTestModel.objects.values_list("id", flat=True).afirst()
+        filter_as_struct.update({"id__range_min": first_id + 1, "id__range_max": first_id + 2})
+        titles = await self.list(
+            _filters=filter_as_struct,
+            _filterset=UnitTestModelWithFilterSetFilterSet(title__in=["z", "zz", "zzzz"]),
+        )
+        self.assertEqual(titles, ["zz"])
+
+    def test_only_filters_applying_their_lookup_compiled(self):
+        class ChoicesFilterSet(FilterSet):
+            title = ChoiceFilter(choices=[("a", "a")])
+            texts = MultipleChoiceFilter(field_name="text", choices=[("a", "a"), ("b", "b")])
+            id = RangeFilter()
+
+            class Meta:
+                model = UnitTestModel
+                fields = {"text": ["in"]}
+
+        compiler = FilterSetCompiler(ChoicesFilterSet)
+
+        self.assertEqual(list(compiler.compiled_filters), ["text__in", "texts"])
+
+    def test_invalid_value_raise_validation_error(self):
+        class IdFilterSet(FilterSet):
+            class Meta:
+                model = UnitTestModel
+                fields = {"id": ["exact"]}
+
+        compiler = FilterSetCompiler(IdFilterSet)
+        # INFO - A typed message can not contain a string for an int field so we fake it
+        message = SimpleNamespace(ListFields=lambda: [(SimpleNamespace(name="id"), "abc")])
+        with self.assertRaises(ValidationError) as error:
+            compiler.compile(message)
+        self.assertIn("id", error.exception.detail)
+
+
+class TestRequestStructDecoding(TestCase):
+    def get_request(self, request, metadata=()):
+        context = FakeContext()
+        context._invocation_metadata = metadata
+        return InternalHttpRequest(context, request, "List", "UnitTestModelService")
+
+    def test_struct_to_dict_same_as_message_to_dict(self):
+        struct = struct_pb2.Struct()
+        struct.update(
+            {"a": 1, "b": "text", "c": [1, "d", None, {"e": True}], "f": None, "g": {"h": []}}
+        )
+        self.assertEqual(struct_to_dict(struct), message_to_dict(struct))
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "FILTER_BEHAVIOR": FilterAndPaginationBehaviorOptions.METADATA_AND_REQUEST_STRUCT,
+        }
+    )
+    def test_filter_params_keep_types_and_request_struct_win(self):
+        filter_as_struct = struct_pb2.Struct()
+        filter_as_struct.update({"title": "zzz", "ordering": ["-title", "text"]})
+        request = self.get_request(
+            UnitTestModelWithStructFilterListRequest(_filters=filter_as_struct),
+            (("filters", json.dumps({"title": "metadata", "text": "abc"})),),
+        )
+
+        self.assertEqual(
+            request.filter_params,
+            {"title": "zzz", "text": "abc", "ordering": ["-title", "text"]},
+        )
+        self.assertEqual(request.pagination_params, {})
+        self.assertEqual(request.query_params, request.filter_params)
+
+    def test_query_string_only_encoded_when_read(self):
+        request = self.get_request(
+            UnitTestModelWithStructFilterListRequest(),
+            (("filters", json.dumps({"title": "zzz"})),),
+        )
+
+        with mock.patch(
+            "django_socio_grpc.request_transformer.socio_internal_request.urllib.parse.urlencode",
+            wraps=urllib.parse.urlencode,
+        ) as urlencode:
+            self.assertIn("QUERY_STRING", request.META)
+            urlencode.assert_not_called()
+            self.assertEqual(request.META["QUERY_STRING"], "title=zzz")
+            self.assertEqual(request.META.get("QUERY_STRING"), "title=zzz")
+
+        urlencode.assert_called_once()
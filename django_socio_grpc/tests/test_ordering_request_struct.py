@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+from unittest import mock
+
 from django.test import TestCase, override_settings
 from fakeapp.grpc.fakeapp_pb2 import UnitTestModelWithStructFilterListRequest
 from fakeapp.grpc.fakeapp_pb2_grpc import (
@@ -10,6 +13,7 @@ from fakeapp.services.unit_test_model_with_struct_filter_service import (
 )
 from google.protobuf import struct_pb2
 
+from django_socio_grpc.filters import OrderingFilter
 from django_socio_grpc.settings import FilterAndPaginationBehaviorOptions
 
 from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
@@ -135,3 +139,57 @@ class TestOrderingRequestStruct(TestCase):
         self.assertEqual(response.results[11].id, second_z_unit_model.id)
         self.assertEqual(response.results[12].title, "z")
         self.assertEqual(response.results[12].id, third_z_unit_model.id)
+
+
+class TestOrderingFilterCache(TestCase):
+    def setUp(self):
+        OrderingFilter.clear_cache()
+        self.addCleanup(OrderingFilter.clear_cache)
+        self.ordering_filter = OrderingFilter()
+        self.service = UnitTestModelWithStructFilterService()
+        self.queryset = UnitTestModel.objects.all()
+
+    def get_ordering(self, ordering):
+        request = SimpleNamespace(query_params={"ordering": ordering})
+        return self.ordering_filter.get_ordering(request, self.queryset, self.service)
+
+    def test_valid_fields_computed_once(self):
+        with mock.patch.object(
+            OrderingFilter, "get_valid_fields", wraps=self.ordering_filter.get_valid_fields
+        ) as get_valid_fields:
+            self.assertEqual(self.get_ordering("-title,unknown, id"), ["-title", "id"])
+            self.assertEqual(self.get_ordering(["id", "-title"]), ["id", "-title"])
+            self.assertEqual(self.get_ordering("text"), ["-id"])
+
+        get_valid_fields.assert_called_once()
+
+    def test_requested_ordering_validated_once(self):
+        with mock.patch.object(
+            OrderingFilter,
+            "remove_invalid_fields",
+            wraps=self.ordering_filter.remove_invalid_fields,
+        ) as remove_invalid_fields:
+            self.assertEqual(self.get_ordering(["-title", "id"]), ["-title", "id"])
+            self.assertEqual(self.get_ordering(["-title", "id"]), ["-title", "id"])
+
+        remove_invalid_fields.assert_called_once()
+
+    def test_ordering_cache_size(self):
+        with mock.patch.object(OrderingFilter, "ordering_cache_size", 2):
+            for ordering in ["title", "id", "-id"]:
+                self.get_ordering(ordering)
+
+        self.assertEqual(list(OrderingFilter._ordering_caches.popitem()[1]), ["id", "-id"])
+
+    def test_cache_disabled(self):
+        with (
+            mock.patch.object(OrderingFilter, "cache_ordering", False),
+            mock.patch.object(
+                OrderingFilter, "get_valid_fields", wraps=self.ordering_filter.get_valid_fields
+            ) as get_valid_fields,
+        ):
+            self.assertEqual(self.get_ordering("title"), ["title"])
+            self.assertEqual(self.get_ordering("title"), ["title"])
+
+        self.assertEqual(get_valid_fields.call_count, 2)
+        self.assertEqual(OrderingFilter._ordering_caches, {})
@@ -117,6 +117,40 @@ class TestPermissionUnitary(TestCase):
         self.assertEqual(len(returned_perms), 1)
         self.assertIsInstance(returned_perms[0], FakePermission)
 
+    def test_permission_instances_cached_per_service_class(self):
+        class CachedPermissionService(Service):
+            permission_classes = [FakePermission]
+
+        first = CachedPermissionService().get_permissions()
+        second = CachedPermissionService().get_permissions()
+        self.assertIs(first[0], second[0])
+        self.assertEqual(
+            CachedPermissionService.get_class_component_instances("permission_classes"),
+            ((first[0], False, False),),
+        )
+
+        class OtherPermission(FakePermission):
+            async def has_permission(self, context, service):
+                return True
+
+        CachedPermissionService.permission_classes = [OtherPermission]
+        ((permission, is_async, is_object_async),) = (
+            CachedPermissionService().get_component_instances("permission_classes")
+        )
+        self.assertIsInstance(permission, OtherPermission)
+        self.assertTrue(is_async)
+        self.assertFalse(is_object_async)
+
+    def test_permission_instances_not_cached(self):
+        class StatefulPermissionService(Service):
+            permission_classes = [FakePermission]
+            cache_component_instances = False
+
+        self.assertIsNot(
+            StatefulPermissionService().get_permissions()[0],
+            StatefulPermissionService().get_permissions()[0],
+        )
+
     @mock.patch("django_socio_grpc.services.Service.perform_authentication", mock.MagicMock())
     @mock.patch("django_socio_grpc.services.Service.check_permissions")
     def test_check_permissions_called_in_before_action(self, mock_check_permissions):
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import pstats
+import shutil
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.profiling import RequestProfiler, rotate_profiles
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+
+class FakeContext:
+    def invocation_metadata(self):
+        return (("x-request-id", "request-1"),)
+
+
+class TestProfilingMiddleware(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def get_settings(self, **profiling_settings):
+        return {
+            "GRPC_ASYNC": True,
+            "GRPC_MIDDLEWARE": ["django_socio_grpc.middlewares.profiling_middleware"],
+            "PROFILING_DIRECTORY": self.directory,
+            **profiling_settings,
+        }
+
+    async def call_list(self, request_id="abc-123"):
+        fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        await grpc_stub.List(
+            request=fakeapp_pb2.UnitTestModelListRequest(),
+            metadata=(("x-request-id", request_id),),
+        )
+        fake_grpc.close()
+
+    def test_sampled_sync_call_profiled(self):
+        request = SimpleNamespace(
+            service=UnitTestModelService(), action="List", context=FakeContext()
+        )
+        with override_settings(
+            GRPC_FRAMEWORK=self.get_settings(PROFILING_ACTIONS=["*"], PROFILING_SAMPLE_RATE=1)
+        ):
+            profiler = RequestProfiler.for_request(request)
+            profiler.start()
+            time.sleep(0.01)
+            profiler.stop()
+
+        files = os.listdir(self.directory)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith("-UnitTestModel-List-request-1.prof"))
+        stats = pstats.Stats(os.path.join(self.directory, files[0]))
+        self.assertTrue(
+            any("sleep" in function_name for _, _, function_name in stats.stats),
+        )
+
+    async def test_sampled_async_calls_stack_sampled(self):
+        afilter_queryset = UnitTestModelService.afilter_queryset
+
+        async def slow_filter_queryset(service, queryset):
+            await asyncio.sleep(0.05)
+            return await afilter_queryset(service, queryset)
+
+        with (
+            override_settings(
+                GRPC_FRAMEWORK=self.get_settings(
+                    PROFILING_ACTIONS=["UnitTestModel.List"],
+                    PROFILING_SAMPLE_RATE=1,
+                    PROFILING_STACK_INTERVAL=0.001,
+                )
+            ),
+            mock.patch.object(UnitTestModelService, "afilter_queryset", slow_filter_queryset),
+        ):
+            # INFO - Concurrent calls of the event loop thread are all profiled
+            await asyncio.gather(self.call_list("first"), self.call_list("second"))
+
+        files = sorted(os.listdir(self.directory), key=lambda filename: filename[-13:])
+        self.assertEqual(len(files), 2)
+        self.assertTrue(files[0].endswith("-UnitTestModel-List-first.stacks"))
+        self.assertTrue(files[1].endswith("-UnitTestModel-List-second.stacks"))
+        for filename in files:
+            with open(os.path.join(self.directory, filename)) as stacks_file:
+                stacks = stacks_file.read().splitlines()
+            self.assertTrue(any("List" in stack for stack in stacks))
+            self.assertTrue(any("slow_filter_queryset" in stack for stack in stacks))
+            for stack in stacks:
+                # INFO - Only the coroutines of the task of the request are sampled
+                self.assertNotIn("test_sampled_async_calls_stack_sampled", stack)
+
+    async def test_not_profiled_action(self):
+        with override_settings(
+            GRPC_FRAMEWORK=self.get_settings(
+                PROFILING_ACTIONS=["UnitTestModel.Retrieve"],
+                PROFILING_SAMPLE_RATE=1,
+                PROFILING_SLOW_THRESHOLD=0,
+            )
+        ):
+            await self.call_list()
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+    async def test_fast_call_not_saved(self):
+        with override_settings(
+            GRPC_FRAMEWORK=self.get_settings(
+                PROFILING_ACTIONS=["UnitTestModel"], PROFILING_SLOW_THRESHOLD=10
+            )
+        ):
+            await self.call_list()
+
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_slow_call_stack_sampled(self):
+        request = SimpleNamespace(
+            service=UnitTestModelService(), action="List", context=FakeContext()
+        )
+        with override_settings(
+            GRPC_FRAMEWORK=self.get_settings(
+                PROFILING_ACTIONS=["*"],
+                PROFILING_SLOW_THRESHOLD=0.01,
+                PROFILING_STACK_INTERVAL=0.001,
+            )
+        ):
+            profiler = RequestProfiler.for_request(request)
+            profiler.start()
+            time.sleep(0.1)
+            profiler.stop()
+
+        files = os.listdir(self.directory)
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].endswith("-UnitTestModel-List-request-1.stacks"))
+        with open(os.path.join(self.directory, files[0])) as stacks_file:
+            stacks = stacks_file.read().splitlines()
+        self.assertTrue(stacks)
+        for stack in stacks:
+            self.assertIn("test_slow_call_stack_sampled", stack)
+
+    def test_rotate_profiles(self):
+        for idx in range(4):
+            path = os.path.join(self.directory, f"{idx}.prof")
+            open(path, "w").close()
+            os.utime(path, (idx, idx))
+        open(os.path.join(self.directory, "other.txt"), "w").close()
+
+        rotate_profiles(self.directory, 2)
+
+        self.assertEqual(sorted(os.listdir(self.directory)), ["2.prof", "3.prof", "other.txt"])
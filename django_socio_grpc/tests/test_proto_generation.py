@@ -1,6 +1,10 @@
+import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from importlib import reload
+from io import StringIO
 from pathlib import Path
 from unittest import mock
 from unittest.mock import patch
@@ -9,6 +13,9 @@ from django.core.management import call_command
 from django.test import TestCase, override_settings
 
 from django_socio_grpc.exceptions import ProtobufGenerationException
+from django_socio_grpc.management.commands.generateproto import (
+    Command as GenerateProtoCommand,
+)
 from django_socio_grpc.management.commands.generateproto import _get_resource_file_name
 from django_socio_grpc.protobuf import RegistrySingleton
 from django_socio_grpc.protobuf.protoparser import protoparser
@@ -529,3 +536,92 @@ class TestProtoGeneration(TestCase):
         proto_file_content = get_proto_file_content("ENUM_GENERATED")
 
         self.assertEqual(called_with_data, proto_file_content)
+
+
+@patch.dict(os.environ, {"DJANGO_SETTINGS_MODULE": "myproject.settings"})
+class TestIncrementalProtoGeneration(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.proto_path = Path(self.directory.name) / "fakeapp.proto"
+        self.manifest_path = Path(self.directory.name) / ".generateproto_manifest.json"
+
+    def generate(self, **opts):
+        stdout = StringIO()
+        call_command(
+            "generateproto",
+            directory=self.directory.name,
+            incremental=True,
+            no_generate_pb2=True,
+            stdout=stdout,
+            **opts,
+        )
+        return stdout.getvalue()
+
+    @override_settings(GRPC_FRAMEWORK=OVERRIDEN_SETTINGS["SIMPLE_MODEL_GENERATED"])
+    def test_unchanged_app_skipped(self):
+        self.generate()
+        self.assertEqual(
+            self.proto_path.read_text(), get_proto_file_content("SIMPLE_MODEL_GENERATED")
+        )
+        manifest = json.loads(self.manifest_path.read_text())
+        self.assertEqual(list(manifest["apps"]), ["fakeapp"])
+
+        with mock.patch(
+            "django_socio_grpc.protobuf.generators.RegistryToProtoGenerator.parse_proto_file"
+        ) as mock_parse_proto_file:
+            output = self.generate()
+            self.generate(check=True)
+
+        mock_parse_proto_file.assert_not_called()
+        self.assertIn("fakeapp is up to date, skipping it", output)
+
+    @override_settings(GRPC_FRAMEWORK=OVERRIDEN_SETTINGS["SIMPLE_MODEL_GENERATED"])
+    def test_modified_proto_regenerated(self):
+        self.generate()
+        self.proto_path.write_text(self.proto_path.read_text() + "// Edited by hand\n")
+
+        output = self.generate()
+
+        self.assertNotIn("up to date", output)
+        self.assertEqual(
+            self.proto_path.read_text(), get_proto_file_content("SIMPLE_MODEL_GENERATED")
+        )
+
+    def test_changed_registry_regenerated(self):
+        with override_settings(GRPC_FRAMEWORK=OVERRIDEN_SETTINGS["SIMPLE_MODEL_GENERATED"]):
+            self.generate()
+        with override_settings(GRPC_FRAMEWORK=OVERRIDEN_SETTINGS["NO_MODEL_GENERATED"]):
+            output = self.generate()
+
+        self.assertNotIn("up to date", output)
+        self.assertEqual(
+            self.proto_path.read_text(), get_proto_file_content("NO_MODEL_GENERATED")
+        )
+
+    @override_settings(GRPC_FRAMEWORK=OVERRIDEN_SETTINGS["SIMPLE_MODEL_GENERATED"])
+    def test_changed_generator_regenerated(self):
+        self.generate()
+
+        with mock.patch(
+            "django_socio_grpc.protobuf.manifest.get_generator_version",
+            return_value="0.0.0:changed",
+        ):
+            output = self.generate()
+
+        self.assertNotIn("up to date", output)
+        manifest = json.loads(self.manifest_path.read_text())
+        self.assertEqual(manifest["generator_version"], "0.0.0:changed")
+
+    @mock.patch("grpc_tools.protoc.main", return_value=0)
+    def test_run_protoc_in_parallel(self, mock_protoc_main):
+        command = GenerateProtoCommand()
+        command.protoc_executor_class = ThreadPoolExecutor
+        return_codes = command.run_protoc(
+            {"app1": ["", "app1.proto"], "app2": ["", "app2.proto"]}, 2
+        )
+
+        self.assertEqual(return_codes, {"app1": 0, "app2": 0})
+        mock_protoc_main.assert_has_calls(
+            [mock.call(["", "app1.proto"]), mock.call(["", "app2.proto"])], any_order=True
+        )
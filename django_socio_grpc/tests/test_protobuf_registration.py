@@ -618,6 +618,61 @@ class TestProtoMessage:
         assert proto_message.fields[0].name == "serializer"
         assert len(proto_message.fields[0].field_type.fields) == 14
 
+    def test_from_serializer_cached(self):
+        ProtoMessage.clear_from_serializer_cache()
+        with mock.patch.object(
+            ResponseProtoMessage,
+            "build_from_serializer",
+            wraps=ResponseProtoMessage.build_from_serializer,
+        ) as build_mock:
+            proto_message = ResponseProtoMessage.from_serializer(
+                MyOtherSerializer, name="MyOtherResponse"
+            )
+            build_count = build_mock.call_count
+            # INFO - The messages are modified in place by the generation plugins and set_indices
+            proto_message.fields.append(ProtoField(name="added", field_type="string"))
+            proto_message.fields[0].field_type.set_indices({})
+
+            other_proto_message = ResponseProtoMessage.from_serializer(
+                MyOtherSerializer, name="MyOtherResponse"
+            )
+
+            assert build_mock.call_count == build_count
+
+            RequestProtoMessage.from_serializer(MyOtherSerializer, name="MyOtherResponse")
+            ResponseProtoMessage.from_serializer(MyOtherSerializer, name="OtherName")
+
+            assert build_mock.call_count == build_count + 1
+
+        assert len(other_proto_message.fields) == 4
+        assert (
+            other_proto_message.fields[0].field_type is not proto_message.fields[0].field_type
+        )
+        assert all(
+            field.index == 0 for field in other_proto_message.fields[0].field_type.fields
+        )
+        assert other_proto_message == ResponseProtoMessage.build_from_serializer(
+            MyOtherSerializer, name="MyOtherResponse"
+        )
+
+    def test_get_all_messages(self):
+        nested_message = ProtoMessage(name="Nested", fields=[ProtoField("name", "string")])
+        other_nested_message = ProtoMessage(name="OtherNested")
+        proto_message = ProtoMessage(
+            name="Parent",
+            fields=[
+                ProtoField("nested", nested_message),
+                ProtoField("other_nested", other_nested_message),
+                ProtoField("nested_again", nested_message),
+                ProtoField("struct", StructMessage),
+            ],
+        )
+
+        messages = proto_message.get_all_messages()
+
+        assert list(messages) == ["Parent", "Nested", "OtherNested", "google.protobuf.Struct"]
+        assert messages["Nested"] is nested_message
+
 
 class TestGrpcActionProto(TestCase):
     class MyBaseAction(Service):
@@ -0,0 +1,195 @@
+import logging
+import threading
+from unittest import mock
+
+import grpc
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    ExceptionControllerStub,
+    UnitTestModelControllerStub,
+    add_ExceptionControllerServicer_to_server,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.services.exception_service import ExceptionService
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+from google.protobuf import empty_pb2
+
+from django_socio_grpc.log import (
+    RequestLogEvent,
+    RequestLogQueue,
+    request_log_queue,
+    set_log_record_factory,
+)
+from django_socio_grpc.services.servicer_proxy import get_servicer_context, request_logger
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestRequestLogging(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        self.exception_fake_grpc = FakeFullAIOGRPC(
+            add_ExceptionControllerServicer_to_server, ExceptionService.as_servicer()
+        )
+        set_log_record_factory()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+        self.exception_fake_grpc.close()
+
+    async def call_list(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        await grpc_stub.List(request=fakeapp_pb2.UnitTestModelListRequest())
+
+    async def call_exception(self):
+        grpc_stub = self.exception_fake_grpc.get_fake_stub(ExceptionControllerStub)
+        with self.assertRaises(grpc.RpcError):
+            await grpc_stub.UnaryRaiseException(request=empty_pb2.Empty())
+
+    @override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True, "LOG_OK_RESPONSE": True})
+    async def test_ok_response_logged_with_duration(self):
+        with self.assertLogs("django_socio_grpc.request", level=logging.INFO) as cm:
+            await self.call_list()
+
+        self.assertEqual(len(cm.records), 1)
+        self.assertEqual(cm.records[0].levelno, logging.INFO)
+        self.assertEqual(cm.records[0].msg, "OK : UnitTestModel/List")
+        self.assertEqual(cm.records[0].status_code, grpc.StatusCode.OK)
+        self.assertGreater(cm.records[0].duration, 0)
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "GRPC_ASYNC": True,
+            "LOG_OK_RESPONSE": True,
+            "LOG_SAMPLING_RATES": {"UnitTestModel.List": 0, "*": 1},
+        }
+    )
+    async def test_sampling_skip_ok_responses_but_not_errors(self):
+        with self.assertNoLogs("django_socio_grpc.request", level=logging.INFO):
+            await self.call_list()
+
+        with (
+            override_settings(
+                GRPC_FRAMEWORK={
+                    "GRPC_ASYNC": True,
+                    "LOG_OK_RESPONSE": True,
+                    "LOG_SAMPLING_RATES": {"*": 0},
+                }
+            ),
+            self.assertLogs("django_socio_grpc.request", level=logging.INFO) as cm,
+        ):
+            await self.call_exception()
+
+        self.assertEqual(len(cm.records), 1)
+        self.assertEqual(cm.records[0].levelno, logging.ERROR)
+        self.assertEqual(cm.records[0].msg, "Exception : Exception/UnaryRaiseException")
+
+    @override_settings(
+        GRPC_FRAMEWORK={
+            "GRPC_ASYNC": True,
+            "LOG_SAMPLING_RATES": {"*": 0},
+            "LOG_SLOW_RESPONSE_THRESHOLD": 0,
+        }
+    )
+    async def test_slow_responses_always_logged(self):
+        with self.assertLogs("django_socio_grpc.request", level=logging.INFO) as cm:
+            await self.call_list()
+
+        self.assertEqual(len(cm.records), 1)
+        self.assertEqual(cm.records[0].levelno, logging.WARNING)
+        self.assertEqual(cm.records[0].msg, "OK : UnitTestModel/List")
+
+    @override_settings(
+        GRPC_FRAMEWORK={"GRPC_ASYNC": True, "LOG_OK_RESPONSE": True, "LOG_QUEUE_SIZE": 100}
+    )
+    async def test_queue_emit_logs_in_background_thread(self):
+        with self.assertLogs("django_socio_grpc.request", level=logging.INFO) as cm:
+            await self.call_list()
+            await self.call_exception()
+            request_log_queue.flush()
+
+        self.assertEqual(len(cm.records), 2)
+        self.assertEqual(cm.records[0].msg, "OK : UnitTestModel/List")
+        self.assertEqual(cm.records[1].msg, "Exception : Exception/UnaryRaiseException")
+        for record in cm.records:
+            self.assertEqual(record.threadName, "dsg-request-log")
+        # INFO - The service of the request is still available to the record factory
+        self.assertEqual(cm.records[0].grpc_service_name, "UnitTestModel")
+        self.assertEqual(cm.records[0].grpc_action, "List")
+
+    @override_settings(
+        GRPC_FRAMEWORK={"GRPC_ASYNC": True, "LOG_OK_RESPONSE": True, "LOG_QUEUE_SIZE": 100}
+    )
+    async def test_queued_event_does_not_keep_the_request(self):
+        with (
+            mock.patch.object(request_logger, "isEnabledFor", return_value=True),
+            mock.patch.object(request_log_queue, "put") as put,
+        ):
+            await self.call_list()
+
+        event = put.call_args.args[0]
+        self.assertEqual(event.service_name, "UnitTestModel")
+        self.assertEqual(event.action, "List")
+        for value in event:
+            self.assertNotIsInstance(value, UnitTestModelService)
+
+    def test_extra_context_set_when_the_record_is_created(self):
+        service = UnitTestModelService()
+        service.action = "List"
+        service.context = None
+        servicer_ctx = get_servicer_context()
+        servicer_ctx.service = service
+        self.addCleanup(delattr, servicer_ctx, "service")
+        filtered_records = []
+
+        def service_filter(record):
+            # INFO - The filters run before the record is formatted
+            filtered_records.append((record.grpc_service_name, record.grpc_action))
+            return True
+
+        test_logger = logging.getLogger("django_socio_grpc.tests.log")
+        test_logger.addFilter(service_filter)
+        self.addCleanup(test_logger.removeFilter, service_filter)
+        with self.assertLogs(test_logger, level=logging.INFO):
+            test_logger.info("message")
+
+        self.assertEqual(filtered_records, [("UnitTestModel", "List")])
+
+
+class TestRequestLogQueue(TestCase):
+    def test_events_dropped_when_queue_full(self):
+        log_queue = RequestLogQueue()
+        emitting = threading.Event()
+        release = threading.Event()
+        emitted = []
+
+        def emit(event):
+            emitting.set()
+            release.wait(5)
+            emitted.append(event)
+
+        def make_event():
+            return RequestLogEvent(
+                emit, "Service", "List", None, None, grpc.StatusCode.OK, 0, logging.INFO
+            )
+
+        log_queue.put(make_event(), max_size=1)
+        emitting.wait(5)
+        # INFO - The first event is being emitted, the second one fills the queue
+        log_queue.put(make_event(), max_size=1)
+        log_queue.put(make_event(), max_size=1)
+        self.assertEqual(log_queue.dropped_count, 1)
+
+        with self.assertLogs("django_socio_grpc.log", level=logging.WARNING) as cm:
+            release.set()
+            log_queue.flush()
+
+        self.assertEqual(len(emitted), 2)
+        self.assertEqual(
+            cm.records[0].getMessage(),
+            "1 request logs dropped because LOG_QUEUE_SIZE was reached",
+        )
@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from django_socio_grpc.grpc_actions.actions import GRPCActionMixin
+from django_socio_grpc.protobuf import RegistrySingleton
+from django_socio_grpc.utils.startup_profiler import StartupProfiler
+
+
+class TestStartupProfiler(TestCase):
+    def setUp(self):
+        RegistrySingleton.clean_all()
+
+    def tearDown(self):
+        RegistrySingleton.clean_all()
+
+    def test_grpcprofilestartup(self):
+        register_actions = GRPCActionMixin.__dict__["register_actions"]
+        stdout = StringIO()
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "timings.json")
+            call_command(
+                "grpcprofilestartup", "--top", "5", "--json", json_path, stdout=stdout
+            )
+            with open(json_path) as json_file:
+                timings = json.load(json_file)
+
+        names_by_phase = {}
+        for timing in timings:
+            names_by_phase.setdefault(timing["phase"], []).append(timing["name"])
+        self.assertEqual(
+            names_by_phase["root_handlers_hook"], ["fakeapp.handlers.grpc_handlers"]
+        )
+        self.assertIn("ROOT_HANDLERS_HOOK", names_by_phase["settings"])
+        self.assertIn("UnitTestModelService", names_by_phase["register_actions"])
+        self.assertIn("UnitTestModelService.List", names_by_phase["placeholders"])
+        self.assertIn("UnitTestModelSerializer", names_by_phase["from_serializer"])
+        self.assertIn(
+            "GlobalScopeWrappedEnumGenerationPlugin (EnumService)",
+            names_by_phase["generation_plugins"],
+        )
+        self.assertIn("fakeapp.grpc.fakeapp_pb2_grpc", names_by_phase["pb2_import"])
+        self.assertIn("UnitTestModelService", names_by_phase["add_servicer"])
+
+        report = stdout.getvalue()
+        self.assertIn("Top 5 offenders", report)
+        self.assertEqual(len(report.split("Top 5 offenders\n")[1].splitlines()), 5)
+        # INFO - The wrapped functions are restored
+        self.assertIs(GRPCActionMixin.__dict__["register_actions"], register_actions)
+
+    def test_nested_phase_timed_once(self):
+        profiler = StartupProfiler()
+        with (
+            profiler.time_phase("from_serializer", "Parent"),
+            profiler.time_phase("from_serializer", "Child"),
+        ):
+            pass
+
+        self.assertEqual([timing.name for timing in profiler.timings], ["Parent"])
+        self.assertEqual(profiler.get_phase_totals()["from_serializer"][0], 1)
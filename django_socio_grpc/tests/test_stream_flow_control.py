@@ -0,0 +1,128 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelControllerStub,
+    add_UnitTestModelControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.services.unit_test_model_service import UnitTestModelService
+
+from django_socio_grpc.services.servicer_proxy import ServicerProxy
+from django_socio_grpc.signals import grpc_stream_flow_control
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC
+
+
+class SlowClientContext:
+    """
+    Context whose write only returns when the test release the client
+    """
+
+    def __init__(self, fail_on_write=False):
+        self.messages = []
+        self.release = asyncio.Event()
+        self.fail_on_write = fail_on_write
+
+    async def write(self, message):
+        await self.release.wait()
+        if self.fail_on_write:
+            raise ConnectionError("client gone")
+        self.messages.append(message)
+
+
+async def produce(count, produced, error=None):
+    for idx in range(count):
+        produced.append(idx)
+        yield SimpleNamespace(grpc_response=idx)
+    if error is not None:
+        raise error
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True, "ASYNC_STREAM_WRITE_WINDOW": 2})
+class TestStreamFlowControl(TestCase):
+    def setUp(self):
+        self.stats = []
+        grpc_stream_flow_control.connect(self.receive_stats)
+
+    def tearDown(self):
+        grpc_stream_flow_control.disconnect(self.receive_stats)
+
+    def receive_stats(self, sender, **kwargs):
+        self.stats.append({"sender": sender, **kwargs})
+
+    async def test_producer_paused_while_window_full(self):
+        proxy = ServicerProxy(UnitTestModelService)
+        context = SlowClientContext()
+        produced = []
+        write_task = asyncio.create_task(
+            proxy.write_stream(produce(6, produced), context, "Stream")
+        )
+
+        await asyncio.sleep(0.05)
+        # One message is waiting in the writer and two in the window
+        self.assertEqual(produced, [0, 1, 2, 3])
+        self.assertEqual(context.messages, [])
+
+        context.release.set()
+        await write_task
+
+        self.assertEqual(context.messages, list(range(6)))
+        self.assertEqual(len(self.stats), 1)
+        self.assertEqual(self.stats[0]["sender"], UnitTestModelService)
+        self.assertEqual(self.stats[0]["action"], "Stream")
+        self.assertEqual(self.stats[0]["message_count"], 6)
+        self.assertGreaterEqual(self.stats[0]["stall_count"], 1)
+        self.assertGreater(self.stats[0]["stall_time"], 0.04)
+
+    async def test_writer_error_stop_the_producer(self):
+        proxy = ServicerProxy(UnitTestModelService)
+        context = SlowClientContext(fail_on_write=True)
+        produced = []
+        write_task = asyncio.create_task(
+            proxy.write_stream(produce(100, produced), context, "Stream")
+        )
+        await asyncio.sleep(0.05)
+        context.release.set()
+
+        with self.assertRaises(ConnectionError):
+            await write_task
+
+        self.assertLess(len(produced), 100)
+        self.assertEqual(self.stats[0]["message_count"], len(produced) - 1)
+
+    async def test_producer_error_write_the_window_before_raising(self):
+        proxy = ServicerProxy(UnitTestModelService)
+        context = SlowClientContext()
+        produced = []
+        write_task = asyncio.create_task(
+            proxy.write_stream(produce(3, produced, ValueError("db error")), context, "Stream")
+        )
+        await asyncio.sleep(0.05)
+        self.assertEqual(context.messages, [])
+        context.release.set()
+
+        with self.assertRaises(ValueError):
+            await write_task
+
+        self.assertEqual(context.messages, [0, 1, 2])
+
+    async def test_stream_action_written_with_context_write(self):
+        for idx in range(10):
+            await UnitTestModel.objects.acreate(title=f"title {idx}", text="text")
+
+        fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelControllerServicer_to_server, UnitTestModelService.as_servicer()
+        )
+        grpc_stub = fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+
+        with mock.patch.object(UnitTestModelService, "stream_chunk_size", 3):
+            response_list = [response async for response in grpc_stub.Stream(request=request)]
+        fake_grpc.close()
+
+        self.assertEqual(len(response_list), 10)
+        self.assertEqual(self.stats[0]["message_count"], 10)
@@ -0,0 +1,107 @@
+import json
+
+from django.test import TestCase, override_settings
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelWithStreamPagesControllerStub,
+    add_UnitTestModelWithStreamPagesControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
+from fakeapp.services.unit_test_model_with_stream_pages_service import (
+    UnitTestModelWithStreamPagesService,
+)
+
+from django_socio_grpc import generics, mixins
+from django_socio_grpc.services.servicer_proxy import get_servicer_context
+from django_socio_grpc.settings import grpc_settings
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+
+class SyncUnitTestModelWithStreamPagesService(
+    mixins.StreamPagesModelMixin, generics.GenericService
+):
+    queryset = UnitTestModel.objects.all().order_by("id")
+    serializer_class = UnitTestModelSerializer
+    stream_page_size = 4
+
+
+def create_instances():
+    for idx in range(10):
+        UnitTestModel(title=f"Title {idx}", text="text").save()
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestAsyncStreamPagesModelMixin(TestCase):
+    def setUp(self):
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelWithStreamPagesControllerServicer_to_server,
+            UnitTestModelWithStreamPagesService.as_servicer(),
+        )
+        create_instances()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def test_stream_pages(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithStreamPagesControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamPagesRequest()
+
+        pages = [page async for page in grpc_stub.StreamPages(request=request)]
+
+        self.assertIsInstance(pages[0], fakeapp_pb2.UnitTestModelListResponse)
+        self.assertEqual([len(page.results) for page in pages], [3, 3, 3, 1])
+        self.assertEqual(
+            [result.title for page in pages for result in page.results],
+            [f"Title {idx}" for idx in range(10)],
+        )
+
+    async def test_stream_pages_filtered(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithStreamPagesControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamPagesRequest()
+        metadata = (("filters", json.dumps({"title": "Title 2"})),)
+
+        pages = [
+            page async for page in grpc_stub.StreamPages(request=request, metadata=metadata)
+        ]
+
+        self.assertEqual(
+            [[result.title for result in page.results] for page in pages], [["Title 2"]]
+        )
+
+    async def test_stream_pages_empty_queryset(self):
+        await UnitTestModel.objects.all().adelete()
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithStreamPagesControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamPagesRequest()
+
+        self.assertEqual([page async for page in grpc_stub.StreamPages(request=request)], [])
+
+
+class TestStreamPagesModelMixin(TestCase):
+    def setUp(self):
+        grpc_settings.GRPC_ASYNC = False
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelWithStreamPagesControllerServicer_to_server,
+            SyncUnitTestModelWithStreamPagesService.as_servicer(),
+        )
+        create_instances()
+
+    def tearDown(self):
+        self.fake_grpc.close()
+        # INFO - The sync calls leave their service in the servicer context of the thread
+        servicer_context = get_servicer_context()
+        if hasattr(servicer_context, "service"):
+            del servicer_context.service
+
+    def test_stream_pages(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithStreamPagesControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamPagesRequest()
+
+        pages = list(grpc_stub.StreamPages(request=request))
+
+        self.assertEqual([len(page.results) for page in pages], [4, 4, 2])
+        self.assertEqual(
+            [result.title for page in pages for result in page.results],
+            [f"Title {idx}" for idx in range(10)],
+        )
@@ -1,6 +1,9 @@
+import json
 from datetime import datetime, timezone
+from unittest import mock
 
-from django.test import TestCase
+import grpc
+from django.test import TestCase, override_settings
 from fakeapp.grpc import fakeapp_pb2
 from fakeapp.grpc.fakeapp_pb2_grpc import (
     UnitTestModelControllerStub,
@@ -52,6 +55,32 @@ class TestSyncModelService(TestCase):
 
         self.assertEqual(len(response.results), 10)
 
+    @mock.patch.object(SyncUnitTestModelService, "list_size_check_chunk_size", 3)
+    def test_list_max_message_size(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelListRequest()
+        expected_response = grpc_stub.List(request=request)
+
+        with override_settings(
+            GRPC_FRAMEWORK={
+                "GRPC_ASYNC": False,
+                "LIST_MAX_MESSAGE_SIZE": expected_response.ByteSize(),
+            }
+        ):
+            response = grpc_stub.List(request=request)
+        self.assertEqual(response, expected_response)
+
+        settings = {
+            "GRPC_ASYNC": False,
+            "LIST_MAX_MESSAGE_SIZE": expected_response.ByteSize() - 1,
+        }
+        with (
+            override_settings(GRPC_FRAMEWORK=settings),
+            self.assertRaises(grpc.RpcError) as error,
+        ):
+            grpc_stub.List(request=request)
+        self.assertEqual(error.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+
     def test_retrieve(self):
         unit_id = UnitTestModel.objects.first().id
         grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
@@ -89,6 +118,42 @@ class TestSyncModelService(TestCase):
 
         self.assertEqual(len(response_list), 10)
 
+    @mock.patch.object(SyncUnitTestModelService, "stream_chunk_size", 3)
+    def test_stream_in_chunks(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        response_stream = grpc_stub.Stream(request=request)
+
+        self.assertEqual(next(response_stream).title, "z")
+        response_list = [response for response in response_stream]
+
+        self.assertEqual(len(response_list), 9)
+
+    @mock.patch.object(SyncUnitTestModelService, "resume_field", "id")
+    def test_stream_resume(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        ids = [response.id for response in grpc_stub.Stream(request=request)]
+        self.assertEqual(
+            dict(self.fake_grpc.grpc_channel.context.trailing_metadata())["resume_token"],
+            str(ids[-1]),
+        )
+
+        metadata = (("pagination", json.dumps({"resume_token": str(ids[3])})),)
+        resumed_ids = [
+            response.id for response in grpc_stub.Stream(request=request, metadata=metadata)
+        ]
+        self.assertEqual(resumed_ids, ids[4:])
+
+    @mock.patch.object(SyncUnitTestModelService, "resume_field", "-id")
+    def test_stream_resume_token_zero(self):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelControllerStub)
+        request = fakeapp_pb2.UnitTestModelStreamRequest()
+        metadata = (("pagination", json.dumps({"resume_token": 0})),)
+
+        # INFO - All the ids are greater than 0 so nothing is left after it in descending order
+        self.assertEqual(list(grpc_stub.Stream(request=request, metadata=metadata)), [])
+
     def test_partial_update(self):
         instance = UnitTestModel.objects.first()
 
@@ -0,0 +1,280 @@
+import asyncio
+import gc
+import json
+import tempfile
+import threading
+import time
+from unittest import mock
+
+import grpc
+from asgiref.sync import sync_to_async
+from django.test import TestCase, override_settings
+from django_filters.rest_framework import DjangoFilterBackend
+from fakeapp.grpc import fakeapp_pb2
+from fakeapp.grpc.fakeapp_pb2_grpc import (
+    UnitTestModelWithWatchControllerStub,
+    add_UnitTestModelWithWatchControllerServicer_to_server,
+)
+from fakeapp.models import UnitTestModel
+from fakeapp.serializers import UnitTestModelSerializer
+from fakeapp.services.unit_test_model_with_watch_service import (
+    UnitTestModelWithWatchService,
+)
+
+from django_socio_grpc import generics, mixins, pubsub
+from django_socio_grpc.settings import grpc_settings
+
+from .grpc_test_utils.fake_grpc import FakeFullAIOGRPC, FakeGRPC
+
+
+class SyncUnitTestModelWithWatchService(mixins.WatchModelMixin, generics.GenericService):
+    queryset = UnitTestModel.objects.all().order_by("id")
+    serializer_class = UnitTestModelSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["title"]
+    watch_poll_interval = 0.01
+
+
+class TestSubscription(TestCase):
+    def test_subscription_receive_published_events(self):
+        backend = pubsub.InMemoryPubSubBackend()
+        event = pubsub.ModelEvent("fakeapp.unittestmodel", pubsub.ModelEventType.CREATED, 1)
+        with backend.subscribe("fakeapp.unittestmodel", 10) as subscription:
+            backend.publish(event)
+            backend.publish(
+                pubsub.ModelEvent("fakeapp.other", pubsub.ModelEventType.CREATED, 2)
+            )
+            self.assertEqual(subscription.get(timeout=0), event)
+            self.assertIsNone(subscription.get(timeout=0))
+
+        self.assertEqual(backend._subscriptions["fakeapp.unittestmodel"], set())
+
+    def test_slow_subscription_is_evicted(self):
+        backend = pubsub.InMemoryPubSubBackend()
+        subscription = backend.subscribe("fakeapp.unittestmodel", 2)
+        with self.assertLogs("django_socio_grpc.pubsub", level="WARNING"):
+            for pk in range(3):
+                backend.publish(
+                    pubsub.ModelEvent(
+                        "fakeapp.unittestmodel", pubsub.ModelEventType.CREATED, pk
+                    )
+                )
+
+        self.assertTrue(subscription.evicted)
+        self.assertEqual(backend._subscriptions["fakeapp.unittestmodel"], set())
+        with self.assertRaises(pubsub.SubscriptionEvicted):
+            subscription.get(timeout=0)
+
+    def test_unix_socket_backend_deliver_to_other_process(self):
+        with tempfile.TemporaryDirectory() as socket_dir:
+            publisher = pubsub.UnixSocketPubSubBackend(socket_dir=socket_dir)
+            receiver = pubsub.UnixSocketPubSubBackend(socket_dir=socket_dir)
+            try:
+                subscription = receiver.subscribe("fakeapp.unittestmodel", 10)
+                publisher.publish(
+                    pubsub.ModelEvent(
+                        "fakeapp.unittestmodel", pubsub.ModelEventType.DELETED, 3
+                    )
+                )
+                event = subscription.get(timeout=5)
+            finally:
+                publisher.close()
+                receiver.close()
+
+        self.assertEqual(
+            event, pubsub.ModelEvent("fakeapp.unittestmodel", pubsub.ModelEventType.DELETED, 3)
+        )
+
+
+@override_settings(GRPC_FRAMEWORK={"GRPC_ASYNC": True})
+class TestWatchService(TestCase):
+    def setUp(self):
+        # Some tests (and the run server commands) assign GRPC_ASYNC directly which override_settings can not undo
+        patcher = mock.patch.object(grpc_settings, "GRPC_ASYNC", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.fake_grpc = FakeFullAIOGRPC(
+            add_UnitTestModelWithWatchControllerServicer_to_server,
+            UnitTestModelWithWatchService.as_servicer(),
+        )
+        UnitTestModelWithWatchService.register_actions()
+        self.channel = pubsub.get_model_channel(UnitTestModel)
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    async def start_watch(self, metadata=None):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithWatchControllerStub)
+        call = grpc_stub.Watch(
+            request=fakeapp_pb2.UnitTestModelWatchRequest(), metadata=metadata
+        )
+        # Wait for the service to subscribe before modifying the database
+        deadline = time.monotonic() + 5
+        while not pubsub.get_pubsub_backend()._subscriptions.get(self.channel):
+            self.assertLess(time.monotonic(), deadline)
+            await asyncio.sleep(0.01)
+        return call
+
+    async def stop_watch(self, call):
+        call.method_awaitable.cancel()
+        await asyncio.gather(call.method_awaitable, return_exceptions=True)
+        # If the call is cancelled between two messages the Watch generator is only closed
+        # when it is garbage collected, and the traceback of the cancelled task references it
+        call.method_awaitable = None
+        gc.collect()
+        deadline = time.monotonic() + 5
+        while pubsub.get_pubsub_backend()._subscriptions.get(self.channel):
+            if time.monotonic() > deadline:
+                break
+            await asyncio.sleep(0.01)
+
+    def run_and_commit(self, fn):
+        with self.captureOnCommitCallbacks(execute=True):
+            return fn()
+
+    async def test_watch_stream_created_updated_and_deleted(self):
+        call = await self.start_watch()
+
+        instance = await sync_to_async(self.run_and_commit)(
+            lambda: UnitTestModel.objects.create(title="watched", text="a")
+        )
+        response = await call.__anext__()
+        self.assertEqual(response.event, "CREATED")
+        self.assertEqual(response.data.id, instance.id)
+        self.assertEqual(response.data.title, "watched")
+
+        instance.text = "b"
+        await sync_to_async(self.run_and_commit)(instance.save)
+        response = await call.__anext__()
+        self.assertEqual(response.event, "UPDATED")
+        self.assertEqual(response.data.text, "b")
+
+        instance_id = instance.id
+        await sync_to_async(self.run_and_commit)(instance.delete)
+        response = await call.__anext__()
+        self.assertEqual(response.event, "DELETED")
+        self.assertEqual(response.data.id, instance_id)
+        self.assertEqual(response.data.title, "")
+
+        await self.stop_watch(call)
+        self.assertFalse(pubsub.get_pubsub_backend()._subscriptions.get(self.channel))
+
+    async def test_watch_filter_created_and_updated(self):
+        metadata = (("filters", json.dumps({"title": "kept"})),)
+        call = await self.start_watch(metadata=metadata)
+
+        await sync_to_async(self.run_and_commit)(
+            lambda: UnitTestModel.objects.create(title="ignored", text="a")
+        )
+        kept = await sync_to_async(self.run_and_commit)(
+            lambda: UnitTestModel.objects.create(title="kept", text="a")
+        )
+
+        response = await call.__anext__()
+        self.assertEqual(response.event, "CREATED")
+        self.assertEqual(response.data.id, kept.id)
+
+        await self.stop_watch(call)
+
+    async def test_watch_evict_slow_consumer(self):
+        def create_instances():
+            for idx in range(3):
+                UnitTestModel.objects.create(title=f"title {idx}", text="a")
+
+        with mock.patch.object(UnitTestModelWithWatchService, "watch_queue_max_size", 1):
+            call = await self.start_watch()
+            await sync_to_async(self.run_and_commit)(create_instances)
+
+            with self.assertRaises(grpc.RpcError) as error:
+                async for _ in call:
+                    pass
+
+        self.assertEqual(error.exception.code(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+
+
+class TestSyncWatchService(TestCase):
+    def setUp(self):
+        grpc_settings.GRPC_ASYNC = False
+        self.fake_grpc = FakeGRPC(
+            add_UnitTestModelWithWatchControllerServicer_to_server,
+            SyncUnitTestModelWithWatchService.as_servicer(),
+        )
+        SyncUnitTestModelWithWatchService.register_actions()
+        self.channel = pubsub.get_model_channel(UnitTestModel)
+
+    def tearDown(self):
+        self.fake_grpc.close()
+
+    def start_watch(self, metadata=None):
+        grpc_stub = self.fake_grpc.get_fake_stub(UnitTestModelWithWatchControllerStub)
+        responses = grpc_stub.Watch(
+            request=fakeapp_pb2.UnitTestModelWatchRequest(), metadata=metadata
+        )
+        return responses, self.fake_grpc.grpc_channel.context
+
+    def publish_when_subscribed(self, *events):
+        """
+        Publish the events from another thread once the Watch iterated in this thread has subscribed.
+        """
+
+        def publish():
+            deadline = time.monotonic() + 5
+            while not pubsub.get_pubsub_backend()._subscriptions.get(self.channel):
+                if time.monotonic() > deadline:
+                    return
+                time.sleep(0.01)
+            for event_type, pk in events:
+                pubsub.get_pubsub_backend().publish(
+                    pubsub.ModelEvent(self.channel, event_type, pk)
+                )
+
+        thread = threading.Thread(target=publish)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_watch_stream_created_and_deleted(self):
+        # INFO - Created without committing so only the events published below are received
+        instance = UnitTestModel.objects.create(title="watched", text="a")
+        responses, context = self.start_watch()
+        self.publish_when_subscribed(
+            (pubsub.ModelEventType.CREATED, instance.id),
+            (pubsub.ModelEventType.DELETED, instance.id),
+        )
+
+        response = next(responses)
+        self.assertEqual(response.event, "CREATED")
+        self.assertEqual(response.data.id, instance.id)
+        self.assertEqual(response.data.title, "watched")
+
+        response = next(responses)
+        self.assertEqual(response.event, "DELETED")
+        self.assertEqual(response.data.id, instance.id)
+        self.assertEqual(response.data.title, "")
+
+        responses.close()
+        self.assertFalse(pubsub.get_pubsub_backend()._subscriptions.get(self.channel))
+
+    def test_watch_filter_created(self):
+        ignored = UnitTestModel.objects.create(title="ignored", text="a")
+        kept = UnitTestModel.objects.create(title="kept", text="a")
+        responses, context = self.start_watch(
+            metadata=(("filters", json.dumps({"title": "kept"})),)
+        )
+        self.publish_when_subscribed(
+            (pubsub.ModelEventType.CREATED, ignored.id),
+            (pubsub.ModelEventType.CREATED, kept.id),
+        )
+
+        response = next(responses)
+        self.assertEqual(response.event, "CREATED")
+        self.assertEqual(response.data.id, kept.id)
+        responses.close()
+
+    def test_watch_stop_when_client_disconnected(self):
+        responses, context = self.start_watch()
+        context.is_active = mock.Mock(side_effect=[True, True, False])
+
+        self.assertEqual(list(responses), [])
+
+        self.assertEqual(context.is_active.call_count, 3)
+        self.assertFalse(pubsub.get_pubsub_backend()._subscriptions.get(self.channel))
@@ -0,0 +1,139 @@
+"""
+Bridges used by DSG to call sync code from async services.
+Where the sync code is run is configured by the ASYNC_EXECUTOR setting. See AsyncExecutorOptions.
+"""
+
+import contextlib
+import contextvars
+import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from asgiref.sync import ThreadSensitiveContext
+from asgiref.sync import sync_to_async as asgiref_sync_to_async
+from django.db import close_old_connections, connections
+
+from django_socio_grpc.settings import AsyncExecutorOptions, grpc_settings
+
+_thread_pool_executor: Executor | None = None
+_thread_pool_executor_lock = threading.Lock()
+# Request handled in request_executor_context with THREAD_POOL
+_current_request: contextvars.ContextVar["_PoolRequest | None"] = contextvars.ContextVar(
+    "dsg_executor_request", default=None
+)
+# Requests that used the database connections of each thread of the pool
+_pool_thread_state = threading.local()
+
+
+class _PoolRequest:
+    __slots__ = ("finished",)
+
+    def __init__(self):
+        self.finished = False
+
+
+def get_thread_pool_executor() -> Executor:
+    """
+    Return the executor used by the THREAD_POOL strategy, creating it if needed.
+    """
+    global _thread_pool_executor
+    with _thread_pool_executor_lock:
+        if _thread_pool_executor is None:
+            _thread_pool_executor = ThreadPoolExecutor(
+                max_workers=grpc_settings.ASYNC_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="dsg-sync",
+            )
+        return _thread_pool_executor
+
+
+def set_thread_pool_executor(executor: Executor | None):
+    """
+    Set the executor used by the THREAD_POOL strategy. grpcrunaioserver uses it to share its
+    --max-workers pool. Set it to None to create a new one from the settings on next use.
+    """
+    global _thread_pool_executor
+    with _thread_pool_executor_lock:
+        _thread_pool_executor = executor
+
+
+def _close_unusable_connections():
+    for conn in connections.all():
+        if conn.connection is not None and conn.errors_occurred and not conn.is_usable():
+            conn.close()
+
+
+def _check_thread_connections(request: _PoolRequest):
+    requests = getattr(_pool_thread_state, "requests", None)
+    if requests is None:
+        requests = _pool_thread_state.requests = []
+    if request in requests:
+        return
+    if all(previous_request.finished for previous_request in requests):
+        # No request using the connections of this thread is running anymore: close the ones
+        # that are broken or older than CONN_MAX_AGE as Django does at the end of a request.
+        requests.clear()
+        close_old_connections()
+    else:
+        # The connections are shared with running requests, only close the broken ones
+        requests[:] = [
+            previous_request for previous_request in requests if not previous_request.finished
+        ]
+        _close_unusable_connections()
+    requests.append(request)
+
+
+def _run_with_thread_connections(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # Each thread of the pool keeps its own database connections between calls and
+        # checks them on the first call of each request run in it.
+        request = _current_request.get()
+        if request is not None:
+            _check_thread_connections(request)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def sync_to_async(func):
+    """
+    Same as asgiref ``sync_to_async`` but the function is run according to ASYNC_EXECUTOR.
+    """
+    if grpc_settings.ASYNC_EXECUTOR == AsyncExecutorOptions.THREAD_POOL:
+        return asgiref_sync_to_async(
+            _run_with_thread_connections(func),
+            thread_sensitive=False,
+            executor=get_thread_pool_executor(),
+        )
+    # With PER_REQUEST, the thread sensitive calls are run in the thread of the request
+    # as long as the request is handled in request_executor_context
+    return asgiref_sync_to_async(func)
+
+
+@contextlib.asynccontextmanager
+async def request_executor_context():
+    """
+    Async context manager in which an async request is handled.
+    With PER_REQUEST, it gives the request a thread for its sync code.
+    With THREAD_POOL, the connections of a thread of the pool are closed when the requests using them are finished.
+    """
+    if grpc_settings.ASYNC_EXECUTOR == AsyncExecutorOptions.THREAD_POOL:
+        request = _PoolRequest()
+        token = _current_request.set(request)
+        try:
+            yield
+        finally:
+            request.finished = True
+            _current_request.reset(token)
+        return
+
+    if grpc_settings.ASYNC_EXECUTOR != AsyncExecutorOptions.PER_REQUEST:
+        yield
+        return
+
+    async with ThreadSensitiveContext():
+        try:
+            yield
+        finally:
+            # The thread of the request stops with the context so its connections are closed with it
+            await asgiref_sync_to_async(connections.close_all)()
@@ -0,0 +1,195 @@
+"""
+Time the phases of the startup of a server, used by the ``grpcprofilestartup`` command.
+
+The phases are timed by wrapping the functions of DSG doing them while the ROOT_HANDLERS_HOOK runs.
+A phase called inside itself, like ``ProtoMessage.from_serializer`` for nested serializers, is only
+timed by its outermost call. Phases are inclusive: the time of ``register_actions`` contains the time
+of the placeholders, proto messages and generation plugins of the actions of the service.
+"""
+
+import asyncio
+import contextlib
+import functools
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from asgiref.sync import async_to_sync
+
+from django_socio_grpc.grpc_actions.actions import GRPCAction, GRPCActionMixin
+from django_socio_grpc.protobuf.generation_plugin import BaseGenerationPlugin
+from django_socio_grpc.protobuf.proto_classes import ProtoMessage
+from django_socio_grpc.services.app_handler_registry import AppHandlerRegistry
+from django_socio_grpc.settings import DEFAULTS, IMPORT_STRINGS, GRPCSettings
+
+SETTINGS = "settings"
+ROOT_HANDLERS_HOOK = "root_handlers_hook"
+REGISTER_ACTIONS = "register_actions"
+PLACEHOLDERS = "placeholders"
+FROM_SERIALIZER = "from_serializer"
+GENERATION_PLUGINS = "generation_plugins"
+PB2_IMPORT = "pb2_import"
+ADD_SERVICER = "add_servicer"
+
+PHASES = [
+    SETTINGS,
+    ROOT_HANDLERS_HOOK,
+    REGISTER_ACTIONS,
+    PLACEHOLDERS,
+    FROM_SERIALIZER,
+    GENERATION_PLUGINS,
+    PB2_IMPORT,
+    ADD_SERVICER,
+]
+
+
+def get_plugin_name(plugin: BaseGenerationPlugin, service, **kwargs) -> str:
+    return f"{type(plugin).__name__} ({service.__name__})"
+
+
+@dataclass
+class StartupTiming:
+    phase: str
+    name: str
+    duration: float
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.timings: list[StartupTiming] = []
+        self._active_phases: Counter[str] = Counter()
+
+    @contextlib.contextmanager
+    def time_phase(self, phase: str, name: str):
+        if self._active_phases[phase]:
+            yield
+            return
+        self._active_phases[phase] += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings.append(StartupTiming(phase, name, time.perf_counter() - start))
+            self._active_phases[phase] -= 1
+
+    def wrap(self, phase: str, function, get_name):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.time_phase(phase, get_name(*args, **kwargs)):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def patch(self):
+        """
+        Wrap the functions doing the registration phases to time them.
+        """
+        patches = [
+            (
+                GRPCActionMixin,
+                "register_actions",
+                REGISTER_ACTIONS,
+                lambda cls, *args, **kwargs: cls.__name__,
+            ),
+            (
+                GRPCAction,
+                "resolve_placeholders",
+                PLACEHOLDERS,
+                lambda action, service_class, name: f"{service_class.__name__}.{name}",
+            ),
+            (
+                ProtoMessage,
+                "from_serializer",
+                FROM_SERIALIZER,
+                lambda cls, serializer, *args, **kwargs: serializer.__name__,
+            ),
+            (
+                BaseGenerationPlugin,
+                "run_validation_and_transform",
+                GENERATION_PLUGINS,
+                get_plugin_name,
+            ),
+            (
+                AppHandlerRegistry,
+                "import_pb2_grpc_module",
+                PB2_IMPORT,
+                lambda registry: registry.get_pb2_grpc_module(),
+            ),
+            (
+                AppHandlerRegistry,
+                "add_servicer_to_server",
+                ADD_SERVICER,
+                lambda registry, service_class, pb2_grpc: service_class.__name__,
+            ),
+        ]
+        originals = []
+        for owner, attribute, phase, get_name in patches:
+            original = owner.__dict__[attribute]
+            originals.append((owner, attribute, original))
+            if isinstance(original, classmethod):
+                wrapped = classmethod(self.wrap(phase, original.__func__, get_name))
+            else:
+                wrapped = self.wrap(phase, original, get_name)
+            setattr(owner, attribute, wrapped)
+        try:
+            yield
+        finally:
+            for owner, attribute, original in originals:
+                setattr(owner, attribute, original)
+
+    def profile_settings(self) -> GRPCSettings:
+        """
+        Resolve each setting in new settings, timing the imports of the modules they reference.
+        """
+        settings = GRPCSettings(None, DEFAULTS, IMPORT_STRINGS)
+        for setting_name in DEFAULTS:
+            with self.time_phase(SETTINGS, setting_name):
+                getattr(settings, setting_name)
+        return settings
+
+    def profile_startup(self, server):
+        """
+        Time the resolution of the settings and the registration of the services on the server.
+        """
+        settings = self.profile_settings()
+        hook = settings.ROOT_HANDLERS_HOOK
+        hook_name = f"{hook.__module__}.{hook.__qualname__}"
+        with self.patch(), self.time_phase(ROOT_HANDLERS_HOOK, hook_name):
+            if asyncio.iscoroutinefunction(hook):
+                async_to_sync(hook)(server)
+            else:
+                hook(server)
+
+    def get_phase_totals(self) -> dict[str, tuple[int, float]]:
+        """
+        Return the number of calls and the total duration of each phase.
+        """
+        totals = {phase: (0, 0.0) for phase in PHASES}
+        for timing in self.timings:
+            count, duration = totals[timing.phase]
+            totals[timing.phase] = (count + 1, duration + timing.duration)
+        return totals
+
+    def get_top_timings(
+        self, top: int, phases: list[str] | None = None
+    ) -> list[StartupTiming]:
+        timings = [
+            timing for timing in self.timings if phases is None or timing.phase in phases
+        ]
+        return sorted(timings, key=lambda timing: timing.duration, reverse=True)[:top]
+
+    def format_report(self, top: int = 20, phases: list[str] | None = None) -> str:
+        lines = [f"{'phase':<22}{'calls':>7}{'total ms':>12}"]
+        for phase, (count, duration) in self.get_phase_totals().items():
+            lines.append(f"{phase:<22}{count:>7}{duration * 1000:>12.1f}")
+        lines.append("")
+        lines.append(f"Top {top} offenders")
+        if phases is None:
+            # INFO - The hook contains all the other phases, it would always be the first offender
+            phases = [phase for phase in PHASES if phase != ROOT_HANDLERS_HOOK]
+        for timing in self.get_top_timings(top, phases):
+            lines.append(
+                f"{timing.duration * 1000:>10.1f} ms  {timing.phase:<22}{timing.name}"
+            )
+        return "\n".join(lines)